@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Measure FetchFox Greenhouse detail throughput offline against ``MockFetchFox``.
+
+"single" replays the previous flow: every URL goes into one FetchFox scrape job and
+nothing is normalized until that job returns. "dispatch" runs
+``FetchfoxScraper.scrape_greenhouse_jobs`` with the URLs split into chunks that are
+submitted together and normalized as each chunk finishes. The mock sleeps ``--latency``
+per job plus ``--per-url`` per start URL, standing in for FetchFox's job queueing and
+page visits; first-row time is when the first row reached normalization. Rows are passed
+through instead of running ``normalize_fetchfox_items`` so only dispatch is timed.
+
+    uv run agent_scripts/benchmark_fetchfox_dispatch.py
+    uv run agent_scripts/benchmark_fetchfox_dispatch.py --urls 200 --chunk-size 20 --concurrency 8
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from job_scrape_application.testing.fetchfox_mock import MockFetchFox  # noqa: E402
+from job_scrape_application.workflows.scrapers import fetchfox_scraper  # noqa: E402
+from job_scrape_application.workflows.scrapers.fetchfox_scraper import (  # noqa: E402
+    FetchfoxDependencies,
+    FetchfoxScraper,
+)
+
+
+def _scraper(first_row_at: List[float]) -> FetchfoxScraper:
+    def _normalize(payload: Any) -> List[dict]:
+        rows = [row for row in payload.get("items") or [] if isinstance(row, dict)]
+        if rows and not first_row_at:
+            first_row_at.append(time.perf_counter())
+        return rows
+
+    deps = FetchfoxDependencies(
+        fetch_seen_urls_for_site=lambda *_a, **_k: [],
+        build_job_template=lambda: {},
+        build_request_snapshot=lambda request, **_k: {"body": request},
+        log_provider_dispatch=lambda *_a, **_k: None,
+        log_sync_response=lambda *_a, **_k: None,
+        normalize_fetchfox_items=_normalize,
+        trim_scrape_for_convex=lambda payload, **_k: payload,
+        settings=SimpleNamespace(fetchfox_api_key="mock"),
+        load_greenhouse_board=lambda *_a, **_k: None,
+        extract_greenhouse_job_urls=lambda *_a, **_k: [],
+        extract_raw_body_from_fetchfox_result=lambda _result: "",
+    )
+    return FetchfoxScraper(deps)
+
+
+async def _run(urls: List[str], fox: MockFetchFox, chunk_size: int, concurrency: int) -> Tuple[float, float, int]:
+    fetchfox_scraper.FetchFox = fox
+    fetchfox_scraper.runtime_config.fetchfox_detail_chunk_size = chunk_size
+    fetchfox_scraper.runtime_config.fetchfox_dispatch_concurrency = concurrency
+    first_row_at: List[float] = []
+    started = time.perf_counter()
+    res = await _scraper(first_row_at).scrape_greenhouse_jobs({"urls": urls})
+    total = time.perf_counter() - started
+    first = (first_row_at[0] - started) if first_row_at else total
+    return total * 1000, first * 1000, res["jobsScraped"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--urls", type=int, default=100)
+    parser.add_argument("--chunk-size", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds per FetchFox job")
+    parser.add_argument("--per-url", type=float, default=0.01, help="seconds per start URL")
+    args = parser.parse_args()
+
+    urls = [f"https://boards.greenhouse.io/example/jobs/{4000000 + idx}" for idx in range(args.urls)]
+
+    def _fox() -> MockFetchFox:
+        return MockFetchFox(latency=args.latency, per_url_latency=args.per_url)
+
+    single_ms, single_first_ms, single_rows = asyncio.run(_run(urls, _fox(), 0, 1))
+    fox = _fox()
+    dispatch_ms, dispatch_first_ms, dispatch_rows = asyncio.run(
+        _run(urls, fox, args.chunk_size, args.concurrency)
+    )
+
+    print(f"urls={len(urls)} chunk_size={args.chunk_size} concurrency={args.concurrency}")
+    print(f"single   total {single_ms:9.1f} ms  first row {single_first_ms:9.1f} ms  rows={single_rows}")
+    print(
+        f"dispatch total {dispatch_ms:9.1f} ms  first row {dispatch_first_ms:9.1f} ms  rows={dispatch_rows}"
+        f"  jobs={len(fox.calls)} max_active={fox.max_active}  ({single_ms / max(dispatch_ms, 1e-9):.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
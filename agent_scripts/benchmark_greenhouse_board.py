@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Compare full Pydantic vs lean decoding of a Greenhouse board payload.
+
+    uv run agent_scripts/benchmark_greenhouse_board.py
+    uv run agent_scripts/benchmark_greenhouse_board.py --fixture path/to/board.json --repeat 500
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from job_scrape_application.components.models import (  # noqa: E402
+    extract_greenhouse_job_urls,
+    load_greenhouse_board,
+)
+
+DEFAULT_FIXTURE = REPO_ROOT / "tests" / "fixtures" / "robinhood_greenhouse_board.json"
+
+
+def _time_ms(raw: str, *, lean: bool, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        board = load_greenhouse_board(raw, lean=lean)
+        extract_greenhouse_job_urls(board)
+    return (time.perf_counter() - started) * 1000 / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixture", type=Path, default=DEFAULT_FIXTURE)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    raw = args.fixture.read_text(encoding="utf-8")
+    jobs = len(load_greenhouse_board(raw).jobs)
+    full_ms = _time_ms(raw, lean=False, repeat=args.repeat)
+    lean_ms = _time_ms(raw, lean=True, repeat=args.repeat)
+    print(f"fixture={args.fixture.name} bytes={len(raw)} jobs={jobs} repeat={args.repeat}")
+    print(f"full  {full_ms:8.3f} ms/board")
+    print(f"lean  {lean_ms:8.3f} ms/board  ({full_ms / lean_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
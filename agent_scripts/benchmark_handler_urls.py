@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Time site-handler URL checks on a synthetic Workday listing with and without the URL caches.
+
+Mirrors the listing path: ``filter_job_urls`` over every link, then the per-URL listing
+checks done when splitting listing vs detail URLs. "uncached" is the previous
+implementation (a fresh ``urlparse`` inside every predicate); "cold" clears the parse and
+classification caches before every repeat (first sight of a listing); "warm" keeps them
+(the same URLs re-checked later in the run, or by the next page of the same listing).
+
+    uv run agent_scripts/benchmark_handler_urls.py
+    uv run agent_scripts/benchmark_handler_urls.py --urls 5000 --repeat 10
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+from urllib.parse import urlparse
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from job_scrape_application.workflows.helpers import parsed_url  # noqa: E402
+from job_scrape_application.workflows.site_handlers import WorkdayHandler  # noqa: E402
+from job_scrape_application.workflows.site_handlers import base as base_handlers  # noqa: E402
+from job_scrape_application.workflows.site_handlers import workday as workday_module  # noqa: E402
+
+LISTING_CHECKS_PER_URL = 3
+
+
+def _build_urls(count: int) -> List[str]:
+    base = "https://acme.wd5.myworkdayjobs.com/en-US/External"
+    urls = [f"{base}/job/Remote-USA/Software-Engineer_R{100000 + idx}" for idx in range(count)]
+    urls.extend(f"{base}?offset={offset}" for offset in range(0, count, 20))
+    urls.extend(f"{base}/job/Remote-USA/Software-Engineer_R{100000 + idx}/apply" for idx in range(0, count, 10))
+    return urls
+
+
+def _clear_caches() -> None:
+    parsed_url.cached_urlparse.cache_clear()
+    parsed_url.parse_url.cache_clear()
+    base_handlers._looks_like_non_job_detail_url.cache_clear()
+    base_handlers._classify_url.cache_clear()
+
+
+def _run_cached(handler: WorkdayHandler, urls: List[str]) -> None:
+    kept = handler.filter_job_urls(urls)
+    for _ in range(LISTING_CHECKS_PER_URL):
+        for url in kept:
+            handler.classify(url).listing
+
+
+def _uncached_matches(url: str) -> bool:
+    try:
+        host = (urlparse(url).hostname or "").lower()
+    except Exception:
+        return False
+    return host.endswith(workday_module.WORKDAY_HOST_SUFFIX)
+
+
+def _uncached_is_listing(url: str) -> bool:
+    try:
+        parsed = urlparse(url)
+    except Exception:
+        return False
+    if parsed.hostname and not _uncached_matches(url):
+        return False
+    path = (parsed.path or "").lower()
+    return bool(path) and "/job/" not in path
+
+
+def _uncached_filter(urls: List[str]) -> List[str]:
+    filtered: List[str] = []
+    seen: set[str] = set()
+    for url in urls:
+        cleaned = url.strip()
+        if not cleaned or cleaned in seen:
+            continue
+        lower = cleaned.lower()
+        if lower.startswith(("mailto:", "tel:", "javascript:")):
+            continue
+        try:
+            parsed = urlparse(cleaned)
+        except Exception:
+            parsed = None
+        if parsed and parsed.hostname and not _uncached_matches(cleaned):
+            continue
+        path = (parsed.path if parsed else cleaned).lower()
+        if "/job/" in path or _uncached_is_listing(cleaned):
+            seen.add(cleaned)
+            filtered.append(cleaned)
+    return filtered
+
+
+def _run_uncached(urls: List[str]) -> None:
+    kept = _uncached_filter(urls)
+    for _ in range(LISTING_CHECKS_PER_URL):
+        for url in kept:
+            _uncached_is_listing(url)
+
+
+def _time_ms(fn: Callable[[], None], repeat: int, *, before_each: Callable[[], None] | None = None) -> float:
+    total = 0.0
+    for _ in range(repeat):
+        if before_each:
+            before_each()
+        started = time.perf_counter()
+        fn()
+        total += time.perf_counter() - started
+    return total * 1000 / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--urls", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    handler = WorkdayHandler()
+    urls = _build_urls(args.urls)
+
+    uncached = _time_ms(lambda: _run_uncached(urls), args.repeat)
+    cold = _time_ms(lambda: _run_cached(handler, urls), args.repeat, before_each=_clear_caches)
+    _run_cached(handler, urls)
+    warm = _time_ms(lambda: _run_cached(handler, urls), args.repeat)
+
+    print(f"urls={len(urls)} listing checks per url={LISTING_CHECKS_PER_URL}")
+    print(f"uncached {uncached:8.2f} ms")
+    print(f"cold     {cold:8.2f} ms  ({uncached / max(cold, 1e-9):.2f}x)")
+    print(f"warm     {warm:8.2f} ms  ({uncached / max(warm, 1e-9):.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Compare per-extractor event walks vs the single-pass EventIndex on SpiderCloud fixtures.
+
+Runs the post-stream extractors from ``_scrape_single_url`` (payload validity, listing
+payload/links, JSON-LD, meta description, titles, location, status, credits) once
+against the raw event list, the way they ran before the index, and once through an
+``EventIndex`` built as the events arrive.
+
+    uv run agent_scripts/benchmark_spidercloud_events.py
+    uv run agent_scripts/benchmark_spidercloud_events.py --glob 'spidercloud_uber_*.json' --repeat 20
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from job_scrape_application.workflows.helpers.event_index import EventIndex, status_from_value  # noqa: E402
+from job_scrape_application.workflows.helpers.link_extractors import gather_strings  # noqa: E402
+from job_scrape_application.workflows.scrapers.spidercloud_scraper import (  # noqa: E402
+    SpiderCloudScraper,
+    SpidercloudDependencies,
+)
+from job_scrape_application.workflows.site_handlers import get_site_handler  # noqa: E402
+
+DEFAULT_FIXTURES_DIR = REPO_ROOT / "tests" / "job_scrape_application" / "workflows" / "fixtures"
+
+
+def _make_scraper() -> SpiderCloudScraper:
+    return SpiderCloudScraper(
+        SpidercloudDependencies(
+            mask_secret=lambda v: v,
+            sanitize_headers=lambda h: h,
+            build_request_snapshot=lambda *args, **kwargs: {},
+            log_dispatch=lambda *args, **kwargs: None,
+            log_sync_response=lambda *args, **kwargs: None,
+            trim_scrape_for_convex=lambda payload: payload,
+            settings=type("cfg", (), {"spider_api_key": "key"}),
+            fetch_seen_urls_for_site=lambda *_args, **_kwargs: [],
+        )
+    )
+
+
+def _load_events(path: Path) -> List[Any]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if isinstance(payload, dict) and "response" in payload:
+        payload = payload["response"]
+    events: List[Any] = []
+
+    def _flatten(value: Any) -> None:
+        if isinstance(value, list):
+            for item in value:
+                _flatten(item)
+        else:
+            events.append(value)
+
+    _flatten(payload)
+    return events
+
+
+def _event_url(events: List[Any]) -> str:
+    for event in events:
+        if isinstance(event, dict) and isinstance(event.get("url"), str):
+            return event["url"]
+    return "https://example.com/jobs/1"
+
+
+def _per_extractor(scraper: SpiderCloudScraper, events: List[Any], url: str) -> None:
+    markdown_parts = [text for text in (scraper._extract_markdown(e) for e in events if isinstance(e, dict)) if text]
+    handler = get_site_handler(url)
+    scraper._has_valid_greenhouse_job_payload(events, markdown_parts)
+    for _ in range(2):
+        scraper._extract_json_payload(events)
+    if handler:
+        for _ in range(2):
+            scraper._extract_listing_job_urls_from_events(handler, events, "", base_url=url)
+        scraper._extract_listing_links_from_html(handler, events, "")
+    scraper._extract_structured_job_posting(events)
+    scraper._extract_meta_description_from_events(events)
+    scraper._title_from_events(events)
+    scraper._extract_greenhouse_location_from_events(events)
+    if not any(status_from_value(e) is not None for e in events):
+        for text in gather_strings(events):
+            status_from_value(text)
+
+
+def _indexed(scraper: SpiderCloudScraper, events: List[Any], url: str) -> None:
+    index = EventIndex()
+    for event in events:
+        index.add(event, markdown=scraper._extract_markdown(event) if isinstance(event, dict) else None)
+    handler = get_site_handler(url)
+    scraper._has_valid_greenhouse_job_payload(index.events, index.markdown_parts, index=index)
+    for _ in range(2):
+        scraper._extract_json_payload(index.events, index=index)
+    if handler:
+        scraper._extract_listing_job_urls_from_events(handler, index.events, "", base_url=url, index=index)
+        scraper._extract_listing_links_from_html(handler, index.events, "", index=index)
+    scraper._extract_structured_job_posting(index.events, index=index)
+    scraper._extract_meta_description_from_events(index.events, index=index)
+    scraper._title_from_events(index.events, index=index)
+    scraper._extract_greenhouse_location_from_events(index.events, index=index)
+    index.http_status
+
+
+def _time_ms(fn: Callable[..., None], scraper: SpiderCloudScraper, events: List[Any], url: str, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(scraper, events, url)
+    return (time.perf_counter() - started) * 1000 / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures-dir", type=Path, default=DEFAULT_FIXTURES_DIR)
+    parser.add_argument("--glob", default="spidercloud_*.json")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    scraper = _make_scraper()
+    total_before = total_after = 0.0
+    paths = sorted(args.fixtures_dir.glob(args.glob))
+    for path in paths:
+        events = _load_events(path)
+        url = _event_url(events)
+        before = _time_ms(_per_extractor, scraper, events, url, args.repeat)
+        after = _time_ms(_indexed, scraper, events, url, args.repeat)
+        total_before += before
+        total_after += after
+        print(f"{path.name:<72} per-extractor {before:8.2f} ms  indexed {after:8.2f} ms")
+    if paths:
+        print(
+            f"total fixtures={len(paths)} per-extractor {total_before:.1f} ms  "
+            f"indexed {total_after:.1f} ms  ({total_before / max(total_after, 1e-9):.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Time listing URL normalization: chained per-stage passes vs one shared UrlBatch.
+
+Builds synthetic Greenhouse/Ashby/Lever/Workday listing URLs with the noise seen in real
+payloads (duplicates, trailing and doubled slashes, ``&amp;`` entities, tracking params)
+plus a ``posted_at_by_url`` map keyed by the raw URLs. "chained" replays the previous
+flow: the listing activity normalizes the list and the timestamp keys, the SpiderCloud
+batch re-sanitizes the same list and re-keys the timestamps, then every scraped URL is
+normalized again for its timestamp lookup, all with the uncached ``normalize_url``.
+"batch" builds one ``UrlBatch`` and hands it to the later stages.
+
+    uv run agent_scripts/benchmark_url_batch.py
+    uv run agent_scripts/benchmark_url_batch.py --urls 50000 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import html as html_lib
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+from urllib.parse import urlparse, urlunparse
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from job_scrape_application.workflows.helpers import link_extractors  # noqa: E402
+from job_scrape_application.workflows.helpers.url_batch import UrlBatch  # noqa: E402
+
+_SLASH_RUN_RE = re.compile(r"/{2,}")
+ATS_TEMPLATES = (
+    "https://boards.greenhouse.io/acme/jobs/{id}",
+    "https://job-boards.greenhouse.io/acme/jobs/{id}?gh_jid={id}",
+    "https://jobs.ashbyhq.com/acme/{id}-0000-4000-8000-000000000000",
+    "https://jobs.lever.co/acme/{id}-aaaa-bbbb",
+    "https://acme.wd5.myworkdayjobs.com/en-US/External/job/Remote-USA/Engineer_R{id}",
+)
+NOISE = (
+    lambda url: url,
+    lambda url: url + "/",
+    lambda url: url.replace(".com/", ".com//", 1).replace(".io/", ".io//", 1),
+    lambda url: url + ("&amp;" if "?" in url else "?") + "utm_source=linkedin",
+    lambda url: f" {url} ",
+)
+
+
+def _build_urls(count: int) -> List[str]:
+    urls: List[str] = []
+    for idx in range(count):
+        job_id = 4000000 + idx // 2
+        template = ATS_TEMPLATES[job_id % len(ATS_TEMPLATES)]
+        urls.append(NOISE[idx % len(NOISE)](template.format(id=job_id)))
+    return urls
+
+
+def _old_normalize_http_url(candidate: str) -> str:
+    if not candidate.startswith(("http://", "https://")):
+        return candidate
+    try:
+        parsed = urlparse(candidate)
+    except Exception:
+        return candidate
+    if not parsed.scheme or not parsed.netloc:
+        return candidate
+    path = _SLASH_RUN_RE.sub("/", parsed.path or "")
+    if path and path != "/":
+        path = path.rstrip("/")
+    return urlunparse((parsed.scheme, parsed.netloc, path, parsed.params, parsed.query, parsed.fragment))
+
+
+def _old_normalize_url(url: str) -> str | None:
+    if not isinstance(url, str):
+        return None
+    candidate = html_lib.unescape(url.strip()).strip()
+    candidate = link_extractors.strip_wrapping_url(candidate)
+    if not candidate:
+        return None
+    candidate = link_extractors.fix_scheme_slashes(candidate).replace("\\", "/")
+    if candidate.lower().startswith(("mailto:", "tel:", "javascript:", "#")):
+        return None
+    if candidate.startswith(("http://", "https://")):
+        return _old_normalize_http_url(candidate)
+    return None
+
+
+def _old_keys(values: Dict[str, int]) -> Dict[str, int]:
+    return {(_old_normalize_url(key) or key): int(value) for key, value in values.items()}
+
+
+def _run_chained(urls: List[str], posted: Dict[str, int]) -> None:
+    listing: List[str] = []
+    seen: set[str] = set()
+    for candidate in urls:
+        normalized = _old_normalize_url(candidate)
+        if normalized and normalized not in seen:
+            seen.add(normalized)
+            listing.append(normalized)
+    listing_posted = _old_keys(posted)
+
+    sanitized: List[str] = []
+    seen = set()
+    for value in listing:
+        candidate = _old_normalize_url(value.strip().replace("\\", "/")) or value
+        if candidate not in seen:
+            seen.add(candidate)
+            sanitized.append(candidate)
+    batch_posted = _old_keys(listing_posted)
+    for url in sanitized:
+        batch_posted.get(url) or batch_posted.get(_old_normalize_url(url) or url)
+
+
+def _run_batch(urls: List[str], posted: Dict[str, int]) -> None:
+    batch = UrlBatch.from_values(urls)
+    batch_posted = batch.timestamps_by_url(posted)
+    for url in batch.urls:
+        batch_posted.get(url)
+
+
+def _time_ms(fn: Callable[[], None], repeat: int) -> float:
+    total = 0.0
+    for _ in range(repeat):
+        link_extractors.cached_normalize_url.cache_clear()
+        started = time.perf_counter()
+        fn()
+        total += time.perf_counter() - started
+    return total * 1000 / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--urls", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    urls = _build_urls(args.urls)
+    posted = {url: 1700000000000 + idx for idx, url in enumerate(urls)}
+    batch = UrlBatch.from_values(urls)
+
+    chained = _time_ms(lambda: _run_chained(urls, posted), args.repeat)
+    batched = _time_ms(lambda: _run_batch(urls, posted), args.repeat)
+
+    print(f"raw urls={len(urls)} canonical={len(batch)}")
+    print(f"chained {chained:9.2f} ms")
+    print(f"batch   {batched:9.2f} ms  ({chained / max(batched, 1e-9):.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Measure workflow-task latency by replaying recorded histories with different sandbox runners.
+
+``tests/fixtures/workflow_histories`` holds one history per workflow type, written by
+``record_workflow_histories.py``. Histories exported from a Temporal server with ``--export``
+land in the same directory (``test_workflow_replay.py`` replays them too):
+
+    uv run agent_scripts/benchmark_workflow_replay.py --repeat 5
+    uv run agent_scripts/benchmark_workflow_replay.py --export spidercloud-job-details-drainer
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from temporalio.api.enums.v1 import EventType  # noqa: E402
+from temporalio.client import Client, WorkflowHistory  # noqa: E402
+from temporalio.worker import Replayer, UnsandboxedWorkflowRunner  # noqa: E402
+from temporalio.worker.workflow_sandbox import SandboxedWorkflowRunner  # noqa: E402
+
+from job_scrape_application.config import settings  # noqa: E402
+from job_scrape_application.workflows.payload_codec import build_data_converter  # noqa: E402
+from job_scrape_application.workflows.sandbox import build_workflow_runner  # noqa: E402
+from job_scrape_application.workflows.worker import WORKFLOW_CLASSES  # noqa: E402
+
+DEFAULT_HISTORIES_DIR = REPO_ROOT / "tests" / "fixtures" / "workflow_histories"
+
+RUNNERS = {
+    "default": SandboxedWorkflowRunner,
+    "curated": build_workflow_runner,
+    "unsandboxed": UnsandboxedWorkflowRunner,
+}
+
+
+def _history_filename(workflow_id: str) -> str:
+    return workflow_id.replace("/", "__") + ".json"
+
+
+async def _export(workflow_ids: List[str], out_dir: Path) -> None:
+    client = await Client.connect(
+        settings.temporal_address,
+        namespace=settings.temporal_namespace,
+        data_converter=build_data_converter(),
+    )
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for workflow_id in workflow_ids:
+        history = await client.get_workflow_handle(workflow_id).fetch_history()
+        path = out_dir / _history_filename(workflow_id)
+        path.write_text(history.to_json(), encoding="utf-8")
+        print(f"wrote {path} events={len(history.events)}")
+
+
+def _load_histories(histories_dir: Path) -> List[WorkflowHistory]:
+    histories = []
+    for path in sorted(histories_dir.glob("*.json")):
+        workflow_id = path.stem.replace("__", "/")
+        histories.append(WorkflowHistory.from_json(workflow_id, path.read_text(encoding="utf-8")))
+    return histories
+
+
+def _workflow_task_count(history: WorkflowHistory) -> int:
+    completed = EventType.EVENT_TYPE_WORKFLOW_TASK_COMPLETED
+    return sum(1 for event in history.events if event.event_type == completed)
+
+
+async def _replay(histories: List[WorkflowHistory], runner_name: str, repeat: int) -> Dict[str, float]:
+    replayer = Replayer(
+        workflows=WORKFLOW_CLASSES,
+        workflow_runner=RUNNERS[runner_name](),
+        data_converter=build_data_converter(),
+    )
+    tasks = sum(_workflow_task_count(history) for history in histories) * repeat
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for history in histories:
+            await replayer.replay_workflow(history, raise_on_replay_failure=True)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return {
+        "total_ms": elapsed_ms,
+        "workflow_tasks": tasks,
+        "ms_per_task": elapsed_ms / tasks if tasks else 0.0,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--histories-dir", type=Path, default=DEFAULT_HISTORIES_DIR)
+    parser.add_argument("--export", nargs="+", metavar="WORKFLOW_ID", help="Fetch histories from Temporal and exit")
+    parser.add_argument("--runner", choices=sorted(RUNNERS), action="append", help="Runner(s) to benchmark")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.export:
+        await _export(args.export, args.histories_dir)
+        return
+
+    if not args.histories_dir.is_dir():
+        raise SystemExit(
+            f"History directory {args.histories_dir} does not exist; run "
+            "agent_scripts/record_workflow_histories.py or --export WORKFLOW_ID first"
+        )
+    histories = _load_histories(args.histories_dir)
+    if not histories:
+        raise SystemExit(f"No histories found in {args.histories_dir}; export some with --export first")
+
+    for runner_name in args.runner or ["default", "curated"]:
+        result = await _replay(histories, runner_name, max(1, args.repeat))
+        print(
+            f"{runner_name:12s} histories={len(histories)} workflow_tasks={result['workflow_tasks']} "
+            f"total_ms={result['total_ms']:.1f} ms_per_task={result['ms_per_task']:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
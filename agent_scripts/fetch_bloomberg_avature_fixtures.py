@@ -13,6 +13,7 @@ from spider import AsyncSpider
 
 sys.path.insert(0, os.path.abspath("."))
 
+from job_scrape_application.workflows.helpers.host_limiter import split_host_limits
 from job_scrape_application.workflows.site_handlers import AvatureHandler
 
 DEFAULT_BASE_URL = (
@@ -69,7 +70,7 @@ async def main() -> None:
                 "url": url,
                 "limit": 1,
             }
-            payload.update(handler.get_spidercloud_config(url))
+            payload.update(split_host_limits(handler.get_spidercloud_config(url))[0])
             print(f"Fetching {url} -> {filename}")
             response = await _collect_response(
                 client.scrape_url(
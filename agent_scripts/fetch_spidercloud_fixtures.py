@@ -32,6 +32,7 @@ from spider import AsyncSpider
 
 sys.path.insert(0, os.path.abspath("."))
 
+from job_scrape_application.workflows.helpers.host_limiter import split_host_limits
 from job_scrape_application.workflows.site_handlers import AvatureHandler
 
 GH_JOB_URL = "https://boards-api.greenhouse.io/v1/boards/pinterest/jobs/5572858"
@@ -134,7 +135,7 @@ async def main() -> None:
                 url = payload.get("url")
                 params = {k: v for k, v in payload.items() if k != "url"}
                 if isinstance(url, str) and avature_handler.matches_url(url):
-                    params.update(avature_handler.get_spidercloud_config(url))
+                    params.update(split_host_limits(avature_handler.get_spidercloud_config(url))[0])
                 return_format = params.get("return_format")
                 if isinstance(return_format, str):
                     params["return_format"] = [return_format]
@@ -0,0 +1,600 @@
+#!/usr/bin/env python3
+"""Record one replayable history per registered workflow type without a Temporal server.
+
+Each scenario runs a workflow through the SDK ``Replayer`` one workflow task at a time:
+the commands the workflow emits for the newest task are appended to the history as the
+events the server would write, scripted activity / child-workflow results are appended
+after them, and the next task is replayed on top. Core validates every intermediate
+history, so the files written to ``tests/fixtures/workflow_histories`` replay exactly as
+recorded. Histories follow the default settings (``PERSIST_SCRAPES_IN_ACTIVITY`` unset and
+the committed runtime.yaml). Re-run this after intentionally changing a workflow's command
+sequence (and gate the change with ``workflow.patched`` if live executions are affected):
+
+    uv run agent_scripts/record_workflow_histories.py
+    uv run agent_scripts/record_workflow_histories.py --only ScrapeWorkflow
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from google.protobuf.duration_pb2 import Duration  # noqa: E402
+from temporalio.api.common.v1 import (  # noqa: E402
+    ActivityType,
+    Payload,
+    Payloads,
+    WorkflowExecution,
+    WorkflowType,
+)
+from temporalio.api.enums.v1 import EventType  # noqa: E402
+from temporalio.api.history import v1 as history_pb  # noqa: E402
+from temporalio.api.taskqueue.v1 import TaskQueue  # noqa: E402
+from temporalio.client import WorkflowHistory  # noqa: E402
+from temporalio.worker import Replayer, WorkflowInstance, WorkflowRunner  # noqa: E402
+
+from job_scrape_application.config import settings  # noqa: E402
+from job_scrape_application.workflows.payload_codec import build_data_converter  # noqa: E402
+from job_scrape_application.workflows.sandbox import build_workflow_runner  # noqa: E402
+from job_scrape_application.workflows.worker import WORKFLOW_CLASSES  # noqa: E402
+
+DEFAULT_HISTORIES_DIR = REPO_ROOT / "tests" / "fixtures" / "workflow_histories"
+STARTED_AT = datetime(2025, 1, 6, 17, 0, tzinfo=timezone.utc)
+# Core writes the patch id into marker details under this key (sdk-core PATCHED_MARKER_DETAILS_KEY).
+PATCH_MARKER_NAME = "core_patch"
+PATCH_MARKER_DETAILS_KEY = "patch-data"
+
+ActivityResult = Callable[[List[Any]], Any]
+
+
+def _returns(*values: Any) -> ActivityResult:
+    """Return ``values`` on successive calls, repeating the last one."""
+
+    remaining = list(values)
+
+    def _next(_args: List[Any]) -> Any:
+        return remaining.pop(0) if len(remaining) > 1 else remaining[0]
+
+    return _next
+
+
+@dataclass
+class Scenario:
+    workflow_type: str
+    workflow_id: str
+    args: Sequence[Any] = ()
+    # Activity name -> scripted result; unlisted activities return None.
+    activities: Dict[str, ActivityResult] = field(default_factory=dict)
+    # Child workflow type -> scripted result; unlisted children stay running once started.
+    children: Dict[str, ActivityResult] = field(default_factory=dict)
+    # Signals delivered (in order) whenever the workflow is only waiting on timers.
+    signals: List[tuple[str, Sequence[Any]]] = field(default_factory=list)
+    # Workflows that never complete on their own are cut off after this many tasks.
+    max_tasks: int = 50
+
+
+SITE = {
+    "_id": "site-1",
+    "url": "https://boards.greenhouse.io/example",
+    "type": "greenhouse",
+    "pattern": None,
+}
+JOB_URLS = [
+    "https://boards.greenhouse.io/example/jobs/4000001",
+    "https://boards.greenhouse.io/example/jobs/4000002",
+]
+SCRAPE_RESULT = {
+    "provider": "spidercloud",
+    "sourceUrl": SITE["url"],
+    "items": {"provider": "spidercloud", "normalized": [{"url": JOB_URLS[0], "title": "Engineer"}]},
+}
+URL_BATCH = {
+    "urls": [
+        {"_id": "url-1", "url": JOB_URLS[0], "sourceUrl": SITE["url"], "provider": "spidercloud"},
+        {"_id": "url-2", "url": JOB_URLS[1], "sourceUrl": SITE["url"], "provider": "spidercloud"},
+    ]
+}
+FIRECRAWL_STATUS_URL = "https://api.firecrawl.dev/v1/batch/scrape/fc-job-1"
+WEBHOOK_EVENT = {
+    "_id": "wh-1",
+    "jobId": "fc-job-1",
+    "event": "batch_scrape.completed",
+    "siteId": SITE["_id"],
+    "siteUrl": SITE["url"],
+    "metadata": {"siteId": SITE["_id"], "siteUrl": SITE["url"]},
+}
+
+
+def _site_scrape_scenario(workflow_type: str, scrape_activity: str) -> Scenario:
+    return Scenario(
+        workflow_type=workflow_type,
+        workflow_id=f"replay-{workflow_type}",
+        activities={
+            "lease_site": _returns(SITE, None),
+            scrape_activity: _returns(SCRAPE_RESULT),
+            "store_scrape": _returns("scrape-1"),
+        },
+    )
+
+
+SCENARIOS: List[Scenario] = [
+    _site_scrape_scenario("ScrapeWorkflow", "scrape_site"),
+    _site_scrape_scenario("ScraperFirecrawl", "scrape_site_firecrawl"),
+    _site_scrape_scenario("FetchfoxSpidercloud", "crawl_site_fetchfox"),
+    _site_scrape_scenario("ScraperSpidercloud", "scrape_site"),
+    Scenario(
+        workflow_type="SpidercloudJobDetails",
+        workflow_id="replay-SpidercloudJobDetails",
+        activities={
+            "lease_scrape_url_batch": _returns(URL_BATCH),
+            "process_spidercloud_job_batch": _returns(
+                {"scrapes": [dict(SCRAPE_RESULT, subUrls=[JOB_URLS[0]])], "stored": 1}
+            ),
+            "store_scrape": _returns("scrape-1"),
+        },
+    ),
+    Scenario(
+        workflow_type="SpidercloudJobDetailsDrainer",
+        workflow_id="replay-SpidercloudJobDetailsDrainer",
+        children={
+            "SpidercloudJobDetails": _returns(
+                {"site_count": 1, "scrape_ids": ["scrape-1"]},
+                {"site_count": 0, "scrape_ids": []},
+            ),
+        },
+        signals=[("urls_enqueued", [2])],
+        max_tasks=12,
+    ),
+    Scenario(
+        workflow_type="GreenhouseScraperWorkflow",
+        workflow_id="replay-GreenhouseScraperWorkflow",
+        activities={
+            "lease_site": _returns(SITE, None),
+            "fetch_greenhouse_listing": _returns(
+                {"job_urls": JOB_URLS, "fingerprint": "board-v1", "raw": "{}"}
+            ),
+            "filter_existing_job_urls": _returns([JOB_URLS[1]]),
+            "compute_urls_to_scrape": _returns(
+                {"urlsToScrape": [JOB_URLS[0]], "existingCount": 1, "totalCount": 2}
+            ),
+            "scrape_greenhouse_jobs": _returns({"jobsScraped": 1, "scrape": SCRAPE_RESULT}),
+            "store_scrape": _returns("scrape-1"),
+        },
+    ),
+    Scenario(
+        workflow_type="SiteLease",
+        workflow_id="replay-SiteLease",
+        activities={
+            "lease_site": _returns(SITE, None),
+            "start_firecrawl_webhook_scrape": _returns(
+                {"jobId": "fc-job-1", "statusUrl": FIRECRAWL_STATUS_URL}
+            ),
+        },
+    ),
+    Scenario(
+        workflow_type="ProcessWebhookScrape",
+        workflow_id="replay-ProcessWebhookScrape",
+        activities={
+            "fetch_pending_firecrawl_webhooks": _returns([WEBHOOK_EVENT], []),
+            "collect_firecrawl_job_result": _returns(
+                {"status": "completed", "scrape": SCRAPE_RESULT, "jobsScraped": 1}
+            ),
+            "store_scrape": _returns("scrape-1"),
+        },
+    ),
+    Scenario(
+        workflow_type="RecoverMissingFirecrawlWebhook",
+        workflow_id="replay-RecoverMissingFirecrawlWebhook",
+        args=[
+            {
+                "jobId": "fc-job-1",
+                "siteId": SITE["_id"],
+                "siteUrl": SITE["url"],
+                "statusUrl": FIRECRAWL_STATUS_URL,
+            }
+        ],
+        activities={
+            "get_firecrawl_webhook_status": _returns({"hasRealEvent": True}),
+        },
+    ),
+]
+
+
+class _RecordingRunner(WorkflowRunner):
+    """Delegate to a real runner and keep every activation/completion pair it produces."""
+
+    def __init__(self, inner: WorkflowRunner) -> None:
+        self._inner = inner
+        self.completions: List[Any] = []
+
+    def prepare_workflow(self, defn: Any) -> None:
+        self._inner.prepare_workflow(defn)
+
+    def set_worker_level_failure_exception_types(self, types: Sequence[type]) -> None:
+        self._inner.set_worker_level_failure_exception_types(types)
+
+    def create_instance(self, det: Any) -> WorkflowInstance:
+        return _RecordingInstance(self._inner.create_instance(det), self)
+
+
+class _RecordingInstance(WorkflowInstance):
+    def __init__(self, inner: WorkflowInstance, runner: _RecordingRunner) -> None:
+        self._inner = inner
+        self._runner = runner
+
+    def activate(self, act: Any) -> Any:
+        completion = self._inner.activate(act)
+        self._runner.completions.append((act, completion))
+        return completion
+
+    def get_thread_id(self) -> Optional[int]:
+        return self._inner.get_thread_id()
+
+
+class _HistoryRecorder:
+    """Builds a history the way the server would for one scripted execution."""
+
+    def __init__(self, scenario: Scenario) -> None:
+        self.scenario = scenario
+        self.converter = build_data_converter()
+        self.task_queue = settings.task_queue
+        self.run_id = str(uuid.uuid5(uuid.NAMESPACE_URL, scenario.workflow_id))
+        self.events: List[history_pb.HistoryEvent] = []
+        self.clock = STARTED_AT
+        self.wft_scheduled_id = 0
+        self.wft_started_id = 0
+        self.activities: Dict[int, tuple[int, str, List[Any]]] = {}
+        self.timers: Dict[int, tuple[int, Duration]] = {}
+        self.children: Dict[int, tuple[int, str, str]] = {}
+        self.started_children: Dict[int, int] = {}
+        self.signals = list(scenario.signals)
+        self.done = False
+
+    def _add(self, event_type: int, attr_field: str, attrs: Any) -> int:
+        event = history_pb.HistoryEvent(event_id=len(self.events) + 1, event_type=event_type)
+        event.event_time.FromDatetime(self.clock)
+        getattr(event, attr_field).CopyFrom(attrs)
+        self.events.append(event)
+        return event.event_id
+
+    async def _encode(self, payloads: Sequence[Payload]) -> Payloads:
+        codec = self.converter.payload_codec
+        encoded = await codec.encode(list(payloads)) if codec else list(payloads)
+        return Payloads(payloads=encoded)
+
+    async def _to_payloads(self, values: Sequence[Any]) -> Payloads:
+        return await self._encode(self.converter.payload_converter.to_payloads(list(values)))
+
+    def _tick(self, seconds: float = 1.0) -> None:
+        self.clock += timedelta(seconds=seconds)
+
+    def _schedule_workflow_task(self) -> None:
+        self.wft_scheduled_id = self._add(
+            EventType.EVENT_TYPE_WORKFLOW_TASK_SCHEDULED,
+            "workflow_task_scheduled_event_attributes",
+            history_pb.WorkflowTaskScheduledEventAttributes(
+                task_queue=TaskQueue(name=self.task_queue),
+                start_to_close_timeout=Duration(seconds=10),
+                attempt=1,
+            ),
+        )
+        self.wft_started_id = self._add(
+            EventType.EVENT_TYPE_WORKFLOW_TASK_STARTED,
+            "workflow_task_started_event_attributes",
+            history_pb.WorkflowTaskStartedEventAttributes(
+                scheduled_event_id=self.wft_scheduled_id,
+                identity="history-recorder",
+                request_id=f"wft-{self.wft_scheduled_id}",
+                history_size_bytes=sum(event.ByteSize() for event in self.events),
+            ),
+        )
+
+    async def start(self) -> None:
+        self._add(
+            EventType.EVENT_TYPE_WORKFLOW_EXECUTION_STARTED,
+            "workflow_execution_started_event_attributes",
+            history_pb.WorkflowExecutionStartedEventAttributes(
+                workflow_type=WorkflowType(name=self.scenario.workflow_type),
+                task_queue=TaskQueue(name=self.task_queue),
+                input=await self._to_payloads(self.scenario.args),
+                workflow_task_timeout=Duration(seconds=10),
+                original_execution_run_id=self.run_id,
+                first_execution_run_id=self.run_id,
+                identity="history-recorder",
+                attempt=1,
+            ),
+        )
+        self._schedule_workflow_task()
+
+    def history(self) -> WorkflowHistory:
+        return WorkflowHistory(self.scenario.workflow_id, list(self.events))
+
+    async def apply_commands(self, commands: Sequence[Any]) -> None:
+        self._tick()
+        completed_id = self._add(
+            EventType.EVENT_TYPE_WORKFLOW_TASK_COMPLETED,
+            "workflow_task_completed_event_attributes",
+            history_pb.WorkflowTaskCompletedEventAttributes(
+                scheduled_event_id=self.wft_scheduled_id,
+                started_event_id=self.wft_started_id,
+                identity="history-recorder",
+            ),
+        )
+        for command in commands:
+            await self._apply_command(command, completed_id)
+
+    async def _apply_command(self, command: Any, completed_id: int) -> None:
+        variant = command.WhichOneof("variant")
+        if variant == "schedule_activity":
+            cmd = command.schedule_activity
+            event_id = self._add(
+                EventType.EVENT_TYPE_ACTIVITY_TASK_SCHEDULED,
+                "activity_task_scheduled_event_attributes",
+                history_pb.ActivityTaskScheduledEventAttributes(
+                    activity_id=cmd.activity_id,
+                    activity_type=ActivityType(name=cmd.activity_type),
+                    task_queue=TaskQueue(name=self.task_queue),
+                    input=await self._encode(cmd.arguments),
+                    schedule_to_close_timeout=cmd.schedule_to_close_timeout,
+                    schedule_to_start_timeout=cmd.schedule_to_start_timeout,
+                    start_to_close_timeout=cmd.start_to_close_timeout,
+                    heartbeat_timeout=cmd.heartbeat_timeout,
+                    workflow_task_completed_event_id=completed_id,
+                    retry_policy=cmd.retry_policy,
+                ),
+            )
+            args = self.converter.payload_converter.from_payloads(list(cmd.arguments))
+            self.activities[cmd.seq] = (event_id, cmd.activity_type, args)
+        elif variant == "start_timer":
+            cmd = command.start_timer
+            event_id = self._add(
+                EventType.EVENT_TYPE_TIMER_STARTED,
+                "timer_started_event_attributes",
+                history_pb.TimerStartedEventAttributes(
+                    timer_id=str(cmd.seq),
+                    start_to_fire_timeout=cmd.start_to_fire_timeout,
+                    workflow_task_completed_event_id=completed_id,
+                ),
+            )
+            self.timers[cmd.seq] = (event_id, cmd.start_to_fire_timeout)
+        elif variant == "cancel_timer":
+            seq = command.cancel_timer.seq
+            started_id, _ = self.timers.pop(seq)
+            self._add(
+                EventType.EVENT_TYPE_TIMER_CANCELED,
+                "timer_canceled_event_attributes",
+                history_pb.TimerCanceledEventAttributes(
+                    timer_id=str(seq),
+                    started_event_id=started_id,
+                    workflow_task_completed_event_id=completed_id,
+                    identity="history-recorder",
+                ),
+            )
+        elif variant == "start_child_workflow_execution":
+            cmd = command.start_child_workflow_execution
+            event_id = self._add(
+                EventType.EVENT_TYPE_START_CHILD_WORKFLOW_EXECUTION_INITIATED,
+                "start_child_workflow_execution_initiated_event_attributes",
+                history_pb.StartChildWorkflowExecutionInitiatedEventAttributes(
+                    namespace=cmd.namespace,
+                    workflow_id=cmd.workflow_id,
+                    workflow_type=WorkflowType(name=cmd.workflow_type),
+                    task_queue=TaskQueue(name=cmd.task_queue or self.task_queue),
+                    input=await self._encode(cmd.input),
+                    parent_close_policy=cmd.parent_close_policy,
+                    workflow_task_completed_event_id=completed_id,
+                    workflow_id_reuse_policy=cmd.workflow_id_reuse_policy,
+                ),
+            )
+            self.children[cmd.seq] = (event_id, cmd.workflow_id, cmd.workflow_type)
+        elif variant == "set_patch_marker":
+            cmd = command.set_patch_marker
+            data = f'{{"id":"{cmd.patch_id}","deprecated":{str(cmd.deprecated).lower()}}}'
+            marker = history_pb.MarkerRecordedEventAttributes(
+                marker_name=PATCH_MARKER_NAME,
+                workflow_task_completed_event_id=completed_id,
+            )
+            payload = Payload(metadata={"encoding": b"json/plain"}, data=data.encode())
+            marker.details[PATCH_MARKER_DETAILS_KEY].CopyFrom(Payloads(payloads=[payload]))
+            self._add(
+                EventType.EVENT_TYPE_MARKER_RECORDED, "marker_recorded_event_attributes", marker
+            )
+        elif variant == "complete_workflow_execution":
+            result = command.complete_workflow_execution.result
+            self._add(
+                EventType.EVENT_TYPE_WORKFLOW_EXECUTION_COMPLETED,
+                "workflow_execution_completed_event_attributes",
+                history_pb.WorkflowExecutionCompletedEventAttributes(
+                    result=await self._encode([result] if result.ByteSize() else []),
+                    workflow_task_completed_event_id=completed_id,
+                ),
+            )
+            self.done = True
+        elif variant == "fail_workflow_execution":
+            self._add(
+                EventType.EVENT_TYPE_WORKFLOW_EXECUTION_FAILED,
+                "workflow_execution_failed_event_attributes",
+                history_pb.WorkflowExecutionFailedEventAttributes(
+                    failure=command.fail_workflow_execution.failure,
+                    workflow_task_completed_event_id=completed_id,
+                ),
+            )
+            self.done = True
+        elif variant == "continue_as_new_workflow_execution":
+            cmd = command.continue_as_new_workflow_execution
+            self._add(
+                EventType.EVENT_TYPE_WORKFLOW_EXECUTION_CONTINUED_AS_NEW,
+                "workflow_execution_continued_as_new_event_attributes",
+                history_pb.WorkflowExecutionContinuedAsNewEventAttributes(
+                    new_execution_run_id=f"{self.run_id[:-4]}next",
+                    workflow_type=WorkflowType(
+                        name=cmd.workflow_type or self.scenario.workflow_type
+                    ),
+                    task_queue=TaskQueue(name=cmd.task_queue or self.task_queue),
+                    input=await self._encode(cmd.arguments),
+                    workflow_task_completed_event_id=completed_id,
+                ),
+            )
+            self.done = True
+        else:
+            raise SystemExit(f"{self.scenario.workflow_type}: unsupported command {variant}")
+
+    async def resolve_pending(self) -> bool:
+        """Append the results the server would deliver next; False when nothing can happen."""
+
+        resolved = False
+        for seq in sorted(self.activities):
+            scheduled_id, name, args = self.activities.pop(seq)
+            self._tick()
+            started_id = self._add(
+                EventType.EVENT_TYPE_ACTIVITY_TASK_STARTED,
+                "activity_task_started_event_attributes",
+                history_pb.ActivityTaskStartedEventAttributes(
+                    scheduled_event_id=scheduled_id,
+                    identity="history-recorder",
+                    request_id=f"act-{scheduled_id}",
+                    attempt=1,
+                ),
+            )
+            handler = self.scenario.activities.get(name)
+            result = handler(args) if handler else None
+            self._add(
+                EventType.EVENT_TYPE_ACTIVITY_TASK_COMPLETED,
+                "activity_task_completed_event_attributes",
+                history_pb.ActivityTaskCompletedEventAttributes(
+                    result=await self._to_payloads([result]),
+                    scheduled_event_id=scheduled_id,
+                    started_event_id=started_id,
+                    identity="history-recorder",
+                ),
+            )
+            resolved = True
+        for seq in sorted(self.children):
+            initiated_id, workflow_id, workflow_type = self.children[seq]
+            execution = WorkflowExecution(
+                workflow_id=workflow_id, run_id=f"child-run-{initiated_id}"
+            )
+            if seq not in self.started_children:
+                self._tick()
+                self.started_children[seq] = self._add(
+                    EventType.EVENT_TYPE_CHILD_WORKFLOW_EXECUTION_STARTED,
+                    "child_workflow_execution_started_event_attributes",
+                    history_pb.ChildWorkflowExecutionStartedEventAttributes(
+                        initiated_event_id=initiated_id,
+                        workflow_execution=execution,
+                        workflow_type=WorkflowType(name=workflow_type),
+                    ),
+                )
+                resolved = True
+            handler = self.scenario.children.get(workflow_type)
+            if handler is None:
+                continue
+            del self.children[seq]
+            self._add(
+                EventType.EVENT_TYPE_CHILD_WORKFLOW_EXECUTION_COMPLETED,
+                "child_workflow_execution_completed_event_attributes",
+                history_pb.ChildWorkflowExecutionCompletedEventAttributes(
+                    result=await self._to_payloads([handler([])]),
+                    workflow_execution=execution,
+                    workflow_type=WorkflowType(name=workflow_type),
+                    initiated_event_id=initiated_id,
+                    started_event_id=self.started_children.pop(seq),
+                ),
+            )
+        if resolved:
+            return True
+        if self.timers and self.signals:
+            name, args = self.signals.pop(0)
+            self._tick()
+            self._add(
+                EventType.EVENT_TYPE_WORKFLOW_EXECUTION_SIGNALED,
+                "workflow_execution_signaled_event_attributes",
+                history_pb.WorkflowExecutionSignaledEventAttributes(
+                    signal_name=name,
+                    input=await self._to_payloads(args),
+                    identity="history-recorder",
+                ),
+            )
+            return True
+        if self.timers:
+            seq = min(self.timers, key=lambda key: self.timers[key][1].ToTimedelta())
+            started_id, duration = self.timers.pop(seq)
+            self._tick(duration.ToTimedelta().total_seconds())
+            self._add(
+                EventType.EVENT_TYPE_TIMER_FIRED,
+                "timer_fired_event_attributes",
+                history_pb.TimerFiredEventAttributes(
+                    timer_id=str(seq), started_event_id=started_id
+                ),
+            )
+            return True
+        return False
+
+
+async def record(scenario: Scenario) -> WorkflowHistory:
+    recorder = _HistoryRecorder(scenario)
+    await recorder.start()
+    runner = _RecordingRunner(build_workflow_runner())
+    replayer = Replayer(
+        workflows=WORKFLOW_CLASSES,
+        workflow_runner=runner,
+        data_converter=recorder.converter,
+    )
+    for _ in range(scenario.max_tasks):
+        runner.completions.clear()
+        result = await replayer.replay_workflow(recorder.history(), raise_on_replay_failure=False)
+        if result.replay_failure:
+            raise SystemExit(f"{scenario.workflow_type}: replay failed: {result.replay_failure}")
+        commands = []
+        for act, completion in runner.completions:
+            if act.is_replaying:
+                continue
+            if completion.HasField("failed"):
+                raise SystemExit(
+                    f"{scenario.workflow_type}: workflow task failed: {completion.failed}"
+                )
+            commands.extend(completion.successful.commands)
+        await recorder.apply_commands(commands)
+        if recorder.done or not await recorder.resolve_pending():
+            break
+        recorder._schedule_workflow_task()
+
+    history = recorder.history()
+    result = await replayer.replay_workflow(history, raise_on_replay_failure=False)
+    if result.replay_failure:
+        raise SystemExit(
+            f"{scenario.workflow_type}: recorded history does not replay: {result.replay_failure}"
+        )
+    return history
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--out-dir", type=Path, default=DEFAULT_HISTORIES_DIR)
+    parser.add_argument(
+        "--only", nargs="+", metavar="WORKFLOW_TYPE", help="Record just these workflow types"
+    )
+    args = parser.parse_args()
+
+    scenarios = [s for s in SCENARIOS if not args.only or s.workflow_type in args.only]
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    for scenario in scenarios:
+        history = await record(scenario)
+        path = args.out_dir / f"{scenario.workflow_id}.json"
+        path.write_text(history.to_json(), encoding="utf-8")
+        print(f"wrote {path} events={len(history.events)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -12,6 +12,7 @@ from spider import AsyncSpider
 
 sys.path.insert(0, os.path.abspath("."))
 
+from job_scrape_application.workflows.helpers.host_limiter import split_host_limits
 from job_scrape_application.workflows.site_handlers import AvatureHandler
 
 AVATURE_BLOOMBERG_URL = (
@@ -114,7 +115,7 @@ async def _fetch_html(client: AsyncSpider, url: str) -> tuple[str, List[str]]:
         "preserve_host": True,
         "limit": 1,
     }
-    params.update(handler.get_spidercloud_config(url))
+    params.update(split_host_limits(handler.get_spidercloud_config(url))[0])
     response = await _collect_response(
         client.scrape_url(
             url,
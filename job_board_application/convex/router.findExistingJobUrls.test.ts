@@ -2,7 +2,7 @@ import { describe, expect, it } from "vitest";
 import { findExistingJobUrls } from "./router";
 import { getHandler } from "./__tests__/getHandler";
 
-type JobRow = { url: string };
+type JobRow = { url: string; sourceUpdatedAt?: number; scrapedAt?: number };
 
 class FakeJobsQuery {
   private filterUrl: string | undefined;
@@ -50,4 +50,29 @@ describe("findExistingJobUrls", () => {
 
     expect(res).toEqual({ existing: ["https://example.com/jobs/2"] });
   });
+
+  it("reports existing jobs whose listing updated_at is newer than the stored watermark", async () => {
+    const jobs: JobRow[] = [
+      { url: "https://example.com/jobs/1", sourceUpdatedAt: 2_000 },
+      { url: "https://example.com/jobs/2", sourceUpdatedAt: 2_000 },
+      { url: "https://example.com/jobs/3", scrapedAt: 5_000 },
+    ];
+    const ctx: any = { db: new FakeDb(jobs) };
+    const handler = getHandler(findExistingJobUrls);
+
+    const res = await handler(ctx, {
+      urls: [
+        "https://example.com/jobs/1",
+        "https://example.com/jobs/2",
+        "https://example.com/jobs/3",
+        "https://example.com/jobs/4",
+      ],
+      updatedAts: [3_000, 2_000, 4_000, 9_000],
+    });
+
+    expect(res).toEqual({
+      existing: ["https://example.com/jobs/1", "https://example.com/jobs/2", "https://example.com/jobs/3"],
+      changed: ["https://example.com/jobs/1"],
+    });
+  });
 });
@@ -23,6 +23,19 @@ class FakeDb {
         },
       };
     }
+    if (table === "job_details") {
+      const details = this.jobDetails;
+      return {
+        withIndex(_name: string, cb: (q: any) => any) {
+          const jobId = cb({ eq: (_field: string, value: string) => value });
+          return {
+            first() {
+              return details.find((row) => row.jobId === jobId) ?? null;
+            },
+          };
+        },
+      };
+    }
     if (table === "domain_aliases") {
       const aliases = this.domainAliases;
       return {
@@ -52,6 +65,17 @@ class FakeDb {
     }
     throw new Error(`Unsupported insert table ${table}`);
   }
+
+  patch(id: string, fields: any) {
+    const job = this.jobs.get(id);
+    if (job) {
+      Object.assign(job, fields);
+      return;
+    }
+    const detail = this.jobDetails.find((row) => row._id === id);
+    if (!detail) throw new Error(`Unknown id ${id}`);
+    Object.assign(detail, fields);
+  }
 }
 
 describe("ingestJobsFromScrape", () => {
@@ -81,4 +105,49 @@ describe("ingestJobsFromScrape", () => {
     expect(job?.company).toBe("Notion");
     expect(job?.companyKey).toBe("notion");
   });
+
+  it("patches existing rows in place only when the listing updated_at is newer", async () => {
+    const ctx: any = { db: new FakeDb() };
+    const handler = getHandler(ingestJobsFromScrape);
+    const url = "https://boards.greenhouse.io/acme/jobs/123";
+    const baseJob = {
+      title: "Software Engineer",
+      company: "Acme",
+      description: "Original details",
+      location: "Remote",
+      remote: true,
+      level: "mid" as const,
+      totalCompensation: 0,
+      url,
+      postedAt: 1_000,
+      postedAtUnknown: false,
+      sourceUpdatedAt: 2_000,
+    };
+
+    expect(await handler(ctx, { jobs: [baseJob] })).toEqual({ inserted: 1, updated: 0 });
+    expect(
+      await handler(ctx, { jobs: [{ ...baseJob, description: "Stale copy", sourceUpdatedAt: 2_000 }] })
+    ).toEqual({ inserted: 0, updated: 0 });
+    expect(
+      await handler(ctx, {
+        jobs: [
+          {
+            ...baseJob,
+            description: "Now with salary",
+            totalCompensation: 200_000,
+            postedAt: 3_000,
+            sourceUpdatedAt: 3_000,
+          },
+        ],
+      })
+    ).toEqual({ inserted: 0, updated: 1 });
+
+    const jobs = Array.from(ctx.db.jobs.values()) as any[];
+    expect(jobs).toHaveLength(1);
+    expect(jobs[0].totalCompensation).toBe(200_000);
+    expect(jobs[0].sourceUpdatedAt).toBe(3_000);
+    expect(jobs[0].postedAt).toBe(1_000);
+    expect(ctx.db.jobDetails).toHaveLength(1);
+    expect(ctx.db.jobDetails[0].description).toBe("Now with salary");
+  });
 });
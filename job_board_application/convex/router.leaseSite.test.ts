@@ -256,4 +256,28 @@ describe("leaseSite", () => {
     expect(leased).toBeNull();
     expect(patches).toHaveLength(0);
   });
+
+  it("records the listing fingerprint only when completeSite receives one", async () => {
+    const now = new Date("2024-01-01T12:00:00Z");
+    vi.useFakeTimers();
+    vi.setSystemTime(now);
+
+    const patches: Array<{ id: string; updates: Record<string, any> }> = [];
+    const ctx: any = {
+      db: {
+        patch: async (id: string, updates: Record<string, any>) => {
+          patches.push({ id, updates });
+        },
+      },
+    };
+    const completeHandler = getHandler(completeSite);
+
+    await completeHandler(ctx, { id: "site-gh", listingFingerprint: "fp-1" });
+    await completeHandler(ctx, { id: "site-gh" });
+
+    expect(patches[0].updates.listingFingerprint).toBe("fp-1");
+    expect(patches[0].updates.listingFingerprintAt).toBe(now.getTime());
+    expect(patches[1].updates).not.toHaveProperty("listingFingerprint");
+    expect(patches[1].updates).not.toHaveProperty("listingFingerprintAt");
+  });
 });
@@ -356,6 +356,52 @@ describe("leaseScrapeUrlBatch", () => {
     ]);
   });
 
+  it("spreads leases across hosts and caps rows per host when maxPerHost is set", async () => {
+    const now = Date.now();
+    const workdayRows: QueueRow[] = Array.from({ length: 5 }, (_, idx) => ({
+      _id: `wd-${idx + 1}`,
+      url: `https://acme.wd1.myworkdayjobs.com/en-US/Careers/job/${idx + 1}`,
+      status: "pending",
+      updatedAt: now - 1_000,
+      createdAt: now - 10_000 + idx,
+      scheduledAt: now - 1_000,
+      provider: "spidercloud",
+      attempts: 0,
+      siteId: "site-workday",
+    }));
+    const greenhouseRows: QueueRow[] = Array.from({ length: 2 }, (_, idx) => ({
+      _id: `gh-${idx + 1}`,
+      url: `https://boards-api.greenhouse.io/v1/boards/acme/jobs/${idx + 1}`,
+      status: "pending",
+      updatedAt: now - 1_000,
+      createdAt: now - 5_000 + idx,
+      scheduledAt: now - 1_000,
+      provider: "spidercloud",
+      attempts: 0,
+      siteId: "site-greenhouse",
+    }));
+    const rows = [...workdayRows, ...greenhouseRows];
+    const db = new FakeDb(rows);
+    const ctx: any = { db };
+    const handler = getHandler(leaseScrapeUrlBatch);
+
+    const res = await handler(ctx, {
+      provider: "spidercloud",
+      limit: 5,
+      processingExpiryMs: 15 * 60 * 1000,
+      maxPerHost: 2,
+    });
+
+    const hosts = res.urls.map((u: any) => new URL(u.url).hostname);
+    expect(hosts).toEqual([
+      "acme.wd1.myworkdayjobs.com",
+      "boards-api.greenhouse.io",
+      "acme.wd1.myworkdayjobs.com",
+      "boards-api.greenhouse.io",
+    ]);
+    expect(rows.filter((r) => r.status === "pending").length).toBe(3);
+  });
+
   it("skips active processing rows to prevent double-leasing", async () => {
     const now = Date.now();
     const rows: QueueRow[] = [
@@ -1475,6 +1475,8 @@ export const leaseSite = mutation({
       failed: (s as any).failed,
       failCount: (s as any).failCount,
       manualTriggerAt: (s as any).manualTriggerAt,
+      listingFingerprint: (s as any).listingFingerprint,
+      listingFingerprintAt: (s as any).listingFingerprintAt,
     };
   },
 });
@@ -1626,7 +1628,7 @@ export const clearIgnoredJobsForSource = mutation({
 
 // Mark a leased site as completed and clear its lock.
 export const completeSite = mutation({
-  args: { id: v.id("sites") },
+  args: { id: v.id("sites"), listingFingerprint: v.optional(v.string()) },
   handler: async (ctx, args) => {
     const now = Date.now();
     await ctx.db.patch(args.id, {
@@ -1636,6 +1638,10 @@ export const completeSite = mutation({
       lastRunAt: now,
       // One-off manual triggers should not keep re-leasing after a successful run.
       manualTriggerAt: 0,
+      // Only full listing runs record a fingerprint; unchanged runs keep the previous one and its age.
+      ...(args.listingFingerprint
+        ? { listingFingerprint: args.listingFingerprint, listingFingerprintAt: now }
+        : {}),
     });
     return { success: true };
   },
@@ -1891,9 +1897,16 @@ const leaseScrapeUrlBatchHandler = async (
     limit?: number;
     processingExpiryMs?: number;
     workerId?: string;
+    maxPerHost?: number;
   }
 ) => {
   const limit = Math.max(1, Math.min(args.limit ?? 50, 200));
+  // When set, round-robin across hosts and cap how many rows a single host contributes.
+  const maxPerHost =
+    typeof args.maxPerHost === "number" && args.maxPerHost > 0
+      ? Math.max(1, Math.floor(args.maxPerHost))
+      : undefined;
+  const candidateLimit = maxPerHost ? limit * 6 : limit * 3;
   const now = Date.now();
   const processingExpiryMs = Math.max(60_000, Math.min(args.processingExpiryMs ?? 5 * 60_000, 24 * 60 * 60_000));
   const aliasCache = new Map<string, string | null>();
@@ -1932,7 +1945,7 @@ const leaseScrapeUrlBatchHandler = async (
     .withIndex("by_status_and_scheduled_at", (q: any) =>
       q.eq("status", "pending").lte("scheduledAt", now)
     );
-  let rows = await baseQuery.order("asc").take(limit * 3);
+  let rows = await baseQuery.order("asc").take(candidateLimit);
   rows = rows.slice().sort((a: any, b: any) => {
     const attemptsA = a.attempts ?? 0;
     const attemptsB = b.attempts ?? 0;
@@ -1957,7 +1970,7 @@ const leaseScrapeUrlBatchHandler = async (
       if ((missingScheduled || missingAttempts) && !seenIds.has(row._id)) {
         rows.push(row);
       }
-      if (rows.length >= limit * 3) break;
+      if (rows.length >= candidateLimit) break;
     }
   }
   const siteKeyForRow = (row: any) => {
@@ -2012,8 +2025,32 @@ const leaseScrapeUrlBatchHandler = async (
     }
   }
 
+  const hostForRow = (row: any) => normalizeDomain(row.url) || `row:${row._id}`;
+  let bucketKeys = Array.from(buckets.keys());
+  if (maxPerHost) {
+    // Interleave source buckets by host so consecutive picks land on different hosts.
+    const keysByHost = new Map<string, string[]>();
+    for (const key of bucketKeys) {
+      const host = hostForRow(buckets.get(key)![0]);
+      const hostKeys = keysByHost.get(host);
+      if (hostKeys) {
+        hostKeys.push(key);
+      } else {
+        keysByHost.set(host, [key]);
+      }
+    }
+    const hostGroups = Array.from(keysByHost.values());
+    const interleaved: string[] = [];
+    for (let i = 0; interleaved.length < bucketKeys.length; i += 1) {
+      for (const group of hostGroups) {
+        if (i < group.length) interleaved.push(group[i]);
+      }
+    }
+    bucketKeys = interleaved;
+  }
+
   const picked: any[] = [];
-  const bucketKeys = Array.from(buckets.keys());
+  const hostCounts = new Map<string, number>();
   let madeProgress = true;
   while (picked.length < limit && madeProgress) {
     madeProgress = false;
@@ -2023,6 +2060,13 @@ const leaseScrapeUrlBatchHandler = async (
       if (!bucket || bucket.length === 0) continue;
       while (bucket.length > 0) {
         const row = bucket.shift();
+        if (maxPerHost) {
+          const host = hostForRow(row);
+          const count = hostCounts.get(host) ?? 0;
+          // Leave rows for saturated hosts pending for a later batch.
+          if (count >= maxPerHost) continue;
+          hostCounts.set(host, count + 1);
+        }
         picked.push(row);
         madeProgress = true;
         break; // one per bucket per pass
@@ -2063,6 +2107,7 @@ export const leaseScrapeUrlBatch = Object.assign(
       limit: v.optional(v.number()),
       processingExpiryMs: v.optional(v.number()),
       workerId: v.optional(v.string()),
+      maxPerHost: v.optional(v.number()),
     },
     handler: leaseScrapeUrlBatchHandler,
   }),
@@ -2893,7 +2938,10 @@ http.route({
   method: "POST",
   handler: httpAction(async (ctx, request) => {
     const body = await request.json();
-    const res = await ctx.runMutation(api.router.completeSite, { id: body.id });
+    const res = await ctx.runMutation(api.router.completeSite, {
+      id: body.id,
+      listingFingerprint: typeof body.listingFingerprint === "string" ? body.listingFingerprint : undefined,
+    });
     return new Response(JSON.stringify(res), {
       status: 200,
       headers: { "Content-Type": "application/json" },
@@ -3373,42 +3421,64 @@ export const insertJobRecord = mutation({
   },
 });
 
+// Per-job freshness watermark: the listing updated_at recorded at ingest, falling back to
+// the scrape time for rows ingested before watermarks were stored.
+const jobSourceWatermark = (job: any): number => {
+  if (typeof job?.sourceUpdatedAt === "number") return job.sourceUpdatedAt;
+  if (typeof job?.scrapedAt === "number") return job.scrapedAt;
+  return typeof job?._creationTime === "number" ? job._creationTime : 0;
+};
+
 export const findExistingJobUrls = query({
   args: {
     urls: v.array(v.string()),
+    // Optional listing updated_at values (ms) aligned with `urls`. Existing jobs whose
+    // watermark is older are also reported in `changed` so callers can rescrape them.
+    updatedAts: v.optional(v.array(v.union(v.number(), v.null()))),
   },
-  returns: v.object({ existing: v.array(v.string()) }),
+  returns: v.object({ existing: v.array(v.string()), changed: v.optional(v.array(v.string())) }),
   handler: async (ctx, args) => {
     const existing: string[] = [];
+    const changed: string[] = [];
     const unique = Array.from(new Set(args.urls));
-    const cachedMatches = new Map<string, boolean>();
+    const cachedMatches = new Map<string, any | null>();
+    const updatedAtByUrl = new Map<string, number>();
+    if (args.updatedAts) {
+      args.urls.forEach((url, idx) => {
+        const value = args.updatedAts?.[idx];
+        if (typeof value !== "number") return;
+        updatedAtByUrl.set(url, Math.max(value, updatedAtByUrl.get(url) ?? value));
+      });
+    }
 
     for (const url of unique) {
       const candidates = buildJobUrlCandidates(url);
-      let found = false;
+      let found: any | null = null;
       for (const candidate of candidates) {
         if (cachedMatches.has(candidate)) {
-          if (cachedMatches.get(candidate)) {
-            found = true;
-            break;
-          }
+          found = cachedMatches.get(candidate) ?? null;
+          if (found) break;
           continue;
         }
         const dup = await ctx.db
           .query("jobs")
           .withIndex("by_url", (q: any) => q.eq("url", candidate))
           .first();
-        const exists = Boolean(dup);
-        cachedMatches.set(candidate, exists);
-        if (exists) {
-          found = true;
+        cachedMatches.set(candidate, dup ?? null);
+        if (dup) {
+          found = dup;
           break;
         }
       }
-      if (found) existing.push(url);
+      if (!found) continue;
+      existing.push(url);
+      const updatedAt = updatedAtByUrl.get(url);
+      if (updatedAt !== undefined && updatedAt > jobSourceWatermark(found)) {
+        changed.push(url);
+      }
     }
 
-    return { existing };
+    return args.updatedAts ? { existing, changed } : { existing };
   },
 });
 
@@ -4315,6 +4385,7 @@ export const ingestJobsFromScrape = mutation({
         heuristicLastTried: v.optional(v.number()),
         heuristicVersion: v.optional(v.number()),
         scrapeUrl: v.optional(v.string()),
+        sourceUpdatedAt: v.optional(v.number()),
       })
     ),
     siteId: v.optional(v.id("sites")),
@@ -4334,6 +4405,7 @@ export const ingestJobsFromScrape = mutation({
     const aliasCache = new Map<string, string | null>();
 
     let inserted = 0;
+    let updated = 0;
     for (const job of args.jobs) {
       if (sourceUrlForSeen) {
         await recordSeenJobUrl(ctx, sourceUrlForSeen, job.url);
@@ -4342,7 +4414,10 @@ export const ingestJobsFromScrape = mutation({
         .query("jobs")
         .withIndex("by_url", (q) => q.eq("url", job.url))
         .first();
-      if (dup) continue;
+      // Existing rows are only rewritten when the listing reports a newer updated_at.
+      if (dup && !(typeof job.sourceUpdatedAt === "number" && job.sourceUpdatedAt > jobSourceWatermark(dup))) {
+        continue;
+      }
 
       const locationSeed = job.locations ?? [job.location];
       const locationInfo = deriveLocationFields({ locations: locationSeed, location: job.location });
@@ -4377,7 +4452,7 @@ export const ingestJobsFromScrape = mutation({
         ...jobFields
       } = job;
       const engineer = typeof jobEngineer === "boolean" ? jobEngineer : deriveEngineerFlag(job.title);
-      const jobId = await ctx.db.insert("jobs", {
+      const jobRow = {
         ...jobFields,
         engineer,
         company: resolvedCompany,
@@ -4394,8 +4469,8 @@ export const ingestJobsFromScrape = mutation({
         compensationUnknown,
         compensationReason,
         postedAtUnknown: job.postedAtUnknown,
-      });
-      const detailRow: any = { jobId };
+      };
+      const detailRow: any = {};
       if (description !== undefined) detailRow.description = description;
       if (metadata !== undefined) detailRow.metadata = metadata;
       if (scrapeUrl !== undefined) detailRow.scrapeUrl = scrapeUrl;
@@ -4405,10 +4480,29 @@ export const ingestJobsFromScrape = mutation({
       if (heuristicAttempts !== undefined) detailRow.heuristicAttempts = heuristicAttempts;
       if (heuristicLastTried !== undefined) detailRow.heuristicLastTried = heuristicLastTried;
       if (heuristicVersion !== undefined) detailRow.heuristicVersion = heuristicVersion;
-      await ctx.db.insert("job_details", detailRow);
+
+      if (dup) {
+        // Keep the original posting date; an edited posting is not a new one.
+        const { postedAt: _postedAt, postedAtUnknown: _postedAtUnknown, ...changedFields } = jobRow;
+        await ctx.db.patch(dup._id, changedFields);
+        const existingDetail = await ctx.db
+          .query("job_details")
+          .withIndex("by_job", (q: any) => q.eq("jobId", dup._id))
+          .first();
+        if (existingDetail) {
+          await ctx.db.patch(existingDetail._id, detailRow);
+        } else {
+          await ctx.db.insert("job_details", { jobId: dup._id, ...detailRow });
+        }
+        updated += 1;
+        continue;
+      }
+
+      const jobId = await ctx.db.insert("jobs", jobRow);
+      await ctx.db.insert("job_details", { jobId, ...detailRow });
       inserted += 1;
     }
-    return { inserted };
+    return { inserted, updated };
   },
 });
 
@@ -33,6 +33,9 @@ const applicationTables = {
     postedAt: v.number(),
     postedAtUnknown: v.optional(v.boolean()),
     scrapedAt: v.optional(v.number()),
+    // Source-side updated_at (ms) from the listing that produced this row; rows whose
+    // listing reports a newer value are rescraped and patched in place.
+    sourceUpdatedAt: v.optional(v.number()),
     // Optional flag to identify internal/test rows not meant for UI
     test: v.optional(v.boolean()),
   })
@@ -187,6 +190,9 @@ const applicationTables = {
     lastFailureAt: v.optional(v.number()),
     lastError: v.optional(v.string()),
     manualTriggerAt: v.optional(v.number()),
+    // Hash of the listing's job ids + updated_at from the last full run; unchanged listings skip the diff
+    listingFingerprint: v.optional(v.string()),
+    listingFingerprintAt: v.optional(v.number()),
   })
     .index("by_enabled", ["enabled"])
     .index("by_schedule", ["scheduleId"]),
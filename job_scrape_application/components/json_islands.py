@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Keys that mark a listing payload; used both as a cheap substring prefilter and by
+# ``find_jobs_payload`` once a span decodes.
+JOBS_PAYLOAD_KEYS = ("jobs", "positions")
+JOBS_PAYLOAD_MARKERS = tuple(f'"{key}"' for key in JOBS_PAYLOAD_KEYS)
+
+_DECODER = json.JSONDecoder()
+_CLOSERS = {"}": "{", "]": "["}
+_STRUCTURAL_PATTERN = re.compile(r'[{}\[\]"\\\n]')
+
+
+def _iter_bracket_spans(text: str) -> Iterator[List[Tuple[int, int]]]:
+    """Yield balanced ``{}``/``[]`` spans in one pass, grouped per top-level region.
+
+    Each group is sorted by start offset, so an enclosing span precedes the spans nested
+    inside it. Double-quoted strings (with backslash escapes) are skipped while inside a
+    bracket; a raw newline ends a string early, since valid JSON never contains one. A
+    mismatched closer unwinds to its nearest matching opener, dropping the unmatched ones.
+    The regex jumps between structural characters so plain text is skipped in C.
+    """
+
+    stack: List[Tuple[str, int]] = []
+    group: List[Tuple[int, int]] = []
+    in_string = False
+    skip_to = 0
+    for match in _STRUCTURAL_PATTERN.finditer(text):
+        idx = match.start()
+        if idx < skip_to:
+            continue
+        char = match.group()
+        if in_string:
+            if char == "\\":
+                skip_to = idx + 2
+            elif char == '"' or char == "\n":
+                in_string = False
+            continue
+        if char == "{" or char == "[":
+            stack.append((char, idx))
+        elif char in _CLOSERS:
+            opener = _CLOSERS[char]
+            depth = len(stack) - 1
+            while depth >= 0 and stack[depth][0] != opener:
+                depth -= 1
+            if depth < 0:
+                continue
+            start = stack[depth][1]
+            del stack[depth:]
+            group.append((start, idx + 1))
+            if not stack:
+                group.sort()
+                yield group
+                group = []
+        elif char == '"' and stack:
+            in_string = True
+    if group:
+        group.sort()
+        yield group
+
+
+def iter_json_islands(text: str, *, require: Optional[Sequence[str]] = None) -> Iterator[Any]:
+    """Yield JSON objects/arrays embedded in ``text`` (HTML, markdown, script bodies).
+
+    Spans are decoded outermost-first with ``raw_decode(text, idx)`` so nothing is sliced;
+    spans inside an island that already decoded are skipped. With ``require``, spans that
+    contain none of the given substrings are skipped without decoding. Work is linear in
+    ``len(text)`` for the scan plus the length of each attempted span.
+    """
+
+    if not isinstance(text, str) or not text:
+        return
+    if require and not any(marker in text for marker in require):
+        return
+    for group in _iter_bracket_spans(text):
+        covered_until = -1
+        for start, end in group:
+            if start < covered_until:
+                continue
+            if require and not any(text.find(marker, start, end) >= 0 for marker in require):
+                continue
+            try:
+                value, decoded_end = _DECODER.raw_decode(text, start)
+            except json.JSONDecodeError:
+                continue
+            covered_until = decoded_end
+            yield value
+
+
+def find_jobs_payload(node: Any) -> Optional[Dict[str, Any]]:
+    """Return the first mapping (depth-first) whose ``jobs`` or ``positions`` value is a list."""
+
+    if isinstance(node, dict):
+        for key in JOBS_PAYLOAD_KEYS:
+            if isinstance(node.get(key), list):
+                return node
+        for child in node.values():
+            found = find_jobs_payload(child)
+            if found is not None:
+                return found
+    elif isinstance(node, list):
+        for child in node:
+            found = find_jobs_payload(child)
+            if found is not None:
+                return found
+    return None
+
+
+def extract_jobs_payload(text: str) -> Optional[Dict[str, Any]]:
+    """Return the first embedded JSON island that carries a ``jobs``/``positions`` list."""
+
+    for value in iter_json_islands(text, require=JOBS_PAYLOAD_MARKERS):
+        found = find_jobs_payload(value)
+        if found is not None:
+            return found
+    return None
+
+
+__all__ = [
+    "JOBS_PAYLOAD_KEYS",
+    "JOBS_PAYLOAD_MARKERS",
+    "extract_jobs_payload",
+    "find_jobs_payload",
+    "iter_json_islands",
+]
@@ -4,6 +4,7 @@ import socket
 import os
 from temporalio.client import Client
 from ...config import settings
+from ...workflows.payload_codec import build_data_converter
 
 async def main():
     if not settings.convex_http_url:
@@ -21,6 +22,7 @@ async def main():
     client = await Client.connect(
         settings.temporal_address,
         namespace=settings.temporal_namespace,
+        data_converter=build_data_converter(),
     )
     print("Connected. Starting monitor loop...")
 
@@ -15,6 +15,7 @@ from temporalio.client import (
 )
 from temporalio.worker import Worker
 
+from ...workflows.payload_codec import build_data_converter
 from .temporal_health_check import TestActivities, normalize_convex_base
 from .test_workflow import ScrapeWorkflowTest
 
@@ -34,7 +35,11 @@ async def main() -> None:
     client: Client | None = None
     for attempt in range(30):
         try:
-            client = await Client.connect(temporal_address, namespace=temporal_namespace)
+            client = await Client.connect(
+                temporal_address,
+                namespace=temporal_namespace,
+                data_converter=build_data_converter(),
+            )
             break
         except Exception:
             if attempt == 29:
@@ -2,10 +2,14 @@
 
 from .fetchfox import FetchFoxPriority, FetchFoxScrapeRequest, MAX_FETCHFOX_VISITS
 from .greenhouse import (
+    GreenhouseBoard,
     GreenhouseBoardResponse,
+    GreenhouseBoardSummary,
     GreenhouseJob,
     GreenhouseJobLocation,
+    GreenhouseJobSummary,
     extract_greenhouse_job_urls,
+    greenhouse_board_fingerprint,
     load_greenhouse_board,
 )
 
@@ -13,9 +17,13 @@ __all__ = [
     "FetchFoxPriority",
     "FetchFoxScrapeRequest",
     "MAX_FETCHFOX_VISITS",
+    "GreenhouseBoard",
     "GreenhouseBoardResponse",
+    "GreenhouseBoardSummary",
     "GreenhouseJob",
     "GreenhouseJobLocation",
+    "GreenhouseJobSummary",
     "extract_greenhouse_job_urls",
+    "greenhouse_board_fingerprint",
     "load_greenhouse_board",
 ]
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import hashlib
 import html
 import json
 import re
-from typing import Any, Iterable, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from ...constants import title_matches_required_keywords
+from ..json_islands import extract_jobs_payload, find_jobs_payload
 
 
 class GreenhouseJobLocation(BaseModel):
@@ -36,44 +39,47 @@ class GreenhouseBoardResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True, extra="allow")
 
 
-_PRE_TAG_PATTERN = re.compile(r"<pre[^>]*>(.*?)</pre>", flags=re.IGNORECASE | re.DOTALL)
-_INVALID_JSON_ESCAPE_PATTERN = re.compile(r"\\(?![\"\\/bfnrtu])")
+# Timestamp spellings the posted-at extractors read from ``model_extra``.
+_EXTRA_TIMESTAMP_KEYS = ("updatedAt", "firstPublished", "created_at", "createdAt")
 
 
-def _find_jobs_payload(node: Any) -> Optional[dict[str, Any]]:
-    if isinstance(node, dict):
-        jobs = node.get("jobs")
-        if isinstance(jobs, list):
-            return node
-        positions = node.get("positions")
-        if isinstance(positions, list):
-            return node
-        for child in node.values():
-            found = _find_jobs_payload(child)
-            if found is not None:
-                return found
-    elif isinstance(node, list):
-        for child in node:
-            found = _find_jobs_payload(child)
-            if found is not None:
-                return found
-    return None
+@dataclass(slots=True)
+class GreenhouseJobSummary:
+    """Projection of a board job onto the fields listing extraction reads.
 
+    Mirrors the ``GreenhouseJob`` attributes used downstream (including ``model_extra``
+    for alternate timestamp keys) without validating or copying the rest of the job.
+    """
 
-def _scan_json_candidates(text: str) -> Iterable[Any]:
-    decoder = json.JSONDecoder()
-    for match in re.finditer(r"[{[]", text):
-        idx = match.start()
-        try:
-            parsed, _ = decoder.raw_decode(text[idx:])
-        except json.JSONDecodeError:
-            continue
-        if isinstance(parsed, str):
-            try:
-                parsed = json.loads(parsed)
-            except Exception:
-                pass
-        yield parsed
+    id: int
+    absolute_url: str
+    title: Optional[str] = None
+    updated_at: Optional[str] = None
+    first_published: Optional[str] = None
+    model_extra: Dict[str, Any] = field(default_factory=dict)
+    _raw: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    def to_model(self) -> GreenhouseJob:
+        """Validate the full job on demand."""
+
+        return GreenhouseJob.model_validate(self._raw)
+
+
+@dataclass(slots=True)
+class GreenhouseBoardSummary:
+    """Lean board decoded by ``load_greenhouse_board(..., lean=True)``."""
+
+    jobs: List[GreenhouseJobSummary] = field(default_factory=list)
+
+    def to_response(self) -> GreenhouseBoardResponse:
+        return GreenhouseBoardResponse(jobs=[job.to_model() for job in self.jobs])
+
+
+GreenhouseBoard = Union[GreenhouseBoardResponse, GreenhouseBoardSummary]
+
+
+_PRE_TAG_PATTERN = re.compile(r"<pre[^>]*>(.*?)</pre>", flags=re.IGNORECASE | re.DOTALL)
+_INVALID_JSON_ESCAPE_PATTERN = re.compile(r"\\(?![\"\\/bfnrtu])")
 
 
 def _extract_jobs_payload_from_text(text: str) -> Optional[dict[str, Any]]:
@@ -88,10 +94,9 @@ def _extract_jobs_payload_from_text(text: str) -> Optional[dict[str, Any]]:
         cleaned = html.unescape(candidate).strip()
         if not cleaned:
             continue
-        for parsed in _scan_json_candidates(cleaned):
-            found = _find_jobs_payload(parsed)
-            if found is not None:
-                return found
+        found = extract_jobs_payload(cleaned)
+        if found is not None:
+            return found
     return None
 
 
@@ -99,14 +104,76 @@ def _strip_invalid_json_escapes(text: str) -> str:
     return _INVALID_JSON_ESCAPE_PATTERN.sub("", text)
 
 
-def load_greenhouse_board(raw_payload: Any) -> GreenhouseBoardResponse:
+def _summarize_job(job: Any) -> Optional[GreenhouseJobSummary]:
+    if not isinstance(job, dict):
+        return None
+    job_id = job.get("id")
+    absolute_url = job.get("absolute_url")
+    if type(job_id) is not int or not isinstance(absolute_url, str):
+        return None
+    title = job.get("title")
+    updated_at = job.get("updated_at")
+    first_published = job.get("first_published")
+    for value in (title, updated_at, first_published):
+        if value is not None and not isinstance(value, str):
+            return None
+    return GreenhouseJobSummary(
+        id=job_id,
+        absolute_url=absolute_url,
+        title=title,
+        updated_at=updated_at,
+        first_published=first_published,
+        model_extra={key: job[key] for key in _EXTRA_TIMESTAMP_KEYS if key in job},
+        _raw=job,
+    )
+
+
+def _summarize_board(data: Any) -> Optional[GreenhouseBoardSummary]:
+    """Project ``data`` onto summaries, or None when it needs full validation.
+
+    Anything the fast path cannot vouch for (coercible ids, non-string titles, missing
+    URLs) is left to ``GreenhouseBoardResponse.model_validate`` so lean decoding accepts
+    and rejects exactly the payloads the full model does.
+    """
+
+    if not isinstance(data, dict):
+        return None
+    jobs = data.get("jobs", [])
+    if not isinstance(jobs, list):
+        return None
+    summaries: List[GreenhouseJobSummary] = []
+    for job in jobs:
+        summary = _summarize_job(job)
+        if summary is None:
+            return None
+        summaries.append(summary)
+    return GreenhouseBoardSummary(jobs=summaries)
+
+
+def load_greenhouse_board(raw_payload: Any, *, lean: bool = False) -> GreenhouseBoard:
     """Normalize raw FetchFox/http payload into a typed board response.
 
-    Accepts raw JSON string, bytes, or already-parsed mapping/list structures.
+    Accepts raw JSON string, bytes, or already-parsed mapping/list structures. With
+    ``lean=True`` the jobs are projected onto ``GreenhouseJobSummary`` (id, URL, title,
+    timestamps) instead of being validated, which skips per-job Pydantic work on large
+    boards; payloads outside the fast path still go through the full model.
     """
 
+    data = _board_payload(raw_payload)
+    if data is None:
+        return GreenhouseBoardSummary() if lean else GreenhouseBoardResponse()
+    if lean:
+        summary = _summarize_board(data)
+        if summary is not None:
+            return summary
+    return GreenhouseBoardResponse.model_validate(data)
+
+
+def _board_payload(raw_payload: Any) -> Any:
+    """Decode ``raw_payload`` down to the mapping that carries ``jobs`` (None when empty)."""
+
     if raw_payload is None:
-        return GreenhouseBoardResponse()
+        return None
 
     if isinstance(raw_payload, (bytes, bytearray)):
         raw_payload = raw_payload.decode("utf-8", errors="replace")
@@ -114,13 +181,13 @@ def load_greenhouse_board(raw_payload: Any) -> GreenhouseBoardResponse:
     if isinstance(raw_payload, str):
         text_payload = raw_payload.lstrip("\ufeff")
         if not text_payload.strip():
-            return GreenhouseBoardResponse()
+            return None
         try:
             data = json.loads(text_payload)
         except json.JSONDecodeError:
             cleaned = _strip_invalid_json_escapes(text_payload)
             if not cleaned.strip():
-                return GreenhouseBoardResponse()
+                return None
             try:
                 data = json.loads(cleaned)
             except json.JSONDecodeError:
@@ -142,11 +209,11 @@ def load_greenhouse_board(raw_payload: Any) -> GreenhouseBoardResponse:
                 data = extracted
 
     if data is None:
-        return GreenhouseBoardResponse()
+        return None
 
     if isinstance(data, list):
         if not data:
-            return GreenhouseBoardResponse()
+            return None
         if all(isinstance(item, dict) for item in data):
             if any(
                 key in item
@@ -156,15 +223,15 @@ def load_greenhouse_board(raw_payload: Any) -> GreenhouseBoardResponse:
                 data = {"jobs": data}
 
     if isinstance(data, dict):
-        found = _find_jobs_payload(data)
+        found = find_jobs_payload(data)
         if found is not None:
             data = found
 
-    return GreenhouseBoardResponse.model_validate(data)
+    return data
 
 
 def extract_greenhouse_job_urls(
-    board: GreenhouseBoardResponse, required_keywords: Iterable[str] | None = None
+    board: GreenhouseBoard, required_keywords: Iterable[str] | None = None
 ) -> list[str]:
     """Return unique, non-empty job URLs from a board response that match title filters."""
 
@@ -184,3 +251,18 @@ def extract_greenhouse_job_urls(
         seen.add(url)
         deduped.append(url)
     return deduped
+
+
+def greenhouse_board_fingerprint(board: GreenhouseBoard) -> Optional[str]:
+    """Hash the board's job ids and ``updated_at`` values (order-insensitive).
+
+    Two fetches of an unchanged board produce the same fingerprint, so a listing run can
+    skip the diff and detail scrape. Returns None for empty boards.
+    """
+
+    entries = sorted(
+        f"{getattr(job, 'id', '')}:{getattr(job, 'updated_at', None) or ''}" for job in board.jobs
+    )
+    if not entries:
+        return None
+    return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()
@@ -38,8 +38,15 @@ class Settings:
     monitor_rpc_timeout_seconds: int = int(
         os.getenv("TEMPORAL_MONITOR_RPC_TIMEOUT_SECONDS", "10")
     )
+    # host:port for the worker's Prometheus /metrics endpoint (SDK + scraper_* metrics); unset disables it.
+    temporal_metrics_bind_address: str | None = os.getenv("TEMPORAL_METRICS_BIND_ADDRESS") or None
     workflow_task_debug_log_ms: int = int(os.getenv("WORKFLOW_TASK_DEBUG_LOG_MS", "1500"))
     workflow_task_debug_log_all: bool = _env_flag("WORKFLOW_TASK_DEBUG_LOG_ALL", "false")
+    # Opt-in stack sampler for workflow task threads; reports top frames per workflow type.
+    workflow_task_profile_enabled: bool = _env_flag("WORKFLOW_TASK_PROFILE", "false")
+    workflow_task_profile_interval_ms: int = int(os.getenv("WORKFLOW_TASK_PROFILE_INTERVAL_MS", "5"))
+    workflow_task_profile_report_seconds: int = int(os.getenv("WORKFLOW_TASK_PROFILE_REPORT_SECONDS", "300"))
+    workflow_task_profile_top_n: int = int(os.getenv("WORKFLOW_TASK_PROFILE_TOP_N", "15"))
     persist_scrapes_in_activity: bool = _env_flag("PERSIST_SCRAPES_IN_ACTIVITY", "true")
 
     # Convex deployment URL for the ConvexClient (e.g., https://your-app.convex.cloud)
@@ -71,5 +78,11 @@ class Settings:
         "POSTHOG_DISABLE", "false"
     )
 
+    @property
+    def job_details_queue(self) -> str:
+        """Queue serving SpiderCloud job-detail work (the drainer and its batches)."""
+
+        return self.job_details_task_queue or self.task_queue
+
 
 settings = Settings()
@@ -12,8 +12,37 @@ class RuntimeConfig:
     spidercloud_job_details_concurrency: int
     spidercloud_job_details_processing_expire_minutes: int
     spidercloud_http_timeout_seconds: int
+    spidercloud_job_details_max_concurrency: int
+    spidercloud_job_details_max_per_host: int
+    spidercloud_host_max_concurrency: int
+    spidercloud_host_rate_per_second: float
+    spidercloud_job_details_drainer_parallelism: int
+    spidercloud_job_details_idle_backoff_max_seconds: int
+    spidercloud_proxy_escalation_decay_after: int
+    spidercloud_proxy_escalation_db: str
     temporal_general_worker_count: int
     temporal_job_details_worker_count: int
+    temporal_general_max_concurrent_activities: int
+    temporal_general_max_concurrent_workflow_tasks: int
+    temporal_general_max_concurrent_activity_task_polls: int
+    temporal_general_max_concurrent_workflow_task_polls: int
+    temporal_job_details_max_concurrent_activities: int
+    temporal_job_details_max_concurrent_workflow_tasks: int
+    temporal_job_details_max_concurrent_activity_task_polls: int
+    temporal_job_details_max_concurrent_workflow_task_polls: int
+    temporal_max_cached_workflows: int
+    temporal_worker_graceful_shutdown_seconds: int
+    temporal_worker_tuner: str
+    temporal_resource_tuner_target_cpu: float
+    temporal_resource_tuner_target_memory: float
+    temporal_payload_codec: str
+    temporal_payload_compression_threshold_bytes: int
+    workflow_history_max_events: int
+    workflow_history_max_bytes: int
+    schedule_index_refresh_seconds: int
+    listing_fingerprint_max_age_hours: float
+    fetchfox_dispatch_concurrency: int
+    fetchfox_detail_chunk_size: int
 
 
 def _load_runtime_yaml() -> Dict[str, Any]:
@@ -38,6 +67,20 @@ def _coerce_int(config: Dict[str, Any], key: str, default: int) -> int:
     return default
 
 
+def _coerce_float(config: Dict[str, Any], key: str, default: float) -> float:
+    value = config.get(key)
+    if isinstance(value, (int, float)):
+        return float(value)
+    return default
+
+
+def _coerce_str(config: Dict[str, Any], key: str, default: str) -> str:
+    value = config.get(key)
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return default
+
+
 _raw_runtime_config = _load_runtime_yaml()
 
 runtime_config = RuntimeConfig(
@@ -66,6 +109,46 @@ runtime_config = RuntimeConfig(
         "spidercloud_http_timeout_seconds",
         900,
     ),
+    spidercloud_job_details_max_concurrency=_coerce_int(
+        _raw_runtime_config,
+        "spidercloud_job_details_max_concurrency",
+        16,
+    ),
+    spidercloud_job_details_max_per_host=_coerce_int(
+        _raw_runtime_config,
+        "spidercloud_job_details_max_per_host",
+        10,
+    ),
+    spidercloud_host_max_concurrency=_coerce_int(
+        _raw_runtime_config,
+        "spidercloud_host_max_concurrency",
+        8,
+    ),
+    spidercloud_host_rate_per_second=_coerce_float(
+        _raw_runtime_config,
+        "spidercloud_host_rate_per_second",
+        4.0,
+    ),
+    spidercloud_job_details_drainer_parallelism=_coerce_int(
+        _raw_runtime_config,
+        "spidercloud_job_details_drainer_parallelism",
+        6,
+    ),
+    spidercloud_job_details_idle_backoff_max_seconds=_coerce_int(
+        _raw_runtime_config,
+        "spidercloud_job_details_idle_backoff_max_seconds",
+        60,
+    ),
+    spidercloud_proxy_escalation_decay_after=_coerce_int(
+        _raw_runtime_config,
+        "spidercloud_proxy_escalation_decay_after",
+        20,
+    ),
+    spidercloud_proxy_escalation_db=_coerce_str(
+        _raw_runtime_config,
+        "spidercloud_proxy_escalation_db",
+        "",
+    ),
     temporal_general_worker_count=_coerce_int(
         _raw_runtime_config,
         "temporal_general_worker_count",
@@ -76,4 +159,109 @@ runtime_config = RuntimeConfig(
         "temporal_job_details_worker_count",
         4,
     ),
+    temporal_general_max_concurrent_activities=_coerce_int(
+        _raw_runtime_config,
+        "temporal_general_max_concurrent_activities",
+        0,
+    ),
+    temporal_general_max_concurrent_workflow_tasks=_coerce_int(
+        _raw_runtime_config,
+        "temporal_general_max_concurrent_workflow_tasks",
+        0,
+    ),
+    temporal_general_max_concurrent_activity_task_polls=_coerce_int(
+        _raw_runtime_config,
+        "temporal_general_max_concurrent_activity_task_polls",
+        0,
+    ),
+    temporal_general_max_concurrent_workflow_task_polls=_coerce_int(
+        _raw_runtime_config,
+        "temporal_general_max_concurrent_workflow_task_polls",
+        0,
+    ),
+    temporal_job_details_max_concurrent_activities=_coerce_int(
+        _raw_runtime_config,
+        "temporal_job_details_max_concurrent_activities",
+        0,
+    ),
+    temporal_job_details_max_concurrent_workflow_tasks=_coerce_int(
+        _raw_runtime_config,
+        "temporal_job_details_max_concurrent_workflow_tasks",
+        0,
+    ),
+    temporal_job_details_max_concurrent_activity_task_polls=_coerce_int(
+        _raw_runtime_config,
+        "temporal_job_details_max_concurrent_activity_task_polls",
+        0,
+    ),
+    temporal_job_details_max_concurrent_workflow_task_polls=_coerce_int(
+        _raw_runtime_config,
+        "temporal_job_details_max_concurrent_workflow_task_polls",
+        0,
+    ),
+    temporal_max_cached_workflows=_coerce_int(
+        _raw_runtime_config,
+        "temporal_max_cached_workflows",
+        0,
+    ),
+    temporal_worker_graceful_shutdown_seconds=_coerce_int(
+        _raw_runtime_config,
+        "temporal_worker_graceful_shutdown_seconds",
+        30,
+    ),
+    temporal_worker_tuner=_coerce_str(
+        _raw_runtime_config,
+        "temporal_worker_tuner",
+        "fixed",
+    ),
+    temporal_resource_tuner_target_cpu=_coerce_float(
+        _raw_runtime_config,
+        "temporal_resource_tuner_target_cpu",
+        0.8,
+    ),
+    temporal_resource_tuner_target_memory=_coerce_float(
+        _raw_runtime_config,
+        "temporal_resource_tuner_target_memory",
+        0.8,
+    ),
+    temporal_payload_codec=_coerce_str(
+        _raw_runtime_config,
+        "temporal_payload_codec",
+        "zlib",
+    ),
+    temporal_payload_compression_threshold_bytes=_coerce_int(
+        _raw_runtime_config,
+        "temporal_payload_compression_threshold_bytes",
+        4096,
+    ),
+    workflow_history_max_events=_coerce_int(
+        _raw_runtime_config,
+        "workflow_history_max_events",
+        8000,
+    ),
+    workflow_history_max_bytes=_coerce_int(
+        _raw_runtime_config,
+        "workflow_history_max_bytes",
+        8 * 1024 * 1024,
+    ),
+    schedule_index_refresh_seconds=_coerce_int(
+        _raw_runtime_config,
+        "schedule_index_refresh_seconds",
+        60,
+    ),
+    listing_fingerprint_max_age_hours=_coerce_float(
+        _raw_runtime_config,
+        "listing_fingerprint_max_age_hours",
+        24.0,
+    ),
+    fetchfox_dispatch_concurrency=_coerce_int(
+        _raw_runtime_config,
+        "fetchfox_dispatch_concurrency",
+        4,
+    ),
+    fetchfox_detail_chunk_size=_coerce_int(
+        _raw_runtime_config,
+        "fetchfox_detail_chunk_size",
+        10,
+    ),
 )
@@ -7,6 +7,7 @@ from convex import ConvexClient
 
 from ..config import settings
 from . import telemetry
+from .metrics import timed
 
 _client: ConvexClient | None = None
 
@@ -38,13 +39,15 @@ def get_client() -> ConvexClient:
 
 async def convex_query(name: str, args: Mapping[str, Any] | None = None) -> Any:
     client = get_client()
-    return await asyncio.to_thread(client.query, name, args)
+    with timed("convex_call_latency", kind="query", function=name):
+        return await asyncio.to_thread(client.query, name, args)
 
 
 async def convex_mutation(name: str, args: Mapping[str, Any] | None = None) -> Any:
     client = get_client()
     try:
-        return await asyncio.to_thread(client.mutation, name, args)
+        with timed("convex_call_latency", kind="mutation", function=name):
+            return await asyncio.to_thread(client.mutation, name, args)
     except Exception:
         try:
             payload = {
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Iterator, Mapping, Optional, Union
+
+from temporalio import activity
+from temporalio.common import MetricMeter
+
+logger = logging.getLogger("temporal.worker.metrics")
+
+# Prefix for our own instruments; the SDK's built-in ones use "temporal_".
+METRIC_PREFIX = "scraper_"
+
+AttributeValue = Union[str, int, float, bool]
+
+
+def current_meter() -> Optional[MetricMeter]:
+    """Return the running activity's metric meter, or None outside an activity."""
+
+    try:
+        return activity.metric_meter()
+    except RuntimeError:
+        return None
+
+
+def _clean_attributes(attributes: Mapping[str, object]) -> dict[str, AttributeValue]:
+    cleaned: dict[str, AttributeValue] = {}
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        cleaned[key] = value if isinstance(value, (str, int, float, bool)) else str(value)
+    return cleaned
+
+
+def record_histogram(
+    name: str,
+    value: float,
+    *,
+    unit: str = "ms",
+    description: str | None = None,
+    meter: Optional[MetricMeter] = None,
+    **attributes: object,
+) -> None:
+    """Record ``value`` on the ``scraper_<name>`` histogram; a no-op outside an activity."""
+
+    meter = meter or current_meter()
+    if meter is None:
+        return
+    try:
+        meter.create_histogram_float(f"{METRIC_PREFIX}{name}", description, unit).record(
+            float(value), _clean_attributes(attributes)
+        )
+    except Exception:  # noqa: BLE001
+        logger.debug("Failed to record metric %s", name, exc_info=True)
+
+
+@contextmanager
+def timed(name: str, *, description: str | None = None, **attributes: object) -> Iterator[None]:
+    """Record the wall time of the block in milliseconds, labeled with its outcome."""
+
+    meter = current_meter()
+    if meter is None:
+        yield
+        return
+    started = time.perf_counter()
+    outcome = "ok"
+    try:
+        yield
+    except BaseException as exc:
+        outcome = type(exc).__name__
+        raise
+    finally:
+        record_histogram(
+            name,
+            (time.perf_counter() - started) * 1000,
+            description=description,
+            meter=meter,
+            outcome=outcome,
+            **attributes,
+        )
+
+
+__all__ = ["METRIC_PREFIX", "current_meter", "record_histogram", "timed"]
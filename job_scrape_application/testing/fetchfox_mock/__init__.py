@@ -0,0 +1,6 @@
+from .simulator import MockFetchFox, MockFetchFoxScenario
+
+__all__ = [
+    "MockFetchFox",
+    "MockFetchFoxScenario",
+]
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class MockFetchFoxScenario(str, Enum):
+    """Enumerate common FetchFox behaviours for tests."""
+
+    SUCCESS = "success"
+    FAIL_URLS = "fail_urls"
+    JSON_STRING = "json_string"
+
+
+class MockFetchFox:
+    """Drop-in replacement for ``fetchfox_sdk.FetchFox`` with configurable latency and failures.
+
+    ``scrape``/``crawl`` block for ``latency`` seconds (plus ``per_url_latency`` per start URL),
+    like the SDK does while it polls a job, and return FetchFox-shaped payloads. Calls are
+    thread-safe and recorded on the instance; ``max_active`` tracks the highest number of calls
+    in flight at once so tests can assert dispatcher parallelism. Share one instance across the
+    clients a dispatcher creates by passing ``instance.factory`` (or the instance itself, which
+    is callable with the SDK constructor signature).
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        *,
+        scenario: MockFetchFoxScenario = MockFetchFoxScenario.SUCCESS,
+        latency: float = 0.0,
+        per_url_latency: float = 0.0,
+        fail_urls: Optional[Iterable[str]] = None,
+        crawl_hits: int = 5,
+    ) -> None:
+        self.api_key = api_key
+        self.scenario = scenario
+        self.latency = latency
+        self.per_url_latency = per_url_latency
+        self.fail_urls = set(fail_urls or [])
+        self.crawl_hits = crawl_hits
+        self.calls: List[Dict[str, Any]] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, api_key: str | None = None, **_kwargs: Any) -> "MockFetchFox":
+        return self
+
+    def factory(self) -> "MockFetchFox":
+        return self
+
+    def scrape(self, payload: Dict[str, Any]) -> Any:
+        start_urls = self._run("scrape", payload)
+        if self.scenario is MockFetchFoxScenario.FAIL_URLS and self.fail_urls.intersection(start_urls):
+            raise RuntimeError(f"Mock FetchFox scrape failed for {sorted(self.fail_urls.intersection(start_urls))}")
+        items = [
+            {
+                "job_title": f"Software Engineer {idx}",
+                "company": "Example",
+                "url": url,
+                "location": "Remote",
+                "description": f"Mock FetchFox description for {url}",
+            }
+            for idx, url in enumerate(start_urls)
+        ]
+        result = {"items": items, "urls": list(start_urls)}
+        if self.scenario is MockFetchFoxScenario.JSON_STRING:
+            return json.dumps(result)
+        return result
+
+    def crawl(self, payload: Dict[str, Any]) -> Any:
+        start_urls = self._run("crawl", payload)
+        skip = set((payload.get("priority") or {}).get("skip") or [])
+        base = (start_urls[0] if start_urls else "https://example.com").rstrip("/")
+        hits = [f"{base}/jobs/{idx}" for idx in range(self.crawl_hits)]
+        result = {"jobId": f"crawl-{uuid.uuid4().hex[:10]}", "results": {"hits": [u for u in hits if u not in skip]}}
+        if self.scenario is MockFetchFoxScenario.JSON_STRING:
+            return json.dumps(result)
+        return result
+
+    def _run(self, kind: str, payload: Dict[str, Any]) -> List[str]:
+        start_urls = [u for u in payload.get("start_urls") or [] if isinstance(u, str)]
+        with self._lock:
+            self.calls.append({"kind": kind, "payload": payload})
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            delay = self.latency + self.per_url_latency * len(start_urls)
+            if delay > 0:
+                time.sleep(delay)
+        finally:
+            with self._lock:
+                self.active -= 1
+        return start_urls
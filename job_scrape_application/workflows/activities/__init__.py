@@ -10,9 +10,6 @@ from urllib.parse import parse_qs, urlparse, urljoin
 from html.parser import HTMLParser
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from firecrawl import Firecrawl
-from firecrawl.v2.types import PaginationConfig
-from fetchfox_sdk import FetchFox
 from temporalio import activity
 from temporalio.exceptions import ApplicationError
 
@@ -20,7 +17,7 @@ from ...config import settings, runtime_config
 from ...components.models import (
     FetchFoxPriority,
     MAX_FETCHFOX_VISITS,
-    GreenhouseBoardResponse,
+    GreenhouseBoard,
     extract_greenhouse_job_urls,
     load_greenhouse_board,
 )
@@ -64,12 +61,17 @@ from ..helpers.scrape_utils import (
     normalize_firecrawl_items,
     trim_scrape_for_convex,
 )
+from ..helpers.firecrawl_client import get_firecrawl_client, run_firecrawl_call
+from ..helpers.host_limiter import host_key
+from ..helpers.lazy_imports import lazy_module_attrs
 from ..helpers.link_extractors import (
+    cached_normalize_url,
     gather_strings,
     extract_job_urls_from_json_payload,
     extract_links_from_payload,
     normalize_url,
 )
+from ..helpers.listing_fingerprint import listing_unchanged
 from ..helpers.regex_patterns import (
     APPLY_WORD_PATTERN,
     ASHBY_JOB_SLUG_PATTERN,
@@ -108,13 +110,17 @@ from ..helpers.regex_patterns import (
     COMP_LPA_PATTERN,
     COMP_USD_RANGE_PATTERN,
 )
-from ..scrapers import BaseScraper, FetchfoxScraper, FirecrawlScraper, SpiderCloudScraper
+from ..helpers.url_batch import UrlBatch
+from ..scrapers import BaseScraper, FetchfoxDispatcher, FetchfoxScraper, FirecrawlScraper, SpiderCloudScraper
 from ..site_handlers import get_site_handler
 from ..site_handlers.base import BaseSiteHandler
 from .constants import (
     FIRECRAWL_CACHE_MAX_AGE_MS,
     FIRECRAWL_STATUS_EXPIRATION_MS,
     FIRECRAWL_STATUS_WARN_MS,
+    JOB_DETAILS_DRAINER_SIGNAL,
+    JOB_DETAILS_DRAINER_WORKFLOW,
+    JOB_DETAILS_DRAINER_WORKFLOW_ID,
     FirecrawlJobKind,
 )
 from .errors import ScrapeErrorInput, clean_scrape_error_payload, log_scrape_error as _log_scrape_error
@@ -142,6 +148,20 @@ _sanitize_headers = sanitize_headers
 _trim_scrape_for_convex = trim_scrape_for_convex
 _clean_scrape_error_payload = clean_scrape_error_payload
 
+# Provider SDKs are imported on first use so worker boot and sandbox validation do not pay
+# for them; ``activities.Firecrawl`` etc. stay available (and patchable) via ``__getattr__``.
+_provider_attr, __getattr__ = lazy_module_attrs(
+    globals(),
+    {
+        "Firecrawl": ("firecrawl", "Firecrawl"),
+        # Older SDKs and test stubs only ship the blocking client.
+        "AsyncFirecrawl": ("firecrawl", "AsyncFirecrawl"),
+        "PaginationConfig": ("firecrawl.v2.types", "PaginationConfig"),
+        "FetchFox": ("fetchfox_sdk", "FetchFox"),
+    },
+    optional=("AsyncFirecrawl",),
+)
+
 __all__ = [
     "fetch_seen_urls_for_site",
     "normalize_fetchfox_items",
@@ -211,6 +231,63 @@ def _looks_like_auth_url(url: str) -> bool:
     return any(seg in auth_segments for seg in segments)
 
 
+def _interleave_by_host(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reorder leased queue rows round-robin by host, keeping per-host order.
+
+    Batch tasks are started in list order, so interleaving keeps one slow or
+    throttled host from occupying every early concurrency slot.
+    """
+
+    by_host: Dict[str, List[Dict[str, Any]]] = {}
+    for entry in entries:
+        url_val = entry.get("url")
+        by_host.setdefault(host_key(url_val) if isinstance(url_val, str) else "", []).append(entry)
+    if len(by_host) <= 1:
+        return list(entries)
+    ordered: List[Dict[str, Any]] = []
+    queues = list(by_host.values())
+    depth = max(len(queue) for queue in queues)
+    for idx in range(depth):
+        for queue in queues:
+            if idx < len(queue):
+                ordered.append(queue[idx])
+    return ordered
+
+
+# Enqueue bursts only need one wake-up; skip signals sent within this window by the same process.
+_DRAINER_SIGNAL_MIN_INTERVAL_SECONDS = 1.0
+_drainer_signalled_at = 0.0
+
+
+async def _signal_job_details_drainer(provider: str | None, queued: int) -> None:
+    """Wake (or start) the job-details drainer after SpiderCloud URLs are enqueued."""
+
+    global _drainer_signalled_at
+
+    if queued <= 0 or (provider or "").lower() != "spidercloud":
+        return
+    now = time.monotonic()
+    if now - _drainer_signalled_at < _DRAINER_SIGNAL_MIN_INTERVAL_SECONDS:
+        return
+    try:
+        client = activity.client()
+    except RuntimeError:
+        # Not running inside an activity (e.g. direct calls from scripts/tests).
+        return
+    _drainer_signalled_at = now
+    try:
+        await client.start_workflow(
+            JOB_DETAILS_DRAINER_WORKFLOW,
+            id=JOB_DETAILS_DRAINER_WORKFLOW_ID,
+            task_queue=settings.job_details_queue,
+            start_signal=JOB_DETAILS_DRAINER_SIGNAL,
+            start_signal_args=[queued],
+        )
+    except Exception as exc:  # noqa: BLE001
+        # Best-effort; the safety-net schedule still drains the queue.
+        logger.debug("Job-details drainer signal failed: %s", exc)
+
+
 def _is_spidercloud_listing_url(url: str, source_url: str | None = None) -> bool:
     handler = get_site_handler(url) or (get_site_handler(source_url) if source_url else None)
     if handler and handler.is_listing_url(url):
@@ -296,6 +373,10 @@ def _summarize_scrape_payload(res: Dict[str, Any]) -> Dict[str, Any]:
         summary["workflowName"] = res.get("workflowName")
     if res.get("costMilliCents"):
         summary["costMilliCents"] = res.get("costMilliCents")
+    if res.get("listingFingerprint"):
+        summary["listingFingerprint"] = res.get("listingFingerprint")
+    if res.get("listingUnchanged"):
+        summary["listingUnchanged"] = True
     return {k: v for k, v in summary.items() if v is not None}
 
 
@@ -354,7 +435,8 @@ def _make_firecrawl_scraper() -> FirecrawlScraper:
         build_request_snapshot=_build_request_snapshot,
         log_provider_dispatch=_log_provider_dispatch,
         log_sync_response=_log_sync_response,
-        firecrawl_cls=Firecrawl,
+        firecrawl_cls=_provider_attr("Firecrawl"),
+        async_firecrawl_cls=_provider_attr("AsyncFirecrawl"),
     )
 
 
@@ -428,6 +510,11 @@ async def lease_site(
     scrape_provider: Optional[str] = None,
 ) -> Optional[Site]:
     from ...services.convex_client import convex_mutation
+    from ..schedule_index import lease_may_find_site
+
+    if runtime_config.schedule_index_refresh_seconds > 0 and not lease_may_find_site(site_type, scrape_provider):
+        # The host's schedule index shows nothing due for this filter; skip the full-table mutation.
+        return None
 
     payload: Dict[str, Any] = {"workerId": worker_id, "lockSeconds": lock_seconds}
     if site_type:
@@ -496,27 +583,35 @@ async def _scrape_spidercloud_greenhouse(scraper: SpiderCloudScraper, site: Site
             pass
         raise
     job_urls = listing.get("job_urls") if isinstance(listing, dict) else []
-    posted_at_by_url: Dict[str, int] = {}
-    if isinstance(listing, dict):
-        raw_posted = listing.get("posted_at_by_url")
-        if isinstance(raw_posted, dict):
-            for key, value in raw_posted.items():
-                if not isinstance(key, str):
-                    continue
-                if not isinstance(value, (int, float)):
-                    continue
-                normalized_key = normalize_url(key) or key
-                posted_at_by_url[normalized_key] = int(value)
-    urls: list[str] = []
-    seen_urls: set[str] = set()
-    for candidate in job_urls:
-        if not isinstance(candidate, str) or not candidate.strip():
-            continue
-        normalized = normalize_url(candidate)
-        if not normalized or normalized in seen_urls:
-            continue
-        seen_urls.add(normalized)
-        urls.append(normalized)
+    # Normalize once; the diff against Convex and the enqueue below reuse the same URLs.
+    url_batch = UrlBatch.from_values(job_urls or [])
+    posted_at_by_url = url_batch.timestamps_by_url(
+        listing.get("posted_at_by_url") if isinstance(listing, dict) else None
+    )
+    urls = list(url_batch.urls)
+    fingerprint = listing.get("fingerprint") if isinstance(listing, dict) else None
+    if listing_unchanged(site, fingerprint, int(time.time() * 1000)):
+        # Same board as the last full run: skip the Convex diff and enqueue entirely. The
+        # stored fingerprint (and its age) is left alone so the max-age rerun still happens.
+        logger.info(
+            "SpiderCloud greenhouse listing unchanged source_url=%s urls=%s fingerprint=%s",
+            site.get("url"),
+            len(urls),
+            fingerprint,
+        )
+        return {
+            "provider": scraper.provider,
+            "sourceUrl": site.get("url"),
+            "listingUnchanged": True,
+            "items": {
+                "normalized": [],
+                "provider": scraper.provider,
+                "job_urls": urls,
+                "existing": [],
+                "queued": False,
+            },
+            "skippedUrls": [],
+        }
 
     seen_for_site: list[str] = []
     try:
@@ -540,6 +635,7 @@ async def _scrape_spidercloud_greenhouse(scraper: SpiderCloudScraper, site: Site
         return {
             "provider": scraper.provider,
             "sourceUrl": site.get("url"),
+            "listingFingerprint": fingerprint,
             "items": {
                 "normalized": [],
                 "provider": scraper.provider,
@@ -633,6 +729,7 @@ async def _scrape_spidercloud_greenhouse(scraper: SpiderCloudScraper, site: Site
     return {
         "provider": scraper.provider,
         "sourceUrl": site.get("url"),
+        "listingFingerprint": fingerprint,
         "items": {
             "normalized": [],
             "provider": scraper.provider,
@@ -684,6 +781,9 @@ async def scrape_site(
     if not isinstance(result, dict):
         raise ApplicationError("Scrape payload missing/invalid", non_retryable=True)
 
+    if result.get("listingUnchanged"):
+        return {"scrapeId": None, "summary": _summarize_scrape_payload(result)}
+
     result = _apply_workflow_context(result, workflow_context, site)
     scrape_id = await store_scrape(result)
     return {
@@ -805,7 +905,7 @@ async def start_firecrawl_webhook_scrape(site: Site) -> Dict[str, Any]:
             },
         }
 
-        client = Firecrawl(api_key=firecrawl_api_key)
+        client = get_firecrawl_client(_provider_attr("Firecrawl"), firecrawl_api_key)
         provider_request = {
             "urls": [site["url"]],
             "options": {
@@ -905,7 +1005,7 @@ async def start_firecrawl_webhook_scrape(site: Site) -> Dict[str, Any]:
         {"type": "json", "schema": job_schema},
     ]
 
-    client = Firecrawl(api_key=firecrawl_api_key)
+    client = get_firecrawl_client(_provider_attr("Firecrawl"), firecrawl_api_key)
 
     provider_request = {
         "urls": [site["url"]],
@@ -1022,40 +1122,48 @@ async def crawl_site_fetchfox(
     start_urls = [source_url] if source_url else []
     site_id = _convex_site_id(site)
 
-    skip_urls: list[str] = []
-    try:
-        if source_url:
-            skip_urls = await fetch_seen_urls_for_site(source_url, pattern)
-    except Exception:
-        skip_urls = []
+    now_ms = int(time.time() * 1000)
+    processing_expiry_ms = runtime_config.spidercloud_job_details_processing_expire_minutes * 60 * 1000
+    per_status_limit = 250
 
-    queued_urls: list[str] = []
-    try:
-        now_ms = int(time.time() * 1000)
-        processing_expiry_ms = runtime_config.spidercloud_job_details_processing_expire_minutes * 60 * 1000
-        per_status_limit = 250
-        for status_value in ("pending", "processing"):
-            queued_rows = await convex_query(
-                "router:listQueuedScrapeUrls",
-                _strip_none_values(
-                    {"siteId": site_id, "provider": "spidercloud", "status": status_value, "limit": per_status_limit}
-                ),
-            )
-            if isinstance(queued_rows, list):
-                for row in queued_rows:
-                    if isinstance(row, dict):
-                        url_val = row.get("url")
-                        if isinstance(url_val, str) and url_val.strip():
-                            if status_value == "processing":
-                                updated_at = row.get("updatedAt")
-                                if isinstance(updated_at, (int, float)):
-                                    if updated_at < now_ms - processing_expiry_ms:
-                                        continue
-                                else:
+    async def _queued_for_status(status_value: str) -> list[str]:
+        urls: list[str] = []
+        queued_rows = await convex_query(
+            "router:listQueuedScrapeUrls",
+            _strip_none_values(
+                {"siteId": site_id, "provider": "spidercloud", "status": status_value, "limit": per_status_limit}
+            ),
+        )
+        if isinstance(queued_rows, list):
+            for row in queued_rows:
+                if isinstance(row, dict):
+                    url_val = row.get("url")
+                    if isinstance(url_val, str) and url_val.strip():
+                        if status_value == "processing":
+                            updated_at = row.get("updatedAt")
+                            if isinstance(updated_at, (int, float)):
+                                if updated_at < now_ms - processing_expiry_ms:
                                     continue
-                            queued_urls.append(url_val.strip())
-    except Exception:
-        queued_urls = []
+                            else:
+                                continue
+                        urls.append(url_val.strip())
+        return urls
+
+    async def _no_seen_urls() -> list[str]:
+        return []
+
+    # The seen-URL and queued-URL lookups are independent; run them together.
+    seen_result, *queued_results = await asyncio.gather(
+        fetch_seen_urls_for_site(source_url, pattern) if source_url else _no_seen_urls(),
+        _queued_for_status("pending"),
+        _queued_for_status("processing"),
+        return_exceptions=True,
+    )
+    skip_urls: list[str] = [] if isinstance(seen_result, BaseException) else list(seen_result or [])
+    queued_urls: list[str] = []
+    if not any(isinstance(result, BaseException) for result in queued_results):
+        for result in queued_results:
+            queued_urls.extend(result)
 
     skip_set = {u for u in skip_urls if isinstance(u, str)}
     skip_set.update(u for u in queued_urls if isinstance(u, str))
@@ -1084,12 +1192,14 @@ async def crawl_site_fetchfox(
     )
 
     started_at = int(time.time() * 1000)
-    try:
-        fox = FetchFox(api_key=settings.fetchfox_api_key)
-        result = await asyncio.to_thread(fox.crawl, crawl_request)
-        result_obj: Dict[str, Any] | Any = result if isinstance(result, dict) else json.loads(result)
-    except Exception as exc:  # noqa: BLE001
-        raise ApplicationError(f"FetchFox crawl failed: {exc}") from exc
+    dispatcher = FetchfoxDispatcher(
+        lambda: _provider_attr("FetchFox")(api_key=settings.fetchfox_api_key),
+        max_concurrency=runtime_config.fetchfox_dispatch_concurrency,
+    )
+    crawl_job = await dispatcher.run("crawl", crawl_request)
+    if crawl_job.status == "failed":
+        raise ApplicationError(f"FetchFox crawl failed: {crawl_job.error}") from crawl_job.error
+    result_obj: Dict[str, Any] | Any = crawl_job.result
     completed_at = int(time.time() * 1000)
 
     def _collect_urls(value: Any, acc: list[str]) -> None:
@@ -1162,6 +1272,7 @@ async def crawl_site_fetchfox(
                     enqueued = [u for u in queued if isinstance(u, str)]
         except Exception:
             enqueued = []
+        await _signal_job_details_drainer("spidercloud", len(enqueued))
 
     skipped_urls = [u for u in unique_urls if u in skip_set]
 
@@ -1261,24 +1372,45 @@ async def fetch_greenhouse_listing_firecrawl(site: Site) -> Dict[str, Any]:
 
 
 @activity.defn
-async def filter_existing_job_urls(urls: List[str]) -> List[str]:
-    """Return the subset of URLs that already exist in Convex jobs table."""
+async def filter_existing_job_urls(
+    urls: List[str],
+    updated_at_by_url: Optional[Dict[str, int]] = None,
+) -> List[str]:
+    """Return the subset of URLs that already exist in Convex jobs table.
+
+    With ``updated_at_by_url`` (listing ``updated_at`` in ms), existing jobs whose stored
+    watermark is older are left out, so callers rescrape them and ingestion patches the
+    row in place.
+    """
 
     cleaned = [u for u in urls if isinstance(u, str) and u.strip()]
     if not cleaned:
         return []
     from ...services.convex_client import convex_query
 
+    query_args: Dict[str, Any] = {"urls": cleaned}
+    if updated_at_by_url:
+        updated_ats: List[int | None] = []
+        for url in cleaned:
+            value = updated_at_by_url.get(url)
+            if value is None:
+                value = updated_at_by_url.get(normalize_url(url) or url)
+            updated_ats.append(int(value) if isinstance(value, (int, float)) else None)
+        if any(value is not None for value in updated_ats):
+            query_args["updatedAts"] = updated_ats
+
     try:
-        data = await convex_query("router:findExistingJobUrls", {"urls": cleaned})
+        data = await convex_query("router:findExistingJobUrls", query_args)
     except Exception:
         return []
 
     existing = data.get("existing", []) if isinstance(data, dict) else []
     if not isinstance(existing, list):
         return []
+    changed = data.get("changed") if isinstance(data, dict) else None
+    changed_set = {u for u in changed if isinstance(u, str)} if isinstance(changed, list) else set()
 
-    return [u for u in existing if isinstance(u, str)]
+    return [u for u in existing if isinstance(u, str) and u not in changed_set]
 
 
 @activity.defn
@@ -1351,6 +1483,7 @@ async def lease_scrape_url_batch(provider: Optional[str] = None, limit: int = SP
                     "limit": limit,
                     "processingExpiryMs": runtime_config.spidercloud_job_details_processing_expire_minutes * 60 * 1000,
                     "workerId": _get_activity_worker_id(),
+                    "maxPerHost": runtime_config.spidercloud_job_details_max_per_host or None,
                 }
             ),
         )
@@ -1432,7 +1565,7 @@ async def lease_scrape_url_batch(provider: Optional[str] = None, limit: int = SP
                 logger.warning("Failed to mark auth URLs as failed: %s", exc, exc_info=exc)
 
         if filtered:
-            return _build_lease_response(filtered, skipped)
+            return _build_lease_response(_interleave_by_host(filtered), skipped)
 
     return _build_lease_response([], skipped)
 
@@ -1960,7 +2093,7 @@ async def collect_firecrawl_job_result(event: FirecrawlWebhookEvent) -> Dict[str
             non_retryable=True,
         )
 
-    pagination = PaginationConfig(auto_paginate=True, max_wait_time=30, max_results=5000)
+    pagination = _provider_attr("PaginationConfig")(auto_paginate=True, max_wait_time=30, max_results=5000)
 
     async def _record_scrape_error(error: str) -> None:
         from ...services.convex_client import convex_mutation
@@ -2022,11 +2155,11 @@ async def collect_firecrawl_job_result(event: FirecrawlWebhookEvent) -> Dict[str
         )
 
     def _get_status() -> Any:
-        client = Firecrawl(api_key=firecrawl_api_key)
+        client = get_firecrawl_client(_provider_attr("Firecrawl"), firecrawl_api_key)
         return client.get_batch_scrape_status(job_id, pagination_config=pagination)
 
     try:
-        status = await asyncio.to_thread(_get_status)
+        status = await run_firecrawl_call(_get_status)
     except Exception as exc:  # noqa: BLE001
         error_msg = str(exc)
         logger.warning(
@@ -2130,7 +2263,7 @@ async def collect_firecrawl_job_result(event: FirecrawlWebhookEvent) -> Dict[str
         }
 
         try:
-            board: GreenhouseBoardResponse = load_greenhouse_board(raw_text or json_payload)
+            board: GreenhouseBoard = load_greenhouse_board(raw_text or json_payload, lean=True)
             job_urls = extract_greenhouse_job_urls(board, required_keywords=())
             posted_at_by_url: Dict[str, int] = {}
 
@@ -2980,7 +3113,7 @@ async def store_scrape(scrape: Dict[str, Any]) -> str:
             delays_ms: list[int] | None = None
             if urls:
                 for url in urls:
-                    if handler and handler.is_listing_url(url):
+                    if handler and handler.classify(url).listing:
                         listing_urls.append(url)
                     else:
                         job_urls.append(url)
@@ -3003,8 +3136,8 @@ async def store_scrape(scrape: Dict[str, Any]) -> str:
                                 for u in urls
                                 if not (
                                     handler
-                                    and handler.is_listing_url(u)
                                     and isinstance(u, str)
+                                    and handler.classify(u).listing
                                     and u in seen_listing
                                 )
                             ]
@@ -3012,7 +3145,7 @@ async def store_scrape(scrape: Dict[str, Any]) -> str:
                     delay_map: Dict[str, int] = {}
                     delay_idx = 1
                     for url in urls:
-                        if handler and handler.is_listing_url(url):
+                        if handler and handler.classify(url).listing:
                             delay_map[url] = delay_idx * PAGINATION_ENQUEUE_STAGGER_MS
                             delay_idx += 1
                     if delay_map:
@@ -3117,19 +3250,25 @@ async def store_scrape(scrape: Dict[str, Any]) -> str:
             )
             if urls:
                 site_id = _convex_site_id(payload.get("siteId"))
-                await convex_mutation(
+                enqueue_provider = scraped_with or payload.get("provider") or ""
+                enqueue_res = await convex_mutation(
                     "router:enqueueScrapeUrls",
                     _strip_none_values(
                         {
                             "urls": urls,
                             "sourceUrl": payload.get("sourceUrl") or "",
-                            "provider": scraped_with or payload.get("provider") or "",
+                            "provider": enqueue_provider,
                             "siteId": site_id,
                             "pattern": payload.get("pattern"),
                             "delaysMs": delays_ms,
                         }
                     ),
                 )
+                queued_urls = enqueue_res.get("queued") if isinstance(enqueue_res, dict) else None
+                await _signal_job_details_drainer(
+                    str(enqueue_provider),
+                    len(queued_urls) if isinstance(queued_urls, list) else len(urls),
+                )
                 await _log_workflow_event(
                     "scrape.url_enqueue",
                     message="Enqueued URLs from scrape payload",
@@ -3237,15 +3376,18 @@ async def store_scrape(scrape: Dict[str, Any]) -> str:
 
 
 @activity.defn
-async def complete_site(site_id: str) -> None:
+async def complete_site(site_id: str, listing_fingerprint: Optional[str] = None) -> None:
     from ...services.convex_client import convex_mutation
 
     if not _looks_like_convex_id(site_id):
         # Skip best-effort if id is not a Convex document id
         return
 
+    args: Dict[str, Any] = {"id": site_id}
+    if listing_fingerprint:
+        args["listingFingerprint"] = listing_fingerprint
     try:
-        await convex_mutation("router:completeSite", {"id": site_id})
+        await convex_mutation("router:completeSite", args)
     except Exception as exc:  # noqa: BLE001
         # Swallow validator errors so workflows continue
         if "ArgumentValidationError" in str(exc) and ".id" in str(exc):
@@ -3748,7 +3890,7 @@ def _extract_job_urls_from_scrape(scrape: Dict[str, Any]) -> list[str]:
         return deduped
 
     def _normalize_job_url(value: str, *, base_url: str | None = None) -> str | None:
-        normalized = normalize_url(value, base_url=base_url)
+        normalized = cached_normalize_url(value, base_url)
         if not normalized:
             return None
         return _strip_ashby_application_url(normalized)
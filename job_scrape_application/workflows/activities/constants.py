@@ -13,6 +13,11 @@ FIRECRAWL_STATUS_WARN_MS = 23 * 60 * 60 * 1000
 HTTP_RETRY_BASE_SECONDS = 30
 CONVEX_MUTATION_TIMEOUT_SECONDS = 3
 
+# Long-lived workflow that drains the SpiderCloud job-detail queue; enqueuers signal it by this id.
+JOB_DETAILS_DRAINER_WORKFLOW = "SpidercloudJobDetailsDrainer"
+JOB_DETAILS_DRAINER_WORKFLOW_ID = "spidercloud-job-details-drainer"
+JOB_DETAILS_DRAINER_SIGNAL = "urls_enqueued"
+
 
 class FirecrawlJobKind(StrEnum):
     GREENHOUSE_LISTING = "greenhouse_listing"
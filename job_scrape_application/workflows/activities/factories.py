@@ -58,6 +58,7 @@ def build_firecrawl_scraper(
     log_provider_dispatch: Callable[..., None],
     log_sync_response: Callable[..., None],
     firecrawl_cls: Any,
+    async_firecrawl_cls: Any = None,
 ) -> FirecrawlScraper:
     return FirecrawlScraper(
         FirecrawlDependencies(
@@ -74,6 +75,7 @@ def build_firecrawl_scraper(
             load_greenhouse_board=load_greenhouse_board,
             extract_greenhouse_job_urls=extract_greenhouse_job_urls,
             firecrawl_cache_max_age_ms=FIRECRAWL_CACHE_MAX_AGE_MS,
+            async_firecrawl_cls=async_firecrawl_cls,
         )
     )
 
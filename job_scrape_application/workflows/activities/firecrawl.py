@@ -8,6 +8,7 @@ from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
 from temporalio.exceptions import ApplicationError
 
 from ..helpers.firecrawl import metadata_urls_to_list, should_mock_convex_webhooks
+from ..helpers.firecrawl_client import run_firecrawl_call
 from ..helpers.provider import build_provider_status_url
 from .constants import CONVEX_MUTATION_TIMEOUT_SECONDS, FirecrawlJobKind
 
@@ -51,14 +52,14 @@ async def start_firecrawl_batch(
         list((webhook_payload.get("metadata") or {}).keys()),
     )
     try:
-        return await asyncio.to_thread(start_fn, webhook_model)
+        return await run_firecrawl_call(start_fn, webhook_model)
     except AttributeError as exc:
         if "model_dump" not in str(exc):
             raise
 
         retry_webhook = WebhookModel(webhook_payload)
         logger.warning("Retrying Firecrawl start with wrapped webhook after model_dump error")
-        return await asyncio.to_thread(start_fn, retry_webhook)
+        return await run_firecrawl_call(start_fn, retry_webhook)
 
 
 def serialize_firecrawl_job(
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Optional, Sequence
+
+from temporalio import activity
+from temporalio.worker import ActivityInboundInterceptor, ExecuteActivityInput, Interceptor
+
+from ..services.metrics import record_histogram
+from .helpers.json_budget import estimate_json_size
+from .site_handlers import get_site_handler
+
+# Payload sizes above this are reported as the cap; walking multi-MB payloads twice per
+# activity would cost more than the measurement is worth.
+PAYLOAD_SIZE_CAP_BYTES = 16 * 1024 * 1024
+_PROVIDERS = ("spidercloud", "firecrawl", "fetchfox")
+
+
+def activity_labels(activity_type: str, args: Sequence[Any]) -> Dict[str, str]:
+    """Derive ``provider`` and ``handler`` labels from an activity's name and first argument."""
+
+    provider: Optional[str] = None
+    handler: Optional[str] = None
+    first = args[0] if args else None
+    if isinstance(first, str) and first.lower() in _PROVIDERS:
+        provider = first.lower()
+    elif isinstance(first, dict):
+        raw_provider = first.get("scrapeProvider") or first.get("provider")
+        if isinstance(raw_provider, str) and raw_provider:
+            provider = raw_provider.lower()
+        url = first.get("url")
+        if isinstance(url, str) and url:
+            site_handler = get_site_handler(url, first.get("type"))
+            handler = site_handler.name if site_handler else None
+    if provider is None:
+        provider = next((name for name in _PROVIDERS if name in activity_type.lower()), None)
+    return {"provider": provider or "none", "handler": handler or "none"}
+
+
+class _ActivityMetricsInbound(ActivityInboundInterceptor):
+    async def execute_activity(self, input: ExecuteActivityInput) -> Any:  # noqa: A002
+        info = activity.info()
+        meter = activity.metric_meter()
+        labels = activity_labels(info.activity_type, input.args)
+        attributes = {"activity": info.activity_type, **labels}
+
+        scheduled = info.current_attempt_scheduled_time
+        if scheduled is not None and info.started_time is not None:
+            record_histogram(
+                "activity_schedule_to_start",
+                max(0.0, (info.started_time - scheduled).total_seconds() * 1000),
+                description="Time an activity attempt waited in the task queue",
+                meter=meter,
+                **attributes,
+            )
+        record_histogram(
+            "activity_payload_bytes",
+            estimate_json_size(list(input.args), limit=PAYLOAD_SIZE_CAP_BYTES),
+            unit="By",
+            description="Approximate JSON size of activity inputs and results",
+            meter=meter,
+            direction="input",
+            **attributes,
+        )
+
+        started = time.perf_counter()
+        outcome = "ok"
+        try:
+            result = await super().execute_activity(input)
+        except BaseException as exc:
+            outcome = type(exc).__name__
+            raise
+        finally:
+            record_histogram(
+                "activity_duration",
+                (time.perf_counter() - started) * 1000,
+                description="Activity execution time",
+                meter=meter,
+                outcome=outcome,
+                **attributes,
+            )
+        record_histogram(
+            "activity_payload_bytes",
+            estimate_json_size(result, limit=PAYLOAD_SIZE_CAP_BYTES),
+            unit="By",
+            description="Approximate JSON size of activity inputs and results",
+            meter=meter,
+            direction="output",
+            **attributes,
+        )
+        return result
+
+
+class ActivityMetricsInterceptor(Interceptor):
+    """Record per-activity latency, queue wait and payload size on the SDK metric meter."""
+
+    def intercept_activity(self, next: ActivityInboundInterceptor) -> ActivityInboundInterceptor:
+        return _ActivityMetricsInbound(next)
+
+
+__all__ = ["ActivityMetricsInterceptor", "activity_labels"]
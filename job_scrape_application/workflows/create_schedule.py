@@ -23,6 +23,7 @@ from temporalio.client import (
 from temporalio.service import RPCError, RPCStatusCode
 
 from ..config import resolve_config_path, settings
+from .payload_codec import build_data_converter
 
 
 SCHEDULES_YAML = resolve_config_path("schedules.yaml")
@@ -149,6 +150,7 @@ async def main(*, skip_trigger: bool = False) -> None:
     client = await Client.connect(
         settings.temporal_address,
         namespace=settings.temporal_namespace,
+        data_converter=build_data_converter(),
     )
 
     configs = load_schedule_configs()
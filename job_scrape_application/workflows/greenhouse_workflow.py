@@ -7,6 +7,7 @@ from typing import Any, Dict, List
 from temporalio import workflow
 from temporalio.exceptions import ActivityError, ApplicationError
 
+from .helpers.listing_fingerprint import listing_unchanged as _listing_unchanged
 from .helpers.workflow_logging import get_workflow_logger
 from ..config import settings
 
@@ -29,6 +30,7 @@ class GreenhouseScrapeSummary:
     site_count: int
     scrape_ids: List[str]
     jobs_scraped: int
+    sites_unchanged: int = 0
 
 
 @workflow.defn(name="GreenhouseScraperWorkflow")
@@ -39,6 +41,7 @@ class GreenhouseScraperWorkflow:
         site_urls: List[str] = []
         site_count = 0
         jobs_scraped = 0
+        sites_unchanged = 0
         failure_reasons: List[str] = []
         status = "completed"
         started_at = int(workflow.now().timestamp() * 1000)
@@ -98,9 +101,31 @@ class GreenhouseScraperWorkflow:
                         if isinstance(listing, dict) and isinstance(listing.get("posted_at_by_url"), dict)
                         else None
                     )
+                    updated_at_by_url = (
+                        listing.get("updated_at_by_url")
+                        if isinstance(listing, dict) and isinstance(listing.get("updated_at_by_url"), dict)
+                        else None
+                    )
+                    fingerprint = listing.get("fingerprint") if isinstance(listing, dict) else None
+                    if _listing_unchanged(site, fingerprint, int(workflow.now().timestamp() * 1000)):
+                        sites_unchanged += 1
+                        await _log(
+                            "greenhouse.unchanged",
+                            site_url=site["url"],
+                            data={"jobUrls": len(job_urls), "fingerprint": fingerprint},
+                        )
+                        await workflow.execute_activity(
+                            complete_site,
+                            args=[site["_id"]],
+                            schedule_to_close_timeout=timedelta(seconds=30),
+                        )
+                        continue
+
+                    # With listing updated_at watermarks, edited postings drop out of
+                    # `existing` so they are rescraped and patched in place.
                     existing = await workflow.execute_activity(
                         filter_existing_job_urls,
-                        args=[job_urls],
+                        args=[job_urls, updated_at_by_url] if updated_at_by_url else [job_urls],
                         schedule_to_close_timeout=timedelta(seconds=30),
                     )
                     diff = await workflow.execute_activity(
@@ -122,6 +147,7 @@ class GreenhouseScraperWorkflow:
                             "jobUrls": len(job_urls),
                             "existing": existing_count,
                             "toScrape": len(urls_to_scrape),
+                            "incremental": bool(updated_at_by_url),
                         },
                     )
 
@@ -129,6 +155,8 @@ class GreenhouseScraperWorkflow:
                         scrape_payload: Dict[str, Any] = {"urls": urls_to_scrape, "source_url": site["url"]}
                         if posted_at_by_url:
                             scrape_payload["posted_at_by_url"] = posted_at_by_url
+                        if updated_at_by_url:
+                            scrape_payload["updated_at_by_url"] = updated_at_by_url
                         workflow_context = {
                             "workflowName": "GreenhouseScraperWorkflow",
                             "workflowId": run_info.workflow_id,
@@ -169,7 +197,7 @@ class GreenhouseScraperWorkflow:
 
                     await workflow.execute_activity(
                         complete_site,
-                        args=[site["_id"]],
+                        args=[site["_id"], fingerprint] if fingerprint else [site["_id"]],
                         schedule_to_close_timeout=timedelta(seconds=30),
                     )
                 except Exception as e:  # noqa: BLE001
@@ -193,7 +221,12 @@ class GreenhouseScraperWorkflow:
                         level="error",
                     )
 
-            return GreenhouseScrapeSummary(site_count=site_count, scrape_ids=scrape_ids, jobs_scraped=jobs_scraped)
+            return GreenhouseScrapeSummary(
+                site_count=site_count,
+                scrape_ids=scrape_ids,
+                jobs_scraped=jobs_scraped,
+                sites_unchanged=sites_unchanged,
+            )
         except Exception as e:  # noqa: BLE001
             status = "failed"
             failure_reasons.append(str(e))
@@ -235,6 +268,7 @@ class GreenhouseScraperWorkflow:
                 data={
                     "status": status,
                     "sitesProcessed": site_count,
+                    "sitesUnchanged": sites_unchanged,
                     "jobsScraped": jobs_scraped,
                 },
                 level="warn" if status != "completed" else "info",
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+_STATUS_KEYS = ("status", "httpStatus")
+
+
+def status_from_value(value: Any) -> Optional[int]:
+    """Return an HTTP status from an event dict (or a JSON string encoding one)."""
+
+    if isinstance(value, dict):
+        for key in _STATUS_KEYS:
+            status_val = value.get(key)
+            if isinstance(status_val, (int, float)):
+                return int(status_val)
+        meta = value.get("metadata")
+        if isinstance(meta, dict):
+            meta_raw = meta.get("raw")
+            if isinstance(meta_raw, dict):
+                status_val = meta_raw.get("status")
+                if isinstance(status_val, (int, float)):
+                    return int(status_val)
+    if isinstance(value, str) and value.lstrip().startswith("{"):
+        try:
+            parsed = json.loads(value)
+        except Exception:
+            return None
+        if isinstance(parsed, dict):
+            return status_from_value(parsed)
+    return None
+
+
+class EventIndex:
+    """Single-pass index over SpiderCloud stream events.
+
+    ``add`` walks each event once as it arrives and records the nested strings (in
+    ``gather_strings`` order), credit/cost candidates, the first event-level HTTP status,
+    and the event's markdown fragment. Extractors that previously re-walked the raw events
+    read from the index instead; values derived from it (JSON payloads, JSON-LD postings,
+    titles, meta descriptions, link lists) are memoized with ``cached`` until the next
+    ``add``.
+    """
+
+    def __init__(self) -> None:
+        self.events: List[Any] = []
+        self.strings: List[str] = []
+        self.markdown_parts: List[str] = []
+        self.credit_candidates: List[float] = []
+        self.cost_candidates_usd: List[float] = []
+        self._event_status: Optional[int] = None
+        self._derived: Dict[str, Any] = {}
+
+    def add(self, event: Any, *, markdown: Optional[str] = None) -> None:
+        self.events.append(event)
+        self._derived.clear()
+        if self._event_status is None:
+            self._event_status = status_from_value(event)
+        if isinstance(event, dict):
+            credits: List[float] = []
+            costs: List[float] = []
+            self._walk(event, credits, costs)
+            if credits:
+                self.credit_candidates.append(max(credits))
+            if costs:
+                self.cost_candidates_usd.append(max(costs))
+        else:
+            self._walk(event, None, None)
+        if markdown:
+            self.markdown_parts.append(markdown)
+
+    def _walk(self, value: Any, credits: Optional[List[float]], costs: Optional[List[float]]) -> None:
+        if isinstance(value, str):
+            self.strings.append(value)
+        elif isinstance(value, dict):
+            for key, val in value.items():
+                if isinstance(val, str):
+                    self.strings.append(val)
+                elif isinstance(val, (int, float)):
+                    if credits is not None and isinstance(key, str):
+                        lowered = key.lower()
+                        if "credit" in lowered:
+                            credits.append(float(val))
+                        if "cost" in lowered:
+                            costs.append(float(val))  # type: ignore[union-attr]
+                elif isinstance(val, (dict, list)):
+                    self._walk(val, credits, costs)
+        elif isinstance(value, list):
+            for item in value:
+                self._walk(item, credits, costs)
+
+    @property
+    def credits_used(self) -> Optional[float]:
+        return max(self.credit_candidates) if self.credit_candidates else None
+
+    @property
+    def cost_usd(self) -> Optional[float]:
+        return max(self.cost_candidates_usd) if self.cost_candidates_usd else None
+
+    @property
+    def http_status(self) -> Optional[int]:
+        """First status on an event, else in any nested JSON string, else in markdown."""
+
+        if self._event_status is not None:
+            return self._event_status
+        return self.cached("http_status", self._fallback_status)
+
+    def _fallback_status(self) -> Optional[int]:
+        for text in self.strings:
+            status = status_from_value(text)
+            if status is not None:
+                return status
+        for text in self.markdown_parts:
+            status = status_from_value(text)
+            if status is not None:
+                return status
+        return None
+
+    def html_strings(self) -> List[str]:
+        """Nested strings that contain markup (both ``<`` and ``>``)."""
+
+        return self.cached("html_strings", lambda: [t for t in self.strings if "<" in t and ">" in t])
+
+    def cached(self, key: str, factory: Callable[[], T]) -> T:
+        if key not in self._derived:
+            self._derived[key] = factory()
+        return self._derived[key]
+
+
+__all__ = ["EventIndex", "status_from_value"]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+# Blocking Firecrawl SDK calls run on their own bounded pool so a burst of site starts
+# cannot exhaust the event loop's default executor (shared with Convex calls).
+FIRECRAWL_EXECUTOR_MAX_WORKERS = 8
+
+_clients: Dict[tuple[Any, str], Any] = {}
+_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+
+
+def get_firecrawl_client(client_cls: Any, api_key: str) -> Any:
+    """Return a cached Firecrawl client for ``(client_cls, api_key)``."""
+
+    key = (client_cls, api_key)
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = client_cls(api_key=api_key)
+            _clients[key] = client
+        return client
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=FIRECRAWL_EXECUTOR_MAX_WORKERS,
+                thread_name_prefix="firecrawl",
+            )
+        return _executor
+
+
+async def run_firecrawl_call(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking Firecrawl SDK call on the dedicated Firecrawl executor."""
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(fn, *args, **kwargs))
+
+
+def shutdown_firecrawl_clients() -> None:
+    """Drop cached clients and stop the Firecrawl executor (worker shutdown)."""
+
+    global _executor
+    with _lock:
+        _clients.clear()
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
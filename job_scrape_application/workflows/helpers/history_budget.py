@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from temporalio import workflow
+
+from ...config import runtime_config
+
+# ``workflow.patched`` id gating the continue-as-new branches, so executions whose history was
+# recorded before those branches existed replay without them. Callers check it after
+# ``history_budget_exceeded()`` so the marker is only consulted when a run would continue.
+HISTORY_BUDGET_PATCH_ID = "history-budget-continue-as-new"
+
+
+def history_budget_exceeded(
+    *,
+    max_events: int | None = None,
+    max_bytes: int | None = None,
+) -> bool:
+    """Return True when the current run should continue-as-new to keep its history short.
+
+    Budgets default to ``workflow_history_max_events`` / ``workflow_history_max_bytes`` from
+    runtime.yaml; a non-positive budget disables that check. Server suggestions are honoured too.
+    """
+
+    event_budget = runtime_config.workflow_history_max_events if max_events is None else max_events
+    byte_budget = runtime_config.workflow_history_max_bytes if max_bytes is None else max_bytes
+    info = workflow.info()
+    try:
+        suggested = getattr(info, "is_continue_as_new_suggested", None)
+        if callable(suggested) and suggested():
+            return True
+        history_length = getattr(info, "get_current_history_length", None)
+        if event_budget > 0 and callable(history_length) and history_length() >= event_budget:
+            return True
+        history_size = getattr(info, "get_current_history_size", None)
+        if byte_budget > 0 and callable(history_size) and history_size() >= byte_budget:
+            return True
+    except Exception:
+        return False
+    return False
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from typing import Any, AsyncIterator, Dict, Mapping, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger("temporal.worker.activities")
+
+# Key inside a handler's ``get_spidercloud_config`` dict that carries per-host limits.
+# It is stripped from the params before they are sent to SpiderCloud.
+HOST_LIMITS_CONFIG_KEY = "host_limits"
+
+# Back-off signals: captcha walls and explicit throttling responses.
+THROTTLE_HTTP_STATUSES = frozenset({429, 503})
+
+_LIMIT_FIELDS = (
+    "initial_concurrency",
+    "min_concurrency",
+    "max_concurrency",
+    "rate_per_second",
+    "burst",
+    "decrease_factor",
+    "increase_step",
+)
+
+_POLL_SECONDS = 0.05
+
+
+@dataclass(frozen=True)
+class HostLimits:
+    """Token-bucket and AIMD settings for one upstream host."""
+
+    initial_concurrency: float = 4.0
+    min_concurrency: float = 1.0
+    max_concurrency: float = 16.0
+    rate_per_second: float = 4.0
+    burst: float = 8.0
+    decrease_factor: float = 0.5
+    increase_step: float = 1.0
+
+    def merged(self, overrides: Optional[Mapping[str, Any]]) -> "HostLimits":
+        """Return a copy with numeric overrides from a handler config applied."""
+
+        if not isinstance(overrides, Mapping):
+            return self
+        changes: Dict[str, float] = {}
+        for field_name in _LIMIT_FIELDS:
+            value = overrides.get(field_name)
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+                changes[field_name] = float(value)
+        return replace(self, **changes) if changes else self
+
+
+def host_key(url: str) -> str:
+    """Return the lowercase hostname used to bucket a URL."""
+
+    try:
+        return (urlparse(url).hostname or "").lower()
+    except Exception:
+        return ""
+
+
+def split_host_limits(config: Dict[str, Any]) -> tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Separate host limit overrides from SpiderCloud request params."""
+
+    if not isinstance(config, dict) or HOST_LIMITS_CONFIG_KEY not in config:
+        return config, None
+    params = dict(config)
+    overrides = params.pop(HOST_LIMITS_CONFIG_KEY, None)
+    return params, overrides if isinstance(overrides, dict) else None
+
+
+class HostLimiter:
+    """Per-host token bucket with an additive-increase/multiplicative-decrease concurrency cap.
+
+    The limiter only uses ``asyncio.sleep`` while waiting so a single instance can be shared
+    by activities running on different event loops within the worker process.
+    """
+
+    def __init__(self, host: str, limits: HostLimits) -> None:
+        self.host = host
+        self.limits = limits
+        self.concurrency = self._clamp(limits.initial_concurrency)
+        self.in_flight = 0
+        self._tokens = float(limits.burst)
+        self._refilled_at = time.monotonic()
+
+    def _clamp(self, value: float) -> float:
+        return max(self.limits.min_concurrency, min(self.limits.max_concurrency, value))
+
+    def configure(self, limits: HostLimits) -> None:
+        if limits == self.limits:
+            return
+        self.limits = limits
+        self.concurrency = self._clamp(self.concurrency)
+        self._tokens = min(self._tokens, float(limits.burst))
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        if elapsed > 0:
+            self._tokens = min(
+                float(self.limits.burst),
+                self._tokens + elapsed * self.limits.rate_per_second,
+            )
+        self._refilled_at = now
+
+    def _try_acquire(self) -> float:
+        """Take a slot and token when available; otherwise return seconds to wait."""
+
+        if self.in_flight >= int(self.concurrency):
+            return _POLL_SECONDS
+        now = time.monotonic()
+        self._refill(now)
+        if self._tokens < 1.0:
+            rate = self.limits.rate_per_second
+            return max(_POLL_SECONDS, (1.0 - self._tokens) / rate) if rate > 0 else _POLL_SECONDS
+        self._tokens -= 1.0
+        self.in_flight += 1
+        return 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator["HostLimiter"]:
+        while True:
+            delay = self._try_acquire()
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+        try:
+            yield self
+        finally:
+            self.in_flight = max(0, self.in_flight - 1)
+
+    def record_success(self) -> None:
+        previous = self.concurrency
+        self.concurrency = self._clamp(
+            self.concurrency + self.limits.increase_step / max(self.concurrency, 1.0)
+        )
+        if int(self.concurrency) != int(previous):
+            logger.debug(
+                "Host limiter increase host=%s concurrency=%s",
+                self.host,
+                int(self.concurrency),
+            )
+
+    def record_throttle(self, reason: str) -> None:
+        previous = self.concurrency
+        self.concurrency = self._clamp(self.concurrency * self.limits.decrease_factor)
+        # Drain the bucket so the next request waits for a fresh token.
+        self._tokens = min(self._tokens, 0.0)
+        logger.info(
+            "Host limiter backoff host=%s reason=%s concurrency=%s->%s",
+            self.host,
+            reason,
+            int(previous),
+            int(self.concurrency),
+        )
+
+
+_HOST_LIMITERS: Dict[str, HostLimiter] = {}
+
+
+def get_host_limiter(host: str, limits: HostLimits) -> HostLimiter:
+    """Return the worker-process limiter for ``host``, creating it on first use."""
+
+    limiter = _HOST_LIMITERS.get(host)
+    if limiter is None:
+        limiter = HostLimiter(host, limits)
+        _HOST_LIMITERS[host] = limiter
+    else:
+        limiter.configure(limits)
+    return limiter
+
+
+def reset_host_limiters() -> None:
+    """Drop all per-host state (used by tests)."""
+
+    _HOST_LIMITERS.clear()
+
+
+__all__ = [
+    "HOST_LIMITS_CONFIG_KEY",
+    "THROTTLE_HTTP_STATUSES",
+    "HostLimiter",
+    "HostLimits",
+    "get_host_limiter",
+    "host_key",
+    "reset_host_limiters",
+    "split_host_limits",
+]
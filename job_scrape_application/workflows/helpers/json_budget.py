@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import math
+import re
+from typing import Any, Iterator, Optional, Tuple
+
+# Matches json.dumps defaults (ensure_ascii=False, separators=(", ", ": ")).
+_ITEM_SEPARATOR = ", "
+_KEY_SEPARATOR = ": "
+_SHORT_ESCAPES = ("\n", "\r", "\t", "\b", "\f")
+_UNICODE_ESCAPE_RE = re.compile(r"[\x00-\x07\x0b\x0e-\x1f]")
+_encode_string = json.encoder.encode_basestring  # type: ignore[attr-defined]
+
+
+def _string_size(value: str) -> int:
+    size = len(value) + 2 + value.count('"') + value.count("\\")
+    if not value.isprintable():
+        size += sum(value.count(ch) for ch in _SHORT_ESCAPES)
+        # Remaining control characters are written as \u00XX (five extra chars each).
+        size += 5 * len(_UNICODE_ESCAPE_RE.findall(value))
+    return size
+
+
+def _float_text(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    return float.__repr__(value)
+
+
+def _scalar_text(value: Any) -> Optional[str]:
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        return _float_text(value)
+    return None
+
+
+def _key_text(key: Any) -> str:
+    if isinstance(key, str):
+        return key
+    text = _scalar_text(key)
+    return text if text is not None else str(key)
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+def estimate_json_size(value: Any, limit: Optional[int] = None) -> int:
+    """Return the length of ``json.dumps(value, ensure_ascii=False)`` without building it.
+
+    Walks the payload once and stops as soon as the running total exceeds ``limit`` (the
+    returned value is then only a lower bound). Objects ``json`` cannot encode are counted as
+    their quoted ``str()`` form, and circular references are counted once, instead of raising.
+    """
+
+    total = 0
+    active: set[int] = set()
+
+    def _add(amount: int) -> None:
+        nonlocal total
+        total += amount
+        if limit is not None and total > limit:
+            raise _BudgetExceeded
+
+    def _walk(current: Any) -> None:
+        if isinstance(current, str):
+            _add(_string_size(current))
+            return
+        if isinstance(current, (dict, list, tuple)):
+            marker = id(current)
+            if marker in active:
+                return
+            active.add(marker)
+            _add(2 + len(_ITEM_SEPARATOR) * max(len(current) - 1, 0))
+            if isinstance(current, dict):
+                for key, child in current.items():
+                    _add(_string_size(_key_text(key)) + len(_KEY_SEPARATOR))
+                    _walk(child)
+            else:
+                for child in current:
+                    _walk(child)
+            active.discard(marker)
+            return
+        text = _scalar_text(current)
+        _add(len(text) if text is not None else _string_size(str(current)))
+
+    try:
+        _walk(value)
+    except (_BudgetExceeded, RecursionError):
+        pass
+    return total
+
+
+def _iter_json(value: Any, string_limit: int) -> Iterator[str]:
+    if isinstance(value, str):
+        if len(value) > string_limit:
+            # The caller cuts the output before this string ends, so only encode the prefix.
+            yield _encode_string(value[:string_limit])[:-1]
+        else:
+            yield _encode_string(value)
+        return
+    if isinstance(value, dict):
+        yield "{"
+        first = True
+        for key, child in value.items():
+            if not first:
+                yield _ITEM_SEPARATOR
+            first = False
+            if not isinstance(key, (str, int, float, bool)) and key is not None:
+                raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+            yield _encode_string(_key_text(key))
+            yield _KEY_SEPARATOR
+            yield from _iter_json(child, string_limit)
+        yield "}"
+        return
+    if isinstance(value, (list, tuple)):
+        yield "["
+        for index, child in enumerate(value):
+            if index:
+                yield _ITEM_SEPARATOR
+            yield from _iter_json(child, string_limit)
+        yield "]"
+        return
+    text = _scalar_text(value)
+    if text is None:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    yield text
+
+
+def truncate_json(value: Any, max_chars: int) -> Tuple[str, bool]:
+    """Serialize ``value`` like ``json.dumps(ensure_ascii=False)`` up to ``max_chars`` characters.
+
+    Serialization stops once the budget is exhausted, so only the returned prefix is ever
+    encoded. Returns ``(text, truncated)``; raises ``TypeError`` for unserializable values.
+    """
+
+    budget = max(0, max_chars)
+    parts: list[str] = []
+    size = 0
+    for chunk in _iter_json(value, budget + 1):
+        parts.append(chunk)
+        size += len(chunk)
+        if size > budget:
+            return "".join(parts)[:budget], True
+    return "".join(parts), False
+
+
+__all__ = ["estimate_json_size", "truncate_json"]
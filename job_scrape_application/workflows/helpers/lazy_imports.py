@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable, Dict, Iterable, MutableMapping, Tuple
+
+LazyAttrs = Dict[str, Tuple[str, str]]
+
+
+def lazy_module_attrs(
+    module_globals: MutableMapping[str, Any],
+    attrs: LazyAttrs,
+    optional: Iterable[str] = (),
+) -> Tuple[Callable[[str], Any], Callable[[str], Any]]:
+    """Defer importing provider SDKs until a module attribute is first used.
+
+    ``attrs`` maps an exported name to ``(module, attribute)``. Returns ``(resolve, getattr)``:
+    ``resolve(name)`` is what module code calls at use time, and ``getattr`` is meant to be
+    assigned to the module's ``__getattr__`` (PEP 562) so ``module.Name`` keeps working for
+    callers and for ``monkeypatch.setattr``. Resolved values are cached in the module globals,
+    which also means a patched attribute always wins over the lazy import. Names listed in
+    ``optional`` resolve to ``None`` when the SDK does not ship them.
+    """
+
+    optional_names = frozenset(optional)
+    module_name = module_globals.get("__name__", "<module>")
+
+    def resolve(name: str) -> Any:
+        if name in module_globals:
+            return module_globals[name]
+        source_module, source_attr = attrs[name]
+        try:
+            value = getattr(importlib.import_module(source_module), source_attr)
+        except (ImportError, AttributeError):
+            if name not in optional_names:
+                raise
+            value = None
+        module_globals[name] = value
+        return value
+
+    def module_getattr(name: str) -> Any:
+        if name in attrs:
+            return resolve(name)
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return resolve, module_getattr
+
+
+__all__ = ["lazy_module_attrs"]
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import html as html_lib
 import re
+from functools import lru_cache
 from typing import Any, Iterable, Sequence
 from urllib.parse import urljoin, urlparse, urlunparse
 
+from .parsed_url import URL_CACHE_SIZE
 from .regex_patterns import URL_PATTERN
 
 def _is_nonempty_string(value: Any) -> bool:
@@ -57,6 +59,17 @@ def fix_scheme_slashes(candidate: str) -> str:
 def _normalize_http_url(candidate: str) -> str:
     if not candidate.startswith(("http://", "https://")):
         return candidate
+    rest = candidate[candidate.index("://") + 3 :]
+    if (
+        "//" not in rest
+        and not rest.endswith("/")
+        and "?" not in rest
+        and "#" not in rest
+        and ";" not in rest
+        and rest.isprintable()
+    ):
+        # Already canonical: urlunparse(urlparse(...)) would return it unchanged.
+        return candidate
     try:
         parsed = urlparse(candidate)
     except Exception:
@@ -99,11 +112,20 @@ def normalize_url(url: str | None, *, base_url: str | None = None) -> str | None
     return None
 
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def cached_normalize_url(url: str, base_url: str | None = None) -> str | None:
+    """``normalize_url`` memoized on the raw string and base URL."""
+
+    return normalize_url(url, base_url=base_url)
+
+
 def normalize_url_list(urls: Iterable[str], *, base_url: str | None = None) -> list[str]:
     normalized: list[str] = []
     seen: set[str] = set()
     for candidate in urls:
-        normalized_url = normalize_url(candidate, base_url=base_url)
+        if not isinstance(candidate, str):
+            continue
+        normalized_url = cached_normalize_url(candidate, base_url)
         if not normalized_url:
             continue
         if normalized_url in seen:
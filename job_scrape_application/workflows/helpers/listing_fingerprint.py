@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from ...config import runtime_config
+
+
+def listing_unchanged(site: Dict[str, Any], fingerprint: Optional[str], now_ms: int) -> bool:
+    """Return True when the listing matches the fingerprint stored by the site's last full run.
+
+    Manual triggers and fingerprints older than ``listing_fingerprint_max_age_hours`` always
+    get a full run.
+    """
+
+    if not fingerprint or site.get("listingFingerprint") != fingerprint:
+        return False
+    max_age_ms = runtime_config.listing_fingerprint_max_age_hours * 3_600_000
+    recorded_at = site.get("listingFingerprintAt")
+    if max_age_ms <= 0 or not isinstance(recorded_at, (int, float)) or now_ms - recorded_at >= max_age_ms:
+        return False
+    manual_trigger_at = site.get("manualTriggerAt") or 0
+    return not (isinstance(manual_trigger_at, (int, float)) and manual_trigger_at > (site.get("lastRunAt") or 0))
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+from urllib.parse import ParseResult, parse_qsl, urlparse
+
+# Listing pages can carry thousands of job links, and each link is checked by several
+# handler predicates; size the caches so one large listing stays resident.
+URL_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def cached_urlparse(url: str) -> ParseResult:
+    """``urlparse`` memoized per URL string (results are immutable named tuples)."""
+
+    return urlparse(url)
+
+
+@dataclass(frozen=True)
+class ParsedUrl:
+    """A URL split once, with the pieces site handlers keep recomputing."""
+
+    url: str
+    parts: ParseResult
+    scheme: str
+    host: str
+    path: str
+    path_lower: str
+    segments: Tuple[str, ...]
+    query: Mapping[str, str]
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def parse_url(url: str) -> Optional[ParsedUrl]:
+    """Return a cached ``ParsedUrl`` for ``url``, or ``None`` when it cannot be parsed.
+
+    ``host`` is the lowercased hostname (empty when missing), ``segments`` are the
+    non-empty path segments, and ``query`` maps each parameter to its first value.
+    """
+
+    try:
+        parts = cached_urlparse(url)
+        host = (parts.hostname or "").lower()
+    except Exception:
+        return None
+    path = parts.path or ""
+    query: dict[str, str] = {}
+    for key, value in parse_qsl(parts.query, keep_blank_values=True):
+        query.setdefault(key, value)
+    return ParsedUrl(
+        url=url,
+        parts=parts,
+        scheme=parts.scheme,
+        host=host,
+        path=path,
+        path_lower=path.lower(),
+        segments=tuple(segment for segment in path.split("/") if segment),
+        query=MappingProxyType(query),
+    )
+
+
+__all__ = ["URL_CACHE_SIZE", "ParsedUrl", "cached_urlparse", "parse_url"]
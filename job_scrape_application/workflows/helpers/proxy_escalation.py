@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+logger = logging.getLogger("temporal.worker.activities")
+
+# Tier 0 is always a direct request; higher tiers are SpiderCloud proxy names.
+DIRECT_TIER_LABEL = "direct"
+
+
+@dataclass
+class HostEscalation:
+    """Remembered proxy tier for one host."""
+
+    tier: int = 0
+    clean_streak: int = 0
+
+
+class ProxyEscalationStore:
+    """Per-host memory of the proxy tier that last got past a captcha wall.
+
+    New requests start at the remembered tier. After ``decay_after`` clean responses
+    in a row the host steps back down one tier, so hosts that stop challenging return
+    to direct requests. With ``db_path`` set, tier changes are persisted to SQLite so
+    restarts and sibling worker processes on the host start from the learned tier.
+    """
+
+    def __init__(
+        self,
+        proxies: Sequence[str],
+        *,
+        decay_after: int = 20,
+        db_path: Optional[str] = None,
+    ) -> None:
+        self.tiers: tuple[Optional[str], ...] = (None, *proxies)
+        self.decay_after = max(1, int(decay_after))
+        self.db_path = db_path or None
+        self._hosts: Dict[str, HostEscalation] = {}
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        if self.db_path:
+            self._open_db()
+
+    @property
+    def max_tier(self) -> int:
+        return len(self.tiers) - 1
+
+    def proxy_for(self, tier: int) -> Optional[str]:
+        return self.tiers[max(0, min(tier, self.max_tier))]
+
+    def tier_label(self, tier: int) -> str:
+        return self.proxy_for(tier) or DIRECT_TIER_LABEL
+
+    def _open_db(self) -> None:
+        try:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=1.0)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS proxy_escalation ("
+                "host TEXT PRIMARY KEY, proxy TEXT NOT NULL, updated_at INTEGER NOT NULL)"
+            )
+            conn.commit()
+        except sqlite3.Error:
+            logger.warning("Proxy escalation store unavailable path=%s", self.db_path, exc_info=True)
+            return
+        self._db = conn
+
+    def _load(self, host: str) -> HostEscalation:
+        state = HostEscalation()
+        if self._db is None:
+            return state
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT proxy FROM proxy_escalation WHERE host = ?", (host,)
+                ).fetchone()
+        except sqlite3.Error:
+            logger.debug("Proxy escalation read failed host=%s", host, exc_info=True)
+            return state
+        if row and row[0] in self.tiers:
+            state.tier = self.tiers.index(row[0])
+        return state
+
+    def _persist(self, host: str, tier: int) -> None:
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO proxy_escalation (host, proxy, updated_at) VALUES (?, ?, ?)",
+                    (host, self.proxy_for(tier) or "", int(time.time() * 1000)),
+                )
+                self._db.commit()
+        except sqlite3.Error:
+            logger.debug("Proxy escalation write failed host=%s", host, exc_info=True)
+
+    def state(self, host: str) -> HostEscalation:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._load(host)
+            self._hosts[host] = state
+        return state
+
+    def start_tier(self, host: str) -> int:
+        """Return the tier a new request to ``host`` should start at."""
+
+        return min(self.state(host).tier, self.max_tier)
+
+    def next_tier(self, tier: int) -> int:
+        return min(tier + 1, self.max_tier)
+
+    def record_success(self, host: str, tier: int) -> None:
+        """Record a clean (non-captcha) response fetched at ``tier``."""
+
+        state = self.state(host)
+        if tier > state.tier:
+            self._set_tier(host, state, tier)
+            return
+        if state.tier == 0:
+            return
+        state.clean_streak += 1
+        if state.clean_streak >= self.decay_after:
+            self._set_tier(host, state, state.tier - 1)
+
+    def _set_tier(self, host: str, state: HostEscalation, tier: int) -> None:
+        previous = state.tier
+        state.tier = tier
+        state.clean_streak = 0
+        if tier != previous:
+            logger.info(
+                "Proxy escalation host=%s tier=%s->%s",
+                host,
+                self.tier_label(previous),
+                self.tier_label(tier),
+            )
+            self._persist(host, tier)
+
+
+_STORE: Optional[ProxyEscalationStore] = None
+
+
+def get_proxy_escalation_store(
+    proxies: Sequence[str],
+    *,
+    decay_after: int,
+    db_path: Optional[str] = None,
+) -> ProxyEscalationStore:
+    """Return the worker-process escalation store, creating it on first use."""
+
+    global _STORE
+    if (
+        _STORE is None
+        or _STORE.tiers[1:] != tuple(proxies)
+        or _STORE.db_path != (db_path or None)
+    ):
+        _STORE = ProxyEscalationStore(proxies, decay_after=decay_after, db_path=db_path)
+    else:
+        _STORE.decay_after = max(1, int(decay_after))
+    return _STORE
+
+
+def reset_proxy_escalation() -> None:
+    """Drop all per-host escalation state (used by tests)."""
+
+    global _STORE
+    _STORE = None
+
+
+__all__ = [
+    "DIRECT_TIER_LABEL",
+    "HostEscalation",
+    "ProxyEscalationStore",
+    "get_proxy_escalation_store",
+    "reset_proxy_escalation",
+]
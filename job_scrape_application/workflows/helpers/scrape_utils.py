@@ -7,6 +7,7 @@ import unicodedata
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
@@ -14,7 +15,8 @@ from urllib.parse import urlparse
 from ...constants import is_remote_company, title_matches_required_keywords
 from pydantic import BaseModel, ConfigDict, Field
 
-from .link_extractors import dedupe_str_list, extract_links_from_payload
+from .json_budget import estimate_json_size, truncate_json
+from .link_extractors import dedupe_str_list, extract_links_from_payload, normalize_url
 from .regex_patterns import (
     DIGIT_PATTERN,
     ERROR_404_PATTERN,
@@ -971,7 +973,7 @@ def _url_suggests_listing(url: str | None) -> bool:
         normalized = _normalize_location_key(slug.replace("-", " ").replace("_", " "))
         if not normalized:
             return False
-        if normalized in _COUNTRY_KEY_TO_LABEL:
+        if normalized in _location_index().country_key_to_label:
             return True
         for state_name in _STATE_ABBR_BY_NAME:
             if _normalize_location_key(state_name) in normalized:
@@ -1187,64 +1189,84 @@ def _format_location_label(city: str | None, state: str | None, country: str | N
 
 
 _LOCATION_DICT_PATH = Path(__file__).resolve().parents[3] / "job_board_application" / "convex" / "locationDictionary.json"
-try:
-    _raw_location_entries = json.loads(_LOCATION_DICT_PATH.read_text(encoding="utf-8"))
-except FileNotFoundError:
-    _raw_location_entries = []
-
-_LOCATION_ENTRIES: list[dict[str, Any]] = []
-if isinstance(_raw_location_entries, list):
-    _LOCATION_ENTRIES = [entry for entry in _raw_location_entries if isinstance(entry, dict)]
-elif isinstance(_raw_location_entries, dict):
-    for city_key, value in _raw_location_entries.items():
-        if isinstance(value, list):
-            for entry in value:
-                if isinstance(entry, dict):
-                    if "city" not in entry:
-                        entry = {**entry, "city": city_key}
-                    _LOCATION_ENTRIES.append(entry)
-        elif isinstance(value, dict):
-            if "city" not in value:
-                value = {**value, "city": city_key}
-            _LOCATION_ENTRIES.append(value)
-
-_LOCATION_DICTIONARY: dict[str, dict[str, Any]] = {}
-_CITY_KEYWORDS: dict[str, dict[str, Any]] = {}
-_COUNTRY_KEY_TO_LABEL: dict[str, str] = {}
-
-
-def _register_location_key(value: str, entry: dict[str, Any], track_city: bool = False) -> None:
-    key = _normalize_location_key(value)
-    if not key or key in _LOCATION_DICTIONARY:
-        return
-    _LOCATION_DICTIONARY[key] = entry
-    if track_city and not entry.get("remoteOnly"):
-        _CITY_KEYWORDS[key] = entry
-
-
-for _entry in _LOCATION_ENTRIES:
-    city = (_entry.get("city") or "").strip()
-    state = (_entry.get("state") or "").strip() or "Unknown"
-    country = (_entry.get("country") or "").strip() or None
-    remote_only = bool(_entry.get("remoteOnly"))
-    state_abbr = _STATE_ABBR_BY_NAME.get(state)
-    record = {"city": city, "state": state, "country": country, "remoteOnly": remote_only}
-    country_key = _normalize_location_key(country)
-    if country_key and country_key not in _COUNTRY_KEY_TO_LABEL:
-        _COUNTRY_KEY_TO_LABEL[country_key] = country
-    aliases = set([city, *(_entry.get("aliases") or [])])
-    for alias in aliases:
-        _register_location_key(alias, record, track_city=True)
-        _register_location_key(f"{alias}, {state}", record)
-        if country:
-            _register_location_key(f"{alias}, {country}", record)
-        if state_abbr:
-            _register_location_key(f"{alias}, {state_abbr}", record)
-
-_LOCATION_DICTIONARY_KEYS: list[tuple[str, dict[str, Any]]] = sorted(
-    _LOCATION_DICTIONARY.items(), key=lambda item: len(item[0]), reverse=True
-)
-_CITY_KEYWORD_KEYS: list[str] = sorted(_CITY_KEYWORDS.keys(), key=len, reverse=True)
+
+
+@dataclass(frozen=True)
+class _LocationIndex:
+    dictionary: dict[str, dict[str, Any]]
+    city_keywords: dict[str, dict[str, Any]]
+    country_key_to_label: dict[str, str]
+    # Longest keys first so "new york city" wins over "york".
+    dictionary_keys: list[tuple[str, dict[str, Any]]]
+    city_keyword_keys: list[str]
+
+
+def _load_location_entries() -> list[dict[str, Any]]:
+    try:
+        raw_entries = json.loads(_LOCATION_DICT_PATH.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return []
+
+    entries: list[dict[str, Any]] = []
+    if isinstance(raw_entries, list):
+        entries = [entry for entry in raw_entries if isinstance(entry, dict)]
+    elif isinstance(raw_entries, dict):
+        for city_key, value in raw_entries.items():
+            if isinstance(value, list):
+                for entry in value:
+                    if isinstance(entry, dict):
+                        if "city" not in entry:
+                            entry = {**entry, "city": city_key}
+                        entries.append(entry)
+            elif isinstance(value, dict):
+                if "city" not in value:
+                    value = {**value, "city": city_key}
+                entries.append(value)
+    return entries
+
+
+@lru_cache(maxsize=1)
+def _location_index() -> _LocationIndex:
+    """Build the location lookup tables on first use instead of at import time."""
+
+    dictionary: dict[str, dict[str, Any]] = {}
+    city_keywords: dict[str, dict[str, Any]] = {}
+    country_key_to_label: dict[str, str] = {}
+
+    def _register_location_key(value: str, entry: dict[str, Any], track_city: bool = False) -> None:
+        key = _normalize_location_key(value)
+        if not key or key in dictionary:
+            return
+        dictionary[key] = entry
+        if track_city and not entry.get("remoteOnly"):
+            city_keywords[key] = entry
+
+    for entry in _load_location_entries():
+        city = (entry.get("city") or "").strip()
+        state = (entry.get("state") or "").strip() or "Unknown"
+        country = (entry.get("country") or "").strip() or None
+        remote_only = bool(entry.get("remoteOnly"))
+        state_abbr = _STATE_ABBR_BY_NAME.get(state)
+        record = {"city": city, "state": state, "country": country, "remoteOnly": remote_only}
+        country_key = _normalize_location_key(country)
+        if country_key and country_key not in country_key_to_label:
+            country_key_to_label[country_key] = country
+        aliases = set([city, *(entry.get("aliases") or [])])
+        for alias in aliases:
+            _register_location_key(alias, record, track_city=True)
+            _register_location_key(f"{alias}, {state}", record)
+            if country:
+                _register_location_key(f"{alias}, {country}", record)
+            if state_abbr:
+                _register_location_key(f"{alias}, {state_abbr}", record)
+
+    return _LocationIndex(
+        dictionary=dictionary,
+        city_keywords=city_keywords,
+        country_key_to_label=country_key_to_label,
+        dictionary_keys=sorted(dictionary.items(), key=lambda item: len(item[0]), reverse=True),
+        city_keyword_keys=sorted(city_keywords.keys(), key=len, reverse=True),
+    )
 
 
 def _resolve_location_from_dictionary(value: str, allow_remote: bool = True) -> Optional[dict[str, Any]]:
@@ -1255,11 +1277,12 @@ def _resolve_location_from_dictionary(value: str, allow_remote: bool = True) ->
     if country_label:
         return {"city": None, "state": None, "country": country_label}
 
-    direct = _LOCATION_DICTIONARY.get(normalized)
+    index = _location_index()
+    direct = index.dictionary.get(normalized)
     if direct and (allow_remote or not direct.get("remoteOnly")):
         return direct
 
-    for key, entry in _LOCATION_DICTIONARY_KEYS:
+    for key, entry in index.dictionary_keys:
         if not allow_remote and entry.get("remoteOnly"):
             continue
         if entry.get("remoteOnly"):
@@ -1276,14 +1299,15 @@ def _resolve_location_from_dictionary(value: str, allow_remote: bool = True) ->
 
 def _find_city_in_text(text: str) -> Optional[dict[str, Any]]:
     normalized_text = _normalize_location_key(text)
-    for key in _CITY_KEYWORD_KEYS:
+    index = _location_index()
+    for key in index.city_keyword_keys:
         idx = normalized_text.find(key)
         if idx == -1:
             continue
         before_ok = idx == 0 or normalized_text[idx - 1] == " "
         after_ok = idx + len(key) == len(normalized_text) or normalized_text[idx + len(key)] == " "
         if before_ok and after_ok:
-            entry = _CITY_KEYWORDS.get(key)
+            entry = index.city_keywords.get(key)
             if entry:
                 return entry
     return None
@@ -1293,7 +1317,7 @@ def _normalize_country_label(value: str) -> Optional[str]:
     key = _normalize_location_key(value)
     if not key:
         return None
-    return _COUNTRY_KEY_TO_LABEL.get(key)
+    return _location_index().country_key_to_label.get(key)
 
 
 def normalize_company_hint(value: Any) -> Optional[str]:
@@ -2116,6 +2140,29 @@ def parse_posted_at_with_unknown(value: Any) -> tuple[int, bool]:
 
     return now_ms, True
 
+
+def greenhouse_updated_at_by_url(board: Any, slug: str = "") -> Dict[str, int]:
+    """Map each board job's absolute and API URLs to its ``updated_at`` in epoch ms.
+
+    Jobs without a parseable ``updated_at`` are left out, so callers treat them as
+    unknown rather than as changed.
+    """
+
+    updated_at_by_url: Dict[str, int] = {}
+    for job in getattr(board, "jobs", None) or []:
+        updated_at, unknown = parse_posted_at_with_unknown(getattr(job, "updated_at", None))
+        if unknown:
+            continue
+        candidates = [getattr(job, "absolute_url", None)]
+        job_id = getattr(job, "id", None)
+        if slug and job_id is not None:
+            candidates.append(f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs/{job_id}")
+        for candidate in candidates:
+            if isinstance(candidate, str) and candidate:
+                updated_at_by_url[normalize_url(candidate) or candidate] = updated_at
+    return updated_at_by_url
+
+
 @dataclass(frozen=True)
 class _HintApplicationConfig:
     apply_location_when_empty: bool
@@ -2416,6 +2463,9 @@ class _JobRowNormalizer:
             "postedAt": int(row.get("posted_at") or context.default_posted_at),
             "postedAtUnknown": bool(posted_at_unknown),
         }
+        updated_at = row.get("updated_at")
+        if isinstance(updated_at, (int, float)) and not isinstance(updated_at, bool):
+            job["sourceUpdatedAt"] = int(updated_at)
         if context.scraped_at:
             job["scrapedAt"] = context.scraped_at
         if context.scraped_with:
@@ -2443,17 +2493,21 @@ def _shrink_payload(value: Any, max_chars: int) -> Any:
         return None
 
     try:
-        serialized = json.dumps(value, ensure_ascii=False)
+        preview, clipped = truncate_json(value, max_chars)
     except Exception:
         try:
             serialized = str(value)
         except Exception:
             return None
+        if len(serialized) <= max_chars:
+            return value
+        return f"{serialized[:max_chars]}... (+{len(serialized) - max_chars} chars)"
 
-    if len(serialized) <= max_chars:
+    if not clipped:
         return value
 
-    return f"{serialized[:max_chars]}... (+{len(serialized) - max_chars} chars)"
+    # Only the preview is serialized; the overflow count comes from the size estimator.
+    return f"{preview}... (+{estimate_json_size(value) - max_chars} chars)"
 
 
 def _trim_request_snapshot(raw_request: Any, max_chars: int) -> Any:
@@ -2545,8 +2599,7 @@ def trim_scrape_for_convex(
     raw_preview = None
     if isinstance(items, dict) and "raw" in items and raw_preview_chars > 0:
         try:
-            raw_str = json.dumps(items["raw"], ensure_ascii=False)
-            raw_preview = raw_str[:raw_preview_chars]
+            raw_preview, _ = truncate_json(items["raw"], raw_preview_chars)
         except Exception:
             raw_preview = None
 
@@ -2800,6 +2853,7 @@ __all__ = [
     "extract_description",
     "extract_raw_body_from_fetchfox_result",
     "fetch_seen_urls_for_site",
+    "greenhouse_updated_at_by_url",
     "looks_like_job_listing_page",
     "normalize_fetchfox_items",
     "normalize_firecrawl_items",
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .link_extractors import cached_normalize_url
+
+if TYPE_CHECKING:
+    from ..site_handlers.base import BaseSiteHandler, UrlClassification
+
+
+@dataclass(frozen=True)
+class UrlBatch:
+    """A list of URLs normalized, canonicalized, deduped and classified in one pass.
+
+    Build it once where a listing's URLs enter the pipeline and hand the same object to the
+    diff and enqueue stages instead of re-running ``normalize_url`` over the list at each
+    step. ``urls`` keeps first-seen order; ``canonical_by_raw`` maps every raw input string
+    that survived to its canonical form, so timestamp maps keyed by raw listing URLs line up
+    with ``urls`` without normalizing again.
+    """
+
+    urls: Tuple[str, ...] = ()
+    canonical_by_raw: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    classifications: Mapping[str, "UrlClassification"] = field(default_factory=lambda: MappingProxyType({}))
+    base_url: Optional[str] = None
+
+    @classmethod
+    def from_values(
+        cls,
+        values: Iterable[Any],
+        *,
+        base_url: Optional[str] = None,
+        handler: Optional["BaseSiteHandler"] = None,
+        keep_unnormalized: bool = False,
+        limit: Optional[int] = None,
+    ) -> "UrlBatch":
+        """Normalize ``values`` once, caching by raw string.
+
+        Non-strings and blanks are skipped. Values ``normalize_url`` rejects are dropped
+        unless ``keep_unnormalized`` is set, in which case the stripped raw string is kept
+        (the SpiderCloud batch behaviour). With a ``handler`` every kept URL is classified
+        via ``handler.classify``.
+        """
+
+        urls: List[str] = []
+        seen: set[str] = set()
+        canonical_by_raw: Dict[str, str] = {}
+        rejected: set[str] = set()
+        for value in values:
+            if not isinstance(value, str):
+                continue
+            canonical = canonical_by_raw.get(value)
+            if canonical is None:
+                if value in rejected:
+                    continue
+                canonical = cached_normalize_url(value, base_url)
+                if not canonical and keep_unnormalized:
+                    canonical = value.strip().replace("\\", "/") or None
+                if not canonical:
+                    rejected.add(value)
+                    continue
+                canonical_by_raw[value] = canonical
+            if canonical in seen:
+                continue
+            seen.add(canonical)
+            urls.append(canonical)
+            if limit is not None and len(urls) >= limit:
+                break
+
+        classifications: Dict[str, "UrlClassification"] = {}
+        if handler is not None:
+            for url in urls:
+                classifications[url] = handler.classify(url)
+        return cls(
+            urls=tuple(urls),
+            canonical_by_raw=MappingProxyType(canonical_by_raw),
+            classifications=MappingProxyType(classifications),
+            base_url=base_url,
+        )
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.urls)
+
+    def canonical(self, value: str) -> Optional[str]:
+        """Canonical form of ``value``, reusing the batch's mapping when it was an input."""
+
+        canonical = self.canonical_by_raw.get(value)
+        if canonical is not None:
+            return canonical
+        return cached_normalize_url(value, self.base_url)
+
+    def timestamps_by_url(self, values: Any) -> Dict[str, int]:
+        """Re-key a ``{url: epoch_ms}`` map by canonical URL, dropping non-numeric values."""
+
+        lookup: Dict[str, int] = {}
+        if not isinstance(values, dict):
+            return lookup
+        for key, value in values.items():
+            if not isinstance(key, str) or not isinstance(value, (int, float)):
+                continue
+            lookup[self.canonical(key) or key] = int(value)
+        return lookup
+
+    @property
+    def listing_urls(self) -> List[str]:
+        return [url for url in self.urls if url in self.classifications and self.classifications[url].listing]
+
+    @property
+    def job_urls(self) -> List[str]:
+        """URLs classified as job details (every URL when no handler was given)."""
+
+        if not self.classifications:
+            return list(self.urls)
+        return [url for url in self.urls if self.classifications[url].job_detail]
+
+
+__all__ = ["UrlBatch"]
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import temporalio.converter
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import DataConverter, PayloadCodec
+
+from ..config import runtime_config
+from ..services import telemetry
+
+try:  # Optional dependency; zlib is always available.
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+logger = logging.getLogger("temporal.worker.codec")
+
+ENCODING_METADATA_KEY = "encoding"
+ZLIB_ENCODING = b"binary/zlib"
+ZSTD_ENCODING = b"binary/zstd"
+CODEC_STATS_LOG_INTERVAL_SECONDS = 300
+
+
+@dataclass
+class CodecStats:
+    """Cumulative counters describing what the codec did since the last snapshot."""
+
+    encoded_payloads: int = 0
+    compressed_payloads: int = 0
+    decoded_payloads: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    encode_seconds: float = 0.0
+    decode_seconds: float = 0.0
+
+    @property
+    def compression_ratio(self) -> Optional[float]:
+        if self.bytes_out <= 0:
+            return None
+        return self.bytes_in / self.bytes_out
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = dataclasses.asdict(self)
+        ratio = self.compression_ratio
+        data["compression_ratio"] = round(ratio, 2) if ratio is not None else None
+        return data
+
+
+class CompressionCodec(PayloadCodec):
+    """Compress serialized payloads larger than ``threshold_bytes``.
+
+    The whole ``Payload`` message is compressed so its original metadata round-trips. Payloads
+    without one of our encodings are passed through on decode, which keeps histories written
+    before the codec was enabled (or with ``algorithm="none"``) readable.
+    """
+
+    def __init__(self, algorithm: str = "zlib", threshold_bytes: int = 4096, level: int = 6) -> None:
+        algorithm = (algorithm or "zlib").lower()
+        if algorithm == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed; falling back to zlib payload compression")
+            algorithm = "zlib"
+        if algorithm not in {"zlib", "zstd", "none"}:
+            logger.warning("Unknown payload codec %r; falling back to zlib", algorithm)
+            algorithm = "zlib"
+        self.algorithm = algorithm
+        self.threshold_bytes = max(0, threshold_bytes)
+        self.level = level
+        self.stats = CodecStats()
+
+    def _compress(self, data: bytes) -> tuple[bytes, bytes]:
+        if self.algorithm == "zstd":
+            return ZSTD_ENCODING, zstandard.ZstdCompressor(level=3).compress(data)
+        return ZLIB_ENCODING, zlib.compress(data, self.level)
+
+    @staticmethod
+    def _decompress(encoding: bytes, data: bytes) -> bytes:
+        if encoding == ZSTD_ENCODING:
+            if zstandard is None:
+                raise RuntimeError("Received a zstd-compressed payload but zstandard is not installed")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
+
+    async def encode(self, payloads: Sequence[Payload]) -> List[Payload]:
+        started = time.perf_counter()
+        encoded: List[Payload] = []
+        for payload in payloads:
+            self.stats.encoded_payloads += 1
+            raw = payload.SerializeToString()
+            if self.algorithm == "none" or len(raw) < self.threshold_bytes:
+                encoded.append(payload)
+                continue
+            encoding, compressed = self._compress(raw)
+            if len(compressed) >= len(raw):
+                encoded.append(payload)
+                continue
+            self.stats.compressed_payloads += 1
+            self.stats.bytes_in += len(raw)
+            self.stats.bytes_out += len(compressed)
+            encoded.append(Payload(metadata={ENCODING_METADATA_KEY: encoding}, data=compressed))
+        self.stats.encode_seconds += time.perf_counter() - started
+        return encoded
+
+    async def decode(self, payloads: Sequence[Payload]) -> List[Payload]:
+        started = time.perf_counter()
+        decoded: List[Payload] = []
+        for payload in payloads:
+            encoding = payload.metadata.get(ENCODING_METADATA_KEY)
+            if encoding not in (ZLIB_ENCODING, ZSTD_ENCODING):
+                decoded.append(payload)
+                continue
+            self.stats.decoded_payloads += 1
+            decoded.append(Payload.FromString(self._decompress(encoding, payload.data)))
+        self.stats.decode_seconds += time.perf_counter() - started
+        return decoded
+
+    def snapshot_stats(self, *, reset: bool = True) -> CodecStats:
+        snapshot = dataclasses.replace(self.stats)
+        if reset:
+            self.stats = CodecStats()
+        return snapshot
+
+
+def build_payload_codec() -> CompressionCodec:
+    return CompressionCodec(
+        algorithm=runtime_config.temporal_payload_codec,
+        threshold_bytes=runtime_config.temporal_payload_compression_threshold_bytes,
+    )
+
+
+def build_data_converter(codec: Optional[CompressionCodec] = None) -> DataConverter:
+    """Return the default data converter with payload compression applied."""
+
+    return dataclasses.replace(
+        temporalio.converter.default(),
+        payload_codec=codec or build_payload_codec(),
+    )
+
+
+async def log_codec_stats(codec: CompressionCodec, worker_id: str) -> None:
+    """Periodically log compression ratio and codec time for this worker process."""
+
+    while True:
+        await asyncio.sleep(CODEC_STATS_LOG_INTERVAL_SECONDS)
+        stats = codec.snapshot_stats()
+        if stats.encoded_payloads == 0 and stats.decoded_payloads == 0:
+            continue
+        summary = stats.as_dict()
+        logger.info(
+            "Payload codec stats algorithm=%s encoded=%s compressed=%s decoded=%s ratio=%s "
+            "encode_ms=%.1f decode_ms=%.1f",
+            codec.algorithm,
+            stats.encoded_payloads,
+            stats.compressed_payloads,
+            stats.decoded_payloads,
+            summary["compression_ratio"],
+            stats.encode_seconds * 1000,
+            stats.decode_seconds * 1000,
+        )
+        try:
+            telemetry.emit_posthog_log(
+                {
+                    "event": "temporal.payload_codec.stats",
+                    "message": "Payload codec stats",
+                    "level": "info",
+                    "workerId": worker_id,
+                    "algorithm": codec.algorithm,
+                    **summary,
+                }
+            )
+        except Exception:
+            logger.debug("Failed to emit payload codec stats", exc_info=True)
+
+
+__all__ = [
+    "CodecStats",
+    "CompressionCodec",
+    "build_data_converter",
+    "build_payload_codec",
+    "log_codec_stats",
+]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from temporalio.worker.workflow_sandbox import SandboxedWorkflowRunner, SandboxRestrictions
+
+# Modules forwarded from the host interpreter instead of being re-imported for every workflow run.
+# Only list modules that are deterministic at import time and never mutate state shared with
+# workflow code; workflow definition modules themselves must stay sandboxed.
+PROJECT_PASSTHROUGH_MODULES: tuple[str, ...] = (
+    "job_scrape_application.config",
+    "job_scrape_application.constants",
+    "job_scrape_application.components",
+    "job_scrape_application.services",
+    "job_scrape_application.testing",
+    "job_scrape_application.workflows.activities",
+    "job_scrape_application.workflows.exceptions",
+    "job_scrape_application.workflows.helpers",
+    "job_scrape_application.workflows.scrapers",
+    "job_scrape_application.workflows.site_handlers",
+)
+
+THIRD_PARTY_PASSTHROUGH_MODULES: tuple[str, ...] = (
+    "convex",
+    "dotenv",
+    "fetchfox_sdk",
+    "firecrawl",
+    "httpx",
+    "opentelemetry",
+    "posthog",
+    "pydantic",
+    "pydantic_core",
+    "spider",
+    "yaml",
+)
+
+SANDBOX_PASSTHROUGH_MODULES: tuple[str, ...] = PROJECT_PASSTHROUGH_MODULES + THIRD_PARTY_PASSTHROUGH_MODULES
+
+
+def build_workflow_runner(extra_passthrough: Sequence[str] = ()) -> SandboxedWorkflowRunner:
+    """Return the sandboxed runner used by our workers, with the curated passthrough list."""
+
+    restrictions = SandboxRestrictions.default.with_passthrough_modules(
+        *SANDBOX_PASSTHROUGH_MODULES,
+        *extra_passthrough,
+    )
+    return SandboxedWorkflowRunner(restrictions=restrictions)
+
+
+__all__ = [
+    "PROJECT_PASSTHROUGH_MODULES",
+    "SANDBOX_PASSTHROUGH_MODULES",
+    "THIRD_PARTY_PASSTHROUGH_MODULES",
+    "build_workflow_runner",
+]
@@ -2,13 +2,49 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from ..services import telemetry
-from ..config import settings
+from ..config import runtime_config, settings
 from ..services.convex_client import convex_query
 
+if TYPE_CHECKING:
+    from .schedule_index import ScheduleDecisionIndex
+
+DEFAULT_TIMEZONE = "America/Denver"
+MANUAL_TRIGGER_WINDOW_MS = 15 * 60 * 1000
+AUDIT_INTERVAL_SECONDS = 60 * 30
+
+# Mirrors SPIDER_CLOUD_DEFAULT_SITE_TYPES in job_board_application/convex/siteTypes.ts.
+SPIDER_CLOUD_DEFAULT_SITE_TYPES = frozenset(
+    {
+        "greenhouse",
+        "ashby",
+        "avature",
+        "workday",
+        "netflix",
+        "uber",
+        "cisco",
+        "adobe",
+        "docusign",
+        "notion",
+        "paloalto",
+        "openai",
+    }
+)
+
+
+def site_group(site: Dict[str, Any]) -> Tuple[str, str]:
+    """Return the ``(siteType, scrapeProvider)`` pair leaseSite filters on."""
+
+    site_type = site.get("type") or "general"
+    provider = site.get("scrapeProvider") or (
+        "spidercloud" if site_type in SPIDER_CLOUD_DEFAULT_SITE_TYPES else "fetchfox"
+    )
+    return str(site_type), str(provider)
+
 
 def _zoned_parts(now_ms: int, tz_name: str) -> Dict[str, int | str]:
     dt_aware = __import__("datetime").datetime.fromtimestamp(now_ms / 1000, ZoneInfo(tz_name))
@@ -23,23 +59,24 @@ def _zoned_parts(now_ms: int, tz_name: str) -> Dict[str, int | str]:
     }
 
 
+def _parse_hhmm(val: str) -> int:
+    try:
+        h, m = val.split(":")
+        return int(h) * 60 + int(m)
+    except Exception:
+        return 0
+
+
 def _latest_eligible_time(schedule: Dict[str, Any] | None, now_ms: int) -> Optional[int]:
     if not schedule:
         return None
 
-    time_zone = schedule.get("timezone") or "America/Denver"
+    time_zone = schedule.get("timezone") or DEFAULT_TIMEZONE
     parts = _zoned_parts(now_ms, time_zone)
     day_key = parts["weekday"]
     if day_key not in schedule.get("days", []):
         return None
 
-    def _parse_hhmm(val: str) -> int:
-        try:
-            h, m = val.split(":")
-            return int(h) * 60 + int(m)
-        except Exception:
-            return 0
-
     minutes_now = int(parts["hour"]) * 60 + int(parts["minute"])
     start_minutes = _parse_hhmm(str(schedule.get("startTime") or "00:00"))
     if minutes_now < start_minutes:
@@ -61,10 +98,7 @@ def _latest_eligible_time(schedule: Dict[str, Any] | None, now_ms: int) -> Optio
 
 
 def _schedule_decision_for_site(site: Dict[str, Any], schedule_map: Dict[str, Dict[str, Any]], now_ms: int) -> Dict[str, Any]:
-    provider = (
-        site.get("scrapeProvider")
-        or ("spidercloud" if site.get("type") == "greenhouse" else "fetchfox")
-    )
+    _site_type, provider = site_group(site)
     site_id = site.get("_id")
     last_run = int(site.get("lastRunAt") or 0)
     manual_trigger_at = int(site.get("manualTriggerAt") or 0)
@@ -82,7 +116,7 @@ def _schedule_decision_for_site(site: Dict[str, Any], schedule_map: Dict[str, Di
         reason = f"skipped: locked until {lock_expires_at}"
     elif completed and not schedule_id:
         reason = "skipped: completed and unscheduled"
-    elif manual_trigger_at and manual_trigger_at > now_ms - 15 * 60 * 1000 and manual_trigger_at > last_run:
+    elif manual_trigger_at and manual_trigger_at > now_ms - MANUAL_TRIGGER_WINDOW_MS and manual_trigger_at > last_run:
         due = True
         eligible_at = manual_trigger_at
         reason = "due: manual trigger window active"
@@ -116,20 +150,19 @@ def _schedule_decision_for_site(site: Dict[str, Any], schedule_map: Dict[str, Di
     }
 
 
-async def _gather_schedule_audit(worker_id: str, now_ms: Optional[int] = None) -> List[Dict[str, Any]]:
-    now_ms = now_ms or int(__import__("time").time() * 1000)
+async def _refresh_schedule_index(
+    index: "ScheduleDecisionIndex", now_ms: int
+) -> Optional[List[Dict[str, Any]]]:
     sites = await convex_query("router:listSites", {"enabledOnly": True})
     schedules = await convex_query("router:listSchedules", {})
-    schedule_map = {str(s.get("_id")): s for s in schedules or [] if isinstance(s, dict)}
-
     if not isinstance(sites, list):
-        return []
+        return None
+    return index.update(sites, schedules or [], now_ms)
+
 
+def _audit_payloads(worker_id: str, decisions: List[Dict[str, Any]], now_ms: int) -> List[Dict[str, Any]]:
     entries: List[Dict[str, Any]] = []
-    for site in sites:
-        if not isinstance(site, dict):
-            continue
-        decision = _schedule_decision_for_site(site, schedule_map, now_ms)
+    for decision in decisions:
         entries.append(
             {
                 "event": "schedule.audit.site",
@@ -162,28 +195,64 @@ async def _gather_schedule_audit(worker_id: str, now_ms: Optional[int] = None) -
     return [summary, *entries]
 
 
+async def _gather_schedule_audit(
+    worker_id: str,
+    now_ms: Optional[int] = None,
+    index: Optional["ScheduleDecisionIndex"] = None,
+) -> List[Dict[str, Any]]:
+    from .schedule_index import ScheduleDecisionIndex
+
+    now_ms = now_ms or int(time.time() * 1000)
+    decisions = await _refresh_schedule_index(index or ScheduleDecisionIndex(), now_ms)
+    if decisions is None:
+        return []
+    return _audit_payloads(worker_id, decisions, now_ms)
+
+
+def _emit_audit(logger: logging.Logger, payloads: List[Dict[str, Any]]) -> None:
+    summary = payloads[0]
+    telemetry.emit_posthog_log(summary)
+    logger.info(summary["message"])
+
+    if settings.schedule_audit_verbose:
+        for payload in payloads[1:]:
+            telemetry.emit_posthog_log(payload)
+            logger.info(payload["message"])
+
+
 async def schedule_audit_logger(worker_id: str) -> None:
+    """Maintain the host's schedule index and log the schedule audit every 30 minutes.
+
+    Only the worker holding the per-host writer lock refreshes the index; the others retry the
+    lock each cycle and take over if the holder exits. With ``schedule_index_refresh_seconds``
+    set, the writer refreshes that often and publishes the next-due snapshot read by
+    ``lease_site``; with it at 0 the index only refreshes for the audit.
+    """
+
+    from .schedule_index import HostWriterLock, ScheduleDecisionIndex, publish_snapshot, writer_lock_path
+
     logger = logging.getLogger("temporal.scheduler.audit")
+    refresh_seconds = max(0, runtime_config.schedule_index_refresh_seconds)
+    cycle_seconds = refresh_seconds or AUDIT_INTERVAL_SECONDS
+    index = ScheduleDecisionIndex()
+    writer_lock = HostWriterLock(writer_lock_path())
+    next_audit_at = 0.0
     try:
         while True:
             try:
-                payloads = await _gather_schedule_audit(worker_id)
-                if not payloads:
-                    await asyncio.sleep(60 * 30)
-                    continue
-
-                summary = payloads[0]
-                detail_payloads = payloads[1:]
-
-                telemetry.emit_posthog_log(summary)
-                logger.info(summary["message"])
-
-                if settings.schedule_audit_verbose:
-                    for payload in detail_payloads:
-                        telemetry.emit_posthog_log(payload)
-                        logger.info(payload["message"])
+                if writer_lock.try_acquire():
+                    now_ms = int(time.time() * 1000)
+                    decisions = await _refresh_schedule_index(index, now_ms)
+                    if decisions is not None:
+                        if refresh_seconds:
+                            publish_snapshot(index.snapshot(now_ms, ttl_ms=2 * refresh_seconds * 1000))
+                        if time.monotonic() >= next_audit_at:
+                            next_audit_at = time.monotonic() + AUDIT_INTERVAL_SECONDS
+                            _emit_audit(logger, _audit_payloads(worker_id, decisions, now_ms))
             except Exception as exc:  # noqa: BLE001
                 logger.exception("Schedule audit failed: %s", exc)
-            await asyncio.sleep(60 * 30)
+            await asyncio.sleep(cycle_seconds)
     except asyncio.CancelledError:
         logger.info("Schedule audit logger stopped.")
+    finally:
+        writer_lock.release()
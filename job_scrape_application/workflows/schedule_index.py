@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from ..config import settings
+from .schedule_audit import (
+    DEFAULT_TIMEZONE,
+    MANUAL_TRIGGER_WINDOW_MS,
+    _parse_hhmm,
+    _schedule_decision_for_site,
+    site_group,
+)
+
+logger = logging.getLogger("temporal.scheduler.index")
+
+# Snapshot and writer-lock files live here; tests point it at a temp dir.
+INDEX_DIR = Path(tempfile.gettempdir())
+_WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+Group = Tuple[str, str]
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _index_key() -> str:
+    # Dev and prod workers can share a host; keep their snapshots apart.
+    return hashlib.sha1((settings.convex_url or "local").encode("utf-8")).hexdigest()[:12]
+
+
+def snapshot_path() -> Path:
+    return INDEX_DIR / f"srajob-schedule-index-{_index_key()}.json"
+
+
+def writer_lock_path() -> Path:
+    return INDEX_DIR / f"srajob-schedule-index-{_index_key()}.lock"
+
+
+def _next_schedule_transition(schedule: Dict[str, Any], now_ms: int) -> Optional[int]:
+    """Return the first instant after ``now_ms`` at which ``_latest_eligible_time`` can change.
+
+    That is the next slot start on a scheduled day, or the next local midnight (when the
+    result drops back to None), whichever comes first.
+    """
+
+    days = schedule.get("days") or []
+    tz = ZoneInfo(schedule.get("timezone") or DEFAULT_TIMEZONE)
+    start_minutes = _parse_hhmm(str(schedule.get("startTime") or "00:00"))
+    interval = max(1, int(schedule.get("intervalMinutes") or 24 * 60))
+    local_now = datetime.fromtimestamp(now_ms / 1000, tz)
+    minutes_now = local_now.hour * 60 + local_now.minute
+
+    candidates: List[datetime] = []
+    tomorrow = local_now.date() + timedelta(days=1)
+    candidates.append(datetime(tomorrow.year, tomorrow.month, tomorrow.day, tzinfo=tz))
+    if _WEEKDAYS[local_now.weekday()] in days:
+        if minutes_now < start_minutes:
+            next_minutes = start_minutes
+        else:
+            next_minutes = start_minutes + ((minutes_now - start_minutes) // interval + 1) * interval
+        if next_minutes < 24 * 60:
+            candidates.append(
+                datetime(
+                    local_now.year,
+                    local_now.month,
+                    local_now.day,
+                    next_minutes // 60,
+                    next_minutes % 60,
+                    tzinfo=tz,
+                )
+            )
+    return min(int(candidate.timestamp() * 1000) for candidate in candidates)
+
+
+def _recheck_at(site: Dict[str, Any], schedule: Optional[Dict[str, Any]], now_ms: int) -> Optional[int]:
+    """When a cached decision for an unchanged site stops being valid (None = never).
+
+    Mirrors the branch order of ``_schedule_decision_for_site``.
+    """
+
+    last_run = int(site.get("lastRunAt") or 0)
+    manual_trigger_at = int(site.get("manualTriggerAt") or 0)
+    lock_expires_at = int(site.get("lockExpiresAt") or 0)
+    schedule_id = site.get("scheduleId")
+
+    if site.get("failed"):
+        return None
+    if lock_expires_at and lock_expires_at > now_ms:
+        return lock_expires_at
+    if site.get("completed") and not schedule_id:
+        return None
+    if manual_trigger_at and manual_trigger_at > now_ms - MANUAL_TRIGGER_WINDOW_MS and manual_trigger_at > last_run:
+        return manual_trigger_at + MANUAL_TRIGGER_WINDOW_MS
+    if schedule_id and schedule:
+        return _next_schedule_transition(schedule, now_ms)
+    return None
+
+
+def _site_fingerprint(site: Dict[str, Any], schedule: Optional[Dict[str, Any]]) -> tuple:
+    schedule_key = None
+    if schedule:
+        schedule_key = (
+            tuple(schedule.get("days") or ()),
+            schedule.get("startTime"),
+            schedule.get("intervalMinutes"),
+            schedule.get("timezone"),
+        )
+    return (
+        site.get("url"),
+        site.get("type"),
+        site.get("scrapeProvider"),
+        site.get("scheduleId"),
+        site.get("lastRunAt"),
+        site.get("manualTriggerAt"),
+        site.get("lockExpiresAt"),
+        bool(site.get("completed")),
+        bool(site.get("failed")),
+        schedule_key,
+    )
+
+
+@dataclass
+class _IndexedSite:
+    fingerprint: tuple
+    decision: Dict[str, Any]
+    recheck_at: Optional[int]
+    group: Group
+    version: int
+    heap_at: Optional[int] = None
+
+
+class ScheduleDecisionIndex:
+    """Cached schedule decisions plus a per-(siteType, provider) min-heap of next-eligible times.
+
+    ``update`` re-evaluates a site only when its fingerprint (schedule, lastRunAt, lock, manual
+    trigger, flags) changes or its cached decision reaches its ``recheck_at``; everything else
+    is served from the cache. Heap entries are invalidated lazily through a per-site version;
+    once stale entries outnumber live ones by ``STALE_HEAP_FACTOR`` the heaps are rebuilt from
+    the live entries so churny sites cannot grow them without bound.
+    """
+
+    STALE_HEAP_FACTOR = 2
+
+    def __init__(self) -> None:
+        self._sites: Dict[str, _IndexedSite] = {}
+        self._heaps: Dict[Group, List[Tuple[int, str, int]]] = {}
+        self._version = 0
+        self._heap_entries = 0
+        self.evaluations = 0
+        self.compactions = 0
+
+    def __len__(self) -> int:
+        return len(self._sites)
+
+    def update(
+        self,
+        sites: Iterable[Any],
+        schedules: Iterable[Any],
+        now_ms: int,
+    ) -> List[Dict[str, Any]]:
+        schedule_map = {str(s.get("_id")): s for s in schedules or [] if isinstance(s, dict)}
+        decisions: List[Dict[str, Any]] = []
+        seen: set[str] = set()
+        for site in sites:
+            if not isinstance(site, dict):
+                continue
+            site_id = str(site.get("_id"))
+            seen.add(site_id)
+            schedule_id = site.get("scheduleId")
+            schedule = schedule_map.get(str(schedule_id)) if schedule_id else None
+            fingerprint = _site_fingerprint(site, schedule)
+            entry = self._sites.get(site_id)
+            if (
+                entry is None
+                or entry.fingerprint != fingerprint
+                or (entry.recheck_at is not None and now_ms >= entry.recheck_at)
+            ):
+                entry = self._evaluate(site_id, site, schedule_map, schedule, fingerprint, now_ms)
+            decisions.append(entry.decision)
+
+        for removed in [site_id for site_id in self._sites if site_id not in seen]:
+            del self._sites[removed]
+        self._compact_heaps_if_stale()
+        return decisions
+
+    def _evaluate(
+        self,
+        site_id: str,
+        site: Dict[str, Any],
+        schedule_map: Dict[str, Dict[str, Any]],
+        schedule: Optional[Dict[str, Any]],
+        fingerprint: tuple,
+        now_ms: int,
+    ) -> _IndexedSite:
+        self.evaluations += 1
+        self._version += 1
+        decision = _schedule_decision_for_site(site, schedule_map, now_ms)
+        recheck_at = _recheck_at(site, schedule, now_ms)
+        entry = _IndexedSite(
+            fingerprint=fingerprint,
+            decision=decision,
+            recheck_at=recheck_at,
+            group=site_group(site),
+            version=self._version,
+        )
+        self._sites[site_id] = entry
+
+        # Due sites sort by their eligible slot (oldest first, as leaseSite does); others by
+        # the time they may next become due. Sites that cannot become due stay off the heap.
+        next_eligible_at = int(decision["eligibleAt"] or 0) if decision["due"] else recheck_at
+        if next_eligible_at is not None:
+            entry.heap_at = next_eligible_at
+            heapq.heappush(self._heaps.setdefault(entry.group, []), (next_eligible_at, site_id, entry.version))
+            self._heap_entries += 1
+        return entry
+
+    def _compact_heaps_if_stale(self) -> None:
+        live = [(site_id, entry) for site_id, entry in self._sites.items() if entry.heap_at is not None]
+        if self._heap_entries - len(live) <= self.STALE_HEAP_FACTOR * len(live):
+            return
+        heaps: Dict[Group, List[Tuple[int, str, int]]] = {}
+        for site_id, entry in live:
+            heaps.setdefault(entry.group, []).append((entry.heap_at, site_id, entry.version))
+        for heap in heaps.values():
+            heapq.heapify(heap)
+        self._heaps = heaps
+        self._heap_entries = len(live)
+        self.compactions += 1
+
+    def next_eligible_at(self, group: Group) -> Optional[int]:
+        heap = self._heaps.get(group)
+        while heap:
+            _at, site_id, version = heap[0]
+            entry = self._sites.get(site_id)
+            if entry is not None and entry.version == version:
+                return heap[0][0]
+            heapq.heappop(heap)
+            self._heap_entries -= 1
+        return None
+
+    def snapshot(self, now_ms: int, ttl_ms: int) -> Dict[str, Any]:
+        groups: Dict[str, int] = {}
+        for group in list(self._heaps):
+            next_at = self.next_eligible_at(group)
+            if next_at is None:
+                del self._heaps[group]
+                continue
+            groups["|".join(group)] = next_at
+        return {"generatedAt": now_ms, "expiresAt": now_ms + ttl_ms, "groups": groups}
+
+
+class HostWriterLock:
+    """Non-blocking, per-host exclusive lock electing the single schedule-index writer.
+
+    The OS drops the lock when the holding process exits, so other workers retry
+    ``try_acquire`` every cycle and one of them takes over.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._handle: Optional[IO[str]] = None
+
+    @property
+    def held(self) -> bool:
+        return self._handle is not None
+
+    def try_acquire(self) -> bool:
+        if self._handle is not None:
+            return True
+        handle = open(self._path, "a+")
+        try:
+            if os.name == "nt":
+                import msvcrt
+
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+        self._handle = handle
+        return True
+
+    def release(self) -> None:
+        handle, self._handle = self._handle, None
+        if handle is None:
+            return
+        try:
+            if os.name == "nt":
+                import msvcrt
+
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        except OSError:
+            pass
+        finally:
+            handle.close()
+
+
+def publish_snapshot(snapshot: Dict[str, Any], path: Optional[Path] = None) -> None:
+    path = path or snapshot_path()
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(snapshot), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    path = path or snapshot_path()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("groups"), dict):
+        return None
+    return data
+
+
+def lease_may_find_site(
+    site_type: Optional[str] = None,
+    scrape_provider: Optional[str] = None,
+    now_ms: Optional[int] = None,
+) -> bool:
+    """False only when a fresh snapshot shows no matching site due before ``now_ms``.
+
+    Any doubt (no snapshot, expired snapshot, unreadable file) returns True so the caller
+    falls back to the ``router:leaseSite`` mutation.
+    """
+
+    snapshot = read_snapshot()
+    if snapshot is None:
+        return True
+    now_ms = now_ms or _now_ms()
+    try:
+        if now_ms >= int(snapshot.get("expiresAt") or 0):
+            return True
+        for key, next_at in snapshot["groups"].items():
+            group_type, _, group_provider = str(key).partition("|")
+            if site_type and group_type != site_type:
+                continue
+            if scrape_provider and group_provider != scrape_provider:
+                continue
+            if int(next_at) <= now_ms:
+                return True
+    except (TypeError, ValueError):
+        return True
+    return False
+
+
+__all__ = [
+    "HostWriterLock",
+    "ScheduleDecisionIndex",
+    "lease_may_find_site",
+    "publish_snapshot",
+    "read_snapshot",
+    "snapshot_path",
+    "writer_lock_path",
+]
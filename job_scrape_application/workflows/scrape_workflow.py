@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from temporalio import workflow
 from temporalio.exceptions import ActivityError, ApplicationError
@@ -23,8 +24,10 @@ with workflow.unsafe.imports_passed_through():
         scrape_site_firecrawl,
         store_scrape,
     )
+    from .activities.constants import JOB_DETAILS_DRAINER_SIGNAL, JOB_DETAILS_DRAINER_WORKFLOW
 
 from ..config import runtime_config, settings
+from .helpers.history_budget import HISTORY_BUDGET_PATCH_ID, history_budget_exceeded
 from .helpers.workflow_logging import get_workflow_logger
 
 
@@ -34,6 +37,28 @@ class ScrapeSummary:
     scrape_ids: List[str]
 
 
+# Lists carried through continue-as-new are capped so the run input stays small; totals are
+# carried as counts.
+MAX_CARRIED_FAILURE_REASONS = 50
+MAX_CARRIED_SCRAPE_IDS = 200
+MAX_CARRIED_SITE_URLS = 200
+
+
+@dataclass
+class ScrapeRunState:
+    """Progress carried across continue-as-new runs of the site-leasing scrape workflows."""
+
+    leased_count: int = 0
+    scrape_ids: List[str] = field(default_factory=list)
+    site_urls: List[str] = field(default_factory=list)
+    status: str = "completed"
+    failure_reasons: List[str] = field(default_factory=list)
+    started_at: Optional[int] = None
+    continued_runs: int = 0
+    # Total scrapes across the chain; ``scrape_ids`` only keeps the most recent ones.
+    scrape_count: int = 0
+
+
 def summarize_scrape_result(res: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(res, dict):
         return {"provider": "unknown"}
@@ -55,6 +80,10 @@ def summarize_scrape_result(res: Dict[str, Any]) -> Dict[str, Any]:
         summary["workflowName"] = res.get("workflowName")
     if res.get("costMilliCents"):
         summary["costMilliCents"] = res.get("costMilliCents")
+    if res.get("listingFingerprint"):
+        summary["listingFingerprint"] = res.get("listingFingerprint")
+    if res.get("listingUnchanged"):
+        summary["listingUnchanged"] = True
     return {k: v for k, v in summary.items() if v is not None}
 
 
@@ -84,13 +113,18 @@ async def _run_scrape_workflow(
     activity_timeout: timedelta = timedelta(minutes=10),
     max_leases: int | None = None,
     persist_scrapes: bool = False,
+    state: ScrapeRunState | None = None,
 ) -> ScrapeSummary:
-    scrape_ids: List[str] = []
-    leased_count = 0
-    site_urls: List[str] = []
-    started_at = _workflow_now_ms()
-    status = "completed"
-    failure_reasons: List[str] = []
+    carried = state or ScrapeRunState()
+    scrape_ids: List[str] = list(carried.scrape_ids)
+    dropped_scrape_ids = max(0, carried.scrape_count - len(scrape_ids))
+    leased_count = carried.leased_count
+    site_urls: List[str] = list(carried.site_urls)
+    started_at = carried.started_at or _workflow_now_ms()
+    status = carried.status
+    failure_reasons: List[str] = list(carried.failure_reasons)
+    leased_this_run = 0
+    continuing = False
     run_info = workflow.info()
 
     wf_logger = get_workflow_logger()
@@ -121,6 +155,30 @@ async def _run_scrape_workflow(
         while True:
             if max_leases is not None and leased_count >= max_leases:
                 break
+            # Only unbounded drains continue-as-new; single-lease workflows finish quickly.
+            if (
+                max_leases is None
+                and leased_this_run > 0
+                and history_budget_exceeded()
+                and workflow.patched(HISTORY_BUDGET_PATCH_ID)
+            ):
+                continuing = True
+                next_state = ScrapeRunState(
+                    leased_count=leased_count,
+                    scrape_ids=scrape_ids[-MAX_CARRIED_SCRAPE_IDS:],
+                    site_urls=site_urls[-MAX_CARRIED_SITE_URLS:],
+                    status=status,
+                    failure_reasons=failure_reasons[-MAX_CARRIED_FAILURE_REASONS:],
+                    started_at=started_at,
+                    continued_runs=carried.continued_runs + 1,
+                    scrape_count=dropped_scrape_ids + len(scrape_ids),
+                )
+                await _log(
+                    "workflow.continue_as_new",
+                    message="History budget reached; continuing as new",
+                    data={"sitesProcessed": leased_count, "continuedRuns": next_state.continued_runs},
+                )
+                workflow.continue_as_new(next_state)
             lease_args = ["scraper-worker", 300, None, scrape_provider]
             site = await workflow.execute_activity(
                 lease_site,
@@ -132,6 +190,7 @@ async def _run_scrape_workflow(
                 break
 
             leased_count += 1
+            leased_this_run += 1
             site_urls.append(site["url"])
             await _log(
                 "site.leased",
@@ -161,10 +220,16 @@ async def _run_scrape_workflow(
                     scrape_id = res.get("scrapeId") if persist_scrapes else None
                     summary = res.get("summary")
                     recovery_payload = res.get("recoveryPayload")
+                    if not isinstance(summary, dict) and res.get("listingUnchanged"):
+                        summary = summarize_scrape_result(res)
+                # The listing matches the site's stored fingerprint, so there is nothing to store.
+                listing_unchanged = isinstance(summary, dict) and bool(
+                    summary.get("listingUnchanged")
+                )
 
                 if persist_scrapes and scrape_id:
                     scrape_ids.append(scrape_id)
-                else:
+                elif not listing_unchanged:
                     if isinstance(res, dict):
                         res_dict: Dict[str, Any] = res
                         res_dict.setdefault("workflowName", workflow_name)
@@ -216,10 +281,17 @@ async def _run_scrape_workflow(
                     data=summary if isinstance(summary, dict) else summarize_scrape_result(res),
                 )
 
-                # Mark site completed so next lease skips it
+                # Mark site completed so next lease skips it; a full listing run also records
+                # its fingerprint so the next tick can skip an unchanged board.
+                listing_fingerprint = (
+                    summary.get("listingFingerprint") if isinstance(summary, dict) else None
+                )
+                complete_args = (
+                    [site["_id"], listing_fingerprint] if listing_fingerprint else [site["_id"]]
+                )
                 await workflow.execute_activity(
                     complete_site,
-                    args=[site["_id"]],
+                    args=complete_args,
                     schedule_to_close_timeout=timedelta(seconds=30),
                 )
             except Exception as e:  # noqa: BLE001
@@ -251,67 +323,71 @@ async def _run_scrape_workflow(
         await _log("workflow.error", message=str(e), level="error")
         raise
     finally:
-        completed_at = _workflow_now_ms()
-        if not site_urls:
-            failure_reasons.append("No sites were leased (siteUrls empty).")
-        try:
-            await workflow.execute_activity(
-                record_workflow_run,
-                args=[
-                    {
-                        "runId": workflow.info().run_id,
-                        "workflowId": workflow.info().workflow_id,
-                        "workflowName": workflow_name,
-                        "status": status,
-                        "startedAt": started_at,
-                        "completedAt": completed_at,
-                        "siteUrls": site_urls,
-                        "sitesProcessed": leased_count,
-                        "jobsScraped": len(scrape_ids),
-                        "workerId": "scraper-worker",
-                        "taskQueue": "scraper-task-queue",
-                        "error": "; ".join(failure_reasons) if failure_reasons else None,
-                    }
-                ],
-                schedule_to_close_timeout=timedelta(seconds=30),
+        # The final run of a continue-as-new chain records the summary for the whole chain.
+        if not continuing:
+            completed_at = _workflow_now_ms()
+            if not site_urls:
+                failure_reasons.append("No sites were leased (siteUrls empty).")
+            try:
+                await workflow.execute_activity(
+                    record_workflow_run,
+                    args=[
+                        {
+                            "runId": workflow.info().run_id,
+                            "workflowId": workflow.info().workflow_id,
+                            "workflowName": workflow_name,
+                            "status": status,
+                            "startedAt": started_at,
+                            "completedAt": completed_at,
+                            "siteUrls": site_urls,
+                            "sitesProcessed": leased_count,
+                            "jobsScraped": dropped_scrape_ids + len(scrape_ids),
+                            "workerId": "scraper-worker",
+                            "taskQueue": "scraper-task-queue",
+                            "error": "; ".join(failure_reasons) if failure_reasons else None,
+                        }
+                    ],
+                    schedule_to_close_timeout=timedelta(seconds=30),
+                )
+            except Exception:
+                # Best-effort; do not fail workflow on log write issues
+                pass
+
+            await _log(
+                "workflow.complete",
+                message="Scrape workflow finished",
+                data={
+                    "status": status,
+                    "sitesProcessed": leased_count,
+                    "jobsScraped": dropped_scrape_ids + len(scrape_ids),
+                },
+                level="warn" if status != "completed" else "info",
             )
-        except Exception:
-            # Best-effort; do not fail workflow on log write issues
-            pass
-
-        await _log(
-            "workflow.complete",
-            message="Scrape workflow finished",
-            data={
-                "status": status,
-                "sitesProcessed": leased_count,
-                "jobsScraped": len(scrape_ids),
-            },
-            level="warn" if status != "completed" else "info",
-        )
 
 
 @workflow.defn(name="ScrapeWorkflow")
 class ScrapeWorkflow:
     @workflow.run
-    async def run(self) -> ScrapeSummary:  # type: ignore[override]
+    async def run(self, state: Optional[ScrapeRunState] = None) -> ScrapeSummary:  # type: ignore[override]
         return await _run_scrape_workflow(
             scrape_site,
             "ScrapeWorkflow",
             scrape_provider="fetchfox",
             persist_scrapes=settings.persist_scrapes_in_activity,
+            state=state,
         )
 
 
 @workflow.defn(name="ScraperFirecrawl")
 class FirecrawlScrapeWorkflow:
     @workflow.run
-    async def run(self) -> ScrapeSummary:  # type: ignore[override]
+    async def run(self, state: Optional[ScrapeRunState] = None) -> ScrapeSummary:  # type: ignore[override]
         return await _run_scrape_workflow(
             scrape_site_firecrawl,
             "ScraperFirecrawl",
             scrape_provider="firecrawl",
             persist_scrapes=settings.persist_scrapes_in_activity,
+            state=state,
         )
 
 
@@ -607,3 +683,97 @@ class SpidercloudJobDetailsWorkflow:
                 )
             except Exception:
                 pass
+
+
+# First idle wait of the drainer; doubles up to spidercloud_job_details_idle_backoff_max_seconds.
+JOB_DETAILS_DRAINER_MIN_IDLE_SECONDS = 1.0
+
+
+@dataclass
+class JobDetailsDrainerState:
+    """Progress carried across continue-as-new runs of the job-details drainer."""
+
+    batches: int = 0
+    scrape_count: int = 0
+    continued_runs: int = 0
+
+
+@workflow.defn(name=JOB_DETAILS_DRAINER_WORKFLOW)
+class SpidercloudJobDetailsDrainerWorkflow:
+    """Keep leasing job-detail batches while work exists and park when the queue is empty.
+
+    Each batch runs as a ``SpidercloudJobDetails`` child so per-batch history stays out of the
+    drainer. When a round leases nothing the drainer waits on ``urls_enqueued`` with exponential
+    backoff, so idle cost is one timer per backoff step and new URLs are picked up on signal.
+    """
+
+    def __init__(self) -> None:
+        self._wake = False
+        self._signals = 0
+
+    @workflow.signal(name=JOB_DETAILS_DRAINER_SIGNAL)
+    def urls_enqueued(self, count: int = 0) -> None:
+        self._wake = True
+        self._signals += 1
+
+    @workflow.run
+    async def run(self, state: Optional[JobDetailsDrainerState] = None) -> ScrapeSummary:  # type: ignore[override]
+        carried = state or JobDetailsDrainerState()
+        batches = carried.batches
+        scrape_count = carried.scrape_count
+        run_info = workflow.info()
+        wf_logger = get_workflow_logger()
+        max_parallel = max(1, runtime_config.spidercloud_job_details_drainer_parallelism)
+        max_idle_seconds = max(
+            JOB_DETAILS_DRAINER_MIN_IDLE_SECONDS,
+            float(runtime_config.spidercloud_job_details_idle_backoff_max_seconds),
+        )
+        width = 1
+        idle_rounds = 0
+        rounds = 0
+
+        async def _run_batch(index: int) -> int:
+            nonlocal scrape_count
+            try:
+                summary = await workflow.execute_child_workflow(
+                    SpidercloudJobDetailsWorkflow.run,
+                    id=f"{run_info.workflow_id}-batch-{run_info.run_id[:8]}-{rounds}-{index}",
+                    task_queue=settings.job_details_queue,
+                )
+            except Exception as exc:  # noqa: BLE001
+                wf_logger.warning(f"{JOB_DETAILS_DRAINER_WORKFLOW} | event=batch.error | error={exc}")
+                return 0
+            scrape_ids = getattr(summary, "scrape_ids", None)
+            if isinstance(scrape_ids, list):
+                scrape_count += len(scrape_ids)
+            return int(getattr(summary, "site_count", 0) or 0)
+
+        while True:
+            if rounds > 0 and history_budget_exceeded() and workflow.patched(HISTORY_BUDGET_PATCH_ID):
+                workflow.continue_as_new(
+                    JobDetailsDrainerState(
+                        batches=batches,
+                        scrape_count=scrape_count,
+                        continued_runs=carried.continued_runs + 1,
+                    )
+                )
+            rounds += 1
+            self._wake = False
+            leased = sum(await asyncio.gather(*(_run_batch(index) for index in range(width))))
+            batches += leased
+            if leased:
+                idle_rounds = 0
+                # Ramp up while every batch finds work; shrink to what the queue could fill.
+                width = min(max_parallel, width * 2) if leased == width else max(1, leased)
+                continue
+
+            width = 1
+            if self._wake:
+                # URLs were enqueued while the round was running; lease again right away.
+                continue
+            delay = min(max_idle_seconds, JOB_DETAILS_DRAINER_MIN_IDLE_SECONDS * (2**idle_rounds))
+            idle_rounds = min(idle_rounds + 1, 16)
+            try:
+                await workflow.wait_condition(lambda: self._wake, timeout=timedelta(seconds=delay))
+            except asyncio.TimeoutError:
+                pass
@@ -1,10 +1,13 @@
 from .base import BaseScraper
+from .fetchfox_dispatch import FetchfoxDispatcher, FetchfoxJob
 from .fetchfox_scraper import FetchfoxScraper, FetchfoxDependencies
 from .firecrawl_scraper import FirecrawlScraper, FirecrawlDependencies
 from .spidercloud_scraper import SpiderCloudScraper, SpidercloudDependencies
 
 __all__ = [
     "BaseScraper",
+    "FetchfoxDispatcher",
+    "FetchfoxJob",
     "FetchfoxScraper",
     "FetchfoxDependencies",
     "FirecrawlScraper",
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("temporal.worker.activities")
+
+# FetchFox SDK entry points the dispatcher may call (``FetchFox.scrape`` / ``FetchFox.crawl``).
+FETCHFOX_JOB_KINDS = ("scrape", "crawl")
+
+
+@dataclass
+class FetchfoxJob:
+    """One FetchFox request tracked by ``FetchfoxDispatcher``.
+
+    ``status`` moves ``queued`` -> ``running`` -> ``completed``/``failed``. ``result`` is the
+    decoded response object (JSON strings are parsed); ``error`` is set on failure.
+    """
+
+    job_id: str
+    kind: str
+    request: Dict[str, Any]
+    status: str = "queued"
+    result: Any = None
+    error: Optional[BaseException] = None
+    submitted_at: float = 0.0
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in {"completed", "failed"}
+
+
+class FetchfoxDispatcher:
+    """Run FetchFox jobs concurrently with bounded parallelism and stream them as they finish.
+
+    The FetchFox SDK call for a job blocks until FetchFox reports the job finished, so each
+    running job occupies one worker thread. ``submit``/``submit_many`` schedule jobs
+    immediately; at most ``max_concurrency`` of them hold a thread at a time. ``as_completed``
+    yields jobs in completion order so callers can normalize results while slower jobs are
+    still in flight, ``run`` is the single-job shortcut, and ``cancel`` drops whatever is still
+    queued when the caller stops consuming.
+
+    ``client_factory`` builds a client exposing ``scrape(payload)`` / ``crawl(payload)``; one
+    client is created per job because the SDK client is not documented as thread-safe.
+    """
+
+    def __init__(self, client_factory: Callable[[], Any], *, max_concurrency: int = 4) -> None:
+        self._client_factory = client_factory
+        self._semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+        self._ids = itertools.count(1)
+        self._jobs: List[FetchfoxJob] = []
+        self._tasks: Dict[asyncio.Task, FetchfoxJob] = {}
+
+    @property
+    def jobs(self) -> List[FetchfoxJob]:
+        return list(self._jobs)
+
+    def status_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for job in self._jobs:
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return counts
+
+    def submit(self, kind: str, request: Dict[str, Any]) -> FetchfoxJob:
+        return self._submit(kind, request)[0]
+
+    def submit_many(self, kind: str, requests: Iterable[Dict[str, Any]]) -> List[FetchfoxJob]:
+        return [self.submit(kind, request) for request in requests]
+
+    async def as_completed(self) -> AsyncIterator[FetchfoxJob]:
+        """Yield every submitted job once it finishes, fastest first."""
+
+        while self._tasks:
+            finished, _ = await asyncio.wait(list(self._tasks), return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                job = self._tasks.pop(task, None)
+                if job is not None:
+                    yield job
+
+    async def run(self, kind: str, request: Dict[str, Any]) -> FetchfoxJob:
+        job, task = self._submit(kind, request)
+        try:
+            await task
+        finally:
+            self._tasks.pop(task, None)
+        return job
+
+    def cancel(self) -> None:
+        """Drop jobs still waiting for a slot; SDK calls already running finish in their threads."""
+
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    def _submit(self, kind: str, request: Dict[str, Any]) -> Tuple[FetchfoxJob, asyncio.Task]:
+        if kind not in FETCHFOX_JOB_KINDS:
+            raise ValueError(f"Unsupported FetchFox job kind: {kind}")
+        job = FetchfoxJob(
+            job_id=f"fetchfox-{next(self._ids)}",
+            kind=kind,
+            request=request,
+            submitted_at=time.monotonic(),
+        )
+        self._jobs.append(job)
+        task = asyncio.create_task(self._execute(job))
+        self._tasks[task] = job
+        return job, task
+
+    async def _execute(self, job: FetchfoxJob) -> None:
+        async with self._semaphore:
+            job.status = "running"
+            job.started_at = time.monotonic()
+            try:
+                raw = await asyncio.to_thread(self._call, job.kind, job.request)
+                job.result = raw if isinstance(raw, (dict, list)) else json.loads(raw)
+                job.status = "completed"
+            except Exception as exc:  # noqa: BLE001
+                job.error = exc
+                job.status = "failed"
+                logger.warning("FetchFox job failed job_id=%s kind=%s error=%s", job.job_id, job.kind, exc)
+            finally:
+                job.completed_at = time.monotonic()
+
+    def _call(self, kind: str, request: Dict[str, Any]) -> Any:
+        client = self._client_factory()
+        return getattr(client, kind)(request)
+
+
+def chunk_urls(urls: Sequence[str], size: int) -> List[List[str]]:
+    """Split ``urls`` into consecutive chunks of at most ``size`` (one chunk when ``size`` < 1)."""
+
+    if size < 1 or len(urls) <= size:
+        return [list(urls)] if urls else []
+    return [list(urls[idx : idx + size]) for idx in range(0, len(urls), size)]
+
+
+__all__ = ["FETCHFOX_JOB_KINDS", "FetchfoxDispatcher", "FetchfoxJob", "chunk_urls"]
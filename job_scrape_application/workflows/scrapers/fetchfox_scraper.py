@@ -1,25 +1,38 @@
 from __future__ import annotations
 
-import asyncio
-import json
 import re
 import time
 from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Dict, List, Optional, TYPE_CHECKING
 
-from fetchfox_sdk import FetchFox
 from temporalio.exceptions import ApplicationError
 
-from ...components.models import FetchFoxPriority, FetchFoxScrapeRequest, GreenhouseBoardResponse, MAX_FETCHFOX_VISITS
-from ..helpers.scrape_utils import MAX_JOB_DESCRIPTION_CHARS, _shrink_payload, parse_posted_at
+from ...config import runtime_config
+from ...components.models import (
+    FetchFoxPriority,
+    FetchFoxScrapeRequest,
+    GreenhouseBoardResponse,
+    MAX_FETCHFOX_VISITS,
+    greenhouse_board_fingerprint,
+)
+from ..helpers.scrape_utils import (
+    MAX_JOB_DESCRIPTION_CHARS,
+    _shrink_payload,
+    greenhouse_updated_at_by_url,
+    parse_posted_at,
+)
+from ..helpers.lazy_imports import lazy_module_attrs
 from ..helpers.link_extractors import normalize_url
 from ..helpers.regex_patterns import GREENHOUSE_BOARDS_PATH_PATTERN
 from ...services import telemetry
 from .base import BaseScraper
+from .fetchfox_dispatch import FetchfoxDispatcher, chunk_urls
 
 if TYPE_CHECKING:
     from ..activities import Site
 
+_sdk_attr, __getattr__ = lazy_module_attrs(globals(), {"FetchFox": ("fetchfox_sdk", "FetchFox")})
+
 
 @dataclass
 class FetchfoxDependencies:
@@ -42,6 +55,13 @@ class FetchfoxScraper(BaseScraper):
     def __init__(self, deps: FetchfoxDependencies):
         self.deps = deps
 
+    def _dispatcher(self) -> FetchfoxDispatcher:
+        api_key = self.deps.settings.fetchfox_api_key
+        return FetchfoxDispatcher(
+            lambda: _sdk_attr("FetchFox")(api_key=api_key),
+            max_concurrency=runtime_config.fetchfox_dispatch_concurrency,
+        )
+
     async def scrape_site(
         self,
         site: Site,
@@ -79,10 +99,6 @@ class FetchfoxScraper(BaseScraper):
             url="https://api.fetchfox.ai/scrape",
         )
 
-        def _do_scrape(scrape_payload: Dict[str, Any]):
-            fox = FetchFox(api_key=settings.fetchfox_api_key)
-            return fox.scrape(scrape_payload)
-
         self.deps.log_provider_dispatch(
             self.provider,
             site.get("url") or "",
@@ -92,11 +108,10 @@ class FetchfoxScraper(BaseScraper):
 
         started_at = int(time.time() * 1000)
 
-        try:
-            result = await asyncio.to_thread(_do_scrape, request)
-            result_obj: Dict[str, Any] = result if isinstance(result, dict) else json.loads(result)
-        except Exception:
-            result_obj = {"raw": "Scrape failed or returned invalid data"}
+        fetch_job = await self._dispatcher().run("scrape", request)
+        result_obj: Dict[str, Any] = (
+            fetch_job.result if fetch_job.status == "completed" else {"raw": "Scrape failed or returned invalid data"}
+        )
 
         normalized_items = self.deps.normalize_fetchfox_items(result_obj)
         raw_urls: List[str] = []
@@ -155,20 +170,16 @@ class FetchfoxScraper(BaseScraper):
             content_transform="full_html",
         ).model_dump(exclude_none=True)
 
-        def _do_scrape(scrape_payload: Dict[str, Any]):
-            fox = FetchFox(api_key=settings.fetchfox_api_key)
-            return fox.scrape(scrape_payload)
-
         self.deps.log_provider_dispatch(
             self.provider, site.get("url") or "", kind="greenhouse_board", siteId=site.get("_id")
         )
 
         started_at = int(time.time() * 1000)
 
-        try:
-            result = await asyncio.to_thread(_do_scrape, request)
-            result_obj: Dict[str, Any] = result if isinstance(result, dict) else json.loads(result)
-        except Exception as exc:  # noqa: BLE001
+        fetch_job = await self._dispatcher().run("scrape", request)
+        result_obj: Dict[str, Any] = fetch_job.result
+        if fetch_job.status == "failed":
+            exc = fetch_job.error or RuntimeError("FetchFox job failed")
             site_url = site.get("url") or ""
             payload = {
                 "event": "scrape.greenhouse_listing.fetch_failed",
@@ -303,6 +314,8 @@ class FetchfoxScraper(BaseScraper):
             "raw": raw_text,
             "job_urls": job_urls,
             "posted_at_by_url": posted_at_by_url if posted_at_by_url else None,
+            "updated_at_by_url": greenhouse_updated_at_by_url(board, slug) or None,
+            "fingerprint": greenhouse_board_fingerprint(board),
             "startedAt": started_at,
             "completedAt": completed_at,
         }
@@ -318,15 +331,18 @@ class FetchfoxScraper(BaseScraper):
         urls: List[str] = [u for u in payload.get("urls", []) if isinstance(u, str) and u.strip()]
         source_url: str = payload.get("source_url") or (urls[0] if urls else "")
         posted_at_by_url: Dict[str, int] = {}
-        raw_posted = payload.get("posted_at_by_url")
-        if isinstance(raw_posted, dict):
-            for key, value in raw_posted.items():
+        updated_at_by_url: Dict[str, int] = {}
+        for field, lookup in (("posted_at_by_url", posted_at_by_url), ("updated_at_by_url", updated_at_by_url)):
+            raw_values = payload.get(field)
+            if not isinstance(raw_values, dict):
+                continue
+            for key, value in raw_values.items():
                 if not isinstance(key, str):
                     continue
                 if not isinstance(value, (int, float)):
                     continue
                 normalized_key = normalize_url(key) or key
-                posted_at_by_url[normalized_key] = int(value)
+                lookup[normalized_key] = int(value)
 
         if not urls:
             return {"scrape": None, "jobsScraped": 0}
@@ -348,33 +364,49 @@ class FetchfoxScraper(BaseScraper):
             url="https://api.fetchfox.ai/scrape",
         )
 
-        def _do_scrape(scrape_payload: Dict[str, Any]):
-            fox = FetchFox(api_key=settings.fetchfox_api_key)
-            return fox.scrape(scrape_payload)
+        chunks = chunk_urls(urls, runtime_config.fetchfox_detail_chunk_size)
+        chunk_requests = [
+            request
+            if len(chunks) == 1
+            else {**request, "start_urls": chunk, "max_visits": min(MAX_FETCHFOX_VISITS, len(chunk))}
+            for chunk in chunks
+        ]
 
-        self.deps.log_provider_dispatch(self.provider, source_url, kind="greenhouse_jobs", urls=len(urls))
+        self.deps.log_provider_dispatch(
+            self.provider, source_url, kind="greenhouse_jobs", urls=len(urls), chunks=len(chunks)
+        )
 
         started_at = int(time.time() * 1000)
 
+        # Chunks are submitted together and normalized as each finishes, so one slow or failed
+        # chunk neither delays the others' normalization nor discards their rows.
+        dispatcher = self._dispatcher()
+        fetch_jobs = dispatcher.submit_many("scrape", chunk_requests)
+        normalized_items: List[Dict[str, Any]] = []
+        failed_items: List[Dict[str, Any]] = []
         try:
-            result = await asyncio.to_thread(_do_scrape, request)
-            result_obj: Dict[str, Any] = result if isinstance(result, dict) else json.loads(result)
-        except Exception as exc:  # noqa: BLE001
-            raise ApplicationError(f"Greenhouse detail scrape failed: {exc}") from exc
-
-        normalized_items = self.deps.normalize_fetchfox_items(result_obj)
-        if posted_at_by_url and isinstance(normalized_items, list):
-            for row in normalized_items:
-                if not isinstance(row, dict):
-                    continue
-                url_val = row.get("url") or row.get("job_url") or row.get("absolute_url")
-                if not isinstance(url_val, str) or not url_val.strip():
+            async for fetch_job in dispatcher.as_completed():
+                if fetch_job.status == "failed":
+                    for url in fetch_job.request.get("start_urls") or []:
+                        failed_items.append(
+                            {"url": url, "reason": "fetchfox_job_failed", "error": str(fetch_job.error)}
+                        )
                     continue
-                normalized_key = normalize_url(url_val) or url_val
-                override = posted_at_by_url.get(normalized_key)
-                if override is not None:
-                    row["posted_at"] = int(override)
-                    row["posted_at_unknown"] = False
+                rows = self.deps.normalize_fetchfox_items(fetch_job.result)
+                _apply_timestamp_overrides(rows, posted_at_by_url, updated_at_by_url)
+                normalized_items.extend(rows)
+        finally:
+            dispatcher.cancel()
+
+        failed_jobs = [fetch_job for fetch_job in fetch_jobs if fetch_job.status == "failed"]
+        if len(failed_jobs) == len(fetch_jobs):
+            exc = failed_jobs[0].error
+            raise ApplicationError(f"Greenhouse detail scrape failed: {exc}") from exc
+        result_obj: Any = (
+            fetch_jobs[0].result
+            if len(fetch_jobs) == 1
+            else {"chunks": [fetch_job.result for fetch_job in fetch_jobs if fetch_job.status == "completed"]}
+        )
         completed_at = int(time.time() * 1000)
 
         scrape_payload = {
@@ -390,6 +422,8 @@ class FetchfoxScraper(BaseScraper):
                 "request": request_snapshot,
             },
         }
+        if failed_items:
+            scrape_payload["items"]["failed"] = failed_items
 
         trimmed = self.deps.trim_scrape_for_convex(
             scrape_payload,
@@ -406,7 +440,37 @@ class FetchfoxScraper(BaseScraper):
             url=source_url,
             kind="greenhouse_jobs",
             summary=f"items={len(normalized_items)}",
-            metadata={"urls": len(urls), "siteId": payload.get("site_id") or payload.get("siteId")},
+            metadata={
+                "urls": len(urls),
+                "chunks": len(fetch_jobs),
+                "failedChunks": len(failed_jobs),
+                "siteId": payload.get("site_id") or payload.get("siteId"),
+            },
         )
 
         return {"scrape": trimmed, "jobsScraped": len(normalized_items)}
+
+
+def _apply_timestamp_overrides(
+    rows: Any,
+    posted_at_by_url: Dict[str, int],
+    updated_at_by_url: Dict[str, int],
+) -> None:
+    """Stamp listing-provided ``posted_at``/``updated_at`` onto normalized detail rows in place."""
+
+    if not (posted_at_by_url or updated_at_by_url) or not isinstance(rows, list):
+        return
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        url_val = row.get("url") or row.get("job_url") or row.get("absolute_url")
+        if not isinstance(url_val, str) or not url_val.strip():
+            continue
+        normalized_key = normalize_url(url_val) or url_val
+        override = posted_at_by_url.get(normalized_key)
+        if override is not None:
+            row["posted_at"] = int(override)
+            row["posted_at_unknown"] = False
+        updated_at = updated_at_by_url.get(normalized_key)
+        if updated_at is not None:
+            row["updated_at"] = updated_at
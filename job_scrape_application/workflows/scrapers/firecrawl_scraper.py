@@ -1,18 +1,17 @@
 from __future__ import annotations
 
-import asyncio
 import json
 import re
 import time
 from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Dict, List, Optional, TYPE_CHECKING
 
-from firecrawl.v2.types import ScrapeOptions
-from firecrawl.v2.utils.error_handler import PaymentRequiredError, RequestTimeoutError
 from temporalio.exceptions import ApplicationError
 
-from ...components.models import GreenhouseBoardResponse
-from ..helpers.scrape_utils import MAX_JOB_DESCRIPTION_CHARS, parse_posted_at
+from ...components.models import GreenhouseBoardResponse, greenhouse_board_fingerprint
+from ..helpers.firecrawl_client import get_firecrawl_client, run_firecrawl_call
+from ..helpers.scrape_utils import MAX_JOB_DESCRIPTION_CHARS, greenhouse_updated_at_by_url, parse_posted_at
+from ..helpers.lazy_imports import lazy_module_attrs
 from ..helpers.link_extractors import normalize_url
 from ..helpers.regex_patterns import GREENHOUSE_BOARDS_PATH_PATTERN
 from ..exceptions import (
@@ -27,6 +26,15 @@ from .base import BaseScraper
 if TYPE_CHECKING:
     from ..activities import Site
 
+_sdk_attr, __getattr__ = lazy_module_attrs(
+    globals(),
+    {
+        "ScrapeOptions": ("firecrawl.v2.types", "ScrapeOptions"),
+        "PaymentRequiredError": ("firecrawl.v2.utils.error_handler", "PaymentRequiredError"),
+        "RequestTimeoutError": ("firecrawl.v2.utils.error_handler", "RequestTimeoutError"),
+    },
+)
+
 
 @dataclass
 class FirecrawlDependencies:
@@ -43,6 +51,7 @@ class FirecrawlDependencies:
     load_greenhouse_board: Callable[[Any], GreenhouseBoardResponse]
     extract_greenhouse_job_urls: Callable[[GreenhouseBoardResponse], List[str]]
     firecrawl_cache_max_age_ms: int
+    async_firecrawl_cls: Any = None
 
 
 class FirecrawlScraper(BaseScraper):
@@ -51,6 +60,19 @@ class FirecrawlScraper(BaseScraper):
     def __init__(self, deps: FirecrawlDependencies):
         self.deps = deps
 
+    async def _batch_scrape(self, api_key: str, urls: List[str], **options: Any) -> Any:
+        """Call ``batch_scrape`` on a cached client.
+
+        Uses the SDK's async client when one is configured; otherwise the blocking client
+        runs on the dedicated Firecrawl executor.
+        """
+
+        if self.deps.async_firecrawl_cls is not None:
+            async_client = get_firecrawl_client(self.deps.async_firecrawl_cls, api_key)
+            return await async_client.batch_scrape(urls, **options)
+        client = get_firecrawl_client(self.deps.firecrawl_cls, api_key)
+        return await run_firecrawl_call(client.batch_scrape, urls, **options)
+
     async def scrape_site(
         self,
         site: Site,
@@ -126,9 +148,14 @@ class FirecrawlScraper(BaseScraper):
 
         raw_html_format = "rawHtml"
 
-        def _do_scrape() -> Any:
-            client = self.deps.firecrawl_cls(api_key=firecrawl_api_key)
-            return client.batch_scrape(
+        self.deps.log_provider_dispatch(
+            self.provider, site.get("url") or "", kind="greenhouse_board", siteId=site.get("_id")
+        )
+
+        started_at = int(time.time() * 1000)
+        try:
+            job = await self._batch_scrape(
+                firecrawl_api_key,
                 [site["url"]],
                 formats=[raw_html_format],
                 proxy="auto",
@@ -136,15 +163,7 @@ class FirecrawlScraper(BaseScraper):
                 store_in_cache=True,
                 ignore_invalid_urls=True,
             )
-
-        self.deps.log_provider_dispatch(
-            self.provider, site.get("url") or "", kind="greenhouse_board", siteId=site.get("_id")
-        )
-
-        started_at = int(time.time() * 1000)
-        try:
-            job = await asyncio.to_thread(_do_scrape)
-        except RequestTimeoutError as exc:
+        except _sdk_attr("RequestTimeoutError") as exc:
             site_url = site.get("url") or ""
             payload = {
                 "event": "scrape.greenhouse_listing.fetch_failed",
@@ -366,6 +385,8 @@ class FirecrawlScraper(BaseScraper):
             "raw": raw_text,
             "job_urls": job_urls,
             "posted_at_by_url": posted_at_by_url if posted_at_by_url else None,
+            "updated_at_by_url": greenhouse_updated_at_by_url(board, slug) or None,
+            "fingerprint": greenhouse_board_fingerprint(board),
             "startedAt": started_at,
             "completedAt": int(time.time() * 1000),
         }
@@ -375,15 +396,18 @@ class FirecrawlScraper(BaseScraper):
         source_url: str = payload.get("source_url") or (urls[0] if urls else "")
         idempotency_key: Optional[str] = payload.get("idempotency_key") or payload.get("webhook_id")
         posted_at_by_url: Dict[str, int] = {}
-        raw_posted = payload.get("posted_at_by_url")
-        if isinstance(raw_posted, dict):
-            for key, value in raw_posted.items():
+        updated_at_by_url: Dict[str, int] = {}
+        for field, lookup in (("posted_at_by_url", posted_at_by_url), ("updated_at_by_url", updated_at_by_url)):
+            raw_values = payload.get(field)
+            if not isinstance(raw_values, dict):
+                continue
+            for key, value in raw_values.items():
                 if not isinstance(key, str):
                     continue
                 if not isinstance(value, (int, float)):
                     continue
                 normalized_key = normalize_url(key) or key
-                posted_at_by_url[normalized_key] = int(value)
+                lookup[normalized_key] = int(value)
 
         if not urls:
             return {"scrape": None, "jobsScraped": 0}
@@ -396,26 +420,13 @@ class FirecrawlScraper(BaseScraper):
             )
 
         schema = self.deps.build_firecrawl_schema()
-        scrape_options = ScrapeOptions(
+        scrape_options = _sdk_attr("ScrapeOptions")(
             formats=[
                 "markdown",
                 {"type": "json", "schema": schema},
             ]
         )
 
-        def _scrape_batch() -> Any:
-            client = self.deps.firecrawl_cls(api_key=firecrawl_api_key)
-            formats: list[Any] = list(scrape_options.formats or [])
-            return client.batch_scrape(
-                urls,
-                formats=formats,
-                proxy="auto",
-                max_age=self.deps.firecrawl_cache_max_age_ms,
-                store_in_cache=True,
-                max_concurrency=5,
-                idempotency_key=idempotency_key,
-            )
-
         self.deps.log_provider_dispatch(
             self.provider,
             source_url,
@@ -425,7 +436,16 @@ class FirecrawlScraper(BaseScraper):
         )
 
         try:
-            result = await asyncio.to_thread(_scrape_batch)
+            result = await self._batch_scrape(
+                firecrawl_api_key,
+                urls,
+                formats=list(scrape_options.formats or []),
+                proxy="auto",
+                max_age=self.deps.firecrawl_cache_max_age_ms,
+                store_in_cache=True,
+                max_concurrency=5,
+                idempotency_key=idempotency_key,
+            )
         except Exception as exc:  # noqa: BLE001
             error_payload: Dict[str, Any] = {
                 "sourceUrl": source_url,
@@ -438,10 +458,10 @@ class FirecrawlScraper(BaseScraper):
                 error_payload["jobId"] = idempotency_key
             await self.deps.log_scrape_error(error_payload)
             msg = str(exc).lower()
-            if isinstance(exc, PaymentRequiredError) or "payment required" in msg or "insufficient credits" in msg:
+            if isinstance(exc, _sdk_attr("PaymentRequiredError")) or "payment required" in msg or "insufficient credits" in msg:
                 raise PaymentRequiredWorkflowError(f"Firecrawl batch scrape failed: {exc}") from exc
 
-            if isinstance(exc, RequestTimeoutError) or "timeout" in msg:
+            if isinstance(exc, _sdk_attr("RequestTimeoutError")) or "timeout" in msg:
                 raise TimeoutWorkflowError(f"Firecrawl batch scrape failed: {exc}") from exc
 
             if "429" in msg or "too many requests" in msg or "rate" in msg:
@@ -470,7 +490,7 @@ class FirecrawlScraper(BaseScraper):
             batch_id = idempotency_key
 
         normalized_items = self.deps.normalize_firecrawl_items(raw_payload)
-        if posted_at_by_url and isinstance(normalized_items, list):
+        if (posted_at_by_url or updated_at_by_url) and isinstance(normalized_items, list):
             for row in normalized_items:
                 if not isinstance(row, dict):
                     continue
@@ -482,6 +502,9 @@ class FirecrawlScraper(BaseScraper):
                 if override is not None:
                     row["posted_at"] = int(override)
                     row["posted_at_unknown"] = False
+                updated_at = updated_at_by_url.get(normalized_key)
+                if updated_at is not None:
+                    row["updated_at"] = updated_at
         completed_at = int(time.time() * 1000)
 
         request_payload = {
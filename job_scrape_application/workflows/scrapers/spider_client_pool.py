@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict
+
+logger = logging.getLogger("temporal.worker.activities")
+
+# Recycle long-lived clients periodically so DNS changes and server-side idle limits are picked up.
+SPIDER_CLIENT_MAX_AGE_SECONDS = 15 * 60
+
+
+@dataclass
+class _PooledClient:
+    factory: Callable[..., Any]
+    context: Any
+    client: Any
+    loop: asyncio.AbstractEventLoop
+    created_at: float = field(default_factory=time.monotonic)
+    in_use: int = 0
+    healthy: bool = True
+
+    def usable(self, factory: Callable[..., Any], loop: asyncio.AbstractEventLoop) -> bool:
+        if not self.healthy or self.factory is not factory or self.loop is not loop:
+            return False
+        if time.monotonic() - self.created_at > SPIDER_CLIENT_MAX_AGE_SECONDS:
+            return False
+        session = getattr(self.client, "session", None)
+        return not bool(getattr(session, "closed", False))
+
+
+def _is_aiohttp_connection_error(exc: BaseException) -> bool:
+    # Matched by name so the pool does not import aiohttp itself.
+    return any(
+        cls.__name__ == "ClientConnectionError" and cls.__module__.startswith("aiohttp")
+        for cls in type(exc).__mro__
+    )
+
+
+def _is_connection_error(exc: BaseException) -> bool:
+    """True when ``exc`` (or its cause chain) means the pooled session's connection broke.
+
+    Timeouts (including aiohttp's ``ServerTimeoutError``) and HTTP status errors leave the
+    session usable, so they keep the cached client.
+    """
+
+    current: BaseException | None = exc
+    while current is not None:
+        if isinstance(current, TimeoutError):
+            return False
+        if isinstance(current, ConnectionError) or _is_aiohttp_connection_error(current):
+            return True
+        current = current.__cause__
+    return False
+
+
+class SpiderClientPool:
+    """Keep one entered ``AsyncSpider`` per API key for the life of the worker process.
+
+    Entering ``AsyncSpider`` opens the SDK's HTTP session, so reusing the entered client keeps
+    keep-alive connections (and their TLS sessions) warm across activity calls. Clients are
+    bound to the event loop that created them and are rebuilt when the loop, the client
+    factory, or the session health changes.
+    """
+
+    def __init__(self) -> None:
+        self._clients: Dict[str, _PooledClient] = {}
+
+    async def _open(self, api_key: str, factory: Callable[..., Any]) -> _PooledClient:
+        loop = asyncio.get_running_loop()
+        raw_client = factory(api_key=api_key)
+        entered = await raw_client.__aenter__()
+        return _PooledClient(
+            factory=factory,
+            context=raw_client,
+            client=entered if entered is not None else raw_client,
+            loop=loop,
+        )
+
+    async def _close(self, pooled: _PooledClient) -> None:
+        try:
+            if pooled.loop is asyncio.get_running_loop():
+                await pooled.context.__aexit__(None, None, None)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("SpiderCloud client close failed error=%s", exc)
+
+    async def _acquire(self, api_key: str, factory: Callable[..., Any]) -> _PooledClient:
+        loop = asyncio.get_running_loop()
+        pooled = self._clients.get(api_key)
+        if pooled is not None and pooled.usable(factory, loop):
+            return pooled
+        fresh = await self._open(api_key, factory)
+        current = self._clients.get(api_key)
+        if current is not None and current is not pooled and current.usable(factory, loop):
+            # Another coroutine opened a client while we were awaiting; keep theirs.
+            await self._close(fresh)
+            return current
+        self._clients[api_key] = fresh
+        if pooled is not None and pooled.in_use == 0:
+            await self._close(pooled)
+        logger.debug("SpiderCloud client opened keys=%s", len(self._clients))
+        return fresh
+
+    @asynccontextmanager
+    async def lease(self, api_key: str, factory: Callable[..., Any]) -> AsyncIterator[Any]:
+        pooled = await self._acquire(api_key, factory)
+        pooled.in_use += 1
+        try:
+            yield pooled.client
+        except BaseException as exc:
+            if _is_connection_error(exc):
+                pooled.healthy = False
+                logger.info("SpiderCloud client marked unhealthy error=%s", type(exc).__name__)
+            raise
+        finally:
+            pooled.in_use -= 1
+            if pooled.in_use == 0 and self._clients.get(api_key) is not pooled:
+                await self._close(pooled)
+
+    async def aclose(self) -> None:
+        """Close every pooled client; called from the worker shutdown path."""
+
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for pooled in clients:
+            await self._close(pooled)
+
+
+spider_clients = SpiderClientPool()
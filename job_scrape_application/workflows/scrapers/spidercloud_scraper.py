@@ -3,17 +3,21 @@ from __future__ import annotations
 import asyncio
 import json
 import html
+import inspect
 import logging
 import os
 import re
 import time
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
-from spider import AsyncSpider
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 from temporalio.exceptions import ApplicationError
 
-from ...components.models import extract_greenhouse_job_urls, load_greenhouse_board
+from ...components.models import (
+    extract_greenhouse_job_urls,
+    greenhouse_board_fingerprint,
+    load_greenhouse_board,
+)
 from ...constants import title_matches_required_keywords
 from ...config import runtime_config
 from ..helpers.scrape_utils import (
@@ -33,13 +37,27 @@ from ..helpers.scrape_utils import (
     looks_like_job_listing_page,
     normalize_company_hint,
     normalize_title_from_bar,
+    greenhouse_updated_at_by_url,
     parse_markdown_hints,
     parse_posted_at,
     parse_posted_at_with_unknown,
     split_description_metadata,
     strip_known_nav_blocks,
 )
-from ..helpers.link_extractors import gather_strings, normalize_url
+from ..helpers.host_limiter import (
+    THROTTLE_HTTP_STATUSES,
+    HostLimiter,
+    HostLimits,
+    get_host_limiter,
+    host_key,
+    split_host_limits,
+)
+from ..helpers.event_index import EventIndex
+from ..helpers.json_budget import estimate_json_size
+from ...components.json_islands import JOBS_PAYLOAD_MARKERS, iter_json_islands
+from ..helpers.proxy_escalation import ProxyEscalationStore, get_proxy_escalation_store
+from ..helpers.lazy_imports import lazy_module_attrs
+from ..helpers.link_extractors import cached_normalize_url, gather_strings, normalize_url
 from ..helpers.regex_patterns import (
     CAPTCHA_PROVIDER_PATTERN,
     CAPTCHA_WORD_PATTERN,
@@ -73,11 +91,16 @@ from ..helpers.regex_patterns import (
     _TITLE_BAR_RE,
     _TITLE_IN_BAR_RE,
 )
+from ..helpers.url_batch import UrlBatch
 from ..site_handlers import BaseSiteHandler, get_site_handler
 from ...services import telemetry
+from ...services.metrics import timed as _metric_timed
 from .base import BaseScraper
+from .spider_client_pool import spider_clients
 
 if TYPE_CHECKING:
+    from spider import AsyncSpider
+
     from ..activities import Site
 
 SPIDERCLOUD_BATCH_SIZE = 50
@@ -156,6 +179,8 @@ JOB_TITLE_KEYWORDS = {
 
 logger = logging.getLogger("temporal.worker.activities")
 
+_sdk_attr, __getattr__ = lazy_module_attrs(globals(), {"AsyncSpider": ("spider", "AsyncSpider")})
+
 
 class CaptchaDetectedError(Exception):
     """Raised when a SpiderCloud response looks like a captcha wall."""
@@ -256,6 +281,33 @@ class SpiderCloudScraper(BaseScraper):
         )
         return key
 
+    def _spider_client(self, api_key: str):
+        """Lease the worker-lifetime SpiderCloud client for ``api_key``."""
+
+        return spider_clients.lease(api_key, _sdk_attr("AsyncSpider"))
+
+    def _handler_spidercloud_config(self, handler: BaseSiteHandler, url: str) -> Dict[str, Any]:
+        """Return a handler's SpiderCloud params without scheduler-only keys."""
+
+        params, _ = split_host_limits(handler.get_spidercloud_config(url))
+        return params
+
+    def _host_limiter(self, url: str, overrides: Optional[Dict[str, Any]] = None) -> HostLimiter:
+        defaults = HostLimits(
+            initial_concurrency=max(1, int(runtime_config.spidercloud_job_details_concurrency)),
+            max_concurrency=max(1, int(runtime_config.spidercloud_host_max_concurrency)),
+            rate_per_second=max(0.1, float(runtime_config.spidercloud_host_rate_per_second)),
+            burst=max(1, int(runtime_config.spidercloud_host_max_concurrency)),
+        )
+        return get_host_limiter(host_key(url), defaults.merged(overrides))
+
+    def _proxy_escalation(self) -> ProxyEscalationStore:
+        return get_proxy_escalation_store(
+            CAPTCHA_PROXY_SEQUENCE,
+            decay_after=runtime_config.spidercloud_proxy_escalation_decay_after,
+            db_path=runtime_config.spidercloud_proxy_escalation_db or None,
+        )
+
     def _trim_scrape_payload(self, scrape_payload: Dict[str, Any]) -> Dict[str, Any]:
         try:
             return self.deps.trim_scrape_for_convex(
@@ -339,8 +391,21 @@ class SpiderCloudScraper(BaseScraper):
             return f"# {title}\n\n{desc}"
         return desc
 
-    def _extract_meta_description_from_events(self, events: List[Any]) -> Optional[str]:
-        for text in gather_strings(events):
+    def _extract_meta_description_from_events(
+        self,
+        events: List[Any],
+        *,
+        index: Optional[EventIndex] = None,
+    ) -> Optional[str]:
+        if index is not None:
+            return index.cached(
+                "meta_description",
+                lambda: self._extract_meta_description_from_strings(index.html_strings()),
+            )
+        return self._extract_meta_description_from_strings(gather_strings(events))
+
+    def _extract_meta_description_from_strings(self, strings: List[str]) -> Optional[str]:
+        for text in strings:
             if not isinstance(text, str):
                 continue
             if "<meta" not in text.lower():
@@ -350,7 +415,20 @@ class SpiderCloudScraper(BaseScraper):
                 return desc
         return None
 
-    def _extract_greenhouse_location_from_events(self, events: List[Any]) -> Optional[str]:
+    def _extract_greenhouse_location_from_events(
+        self,
+        events: List[Any],
+        *,
+        index: Optional[EventIndex] = None,
+    ) -> Optional[str]:
+        if index is not None:
+            return index.cached(
+                "greenhouse_location",
+                lambda: self._extract_greenhouse_location_from_strings(index.strings),
+            )
+        return self._extract_greenhouse_location_from_strings(gather_strings(events))
+
+    def _extract_greenhouse_location_from_strings(self, strings: List[str]) -> Optional[str]:
         def _normalize(value: Any) -> Optional[str]:
             if isinstance(value, dict):
                 value = value.get("name") or value.get("location")
@@ -359,7 +437,7 @@ class SpiderCloudScraper(BaseScraper):
             cleaned = value.strip()
             return cleaned or None
 
-        for text in gather_strings(events):
+        for text in strings:
             if not isinstance(text, str) or not text.strip():
                 continue
             payload = None
@@ -581,47 +659,6 @@ class SpiderCloudScraper(BaseScraper):
 
         return _walk(obj)
 
-    def _extract_credits(self, obj: Any) -> Optional[float]:
-        """Heuristically pull a credit usage number from a payload."""
-
-        matches: List[float] = []
-
-        def _walk(value: Any) -> None:
-            if isinstance(value, dict):
-                for key, val in value.items():
-                    if isinstance(val, (int, float)) and "credit" in key.lower():
-                        matches.append(float(val))
-                    else:
-                        _walk(val)
-            elif isinstance(value, list):
-                for item in value:
-                    _walk(item)
-
-        _walk(obj)
-        if not matches:
-            return None
-        return max(matches)
-
-    def _extract_cost_usd(self, obj: Any) -> Optional[float]:
-        """Pull a dollar-denominated cost (e.g., total_cost) from a payload."""
-
-        costs: List[float] = []
-
-        def _walk(value: Any) -> None:
-            if isinstance(value, dict):
-                for key, val in value.items():
-                    if isinstance(val, (int, float)) and "cost" in key.lower():
-                        costs.append(float(val))
-                    _walk(val)
-            elif isinstance(value, list):
-                for item in value:
-                    _walk(item)
-
-        _walk(obj)
-        if not costs:
-            return None
-        return max(costs)
-
     def _is_greenhouse_job_payload(self, payload: Any) -> bool:
         if not isinstance(payload, dict):
             return False
@@ -640,9 +677,11 @@ class SpiderCloudScraper(BaseScraper):
         self,
         events: List[Any],
         markdown_parts: List[str],
+        *,
+        index: Optional[EventIndex] = None,
     ) -> bool:
         candidates: list[str] = []
-        for text in gather_strings(events):
+        for text in index.strings if index is not None else gather_strings(events):
             if isinstance(text, str) and text.strip():
                 candidates.append(text)
         for text in markdown_parts:
@@ -855,9 +894,22 @@ class SpiderCloudScraper(BaseScraper):
             except Exception:
                 pass
 
-    def _extract_structured_job_posting(self, events: List[Any]) -> Optional[Dict[str, Any]]:
+    def _extract_structured_job_posting(
+        self,
+        events: List[Any],
+        *,
+        index: Optional[EventIndex] = None,
+    ) -> Optional[Dict[str, Any]]:
         """Best-effort extraction of JSON-LD JobPosting data from raw HTML events."""
 
+        if index is not None:
+            return index.cached(
+                "job_posting",
+                lambda: self._extract_structured_job_posting_from_strings(index.html_strings()),
+            )
+        return self._extract_structured_job_posting_from_strings(gather_strings(events))
+
+    def _extract_structured_job_posting_from_strings(self, strings: List[str]) -> Optional[Dict[str, Any]]:
         def _is_job_posting(candidate: Dict[str, Any]) -> bool:
             raw_type = candidate.get("@type") or candidate.get("type")
             if isinstance(raw_type, list):
@@ -888,7 +940,7 @@ class SpiderCloudScraper(BaseScraper):
         script_pattern = re.compile(JSON_LD_SCRIPT_PATTERN, flags=re.IGNORECASE | re.DOTALL)
 
         logged_parse_error = False
-        for text in (t for t in gather_strings(events) if isinstance(t, str) and t.strip()):
+        for text in (t for t in strings if isinstance(t, str) and t.strip()):
             if "<script" not in text.lower():
                 continue
             for match in script_pattern.finditer(text):
@@ -1023,7 +1075,10 @@ class SpiderCloudScraper(BaseScraper):
             return name
         return name
 
-    def _title_from_events(self, events: List[Any]) -> Optional[str]:
+    def _title_from_events(self, events: List[Any], *, index: Optional[EventIndex] = None) -> Optional[str]:
+        if index is not None:
+            return index.cached("event_title", lambda: self._title_from_events(index.events))
+
         def _looks_like_sentence_title(value: str) -> bool:
             stripped = value.strip()
             if not stripped:
@@ -1625,9 +1680,9 @@ class SpiderCloudScraper(BaseScraper):
             "preserve_host": True,
             "limit": 1,
         }
-        spider_params.update(handler.get_spidercloud_config(request_url))
+        spider_params.update(self._handler_spidercloud_config(handler, request_url))
         try:
-            async with AsyncSpider(api_key=api_key) as client:
+            async with self._spider_client(api_key) as client:
                 scrape_fn = getattr(client, "scrape_url", None) or getattr(client, "crawl_url")
                 response = scrape_fn(  # type: ignore[call-arg]
                     request_url,
@@ -1763,7 +1818,12 @@ class SpiderCloudScraper(BaseScraper):
         new_query = urlencode(merged, doseq=True)
         return urlunparse(parsed._replace(query=new_query))
 
-    def _extract_json_payload(self, value: Any) -> Optional[Dict[str, Any]]:
+    def _extract_json_payload(self, value: Any, *, index: Optional[EventIndex] = None) -> Optional[Dict[str, Any]]:
+        if index is not None:
+            return index.cached("jobs_payload", lambda: self._scan_json_payload(index.events, index.strings))
+        return self._scan_json_payload(value, gather_strings(value))
+
+    def _scan_json_payload(self, value: Any, strings: List[str]) -> Optional[Dict[str, Any]]:
         def _find_jobs_payload(node: Any) -> Optional[Dict[str, Any]]:
             if isinstance(node, dict):
                 jobs = node.get("jobs")
@@ -1798,21 +1858,6 @@ class SpiderCloudScraper(BaseScraper):
                 return fence_match.group("content").strip()
             return value
 
-        def _scan_json_candidates(text: str) -> Iterable[Any]:
-            decoder = json.JSONDecoder()
-            for match in re.finditer(r"[{[]", text):
-                idx = match.start()
-                try:
-                    parsed, _ = decoder.raw_decode(text[idx:])
-                except json.JSONDecodeError:
-                    continue
-                if isinstance(parsed, str):
-                    try:
-                        parsed = json.loads(parsed)
-                    except Exception:
-                        pass
-                yield parsed
-
         def _parse_json_text(text: str) -> Any | None:
             text = _strip_code_fences(text)
             text = re.sub(INVALID_JSON_ESCAPE_PATTERN, "", text)
@@ -1856,7 +1901,7 @@ class SpiderCloudScraper(BaseScraper):
         if found:
             return found
 
-        for text in (t for t in gather_strings(value) if isinstance(t, str) and t.strip()):
+        for text in (t for t in strings if isinstance(t, str) and t.strip()):
             parsed = _parse_json_text(text)
             if parsed is not None:
                 found = _find_jobs_payload(parsed)
@@ -1868,7 +1913,7 @@ class SpiderCloudScraper(BaseScraper):
             if "{" in text or "[" in text:
                 cleaned = _strip_code_fences(text)
                 cleaned = re.sub(INVALID_JSON_ESCAPE_PATTERN, "", cleaned)
-                for candidate in _scan_json_candidates(cleaned):
+                for candidate in iter_json_islands(cleaned, require=JOBS_PAYLOAD_MARKERS):
                     found = _find_jobs_payload(candidate)
                     if found:
                         return found
@@ -1961,8 +2006,10 @@ class SpiderCloudScraper(BaseScraper):
         handler: BaseSiteHandler,
         raw_events: List[Any],
         markdown_text: str,
+        *,
+        index: Optional[EventIndex] = None,
     ) -> List[str]:
-        payload = self._extract_json_payload(raw_events)
+        payload = self._extract_json_payload(raw_events, index=index)
         if payload is None and markdown_text:
             payload = self._extract_json_payload(markdown_text)
         if not isinstance(payload, dict):
@@ -1977,9 +2024,10 @@ class SpiderCloudScraper(BaseScraper):
         markdown_text: str,
         *,
         base_url: str | None = None,
+        index: Optional[EventIndex] = None,
     ) -> List[str]:
         candidates: List[str] = []
-        for text in gather_strings(raw_events):
+        for text in index.strings if index is not None else gather_strings(raw_events):
             if isinstance(text, str) and text.strip():
                 candidates.append(text)
         if isinstance(markdown_text, str) and markdown_text.strip():
@@ -2005,33 +2053,56 @@ class SpiderCloudScraper(BaseScraper):
             return []
 
         filtered = handler.filter_job_urls([u for u in urls if isinstance(u, str) and u.strip()])
-        normalized: List[str] = []
-        seen: set[str] = set()
-        for url in filtered:
-            normalized_url = normalize_url(url, base_url=base_url)
-            if not normalized_url:
-                continue
-            if normalized_url in seen:
+        return list(UrlBatch.from_values(filtered, base_url=base_url).urls)
+
+    def _complete_listing_urls_from_event(
+        self,
+        handler: BaseSiteHandler,
+        event: Any,
+        *,
+        base_url: str,
+    ) -> Optional[List[str]]:
+        """Job URLs from one streamed event when the handler says they cover the whole page.
+
+        Mirrors the raw-HTML strategy of ``_extract_listing_job_urls_from_events`` on a single
+        event; returns ``None`` while the listing is still incomplete so streaming continues.
+        """
+
+        if not isinstance(event, dict):
+            return None
+        for text in gather_strings(event):
+            if "<" not in text or ">" not in text:
                 continue
-            seen.add(normalized_url)
-            normalized.append(normalized_url)
-        return normalized
+            try:
+                urls = handler.get_links_from_raw_html(text)
+                if not handler.is_listing_stream_complete(text, urls):
+                    continue
+            except Exception:  # noqa: BLE001
+                return None
+            filtered = handler.filter_job_urls([u for u in urls if isinstance(u, str) and u.strip()])
+            return list(UrlBatch.from_values(filtered, base_url=base_url).urls)
+        return None
 
     def _extract_listing_links_from_html(
         self,
         handler: BaseSiteHandler,
         raw_events: List[Any],
         markdown_text: str,
+        *,
+        index: Optional[EventIndex] = None,
     ) -> List[str]:
         candidates: List[str] = []
         if isinstance(markdown_text, str) and "<" in markdown_text and ">" in markdown_text:
             candidates.append(markdown_text)
-        for text in gather_strings(raw_events):
-            if not isinstance(text, str):
-                continue
-            if "<" not in text or ">" not in text:
-                continue
-            candidates.append(text)
+        if index is not None:
+            candidates.extend(index.html_strings())
+        else:
+            for text in gather_strings(raw_events):
+                if not isinstance(text, str):
+                    continue
+                if "<" not in text or ">" not in text:
+                    continue
+                candidates.append(text)
         if not candidates:
             return []
         for candidate in candidates:
@@ -2048,6 +2119,7 @@ class SpiderCloudScraper(BaseScraper):
         started_at: int,
         *,
         require_keywords: bool = True,
+        index: Optional[EventIndex] = None,
     ) -> Dict[str, Any] | None:
         handler = self._get_site_handler(url)
         parsed_title = None
@@ -2064,7 +2136,9 @@ class SpiderCloudScraper(BaseScraper):
             if normalized_title:
                 parsed_title = normalized_title
 
-        listing_payload = self._extract_json_payload(events) or self._extract_json_payload(parsed_markdown)
+        listing_payload = self._extract_json_payload(events, index=index) or self._extract_json_payload(
+            parsed_markdown
+        )
         if (
             isinstance(listing_payload, dict)
             and self._payload_has_job_urls(listing_payload)
@@ -2078,7 +2152,7 @@ class SpiderCloudScraper(BaseScraper):
             }
             return None
 
-        structured_payload = self._extract_structured_job_posting(events)
+        structured_payload = self._extract_structured_job_posting(events, index=index)
         structured_title = None
         structured_location = None
         structured_description = None
@@ -2114,7 +2188,7 @@ class SpiderCloudScraper(BaseScraper):
         raw_cleaned_markdown = strip_known_nav_blocks(raw_markdown or "")
         raw_cleaned_markdown = _strip_embedded_theme_json(raw_cleaned_markdown)
         if len(cleaned_markdown.strip()) < 200:
-            meta_description = self._extract_meta_description_from_events(events)
+            meta_description = self._extract_meta_description_from_events(events, index=index)
             if meta_description and len(meta_description) > len(cleaned_markdown.strip()):
                 cleaned_markdown = meta_description
         cleaned_markdown_len = len(cleaned_markdown.strip())
@@ -2141,7 +2215,7 @@ class SpiderCloudScraper(BaseScraper):
         hint_title = hints.get("title") if isinstance(hints, dict) else None
         content_title = hint_title or self._title_from_markdown(cleaned_markdown)
 
-        event_title = self._title_from_events(events)
+        event_title = self._title_from_events(events, index=index)
         payload_title = parsed_title or structured_title or event_title
         title_source: str | None = None
         if parsed_title or structured_title:
@@ -2330,7 +2404,7 @@ class SpiderCloudScraper(BaseScraper):
             handler_location = handler.extract_location_hint(raw_markdown)
         greenhouse_location = None
         if handler and handler.name == "greenhouse":
-            greenhouse_location = self._extract_greenhouse_location_from_events(events)
+            greenhouse_location = self._extract_greenhouse_location_from_events(events, index=index)
         location = structured_location or greenhouse_location or handler_location or location_hint
         if structured_location and location_hint:
             structured_label = structured_location.strip()
@@ -2406,8 +2480,15 @@ class SpiderCloudScraper(BaseScraper):
             if raw_posted_at is not None and (not isinstance(raw_posted_at, str) or raw_posted_at.strip()):
                 posted_at, posted_at_unknown = parse_posted_at_with_unknown(raw_posted_at)
 
+        updated_at: int | None = None
+        updated_at_extractor = getattr(handler, "extract_updated_at", None) if handler else None
+        if callable(updated_at_extractor) and listing_payload is not None:
+            updated_at, updated_at_unknown = parse_posted_at_with_unknown(updated_at_extractor(listing_payload, url))
+            if updated_at_unknown:
+                updated_at = None
+
         self._last_ignored_job = None
-        return {
+        normalized: Dict[str, Any] = {
             "job_title": title,
             "title": title,
             "company": company,
@@ -2423,6 +2504,9 @@ class SpiderCloudScraper(BaseScraper):
             "posted_at": posted_at,
             "posted_at_unknown": posted_at_unknown,
         }
+        if updated_at is not None:
+            normalized["updated_at"] = updated_at
+        return normalized
 
     def _consume_chunk(self, chunk: Any, buffer: str) -> Tuple[str, List[Any]]:
         events: List[Any] = []
@@ -2463,8 +2547,13 @@ class SpiderCloudScraper(BaseScraper):
         """
 
         if hasattr(response, "__aiter__"):
-            async for item in response:
-                yield item
+            try:
+                async for item in response:
+                    yield item
+            finally:
+                # Closing early (incremental listing mode) must also stop the underlying stream.
+                if inspect.isasyncgen(response):
+                    await response.aclose()
             return
 
         if hasattr(response, "__await__"):
@@ -2486,10 +2575,10 @@ class SpiderCloudScraper(BaseScraper):
         attempt: int = 0,
     ) -> Dict[str, Any]:
         buffer = ""
-        raw_events: List[Any] = []
-        markdown_parts: List[str] = []
-        credit_candidates: List[float] = []
-        cost_candidates_usd: List[float] = []
+        # Each event is walked once on arrival; the extractors below read from the index.
+        index = EventIndex()
+        raw_events = index.events
+        markdown_parts = index.markdown_parts
         started_at = int(time.time() * 1000)
         logger.debug("SpiderCloud scrape started url=%s", url)
 
@@ -2503,47 +2592,49 @@ class SpiderCloudScraper(BaseScraper):
             if api_url and api_url != url:
                 request_url = api_url
                 logger.debug("SpiderCloud using api_url=%s original_url=%s", request_url, url)
-            local_params.update(handler.get_spidercloud_config(request_url))
+            local_params.update(self._handler_spidercloud_config(handler, request_url))
+        url_class = handler.classify(url) if handler else None
+        incremental_listing = bool(handler and handler.incremental_listing and url_class and url_class.listing)
+        early_listing_urls: Optional[List[str]] = None
 
         try:
-            async for chunk in self._iterate_scrape_response(
+            stream = self._iterate_scrape_response(
                 scrape_fn(  # type: ignore[call-arg]
                     request_url,
                     params=local_params,
                     stream=True,
                     content_type="application/jsonl",
                 )
-            ):
-                buffer, events = self._consume_chunk(chunk, buffer)
-                for evt in events:
-                    raw_events.append(evt)
-                    if isinstance(evt, dict):
-                        credit_value = self._extract_credits(evt)
-                        cost_value = self._extract_cost_usd(evt)
-                        if credit_value is not None:
-                            credit_candidates.append(credit_value)
-                        if cost_value is not None:
-                            cost_candidates_usd.append(cost_value)
-                        text = self._extract_markdown(evt)
-                        if text:
-                            markdown_parts.append(text)
+            )
+            try:
+                async for chunk in stream:
+                    buffer, events = self._consume_chunk(chunk, buffer)
+                    for evt in events:
+                        text = self._extract_markdown(evt) if isinstance(evt, dict) else None
+                        index.add(evt, markdown=text or None)
+                        if incremental_listing and early_listing_urls is None:
+                            early_listing_urls = self._complete_listing_urls_from_event(handler, evt, base_url=url)
+                    if early_listing_urls is not None:
+                        logger.info(
+                            "SpiderCloud listing complete mid-stream url=%s events=%s job_urls=%s; closing stream",
+                            url,
+                            len(raw_events),
+                            len(early_listing_urls),
+                        )
+                        buffer = ""
+                        break
+            finally:
+                await stream.aclose()
 
             tail = buffer.strip()
             if tail:
                 parsed = self._try_parse_json(tail)
-                raw_events.append(parsed if parsed is not None else tail)
+                tail_markdown: Optional[str] = None
                 if isinstance(parsed, dict):
-                    credit_value = self._extract_credits(parsed)
-                    cost_value = self._extract_cost_usd(parsed)
-                    if credit_value is not None:
-                        credit_candidates.append(credit_value)
-                    if cost_value is not None:
-                        cost_candidates_usd.append(cost_value)
-                    text = self._extract_markdown(parsed)
-                    if text:
-                        markdown_parts.append(text)
+                    tail_markdown = self._extract_markdown(parsed) or None
                 elif isinstance(parsed, str):
-                    markdown_parts.append(parsed)
+                    tail_markdown = parsed
+                index.add(parsed if parsed is not None else tail, markdown=tail_markdown)
 
             if not markdown_parts:
                 logger.debug("SpiderCloud stream empty for url=%s (no fallback request)", url)
@@ -2568,13 +2659,13 @@ class SpiderCloudScraper(BaseScraper):
             url,
             len(raw_events),
             len(markdown_parts),
-            len(credit_candidates),
+            len(index.credit_candidates),
         )
 
         # Detect captcha walls early so the caller can decide whether to retry with a proxy.
         captcha_match = None
-        if handler and handler.name == "greenhouse" and handler.is_api_detail_url(url):
-            if not self._has_valid_greenhouse_job_payload(raw_events, markdown_parts):
+        if handler and url_class and handler.name == "greenhouse" and url_class.api_detail:
+            if not self._has_valid_greenhouse_job_payload(raw_events, markdown_parts, index=index):
                 captcha_match = self._detect_captcha("\n\n".join(markdown_parts), raw_events)
         else:
             captcha_match = self._detect_captcha("\n\n".join(markdown_parts), raw_events)
@@ -2595,87 +2686,45 @@ class SpiderCloudScraper(BaseScraper):
         markdown_text = "\n\n".join(
             [part for part in markdown_parts if isinstance(part, str) and part.strip()]
         ).strip()
-        if handler and handler.is_api_detail_url(url):
+        if handler and url_class and url_class.api_detail:
             markdown_text, gh_title = handler.normalize_markdown(markdown_text)
             if gh_title:
-                raw_events.append({"title": gh_title, "gh_api_title": True})
-        listing_job_urls: List[str] = []
-        if handler and handler.supports_listing_api:
+                index.add({"title": gh_title, "gh_api_title": True})
+        listing_job_urls: List[str] = list(early_listing_urls or [])
+        if handler and handler.supports_listing_api and not listing_job_urls:
             try:
-                listing_job_urls = self._extract_listing_job_urls(handler, raw_events, markdown_text)
+                listing_job_urls = self._extract_listing_job_urls(handler, raw_events, markdown_text, index=index)
             except Exception:
                 listing_job_urls = []
-        if handler and handler.is_listing_url(url) and not listing_job_urls:
+        if handler and url_class and url_class.listing and not listing_job_urls:
             try:
                 listing_job_urls = self._extract_listing_job_urls_from_events(
                     handler,
                     raw_events,
                     markdown_text,
                     base_url=url,
+                    index=index,
                 )
             except Exception:
                 listing_job_urls = []
-        if handler and handler.is_listing_url(url) and not listing_job_urls:
-            try:
-                listing_job_urls = self._extract_listing_job_urls_from_events(
-                    handler,
-                    raw_events,
-                    markdown_text,
-                    base_url=url,
-                )
-            except Exception:
-                listing_job_urls = []
-        if handler and handler.is_listing_url(url) and not listing_job_urls:
+        if handler and url_class and url_class.listing and not listing_job_urls:
             try:
                 listing_job_urls = self._extract_listing_links_from_html(
                     handler,
                     raw_events,
                     markdown_text,
+                    index=index,
                 )
             except Exception:
                 listing_job_urls = []
-        credits_used = max(credit_candidates) if credit_candidates else None
-        cost_milli_cents = (
-            int(max(cost_candidates_usd) * 100000) if cost_candidates_usd else None
-        )
+        credits_used = index.credits_used
+        cost_usd_total = index.cost_usd
+        cost_milli_cents = int(cost_usd_total * 100000) if cost_usd_total is not None else None
         if cost_milli_cents is None and credits_used is not None:
             cost_milli_cents = int(float(credits_used) * 10)
         cost_usd = (cost_milli_cents / 100000) if isinstance(cost_milli_cents, (int, float)) else None
 
-        def _extract_http_status(value: Any) -> Optional[int]:
-            if isinstance(value, dict):
-                for key in ("status", "httpStatus"):
-                    status_val = value.get(key)
-                    if isinstance(status_val, (int, float)):
-                        return int(status_val)
-                meta = value.get("metadata")
-                if isinstance(meta, dict):
-                    meta_raw = meta.get("raw")
-                    if isinstance(meta_raw, dict):
-                        status_val = meta_raw.get("status")
-                        if isinstance(status_val, (int, float)):
-                            return int(status_val)
-            if isinstance(value, str) and value.strip():
-                parsed = self._try_parse_json(value)
-                if isinstance(parsed, dict):
-                    return _extract_http_status(parsed)
-            return None
-
-        http_status = None
-        for evt in raw_events:
-            http_status = _extract_http_status(evt)
-            if http_status is not None:
-                break
-        if http_status is None:
-            for text in gather_strings(raw_events):
-                http_status = _extract_http_status(text)
-                if http_status is not None:
-                    break
-        if http_status is None:
-            for text in markdown_parts:
-                http_status = _extract_http_status(text)
-                if http_status is not None:
-                    break
+        http_status = index.http_status
 
         if http_status == 404:
             fallback_title = self._title_from_url(url)
@@ -2701,6 +2750,7 @@ class SpiderCloudScraper(BaseScraper):
                 "startedAt": started_at,
                 "ignored": ignored_entry,
                 "failed": {"url": url, "reason": "http_404", "status": http_status},
+                "httpStatus": http_status,
             }
         require_keywords = attempt <= 1
         normalized = self._normalize_job(
@@ -2709,6 +2759,7 @@ class SpiderCloudScraper(BaseScraper):
             raw_events,
             started_at,
             require_keywords=require_keywords,
+            index=index,
         )
         ignored_entry = getattr(self, "_last_ignored_job", None)
         if listing_job_urls and normalized:
@@ -2744,6 +2795,7 @@ class SpiderCloudScraper(BaseScraper):
             "costMilliCents": cost_milli_cents,
             "startedAt": started_at,
             "ignored": ignored_entry,
+            "httpStatus": http_status,
         }
         logger.debug(
             "SpiderCloud normalized url=%s title=%s credits=%s description_len=%s",
@@ -2760,42 +2812,12 @@ class SpiderCloudScraper(BaseScraper):
         source_url: str,
         pattern: Optional[str] = None,
         posted_at_by_url: Optional[Dict[str, int]] = None,
+        updated_at_by_url: Optional[Dict[str, int]] = None,
     ) -> Dict[str, Any]:
-        def _safe_json_size(payload: Any) -> Optional[int]:
-            try:
-                return len(json.dumps(payload, ensure_ascii=False))
-            except Exception:
-                return None
-
-        def _sanitize_urls(values: Iterable[str]) -> list[str]:
-            cleaned: list[str] = []
-            seen: set[str] = set()
-            for value in values:
-                if not isinstance(value, str):
-                    continue
-                raw = value.strip()
-                if not raw:
-                    continue
-                candidate = raw.replace("\\", "/")
-                normalized = normalize_url(candidate)
-                if normalized:
-                    candidate = normalized
-                if candidate in seen:
-                    continue
-                seen.add(candidate)
-                cleaned.append(candidate)
-            return cleaned
-
-        urls = _sanitize_urls(urls)[:SPIDERCLOUD_BATCH_SIZE]
-        posted_at_lookup: Dict[str, int] = {}
-        if isinstance(posted_at_by_url, dict):
-            for key, value in posted_at_by_url.items():
-                if not isinstance(key, str):
-                    continue
-                if not isinstance(value, (int, float)):
-                    continue
-                normalized_key = normalize_url(key) or key
-                posted_at_lookup[normalized_key] = int(value)
+        batch = UrlBatch.from_values(urls, keep_unnormalized=True, limit=SPIDERCLOUD_BATCH_SIZE)
+        urls = list(batch.urls)
+        posted_at_lookup = batch.timestamps_by_url(posted_at_by_url)
+        updated_at_lookup = batch.timestamps_by_url(updated_at_by_url)
         logger.info(
             "SpiderCloud batch start source=%s urls=%s pattern=%s",
             source_url,
@@ -2827,15 +2849,18 @@ class SpiderCloudScraper(BaseScraper):
             return {}
 
         handler_configs: List[Dict[str, Any]] = []
+        host_limiters: Dict[str, HostLimiter] = {}
         for url in urls:
             handler = self._get_site_handler(url)
+            host_overrides: Optional[Dict[str, Any]] = None
             if handler:
-                config = handler.get_spidercloud_config(url)
+                config, host_overrides = split_host_limits(handler.get_spidercloud_config(url))
                 if not config:
                     config = _infer_spidercloud_config(url)
                 handler_configs.append(config)
             else:
                 handler_configs.append(_infer_spidercloud_config(url))
+            host_limiters[url] = self._host_limiter(url, host_overrides)
 
         def _wants_raw_html(config: Dict[str, Any]) -> bool:
             value = config.get("return_format")
@@ -2869,11 +2894,19 @@ class SpiderCloudScraper(BaseScraper):
         max_markdown_len = 0
 
         timeout_seconds = runtime_config.spidercloud_http_timeout_seconds
-        max_concurrency = max(1, int(runtime_config.spidercloud_job_details_concurrency))
+        # Batch-wide cap; each host is further limited by its own adaptive limiter.
+        max_concurrency = max(
+            1,
+            int(runtime_config.spidercloud_job_details_concurrency),
+            int(runtime_config.spidercloud_job_details_max_concurrency),
+        )
         max_concurrency = min(max_concurrency, len(urls))
         semaphore = asyncio.Semaphore(max_concurrency)
+        escalation = self._proxy_escalation()
+        # host -> attempts skipped by starting above direct, for the batch summary.
+        avoided_attempts_by_host: Dict[str, int] = {}
 
-        async with AsyncSpider(api_key=api_key) as client:
+        async with self._spider_client(api_key) as client:
             async def _scrape_one(idx: int, url: str) -> tuple[int, str, Dict[str, Any] | None]:
                 async with semaphore:
                     # When we receive an API detail URL, try to also capture a
@@ -2883,9 +2916,13 @@ class SpiderCloudScraper(BaseScraper):
                         handler.get_company_uri(url) if handler and handler.name == "greenhouse" else None
                     )
 
+                    limiter = host_limiters.get(url) or self._host_limiter(url)
+                    host = host_key(url)
+                    start_tier = escalation.start_tier(host)
+                    tier = start_tier
                     attempt = 0
                     result: Dict[str, Any] | None = None
-                    proxy: Optional[str] = None
+                    proxy: Optional[str] = escalation.proxy_for(tier)
                     last_error: BaseException | None = None
                     while attempt <= CAPTCHA_RETRY_LIMIT:
                         attempt += 1
@@ -2893,19 +2930,37 @@ class SpiderCloudScraper(BaseScraper):
                         if proxy:
                             local_params["proxy"] = proxy
                         try:
-                            scrape_coro = self._scrape_single_url(
-                                client,
-                                url,
-                                local_params,
-                                attempt=attempt,
-                            )
-                            if timeout_seconds and timeout_seconds > 0:
-                                result = await asyncio.wait_for(scrape_coro, timeout=timeout_seconds)
+                            async with limiter.slot():
+                                with _metric_timed(
+                                    "provider_call_latency",
+                                    provider=self.provider,
+                                    handler=handler.name if handler else "none",
+                                ):
+                                    scrape_coro = self._scrape_single_url(
+                                        client,
+                                        url,
+                                        local_params,
+                                        attempt=attempt,
+                                    )
+                                    if timeout_seconds and timeout_seconds > 0:
+                                        result = await asyncio.wait_for(
+                                            scrape_coro, timeout=timeout_seconds
+                                        )
+                                    else:
+                                        result = await scrape_coro
+                            http_status = result.get("httpStatus") if isinstance(result, dict) else None
+                            if http_status in THROTTLE_HTTP_STATUSES:
+                                limiter.record_throttle(f"http_{http_status}")
                             else:
-                                result = await scrape_coro
+                                limiter.record_success()
+                            escalation.record_success(host, tier)
+                            if start_tier:
+                                avoided_attempts_by_host[host] = avoided_attempts_by_host.get(host, 0) + start_tier
                             break
                         except CaptchaDetectedError as err:
-                            proxy = CAPTCHA_PROXY_SEQUENCE[min(attempt - 1, len(CAPTCHA_PROXY_SEQUENCE) - 1)]
+                            limiter.record_throttle("captcha")
+                            tier = escalation.next_tier(tier)
+                            proxy = escalation.proxy_for(tier)
                             logger.warning(
                                 "SpiderCloud captcha retry url=%s attempt=%s/%s proxy=%s marker=%s",
                                 url,
@@ -2982,10 +3037,18 @@ class SpiderCloudScraper(BaseScraper):
                         if isinstance(normalized_block, dict):
                             override = posted_at_lookup.get(url)
                             if override is None:
-                                override = posted_at_lookup.get(normalize_url(url) or url)
+                                override = posted_at_lookup.get(cached_normalize_url(url) or url)
                             if override is not None:
                                 normalized_block["posted_at"] = int(override)
                                 normalized_block["posted_at_unknown"] = False
+                    if updated_at_lookup and isinstance(result, dict):
+                        normalized_block = result.get("normalized")
+                        if isinstance(normalized_block, dict):
+                            updated_at = updated_at_lookup.get(url)
+                            if updated_at is None:
+                                updated_at = updated_at_lookup.get(cached_normalize_url(url) or url)
+                            if updated_at is not None:
+                                normalized_block["updated_at"] = updated_at
 
                     return idx, url, result
 
@@ -3034,6 +3097,30 @@ class SpiderCloudScraper(BaseScraper):
         cost_milli_cents: int | None = None
         if saw_cost_field or total_cost_milli_cents > 0:
             cost_milli_cents = int(total_cost_milli_cents)
+        proxy_escalation_summary: Dict[str, Any] = {}
+        escalated_hosts = {
+            host: {
+                "tier": escalation.tier_label(escalation.start_tier(host)),
+                "avoidedAttempts": avoided_attempts_by_host.get(host, 0),
+            }
+            for host in sorted({host_key(url) for url in urls})
+            if escalation.start_tier(host) or avoided_attempts_by_host.get(host)
+        }
+        if escalated_hosts:
+            avoided_total = sum(avoided_attempts_by_host.values())
+            proxy_escalation_summary = {"hosts": escalated_hosts, "avoidedAttempts": avoided_total}
+            # Skipped attempts would have been billed like any other request in the batch.
+            if cost_milli_cents is not None and urls:
+                proxy_escalation_summary["estimatedSavedCostMilliCents"] = int(
+                    avoided_total * total_cost_milli_cents / len(urls)
+                )
+            logger.info(
+                "SpiderCloud proxy escalation source=%s hosts=%s avoided_attempts=%s saved_cost_mc=%s",
+                source_url,
+                {host: info["tier"] for host, info in escalated_hosts.items()},
+                avoided_total,
+                proxy_escalation_summary.get("estimatedSavedCostMilliCents"),
+            )
         provider_request: Dict[str, Any] = {
             "urls": urls,
             "params": params,
@@ -3090,9 +3177,10 @@ class SpiderCloudScraper(BaseScraper):
         if cost_milli_cents is not None:
             scrape_payload["costMilliCents"] = cost_milli_cents
 
-        raw_payload_bytes = _safe_json_size(scrape_payload)
+        # Sizes come from the estimator so logging never re-serializes multi-MB raw payloads.
+        raw_payload_bytes = estimate_json_size(scrape_payload)
         trimmed = self._trim_scrape_payload(scrape_payload)
-        trimmed_payload_bytes = _safe_json_size(trimmed)
+        trimmed_payload_bytes = estimate_json_size(trimmed)
         trimmed_items = trimmed.get("items")
         if isinstance(trimmed_items, dict):
             trimmed_items.setdefault("seedUrls", urls)
@@ -3142,7 +3230,11 @@ class SpiderCloudScraper(BaseScraper):
                 f"cost_cents={cost_cents_display} "
                 f"cost_usd={cost_usd_display}"
             ),
-            metadata={"pattern": pattern, "seed": len(urls)},
+            metadata={
+                "pattern": pattern,
+                "seed": len(urls),
+                **({"proxyEscalation": proxy_escalation_summary} if proxy_escalation_summary else {}),
+            },
             response=trimmed,
         )
 
@@ -3235,21 +3327,26 @@ class SpiderCloudScraper(BaseScraper):
             "limit": 1,
         }
         if handler:
-            spider_params.update(handler.get_spidercloud_config(api_url))
+            spider_params.update(self._handler_spidercloud_config(handler, api_url))
 
         async def _do_fetch() -> list[Any]:
-            async with AsyncSpider(api_key=api_key) as client:
-                scrape_fn = getattr(client, "scrape_url", None) or getattr(client, "crawl_url")
-                response = scrape_fn(  # type: ignore[call-arg]
-                    api_url,
-                    params=spider_params,
-                    stream=False,
-                    content_type="application/json",
-                )
-                raw_events: list[Any] = []
-                async for chunk in self._iterate_scrape_response(response):
-                    raw_events.append(chunk)
-                return raw_events
+            async with self._spider_client(api_key) as client:
+                with _metric_timed(
+                    "provider_call_latency",
+                    provider=self.provider,
+                    handler=handler.name if handler else "none",
+                ):
+                    scrape_fn = getattr(client, "scrape_url", None) or getattr(client, "crawl_url")
+                    response = scrape_fn(  # type: ignore[call-arg]
+                        api_url,
+                        params=spider_params,
+                        stream=False,
+                        content_type="application/json",
+                    )
+                    raw_events: list[Any] = []
+                    async for chunk in self._iterate_scrape_response(response):
+                        raw_events.append(chunk)
+                    return raw_events
 
         timeout_seconds = runtime_config.spidercloud_http_timeout_seconds
         try:
@@ -3356,10 +3453,12 @@ class SpiderCloudScraper(BaseScraper):
                 raw_text = str(payload)
 
         try:
-            board = load_greenhouse_board(payload or raw_text or {})
+            board = load_greenhouse_board(payload or raw_text or {}, lean=True)
             # Structured extraction first. Do not filter by required keywords here.
             required_keywords: tuple[str, ...] = ()
             job_urls = extract_greenhouse_job_urls(board, required_keywords=required_keywords)
+            fingerprint = greenhouse_board_fingerprint(board)
+            updated_at_by_url = greenhouse_updated_at_by_url(board, slug)
 
             # Prefer API detail URLs when we know the board slug and job IDs.
             if slug and job_urls:
@@ -3519,6 +3618,8 @@ class SpiderCloudScraper(BaseScraper):
             "raw": raw_text,
             "job_urls": job_urls,
             "posted_at_by_url": posted_at_by_url if posted_at_by_url else None,
+            "updated_at_by_url": updated_at_by_url or None,
+            "fingerprint": fingerprint,
             "startedAt": started_at,
             "completedAt": completed_at,
         }
@@ -3554,11 +3655,15 @@ class SpiderCloudScraper(BaseScraper):
         posted_at_by_url = payload.get("posted_at_by_url")
         if not isinstance(posted_at_by_url, dict):
             posted_at_by_url = None
+        updated_at_by_url = payload.get("updated_at_by_url")
+        if not isinstance(updated_at_by_url, dict):
+            updated_at_by_url = None
         scrape_payload = await self._scrape_urls_batch(
             urls,
             source_url=source_url,
             pattern=None,
             posted_at_by_url=posted_at_by_url,
+            updated_at_by_url=updated_at_by_url,
         )
         items = scrape_payload.get("items") if isinstance(scrape_payload, dict) else {}
         normalized = items.get("normalized") if isinstance(items, dict) else []
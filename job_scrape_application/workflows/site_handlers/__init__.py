@@ -5,7 +5,7 @@ from typing import Iterable, List
 from .adobe_careers import AdobeCareersHandler
 from .ashby import AshbyHqHandler
 from .avature import AvatureHandler
-from .base import BaseSiteHandler
+from .base import BaseSiteHandler, UrlClassification
 from .cisco_careers import CiscoCareersHandler
 from .confluent import ConfluentHandler
 from .docusign import DocusignHandler
@@ -74,6 +74,7 @@ __all__ = [
     "OpenAICareersHandler",
     "PaloAltoNetworksHandler",
     "UberCareersHandler",
+    "UrlClassification",
     "WorkdayHandler",
     "get_site_handler",
     "get_site_handlers_for_urls",
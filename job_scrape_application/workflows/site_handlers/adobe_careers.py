@@ -3,9 +3,10 @@ from __future__ import annotations
 import html as html_lib
 import re
 from typing import Any, Dict, List
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 
 from .base import BaseSiteHandler
+from ..helpers.parsed_url import cached_urlparse
 
 ADOBE_HOST_SUFFIX = "careers.adobe.com"
 ADOBE_BASE_URL = "https://careers.adobe.com"
@@ -38,11 +39,12 @@ class AdobeCareersHandler(BaseSiteHandler):
     name = "adobe_careers"
     site_type = "adobe"
     needs_page_links = True
+    incremental_listing = True
 
     @classmethod
     def matches_url(cls, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         host = (parsed.hostname or "").lower()
@@ -50,7 +52,7 @@ class AdobeCareersHandler(BaseSiteHandler):
 
     def is_listing_url(self, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         if parsed.hostname and not self.matches_url(url):
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import re
 from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse
 
 from .base import BaseSiteHandler
 from ..helpers.link_extractors import fix_scheme_slashes, strip_wrapping_url
+from ..helpers.parsed_url import cached_urlparse
 from ..helpers.regex_patterns import ASHBY_JOB_URL_PATTERN
 
 
@@ -16,7 +16,7 @@ class AshbyHqHandler(BaseSiteHandler):
     @classmethod
     def matches_url(cls, url: str) -> bool:
         try:
-            host = (urlparse(url).hostname or "").lower()
+            host = (cached_urlparse(url).hostname or "").lower()
         except Exception:
             return False
         return host.endswith("ashbyhq.com")
@@ -25,7 +25,7 @@ class AshbyHqHandler(BaseSiteHandler):
         if not self.matches_url(url):
             return None
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return None
         path = parsed.path.strip("/")
@@ -57,7 +57,7 @@ class AshbyHqHandler(BaseSiteHandler):
         if not self.matches_url(url):
             return False
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         segments = [seg for seg in (parsed.path or "").split("/") if seg]
@@ -110,7 +110,7 @@ class AshbyHqHandler(BaseSiteHandler):
             cleaned = fix_scheme_slashes(cleaned)
             cleaned = self._strip_application_suffix(cleaned)
             try:
-                parsed = urlparse(cleaned)
+                parsed = cached_urlparse(cleaned)
             except Exception:
                 parsed = None
             host = (parsed.hostname or "").lower() if parsed else ""
@@ -137,7 +137,7 @@ class AshbyHqHandler(BaseSiteHandler):
     @staticmethod
     def _strip_application_suffix(url: str) -> str:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return url
         host = (parsed.hostname or "").lower()
@@ -153,7 +153,7 @@ class AshbyHqHandler(BaseSiteHandler):
     @staticmethod
     def _looks_like_non_job_detail_url(url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         if parsed.scheme and parsed.scheme not in {"http", "https"}:
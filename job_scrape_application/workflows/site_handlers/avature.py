@@ -3,9 +3,10 @@ from __future__ import annotations
 import html as html_lib
 import re
 from typing import Any, Dict, List, Optional
-from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+from urllib.parse import parse_qsl, urlencode, urljoin, urlunparse
 
 from .base import BaseSiteHandler
+from ..helpers.parsed_url import cached_urlparse
 from ..helpers.regex_patterns import (
     AVATURE_BASE_URL_RE,
     AVATURE_JOB_DETAIL_PATH_RE,
@@ -29,14 +30,14 @@ class AvatureHandler(BaseSiteHandler):
     @classmethod
     def matches_url(cls, url: str) -> bool:
         try:
-            host = (urlparse(url).hostname or "").lower()
+            host = (cached_urlparse(url).hostname or "").lower()
         except Exception:
             return False
         return any(host.endswith(suffix) for suffix in AVATURE_HOST_SUFFIXES)
 
     def is_listing_url(self, url: str) -> bool:
         try:
-            path = (urlparse(url).path or "").lower()
+            path = (cached_urlparse(url).path or "").lower()
         except Exception:
             return False
         return "/careers/searchjobs" in path or "/careers/searchjobsdata" in path
@@ -118,7 +119,7 @@ class AvatureHandler(BaseSiteHandler):
 
     def _augment_pagination_urls(self, base_url: str, html: str, urls: List[str]) -> List[str]:
         def _with_job_offset(url_value: str, offset: int) -> str:
-            parsed = urlparse(url_value)
+            parsed = cached_urlparse(url_value)
             params = [
                 (key, value)
                 for key, value in parse_qsl(parsed.query, keep_blank_values=True)
@@ -129,7 +130,7 @@ class AvatureHandler(BaseSiteHandler):
 
         base_offset = None
         base_has_offset = False
-        for key, value in parse_qsl(urlparse(base_url).query, keep_blank_values=True):
+        for key, value in parse_qsl(cached_urlparse(base_url).query, keep_blank_values=True):
             if key.lower() == "joboffset":
                 base_has_offset = True
                 try:
@@ -209,7 +210,7 @@ class AvatureHandler(BaseSiteHandler):
             if self.is_listing_url(url):
                 return url
         for url in urls:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
             if parsed.scheme and parsed.netloc:
                 return urlunparse(
                     parsed._replace(path="/careers/SearchJobs", params="", query="", fragment="")
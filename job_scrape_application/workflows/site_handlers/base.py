@@ -1,14 +1,29 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
 import html as html_lib
 import json
-import re
 from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse
 
+from ...components.json_islands import extract_jobs_payload, find_jobs_payload
 from ..helpers.link_extractors import fix_scheme_slashes, strip_wrapping_url
-from ..helpers.regex_patterns import JSON_ARRAY_PATTERN, JSON_OBJECT_PATTERN, PRE_PATTERN
+from ..helpers.parsed_url import URL_CACHE_SIZE, cached_urlparse, parse_url
+from ..helpers.regex_patterns import PRE_PATTERN
+
+_NON_HTTP_PREFIXES = ("mailto:", "tel:", "javascript:", "#")
+
+
+@dataclass(frozen=True)
+class UrlClassification:
+    """How a handler sees a URL; ``job_detail`` is anything that is neither a listing nor non-job."""
+
+    listing: bool
+    api_detail: bool
+    job_detail: bool
+    non_job: bool
+
 
 class BaseSiteHandler(ABC):
     """Base class for site-specific scraping helpers."""
@@ -17,6 +32,9 @@ class BaseSiteHandler(ABC):
     site_type: str | None = None
     supports_listing_api: bool = False
     needs_page_links: bool = False
+    # Listing scrapes may stop reading the SpiderCloud stream once one event's raw HTML
+    # satisfies ``is_listing_stream_complete``.
+    incremental_listing: bool = False
 
     @classmethod
     @abstractmethod
@@ -84,9 +102,19 @@ class BaseSiteHandler(ABC):
     def extract_posted_at(self, payload: Any, url: str | None = None) -> Any | None:
         return None
 
+    def extract_updated_at(self, payload: Any, url: str | None = None) -> Any | None:
+        """Source-side last-modified timestamp used as the job's freshness watermark."""
+
+        return None
+
     def get_pagination_urls_from_json(self, payload: Any, source_url: str | None = None) -> List[str]:
         return []
 
+    def is_listing_stream_complete(self, html: str, job_urls: List[str]) -> bool:
+        """Return True when ``job_urls`` pulled from ``html`` already cover the whole listing page."""
+
+        return any(self.classify(url).job_detail for url in job_urls)
+
     def is_listing_url(self, url: str) -> bool:
         return False
 
@@ -105,6 +133,28 @@ class BaseSiteHandler(ABC):
     def is_api_detail_url(self, uri: str) -> bool:
         return False
 
+    def classify(self, url: str) -> UrlClassification:
+        """Classify ``url`` for this handler; repeat checks on the same URL hit a cache.
+
+        Handlers are stateless, so results are memoized on ``(type(self), url)``.
+        """
+
+        return _classify_url(type(self), url)
+
+    def _classify_uncached(self, url: str) -> UrlClassification:
+        non_job = (
+            not url
+            or url.lower().startswith(_NON_HTTP_PREFIXES)
+            or self._looks_like_non_job_detail_url(url)
+        )
+        listing = self.is_listing_url(url)
+        return UrlClassification(
+            listing=listing,
+            api_detail=self.is_api_detail_url(url),
+            job_detail=not listing and not non_job,
+            non_job=non_job,
+        )
+
     def filter_job_urls(self, urls: List[str]) -> List[str]:
         filtered: List[str] = []
         seen: set[str] = set()
@@ -116,7 +166,7 @@ class BaseSiteHandler(ABC):
                 continue
             cleaned = fix_scheme_slashes(cleaned)
             lower = cleaned.lower()
-            if lower.startswith(("mailto:", "tel:", "javascript:", "#")):
+            if lower.startswith(_NON_HTTP_PREFIXES):
                 continue
             if self._looks_like_non_job_detail_url(cleaned):
                 continue
@@ -126,42 +176,7 @@ class BaseSiteHandler(ABC):
 
     @staticmethod
     def _looks_like_non_job_detail_url(url: str) -> bool:
-        try:
-            parsed = urlparse(url)
-        except Exception:
-            return False
-        if parsed.scheme and parsed.scheme not in {"http", "https"}:
-            return True
-        host = (parsed.hostname or "").lower()
-        path = (parsed.path or "").lower()
-        if not host or not path:
-            return False
-        if any(token in path for token in ("http://", "https://", "http:/", "https:/")):
-            return True
-        segments = [seg for seg in path.split("/") if seg]
-        if any(seg in {"apply", "application", "hvhapply"} for seg in segments):
-            return True
-        if host.endswith("linkedin.com"):
-            if path.startswith("/company/"):
-                return True
-            if (
-                path.startswith(("/checkpoint/", "/login", "/m/login", "/uas/", "/sharearticle", "/share/"))
-                or "request-password-reset" in path
-            ):
-                return True
-        if host.endswith("careers.adobe.com"):
-            if "/job/" in path:
-                return False
-            if "c" in segments or "teams" in segments:
-                return True
-        if host.endswith("avature.net") and "savejob" in path:
-            return True
-        if host.endswith("adobe.com") and not host.endswith("careers.adobe.com"):
-            if "/job/" in path:
-                return False
-            if path.startswith("/creativecloud/buy/"):
-                return True
-        return False
+        return _looks_like_non_job_detail_url(url)
 
     def _apply_page_links_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         if not self.needs_page_links:
@@ -204,44 +219,19 @@ class BaseSiteHandler(ABC):
                     return json.loads(unescaped)
                 except Exception:
                     pass
-            for pattern in (JSON_OBJECT_PATTERN, JSON_ARRAY_PATTERN):
-                match = re.search(pattern, text, flags=re.DOTALL)
-                if not match:
-                    continue
-                try:
-                    return json.loads(match.group(0))
-                except Exception:
-                    continue
-            return None
-
-        def _find_jobs_payload(node: Any) -> Optional[Dict[str, Any]]:
-            if isinstance(node, dict):
-                jobs = node.get("jobs")
-                if isinstance(jobs, list):
-                    return node
-                positions = node.get("positions")
-                if isinstance(positions, list):
-                    return node
-                for child in node.values():
-                    found = _find_jobs_payload(child)
-                    if found:
-                        return found
-            elif isinstance(node, list):
-                for child in node:
-                    found = _find_jobs_payload(child)
-                    if found:
-                        return found
             return None
 
         parsed = _parse_json_blob(content)
-        return _find_jobs_payload(parsed)
+        if parsed is None:
+            return extract_jobs_payload(content)
+        return find_jobs_payload(parsed)
 
     @staticmethod
     def _title_from_url(url: str) -> str:
         """Return a title-ish slug from a URL path (best-effort)."""
 
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             parsed = None
         path = parsed.path if parsed else url
@@ -249,3 +239,52 @@ class BaseSiteHandler(ABC):
         slug = slug.split("?")[0]
         slug = slug.replace("-", " ").replace("_", " ").strip()
         return slug
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _looks_like_non_job_detail_url(url: str) -> bool:
+    parsed = parse_url(url)
+    if parsed is None:
+        return False
+    if parsed.scheme and parsed.scheme not in {"http", "https"}:
+        return True
+    host = parsed.host
+    path = parsed.path_lower
+    if not host or not path:
+        return False
+    if any(token in path for token in ("http://", "https://", "http:/", "https:/")):
+        return True
+    segments = [seg for seg in path.split("/") if seg]
+    if any(seg in {"apply", "application", "hvhapply"} for seg in segments):
+        return True
+    if host.endswith("linkedin.com"):
+        if path.startswith("/company/"):
+            return True
+        if (
+            path.startswith(("/checkpoint/", "/login", "/m/login", "/uas/", "/sharearticle", "/share/"))
+            or "request-password-reset" in path
+        ):
+            return True
+    if host.endswith("careers.adobe.com"):
+        if "/job/" in path:
+            return False
+        if "c" in segments or "teams" in segments:
+            return True
+    if host.endswith("avature.net") and "savejob" in path:
+        return True
+    if host.endswith("adobe.com") and not host.endswith("careers.adobe.com"):
+        if "/job/" in path:
+            return False
+        if path.startswith("/creativecloud/buy/"):
+            return True
+    return False
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _classify_url(handler_cls: type[BaseSiteHandler], url: str) -> UrlClassification:
+    return _handler_instance(handler_cls)._classify_uncached(url)
+
+
+@lru_cache(maxsize=None)
+def _handler_instance(handler_cls: type[BaseSiteHandler]) -> BaseSiteHandler:
+    return handler_cls()
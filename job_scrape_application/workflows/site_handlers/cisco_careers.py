@@ -3,9 +3,10 @@ from __future__ import annotations
 import html as html_lib
 import re
 from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 
 from .base import BaseSiteHandler
+from ..helpers.parsed_url import cached_urlparse
 
 CISCO_HOST_SUFFIX = "careers.cisco.com"
 CISCO_BASE_URL = "https://careers.cisco.com"
@@ -39,11 +40,12 @@ _IMAGE_RE = re.compile(r"^!\[[^\]]*]\([^\)]*\)$")
 class CiscoCareersHandler(BaseSiteHandler):
     name = "cisco_careers"
     site_type = "cisco"
+    incremental_listing = True
 
     @classmethod
     def matches_url(cls, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         host = (parsed.hostname or "").lower()
@@ -51,7 +53,7 @@ class CiscoCareersHandler(BaseSiteHandler):
 
     def is_listing_url(self, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         if parsed.hostname and not self.matches_url(url):
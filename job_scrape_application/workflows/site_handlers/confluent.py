@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import re
 from typing import Any
-from urllib.parse import urlparse
 
+from ..helpers.parsed_url import cached_urlparse
 from ..helpers.regex_patterns import CONFLUENT_JOB_PATH_PATTERN
 from .base import BaseSiteHandler
 
@@ -16,7 +16,7 @@ class ConfluentHandler(BaseSiteHandler):
     @classmethod
     def matches_url(cls, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         host = (parsed.hostname or "").lower()
@@ -27,7 +27,7 @@ class ConfluentHandler(BaseSiteHandler):
 
     def is_listing_url(self, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         host = (parsed.hostname or "").lower()
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import math
 from typing import Any, Dict, List, Optional
-from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+from urllib.parse import parse_qsl, urlencode, urlunparse
 
 from .base import BaseSiteHandler
+from ..helpers.parsed_url import cached_urlparse
 
 DOCUSIGN_HOST = "careers.docusign.com"
 LISTING_PATH = "/api/jobs"
@@ -19,7 +20,7 @@ class DocusignHandler(BaseSiteHandler):
     @classmethod
     def matches_url(cls, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         host = (parsed.hostname or "").lower()
@@ -30,7 +31,7 @@ class DocusignHandler(BaseSiteHandler):
 
     def is_listing_url(self, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         path = (parsed.path or "").lower()
@@ -122,7 +123,7 @@ class DocusignHandler(BaseSiteHandler):
             if not cleaned or cleaned in seen:
                 continue
             try:
-                parsed = urlparse(cleaned)
+                parsed = cached_urlparse(cleaned)
             except Exception:
                 continue
             host = (parsed.hostname or "").lower()
@@ -167,7 +168,7 @@ class DocusignHandler(BaseSiteHandler):
         if not url:
             return None
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return None
         for key, value in parse_qsl(parsed.query, keep_blank_values=True):
@@ -182,7 +183,7 @@ class DocusignHandler(BaseSiteHandler):
 
     def _set_page_param(self, url: str, page: int) -> str:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return url
         params = [
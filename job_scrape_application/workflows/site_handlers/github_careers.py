@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from typing import Any, List, Optional
-from urllib.parse import parse_qs, urlencode, urlparse
+from urllib.parse import parse_qs, urlencode
 
 from .base import BaseSiteHandler
+from ..helpers.parsed_url import cached_urlparse
 
 
 class GithubCareersHandler(BaseSiteHandler):
@@ -13,7 +14,7 @@ class GithubCareersHandler(BaseSiteHandler):
     @classmethod
     def matches_url(cls, url: str) -> bool:
         try:
-            host = (urlparse(url).hostname or "").lower()
+            host = (cached_urlparse(url).hostname or "").lower()
         except Exception:
             return False
         return host.endswith("github.careers")
@@ -22,7 +23,7 @@ class GithubCareersHandler(BaseSiteHandler):
         if not self.matches_url(uri):
             return None
         try:
-            parsed = urlparse(uri)
+            parsed = cached_urlparse(uri)
         except Exception:
             return None
         if parsed.path.rstrip("/") == "/api/jobs":
@@ -4,9 +4,10 @@ import json
 import re
 import html as html_lib
 from typing import Any, Dict, List, Optional
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs
 
 from .base import BaseSiteHandler
+from ..helpers.parsed_url import cached_urlparse
 from ..helpers.regex_patterns import (
     HORIZONTAL_WHITESPACE_PATTERN,
     HTML_LINE_BREAK_PATTERN,
@@ -30,14 +31,14 @@ class GreenhouseHandler(BaseSiteHandler):
         if "gh_jid" in url:
             return True
         try:
-            host = (urlparse(url).hostname or "").lower()
+            host = (cached_urlparse(url).hostname or "").lower()
         except Exception:
             return False
         return "greenhouse.io" in host
 
     def _extract_slug_from_url(self, url: str) -> Optional[str]:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return None
         query = parse_qs(parsed.query)
@@ -64,7 +65,7 @@ class GreenhouseHandler(BaseSiteHandler):
 
     def _extract_job_id_from_url(self, url: str) -> Optional[str]:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return None
         query = parse_qs(parsed.query)
@@ -78,7 +79,7 @@ class GreenhouseHandler(BaseSiteHandler):
 
     def is_api_detail_url(self, uri: str) -> bool:
         try:
-            parsed = urlparse(uri)
+            parsed = cached_urlparse(uri)
         except Exception:
             return False
         host = (parsed.hostname or "").lower()
@@ -86,7 +87,7 @@ class GreenhouseHandler(BaseSiteHandler):
 
     def _is_listing_api_url(self, uri: str) -> bool:
         try:
-            parsed = urlparse(uri)
+            parsed = cached_urlparse(uri)
         except Exception:
             return False
         host = (parsed.hostname or "").lower()
@@ -115,7 +116,7 @@ class GreenhouseHandler(BaseSiteHandler):
         if not slug:
             return None
         try:
-            parsed = urlparse(uri)
+            parsed = cached_urlparse(uri)
         except Exception:
             parsed = None
         host = (parsed.hostname or "").lower() if parsed else ""
@@ -130,7 +131,7 @@ class GreenhouseHandler(BaseSiteHandler):
 
     def get_company_uri(self, uri: str) -> Optional[str]:
         try:
-            parsed = urlparse(uri)
+            parsed = cached_urlparse(uri)
         except Exception:
             parsed = None
         if parsed and "boards-api.greenhouse.io" in (parsed.hostname or "").lower():
@@ -164,17 +165,22 @@ class GreenhouseHandler(BaseSiteHandler):
         return urls
 
     def extract_posted_at(self, payload: Any, url: str | None = None) -> Any | None:
+        return self._pick_job_timestamp(
+            payload,
+            url,
+            ("first_published", "firstPublished", "created_at", "createdAt", "updated_at", "updatedAt"),
+        )
+
+    def extract_updated_at(self, payload: Any, url: str | None = None) -> Any | None:
+        return self._pick_job_timestamp(payload, url, ("updated_at", "updatedAt"))
+
+    def _pick_job_timestamp(self, payload: Any, url: str | None, keys: tuple[str, ...]) -> Any | None:
+        """Return the first of ``keys`` on a job payload, or on the board job matching ``url``."""
+
         def _pick_date(node: Any) -> Any | None:
             if not isinstance(node, dict):
                 return None
-            for key in (
-                "first_published",
-                "firstPublished",
-                "created_at",
-                "createdAt",
-                "updated_at",
-                "updatedAt",
-            ):
+            for key in keys:
                 value = node.get(key)
                 if isinstance(value, str):
                     cleaned = value.strip()
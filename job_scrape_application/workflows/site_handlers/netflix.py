@@ -4,11 +4,12 @@ import html as html_lib
 import json
 import re
 from typing import Any, Dict, List, Optional
-from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+from urllib.parse import parse_qsl, urlencode, urlunparse
 
 from .base import BaseSiteHandler
+from ...components.json_islands import extract_jobs_payload
+from ..helpers.parsed_url import cached_urlparse
 from ..helpers.regex_patterns import (
-    JSON_OBJECT_PATTERN,
     NETFLIX_LISTING_URL_PATTERNS,
     PRE_PATTERN,
     SMART_APPLY_PATTERN,
@@ -29,14 +30,14 @@ class NetflixHandler(BaseSiteHandler):
     @classmethod
     def matches_url(cls, url: str) -> bool:
         try:
-            host = (urlparse(url).hostname or "").lower()
+            host = (cached_urlparse(url).hostname or "").lower()
         except Exception:
             return False
         return host.endswith(NETFLIX_HOST_SUFFIX)
 
     def is_listing_url(self, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         path = (parsed.path or "").lower()
@@ -46,7 +47,7 @@ class NetflixHandler(BaseSiteHandler):
 
     def get_listing_api_uri(self, uri: str) -> Optional[str]:
         try:
-            parsed = urlparse(uri)
+            parsed = cached_urlparse(uri)
         except Exception:
             return None
         host = (parsed.hostname or "").lower()
@@ -120,7 +121,7 @@ class NetflixHandler(BaseSiteHandler):
         if not uri:
             return None
         try:
-            parsed = urlparse(uri)
+            parsed = cached_urlparse(uri)
         except Exception:
             return None
         for param_key, value in parse_qsl(parsed.query, keep_blank_values=True):
@@ -137,7 +138,7 @@ class NetflixHandler(BaseSiteHandler):
         if not self.matches_url(uri):
             return {}
         try:
-            parsed = urlparse(uri)
+            parsed = cached_urlparse(uri)
         except Exception:
             parsed = None
         path = (parsed.path or "").lower() if parsed else ""
@@ -205,13 +206,7 @@ class NetflixHandler(BaseSiteHandler):
             parsed = None
         if parsed is not None:
             return parsed
-        match = re.search(JSON_OBJECT_PATTERN, text, flags=re.DOTALL)
-        if match:
-            try:
-                return json.loads(match.group(0))
-            except Exception:
-                return None
-        return None
+        return extract_jobs_payload(text)
 
     def _extract_positions(self, payload: Any) -> List[Dict[str, Any]]:
         positions = payload.get("positions") if isinstance(payload, dict) else None
@@ -266,7 +261,7 @@ class NetflixHandler(BaseSiteHandler):
         params: list[tuple[str, str]] = []
         if listing_url:
             try:
-                parsed = urlparse(listing_url)
+                parsed = cached_urlparse(listing_url)
             except Exception:
                 parsed = None
             if parsed:
@@ -339,7 +334,7 @@ class NetflixHandler(BaseSiteHandler):
 
     def _with_default_pagination(self, uri: str) -> str:
         try:
-            parsed = urlparse(uri)
+            parsed = cached_urlparse(uri)
         except Exception:
             return uri
         params = [(key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)]
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import re
 from typing import Any, Dict, List
-from urllib.parse import urlparse
 
 from .base import BaseSiteHandler
+from ..helpers.parsed_url import cached_urlparse
 from ..helpers.regex_patterns import ASHBY_JOB_URL_PATTERN
 
 NOTION_HOST_SUFFIX = "notion.com"
@@ -20,7 +20,7 @@ class NotionCareersHandler(BaseSiteHandler):
     @classmethod
     def matches_url(cls, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         host = (parsed.hostname or "").lower()
@@ -61,7 +61,7 @@ class NotionCareersHandler(BaseSiteHandler):
             if not cleaned or cleaned in seen:
                 continue
             try:
-                parsed = urlparse(cleaned)
+                parsed = cached_urlparse(cleaned)
             except Exception:
                 continue
             host = (parsed.hostname or "").lower()
@@ -3,9 +3,10 @@ from __future__ import annotations
 import html as html_lib
 import re
 from typing import Any, Dict, List
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 
 from .base import BaseSiteHandler
+from ..helpers.parsed_url import cached_urlparse
 
 OPENAI_HOST_SUFFIX = "openai.com"
 OPENAI_BASE_URL = "https://openai.com"
@@ -22,7 +23,7 @@ class OpenAICareersHandler(BaseSiteHandler):
     @classmethod
     def matches_url(cls, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         host = (parsed.hostname or "").lower()
@@ -32,7 +33,7 @@ class OpenAICareersHandler(BaseSiteHandler):
 
     def is_listing_url(self, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         path = (parsed.path or "").lower()
@@ -86,7 +87,7 @@ class OpenAICareersHandler(BaseSiteHandler):
             if not cleaned or cleaned in seen:
                 continue
             try:
-                parsed = urlparse(cleaned)
+                parsed = cached_urlparse(cleaned)
             except Exception:
                 continue
             host = (parsed.hostname or "").lower()
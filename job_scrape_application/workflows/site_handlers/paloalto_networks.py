@@ -3,9 +3,10 @@ from __future__ import annotations
 import html as html_lib
 import re
 from typing import Any, Dict, List
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 
 from .base import BaseSiteHandler
+from ..helpers.parsed_url import cached_urlparse
 
 PALOALTO_HOST = "jobs.paloaltonetworks.com"
 PALOALTO_BASE_URL = f"https://{PALOALTO_HOST}"
@@ -29,7 +30,7 @@ class PaloAltoNetworksHandler(BaseSiteHandler):
     @classmethod
     def matches_url(cls, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         host = (parsed.hostname or "").lower()
@@ -37,7 +38,7 @@ class PaloAltoNetworksHandler(BaseSiteHandler):
 
     def is_listing_url(self, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         if parsed.hostname and not self.matches_url(url):
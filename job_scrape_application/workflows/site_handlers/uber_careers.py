@@ -5,9 +5,10 @@ import json
 import math
 import re
 from typing import Any, Dict, List, Optional
-from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+from urllib.parse import parse_qsl, urlencode, urljoin, urlunparse
 
 from .base import BaseSiteHandler
+from ..helpers.parsed_url import cached_urlparse
 
 UBER_HOST_SUFFIX = "uber.com"
 UBER_BASE_URL = "https://www.uber.com"
@@ -31,11 +32,12 @@ _OPEN_ROLES_RE = re.compile(
 class UberCareersHandler(BaseSiteHandler):
     name = "uber_careers"
     site_type = "uber"
+    incremental_listing = True
 
     @classmethod
     def matches_url(cls, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         host = (parsed.hostname or "").lower()
@@ -45,7 +47,7 @@ class UberCareersHandler(BaseSiteHandler):
 
     def is_listing_url(self, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         path = (parsed.path or "").strip("/")
@@ -104,6 +106,14 @@ class UberCareersHandler(BaseSiteHandler):
 
         return self.filter_job_urls(urls)
 
+    def is_listing_stream_complete(self, html: str, job_urls: List[str]) -> bool:
+        # The injected search script dumps the whole results array into a <pre>; once it
+        # parses, the page is complete even when it lists no jobs. Without it, rendered job
+        # anchors only appear after the ``#uber-jobs`` wait, so any job link means done.
+        if self._extract_results_payload(html) is not None:
+            return True
+        return super().is_listing_stream_complete(html, job_urls)
+
     def filter_job_urls(self, urls: List[str]) -> List[str]:
         filtered: List[str] = []
         seen: set[str] = set()
@@ -178,7 +188,7 @@ class UberCareersHandler(BaseSiteHandler):
         current_page = payload.get("page") if isinstance(payload.get("page"), int) else None
         if current_page is None:
             try:
-                parsed = urlparse(base_url)
+                parsed = cached_urlparse(base_url)
                 params = dict(parse_qsl(parsed.query, keep_blank_values=True))
                 current_page = int(params.get("page") or 0)
             except Exception:
@@ -250,7 +260,7 @@ class UberCareersHandler(BaseSiteHandler):
 
     def _build_listing_payload(self, uri: str) -> Dict[str, Any]:
         try:
-            parsed = urlparse(uri)
+            parsed = cached_urlparse(uri)
         except Exception:
             return {"limit": DEFAULT_PAGE_SIZE, "page": 0, "params": {}}
         query_params = parse_qsl(parsed.query, keep_blank_values=True)
@@ -356,7 +366,7 @@ class UberCareersHandler(BaseSiteHandler):
 
     def _strip_page_param(self, url: str) -> str:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return url
         params = [
@@ -369,7 +379,7 @@ class UberCareersHandler(BaseSiteHandler):
 
     def _set_page_param(self, url: str, page: int) -> str:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return url
         params = [
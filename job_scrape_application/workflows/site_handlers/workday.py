@@ -3,9 +3,11 @@ from __future__ import annotations
 import html as html_lib
 import re
 from typing import Any, Dict, List, Optional
-from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+from urllib.parse import parse_qsl, urlencode, urljoin, urlunparse
 
 from .base import BaseSiteHandler
+from ..helpers.host_limiter import HOST_LIMITS_CONFIG_KEY
+from ..helpers.parsed_url import cached_urlparse, parse_url
 from ..helpers.regex_patterns import (
     BASE_URL_META_PATTERNS,
     WORKDAY_BASE_URL_RE,
@@ -16,6 +18,13 @@ from ..helpers.regex_patterns import (
 )
 
 WORKDAY_HOST_SUFFIX = "myworkdayjobs.com"
+# Workday tenants captcha quickly under bursty load, so start detail scrapes conservatively.
+WORKDAY_HOST_LIMITS = {
+    "initial_concurrency": 2,
+    "max_concurrency": 4,
+    "rate_per_second": 1,
+    "burst": 2,
+}
 
 
 class WorkdayHandler(BaseSiteHandler):
@@ -26,14 +35,14 @@ class WorkdayHandler(BaseSiteHandler):
     @classmethod
     def matches_url(cls, url: str) -> bool:
         try:
-            host = (urlparse(url).hostname or "").lower()
+            host = (cached_urlparse(url).hostname or "").lower()
         except Exception:
             return False
         return host.endswith(WORKDAY_HOST_SUFFIX)
 
     def is_listing_url(self, url: str) -> bool:
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
         except Exception:
             return False
         if parsed.hostname and not self.matches_url(url):
@@ -43,7 +52,7 @@ class WorkdayHandler(BaseSiteHandler):
 
     def is_api_detail_url(self, uri: str) -> bool:
         try:
-            parsed = urlparse(uri)
+            parsed = cached_urlparse(uri)
         except Exception:
             return False
         return "/wday/cxs/" in (parsed.path or "").lower()
@@ -54,7 +63,7 @@ class WorkdayHandler(BaseSiteHandler):
         if self.is_api_detail_url(uri):
             return None
         try:
-            parsed = urlparse(uri)
+            parsed = cached_urlparse(uri)
         except Exception:
             return None
         segments = [segment for segment in (parsed.path or "").split("/") if segment]
@@ -99,6 +108,7 @@ class WorkdayHandler(BaseSiteHandler):
             "redirect_policy": "Loose",
             "external_domains": ["*"],
             "preserve_host": True,
+            HOST_LIMITS_CONFIG_KEY: dict(WORKDAY_HOST_LIMITS),
         }
 
     def get_links_from_raw_html(self, html: str) -> List[str]:
@@ -141,7 +151,7 @@ class WorkdayHandler(BaseSiteHandler):
 
     def _augment_pagination_urls(self, base_url: str, html: str, urls: List[str]) -> List[str]:
         def _with_offset(url_value: str, offset: int, limit: Optional[int]) -> str:
-            parsed = urlparse(url_value)
+            parsed = cached_urlparse(url_value)
             params = [
                 (key, value)
                 for key, value in parse_qsl(parsed.query, keep_blank_values=True)
@@ -155,14 +165,14 @@ class WorkdayHandler(BaseSiteHandler):
         def _query_hint(url_candidates: List[str]) -> Optional[str]:
             for candidate in url_candidates:
                 try:
-                    parsed = urlparse(candidate)
+                    parsed = cached_urlparse(candidate)
                 except Exception:
                     continue
                 if parsed.query:
                     return parsed.query
             return None
 
-        parsed_base = urlparse(base_url)
+        parsed_base = cached_urlparse(base_url)
         base_params = parse_qsl(parsed_base.query, keep_blank_values=True)
         base_offset = None
         base_limit = None
@@ -236,14 +246,11 @@ class WorkdayHandler(BaseSiteHandler):
             lower = cleaned.lower()
             if lower.startswith(("mailto:", "tel:", "javascript:")):
                 continue
-            try:
-                parsed = urlparse(cleaned)
-            except Exception:
-                parsed = None
-            if parsed and parsed.hostname and not self.matches_url(cleaned):
+            parsed = parse_url(cleaned)
+            if parsed and parsed.host and not parsed.host.endswith(WORKDAY_HOST_SUFFIX):
                 continue
-            path = (parsed.path if parsed else cleaned).lower()
-            if "/job/" in path or self.is_listing_url(cleaned):
+            path = parsed.path_lower if parsed else lower
+            if "/job/" in path or self.classify(cleaned).listing:
                 seen.add(cleaned)
                 filtered.append(cleaned)
         return filtered
@@ -0,0 +1,241 @@
+"""Fork and supervise Temporal worker processes on POSIX hosts.
+
+Run with ``python -m job_scrape_application.workflows.supervisor``. The parent imports the worker
+module graph and builds the read-only lookup tables once, then forks
+``temporal_general_worker_count`` general workers and ``temporal_job_details_worker_count``
+job-details workers so the children share those pages copy-on-write. Crashed children are
+restarted with exponential backoff; SIGTERM/SIGINT drains every child before exiting.
+Windows hosts keep using ``start_worker.ps1``.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import signal
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from ..config import runtime_config, settings
+from . import worker as worker_module
+from .helpers import scrape_utils
+
+logger = logging.getLogger("temporal.supervisor")
+
+RESTART_BACKOFF_BASE_SECONDS = 1.0
+RESTART_BACKOFF_MAX_SECONDS = 60.0
+# A child that stays up this long is considered healthy and its backoff resets.
+STABLE_RUN_SECONDS = 60.0
+DRAIN_TIMEOUT_SECONDS = 60.0
+POLL_INTERVAL_SECONDS = 0.5
+
+
+@dataclass
+class WorkerSlot:
+    role: str
+    index: int
+    # Offset added to the TEMPORAL_METRICS_BIND_ADDRESS port so every child gets its own endpoint.
+    metrics_port_offset: int = 0
+    pid: Optional[int] = None
+    started_at: float = 0.0
+    failures: int = 0
+    restart_at: float = 0.0
+    exit_codes: List[int] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        return f"{self.role}-{self.index}"
+
+
+def restart_delay(failures: int) -> float:
+    """Exponential backoff for the ``failures``-th consecutive crash of a slot."""
+
+    if failures <= 0:
+        return 0.0
+    return min(RESTART_BACKOFF_MAX_SECONDS, RESTART_BACKOFF_BASE_SECONDS * (2 ** (failures - 1)))
+
+
+def build_slots(general_count: int, job_details_count: int) -> List[WorkerSlot]:
+    # General workers use role "all" (like start_worker.ps1) so they also poll the job-details
+    # queue when it is separate; dedicated job-details workers only poll that queue.
+    slots = [WorkerSlot("all", index) for index in range(1, max(0, general_count) + 1)]
+    slots.extend(WorkerSlot("job-details", index) for index in range(1, max(0, job_details_count) + 1))
+    for offset, slot in enumerate(slots):
+        slot.metrics_port_offset = offset
+    return slots
+
+
+def offset_bind_address(bind_address: Optional[str], offset: int) -> Optional[str]:
+    if not bind_address or offset == 0:
+        return bind_address
+    host, sep, port = bind_address.rpartition(":")
+    if not sep or not port.isdigit():
+        return bind_address
+    return f"{host}:{int(port) + offset}"
+
+
+def warm_shared_state() -> None:
+    """Build read-only data in the parent so forked children inherit it copy-on-write."""
+
+    started = time.perf_counter()
+    scrape_utils._location_index()
+    # Move everything allocated so far out of the GC's tracked generations; otherwise the first
+    # collection in each child touches (and copies) every inherited object header.
+    gc.collect()
+    gc.freeze()
+    logger.info(
+        "Supervisor warmed shared state in %.0fms (frozen objects=%s)",
+        (time.perf_counter() - started) * 1000,
+        gc.get_freeze_count(),
+    )
+
+
+async def _run_child_worker() -> None:
+    # SIGTERM goes through Worker.shutdown() so in-flight activities get the configured
+    # graceful_shutdown_timeout instead of being cancelled mid-scrape.
+    shutdown_event = asyncio.Event()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, shutdown_event.set)
+    await worker_module.main(shutdown_event=shutdown_event)
+
+
+def _child_entrypoint(slot: WorkerSlot) -> int:
+    # The parent owns Ctrl+C and forwards SIGTERM, so children ignore SIGINT.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    os.environ["TEMPORAL_WORKER_ROLE"] = slot.role
+    settings.worker_role = slot.role
+    settings.temporal_metrics_bind_address = offset_bind_address(
+        settings.temporal_metrics_bind_address, slot.metrics_port_offset
+    )
+    try:
+        asyncio.run(_run_child_worker())
+    except asyncio.CancelledError:
+        return 0
+    except Exception:  # noqa: BLE001
+        logging.getLogger("temporal.worker").exception("Worker %s crashed", slot.name)
+        return 1
+    return 0
+
+
+class Supervisor:
+    def __init__(self, slots: List[WorkerSlot], drain_timeout: float = DRAIN_TIMEOUT_SECONDS) -> None:
+        self.slots = slots
+        self.drain_timeout = drain_timeout
+        self.draining = False
+        self._by_pid: Dict[int, WorkerSlot] = {}
+
+    def _spawn(self, slot: WorkerSlot) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                code = _child_entrypoint(slot)
+            finally:
+                logging.shutdown()
+                os._exit(code)
+        slot.pid = pid
+        slot.started_at = time.monotonic()
+        self._by_pid[pid] = slot
+        logger.info("Started worker %s pid=%s", slot.name, pid)
+
+    def _request_drain(self, signum: int, _frame: object) -> None:
+        if self.draining:
+            return
+        self.draining = True
+        logger.info("Supervisor received %s; draining %s workers", signal.Signals(signum).name, len(self._by_pid))
+        for pid in list(self._by_pid):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _reap(self) -> None:
+        while self._by_pid:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self._by_pid.clear()
+                return
+            if pid == 0:
+                return
+            slot = self._by_pid.pop(pid, None)
+            if slot is None:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            slot.pid = None
+            slot.exit_codes = (slot.exit_codes + [code])[-10:]
+            if self.draining:
+                logger.info("Worker %s pid=%s exited code=%s during drain", slot.name, pid, code)
+                continue
+            if time.monotonic() - slot.started_at >= STABLE_RUN_SECONDS:
+                slot.failures = 0
+            slot.failures += 1
+            delay = restart_delay(slot.failures)
+            slot.restart_at = time.monotonic() + delay
+            logger.warning(
+                "Worker %s pid=%s exited code=%s; restarting in %.0fs (consecutive failures=%s)",
+                slot.name,
+                pid,
+                code,
+                delay,
+                slot.failures,
+            )
+
+    def _drain(self) -> None:
+        deadline = time.monotonic() + self.drain_timeout
+        while self._by_pid and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(POLL_INTERVAL_SECONDS)
+        for pid, slot in list(self._by_pid.items()):
+            logger.warning("Worker %s pid=%s did not drain within %.0fs; killing", slot.name, pid, self.drain_timeout)
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        self._by_pid.clear()
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self._request_drain)
+        signal.signal(signal.SIGINT, self._request_drain)
+        for slot in self.slots:
+            self._spawn(slot)
+        while not self.draining:
+            self._reap()
+            now = time.monotonic()
+            for slot in self.slots:
+                if slot.pid is None and not self.draining and now >= slot.restart_at:
+                    self._spawn(slot)
+            time.sleep(POLL_INTERVAL_SECONDS)
+        self._drain()
+        logger.info("Supervisor stopped")
+        return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run and supervise Temporal worker processes.")
+    parser.add_argument("--general", type=int, default=runtime_config.temporal_general_worker_count)
+    parser.add_argument("--job-details", type=int, default=runtime_config.temporal_job_details_worker_count)
+    parser.add_argument("--drain-timeout", type=float, default=DRAIN_TIMEOUT_SECONDS)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+    if not hasattr(os, "fork"):
+        logger.error("The worker supervisor needs os.fork; use start_worker.ps1 on Windows")
+        return 2
+    slots = build_slots(args.general, args.job_details)
+    if not slots:
+        logger.error("No worker processes configured (general=%s job_details=%s)", args.general, args.job_details)
+        return 2
+
+    logger.info("Supervisor starting %s general + %s job-details workers", args.general, args.job_details)
+    warm_shared_state()
+    return Supervisor(slots, drain_timeout=args.drain_timeout).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from ..services import telemetry
+from .deadlock_logging import _get_run_metadata
+
+logger = logging.getLogger("temporal.worker.profiler")
+
+_PACKAGE_ROOT = str(Path(__file__).resolve().parents[1])
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+MAX_STACK_DEPTH = 128
+
+
+@dataclass
+class WorkflowTypeProfile:
+    samples: int = 0
+    activations: int = 0
+    activation_seconds: float = 0.0
+    max_activation_seconds: float = 0.0
+    self_frames: Counter = field(default_factory=Counter)
+    project_frames: Counter = field(default_factory=Counter)
+
+
+def _frame_label(code: Any) -> str:
+    filename = code.co_filename
+    if filename.startswith(_REPO_ROOT):
+        filename = filename[len(_REPO_ROOT) + 1 :]
+    qualname = getattr(code, "co_qualname", code.co_name)
+    return f"{filename}:{code.co_firstlineno}:{qualname}"
+
+
+class _ProfilingExecutor(ThreadPoolExecutor):
+    """Workflow task executor that tells the profiler which run each thread is activating."""
+
+    def __init__(self, profiler: "WorkflowTaskProfiler", max_workers: int) -> None:
+        super().__init__(max_workers=max_workers, thread_name_prefix="temporal_workflow_profiled_")
+        self._profiler = profiler
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        run_id = getattr(args[0], "run_id", None) if args else None
+        if not run_id:
+            return super().submit(fn, *args, **kwargs)
+        return super().submit(self._profiler._run_activation, run_id, fn, *args, **kwargs)
+
+
+class WorkflowTaskProfiler:
+    """Sample the stacks of threads executing workflow activations.
+
+    A background thread wakes every ``interval_ms`` and reads ``sys._current_frames()`` for
+    threads that are inside an activation, so workflow code is never instrumented. Samples are
+    grouped by workflow type (from the run metadata the logging interceptor records) and
+    counted twice: by the innermost frame, and by every frame under ``job_scrape_application``
+    on the stack, which is what points at the loop that blew the deadlock timeout.
+    """
+
+    def __init__(self, interval_ms: int = 5, top_n: int = 15) -> None:
+        self.interval = max(1, interval_ms) / 1000
+        self.top_n = max(1, top_n)
+        self._active: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, WorkflowTypeProfile] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def executor(self, max_workers: int) -> ThreadPoolExecutor:
+        return _ProfilingExecutor(self, max_workers)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample_loop, name="workflow-task-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def _profile_for(self, run_id: str) -> WorkflowTypeProfile:
+        metadata = _get_run_metadata(run_id) or {}
+        workflow_type = str(metadata.get("workflowType") or "unknown")
+        profile = self._profiles.get(workflow_type)
+        if profile is None:
+            profile = self._profiles[workflow_type] = WorkflowTypeProfile()
+        return profile
+
+    def _run_activation(self, run_id: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        thread_id = threading.get_ident()
+        with self._lock:
+            self._active[thread_id] = run_id
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._active.pop(thread_id, None)
+                profile = self._profile_for(run_id)
+                profile.activations += 1
+                profile.activation_seconds += elapsed
+                profile.max_activation_seconds = max(profile.max_activation_seconds, elapsed)
+
+    def sample_once(self) -> None:
+        with self._lock:
+            active = dict(self._active)
+        if not active:
+            return
+        frames = sys._current_frames()
+        samples = []
+        for thread_id, run_id in active.items():
+            frame = frames.get(thread_id)
+            if frame is None:
+                continue
+            innermost = _frame_label(frame.f_code)
+            project: set[str] = set()
+            depth = 0
+            while frame is not None and depth < MAX_STACK_DEPTH:
+                if frame.f_code.co_filename.startswith(_PACKAGE_ROOT):
+                    project.add(_frame_label(frame.f_code))
+                frame = frame.f_back
+                depth += 1
+            samples.append((run_id, innermost, project))
+        del frames
+        with self._lock:
+            for run_id, innermost, project in samples:
+                profile = self._profile_for(run_id)
+                profile.samples += 1
+                profile.self_frames[innermost] += 1
+                profile.project_frames.update(project)
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample_once()
+            except Exception:  # noqa: BLE001
+                logger.debug("Workflow task profiler sample failed", exc_info=True)
+
+    def report(self, reset: bool = True) -> List[Dict[str, Any]]:
+        """Return top-N frames per workflow type, busiest workflow types first."""
+
+        with self._lock:
+            profiles = self._profiles
+            if reset:
+                self._profiles = {}
+            else:
+                profiles = dict(profiles)
+        interval_ms = self.interval * 1000
+        reports = []
+        for workflow_type, profile in profiles.items():
+            if not profile.samples and not profile.activations:
+                continue
+            reports.append(
+                {
+                    "workflowType": workflow_type,
+                    "samples": profile.samples,
+                    "sampledMs": round(profile.samples * interval_ms, 1),
+                    "activations": profile.activations,
+                    "activationMs": round(profile.activation_seconds * 1000, 1),
+                    "maxActivationMs": round(profile.max_activation_seconds * 1000, 1),
+                    "topSelf": [
+                        {"frame": label, "samples": count}
+                        for label, count in profile.self_frames.most_common(self.top_n)
+                    ],
+                    "topProject": [
+                        {"frame": label, "samples": count}
+                        for label, count in profile.project_frames.most_common(self.top_n)
+                    ],
+                }
+            )
+        reports.sort(key=lambda item: item["samples"], reverse=True)
+        return reports
+
+
+def _format_frames(frames: List[Dict[str, Any]]) -> str:
+    return "; ".join(f"{item['frame']}={item['samples']}" for item in frames)
+
+
+async def log_profile_reports(profiler: WorkflowTaskProfiler, worker_id: str, interval_seconds: int) -> None:
+    """Periodically log and emit the profiler's top frames per workflow type."""
+
+    while True:
+        await asyncio.sleep(max(1, interval_seconds))
+        for report in profiler.report():
+            logger.info(
+                "Workflow task profile type=%s samples=%s sampled_ms=%s activations=%s activation_ms=%s "
+                "max_activation_ms=%s top_project=[%s] top_self=[%s]",
+                report["workflowType"],
+                report["samples"],
+                report["sampledMs"],
+                report["activations"],
+                report["activationMs"],
+                report["maxActivationMs"],
+                _format_frames(report["topProject"]),
+                _format_frames(report["topSelf"]),
+            )
+            try:
+                telemetry.emit_posthog_log(
+                    {
+                        "event": "temporal.workflow_task.profile",
+                        "message": "Workflow task profile",
+                        "level": "info",
+                        "workerId": worker_id,
+                        **report,
+                    }
+                )
+            except Exception:
+                logger.debug("Failed to emit workflow task profile", exc_info=True)
+
+
+__all__ = ["WorkflowTaskProfiler", "WorkflowTypeProfile", "log_profile_reports"]
@@ -8,6 +8,7 @@ from temporalio.client import Client
 from temporalio.service import RPCError, RPCStatusCode
 
 from ..config import resolve_config_path, settings
+from .payload_codec import build_data_converter
 
 SCHEDULES_YAML = resolve_config_path("schedules.yaml")
 
@@ -33,6 +34,7 @@ async def main() -> None:
     client = await Client.connect(
         settings.temporal_address,
         namespace=settings.temporal_namespace,
+        data_converter=build_data_converter(),
     )
     triggered_ids: set[str] = set()
 
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional
 
 from temporalio import workflow
 from temporalio.common import RetryPolicy
 from temporalio.exceptions import ActivityError, ApplicationError
 
+from .helpers.history_budget import HISTORY_BUDGET_PATCH_ID, history_budget_exceeded
 from .helpers.workflow_logging import get_workflow_logger
 from .exceptions import WorkflowError
 
@@ -590,18 +591,49 @@ class WebhookProcessSummary:
     failed: int
 
 
+# Lists carried through continue-as-new are capped so the run input stays small; totals are
+# carried as counts. Dedup keys keep the most recently seen ones, since duplicate webhook
+# deliveries for a job arrive close together.
+MAX_CARRIED_FAILURE_REASONS = 50
+MAX_CARRIED_SITE_URLS = 200
+MAX_CARRIED_SEEN_JOBS = 1000
+
+
+@dataclass
+class WebhookIngestState:
+    """Progress carried across continue-as-new runs of ProcessWebhookScrape."""
+
+    processed: int = 0
+    stored: int = 0
+    jobs_scraped: int = 0
+    failed: int = 0
+    status: str = "completed"
+    failure_reasons: List[str] = field(default_factory=list)
+    site_urls: List[str] = field(default_factory=list)
+    seen_jobs: List[str] = field(default_factory=list)
+    started_at: Optional[int] = None
+    continued_runs: int = 0
+    # Total sites across the chain; ``site_urls`` only keeps the most recent ones.
+    site_count: int = 0
+
+
 @workflow.defn(name="ProcessWebhookScrape")
 class ProcessWebhookIngestWorkflow:
     @workflow.run
-    async def run(self) -> WebhookProcessSummary:  # type: ignore[override]
-        processed = 0
-        stored = 0
-        jobs_scraped = 0
-        failed = 0
-        status = "completed"
-        failure_reasons: List[str] = []
-        site_urls: List[str] = []
-        started_at = int(workflow.now().timestamp() * 1000)
+    async def run(  # type: ignore[override]
+        self, state: Optional[WebhookIngestState] = None
+    ) -> WebhookProcessSummary:
+        carried = state or WebhookIngestState()
+        processed = carried.processed
+        stored = carried.stored
+        jobs_scraped = carried.jobs_scraped
+        failed = carried.failed
+        status = carried.status
+        failure_reasons: List[str] = list(carried.failure_reasons)
+        site_urls: List[str] = list(carried.site_urls)
+        dropped_site_urls = max(0, carried.site_count - len(site_urls))
+        started_at = carried.started_at or int(workflow.now().timestamp() * 1000)
+        continuing = False
         wf_logger = get_workflow_logger()
 
         async def _log(
@@ -654,10 +686,38 @@ class ProcessWebhookIngestWorkflow:
 
             return False
 
-        seen_jobs: Set[str] = set()
+        # Insertion-ordered so the most recent keys are the ones carried forward.
+        seen_jobs: Dict[str, None] = dict.fromkeys(carried.seen_jobs)
+        batches = 0
 
         try:
             while True:
+                if batches > 0 and history_budget_exceeded() and workflow.patched(HISTORY_BUDGET_PATCH_ID):
+                    continuing = True
+                    next_state = WebhookIngestState(
+                        processed=processed,
+                        stored=stored,
+                        jobs_scraped=jobs_scraped,
+                        failed=failed,
+                        status=status,
+                        failure_reasons=failure_reasons[-MAX_CARRIED_FAILURE_REASONS:],
+                        site_urls=site_urls[-MAX_CARRIED_SITE_URLS:],
+                        seen_jobs=list(seen_jobs)[-MAX_CARRIED_SEEN_JOBS:],
+                        started_at=started_at,
+                        continued_runs=carried.continued_runs + 1,
+                        site_count=dropped_site_urls + len(site_urls),
+                    )
+                    await _log(
+                        "workflow.continue_as_new",
+                        message="History budget reached; continuing as new",
+                        data={
+                            "processed": processed,
+                            "seenJobs": len(seen_jobs),
+                            "continuedRuns": next_state.continued_runs,
+                        },
+                    )
+                    workflow.continue_as_new(next_state)
+
                 events = await workflow.execute_activity(
                     fetch_pending_firecrawl_webhooks,
                     args=[25, None],
@@ -665,6 +725,7 @@ class ProcessWebhookIngestWorkflow:
                 )
                 if not events:
                     break
+                batches += 1
 
                 for event in events:
                     if not isinstance(event, dict):
@@ -693,7 +754,7 @@ class ProcessWebhookIngestWorkflow:
                             )
                         continue
                     if dedup_key:
-                        seen_jobs.add(dedup_key)
+                        seen_jobs[dedup_key] = None
                     processed += 1
                     await _log(
                         "webhook.received",
@@ -827,44 +888,46 @@ class ProcessWebhookIngestWorkflow:
                 processed=processed, stored=stored, jobs_scraped=jobs_scraped, failed=failed
             )
         finally:
-            completed_at = int(workflow.now().timestamp() * 1000)
-            try:
-                await workflow.execute_activity(
-                    record_workflow_run,
-                    args=[
-                        {
-                            "runId": workflow.info().run_id,
-                            "workflowId": workflow.info().workflow_id,
-                            "workflowName": "ProcessWebhookScrape",
-                            "status": status,
-                            "startedAt": started_at,
-                            "completedAt": completed_at,
-                            "siteUrls": site_urls,
-                            "sitesProcessed": len(site_urls),
-                            "jobsScraped": jobs_scraped,
-                            "workerId": "scraper-worker",
-                            "taskQueue": "scraper-task-queue",
-                            "error": "; ".join(failure_reasons) if failure_reasons else None,
-                        }
-                    ],
-                    schedule_to_close_timeout=timedelta(seconds=30),
-                )
-            except Exception:
-                # Log best-effort; do not fail workflow
-                pass
+            # The final run of a continue-as-new chain records the summary for the whole chain.
+            if not continuing:
+                completed_at = int(workflow.now().timestamp() * 1000)
+                try:
+                    await workflow.execute_activity(
+                        record_workflow_run,
+                        args=[
+                            {
+                                "runId": workflow.info().run_id,
+                                "workflowId": workflow.info().workflow_id,
+                                "workflowName": "ProcessWebhookScrape",
+                                "status": status,
+                                "startedAt": started_at,
+                                "completedAt": completed_at,
+                                "siteUrls": site_urls,
+                                "sitesProcessed": dropped_site_urls + len(site_urls),
+                                "jobsScraped": jobs_scraped,
+                                "workerId": "scraper-worker",
+                                "taskQueue": "scraper-task-queue",
+                                "error": "; ".join(failure_reasons) if failure_reasons else None,
+                            }
+                        ],
+                        schedule_to_close_timeout=timedelta(seconds=30),
+                    )
+                except Exception:
+                    # Log best-effort; do not fail workflow
+                    pass
 
-            await _log(
-                "workflow.complete",
-                message="ProcessWebhookScrape finished",
-                data={
-                    "status": status,
-                    "processed": processed,
-                    "stored": stored,
-                    "failed": failed,
-                    "jobsScraped": jobs_scraped,
-                },
-                level="warn" if status != "completed" else "info",
-            )
+                await _log(
+                    "workflow.complete",
+                    message="ProcessWebhookScrape finished",
+                    data={
+                        "status": status,
+                        "processed": processed,
+                        "stored": stored,
+                        "failed": failed,
+                        "jobsScraped": jobs_scraped,
+                    },
+                    level="warn" if status != "completed" else "info",
+                )
 
 
 @dataclass
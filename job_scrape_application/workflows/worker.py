@@ -3,6 +3,7 @@ import atexit
 import logging
 import time
 from dataclasses import dataclass
+from datetime import timedelta
 from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from queue import SimpleQueue
@@ -11,6 +12,7 @@ import os
 
 from temporalio import workflow
 from temporalio.client import Client
+from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
 from temporalio.worker import (
     Interceptor,
     StartActivityInput,
@@ -22,7 +24,7 @@ from temporalio.worker import (
     WorkflowOutboundInterceptor,
 )
 
-from ..config import settings
+from ..config import runtime_config, settings
 from ..services import telemetry
 from . import activities
 from .deadlock_logging import install_deadlock_posthog_handler, record_run_metadata, update_run_metadata
@@ -30,6 +32,7 @@ from .scrape_workflow import (
     FirecrawlScrapeWorkflow,
     FetchfoxSpidercloudWorkflow,
     ScrapeWorkflow,
+    SpidercloudJobDetailsDrainerWorkflow,
     SpidercloudJobDetailsWorkflow,
     SpidercloudScrapeWorkflow,
 )
@@ -39,7 +42,15 @@ from .webhook_workflow import (
     RecoverMissingFirecrawlWebhookWorkflow,
     SiteLeaseWorkflow,
 )
+from .activity_metrics import ActivityMetricsInterceptor
+from .activities.constants import JOB_DETAILS_DRAINER_SIGNAL, JOB_DETAILS_DRAINER_WORKFLOW_ID
+from .helpers.firecrawl_client import shutdown_firecrawl_clients
+from .payload_codec import build_data_converter, build_payload_codec, log_codec_stats
+from .sandbox import build_workflow_runner
+from .task_profiler import WorkflowTaskProfiler, log_profile_reports
+from .worker_tuning import describe_worker_tuning, worker_tuning_kwargs
 from .schedule_audit import schedule_audit_logger
+from .scrapers.spider_client_pool import spider_clients
 
 WORKFLOW_CLASSES = [
     ScrapeWorkflow,
@@ -47,6 +58,7 @@ WORKFLOW_CLASSES = [
     FetchfoxSpidercloudWorkflow,
     SpidercloudScrapeWorkflow,
     SpidercloudJobDetailsWorkflow,
+    SpidercloudJobDetailsDrainerWorkflow,
     GreenhouseScraperWorkflow,
     SiteLeaseWorkflow,
     ProcessWebhookIngestWorkflow,
@@ -130,7 +142,7 @@ FETCHFOX_ACTIVITIES = {
     activities.crawl_site_fetchfox,
 }
 
-JOB_DETAILS_WORKFLOWS = [SpidercloudJobDetailsWorkflow]
+JOB_DETAILS_WORKFLOWS = [SpidercloudJobDetailsWorkflow, SpidercloudJobDetailsDrainerWorkflow]
 JOB_DETAILS_ACTIVITIES = [
     activities.record_workflow_run,
     activities.lease_scrape_url_batch,
@@ -262,8 +274,7 @@ class WorkflowTaskDebugOutboundInterceptor(WorkflowOutboundInterceptor):
 def _select_worker_config() -> tuple[str, list[type], list]:
     role = (settings.worker_role or "all").strip().lower()
     if role in {"job-details", "spidercloud-job-details"}:
-        queue = settings.job_details_task_queue or settings.task_queue
-        return queue, JOB_DETAILS_WORKFLOWS, JOB_DETAILS_ACTIVITIES
+        return settings.job_details_queue, JOB_DETAILS_WORKFLOWS, JOB_DETAILS_ACTIVITIES
     workflows = list(WORKFLOW_CLASSES)
     activities_list = list(ACTIVITY_FUNCTIONS)
     if not settings.enable_firecrawl:
@@ -278,8 +289,7 @@ def _select_worker_config() -> tuple[str, list[type], list]:
 def _select_worker_configs() -> list[WorkerConfig]:
     role = (settings.worker_role or "all").strip().lower()
     if role in {"job-details", "spidercloud-job-details"}:
-        queue = settings.job_details_task_queue or settings.task_queue
-        return [WorkerConfig(queue, JOB_DETAILS_WORKFLOWS, JOB_DETAILS_ACTIVITIES, role)]
+        return [WorkerConfig(settings.job_details_queue, JOB_DETAILS_WORKFLOWS, JOB_DETAILS_ACTIVITIES, role)]
 
     task_queue, workflows, activities_list = _select_worker_config()
     configs = [WorkerConfig(task_queue, workflows, activities_list, role)]
@@ -432,7 +442,62 @@ def _setup_logging() -> logging.Logger:
     return logging.getLogger("temporal.worker")
 
 
-async def main() -> None:
+def _build_runtime(logger: logging.Logger) -> Runtime | None:
+    """Return a runtime exporting Prometheus metrics when TEMPORAL_METRICS_BIND_ADDRESS is set."""
+
+    bind_address = settings.temporal_metrics_bind_address
+    if not bind_address:
+        return None
+    runtime = Runtime(telemetry=TelemetryConfig(metrics=PrometheusConfig(bind_address=bind_address)))
+    logger.info("Prometheus metrics exposed at http://%s/metrics", bind_address)
+    return runtime
+
+
+def _job_details_drainer_queue(configs: list[WorkerConfig]) -> str | None:
+    """Queue to start the drainer on, or ``None`` when no local worker registers it.
+
+    The general queue also registers the drainer workflow, so this is always the job-details
+    queue rather than whichever config happens to list it first; the drainer's batch children
+    and ``_signal_job_details_drainer`` use the same queue.
+    """
+
+    if not any(SpidercloudJobDetailsDrainerWorkflow in cfg.workflows for cfg in configs):
+        return None
+    return settings.job_details_queue
+
+
+async def _ensure_job_details_drainer(client: Client, task_queue: str) -> None:
+    """Start the job-details drainer if it is not already running (signal-with-start)."""
+
+    logger = logging.getLogger("temporal.worker")
+    try:
+        await client.start_workflow(
+            SpidercloudJobDetailsDrainerWorkflow.run,
+            id=JOB_DETAILS_DRAINER_WORKFLOW_ID,
+            task_queue=task_queue,
+            start_signal=JOB_DETAILS_DRAINER_SIGNAL,
+            start_signal_args=[0],
+        )
+        logger.info("Job-details drainer running workflow_id=%s", JOB_DETAILS_DRAINER_WORKFLOW_ID)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Unable to start job-details drainer: %s", exc)
+
+
+async def _shutdown_workers_on(shutdown_event: asyncio.Event, workers: list[Worker]) -> None:
+    """Shut ``workers`` down once ``shutdown_event`` is set.
+
+    ``Worker.shutdown()`` stops polling and gives running activities ``graceful_shutdown_timeout``
+    to finish before they are cancelled, unlike cancelling the ``run()`` tasks.
+    """
+
+    await shutdown_event.wait()
+    logging.getLogger("temporal.worker").info(
+        "Shutdown requested; draining %s workers", len(workers)
+    )
+    await asyncio.gather(*(worker.shutdown() for worker in workers))
+
+
+async def main(shutdown_event: Optional[asyncio.Event] = None) -> None:
     logger = _setup_logging()
     logger.info("Worker main() started.")
     logger.info("Settings: Temporal=%s, Convex=%s", settings.temporal_address, settings.convex_http_url)
@@ -442,11 +507,15 @@ async def main() -> None:
         logger.warning("PostHog exception autocapture disabled or failed to initialize.")
     logger.info("Connecting to Temporal at %s...", settings.temporal_address)
     os.environ.setdefault("TEMPORAL_MAX_INCOMING_GRPC_BYTES", str(10 * 1024 * 1024))
+    payload_codec = build_payload_codec()
+    runtime = _build_runtime(logger)
     try:
         client = await asyncio.wait_for(
             Client.connect(
                 settings.temporal_address,
                 namespace=settings.temporal_namespace,
+                data_converter=build_data_converter(payload_codec),
+                runtime=runtime,
             ),
             timeout=10.0
         )
@@ -478,18 +547,63 @@ async def main() -> None:
     }
     _set_worker_context(worker_context)
     install_deadlock_posthog_handler(worker_context)
-    workers = [
-        Worker(
-            client,
-            task_queue=cfg.task_queue,
-            workflows=cfg.workflows,
-            activities=cfg.activities,
-            interceptors=[WorkflowLoggingInterceptor()],
+    workflow_runner = build_workflow_runner()
+    profiler: WorkflowTaskProfiler | None = None
+    if settings.workflow_task_profile_enabled:
+        profiler = WorkflowTaskProfiler(
+            interval_ms=settings.workflow_task_profile_interval_ms,
+            top_n=settings.workflow_task_profile_top_n,
+        )
+        profiler.start()
+        logger.info(
+            "Workflow task profiler enabled interval_ms=%s report_seconds=%s",
+            settings.workflow_task_profile_interval_ms,
+            settings.workflow_task_profile_report_seconds,
         )
-        for cfg in configs
-    ]
+    workers = []
+    for cfg in configs:
+        tuning = worker_tuning_kwargs(cfg.role)
+        if profiler is not None:
+            # Mirrors the SDK default executor size.
+            tuning["workflow_task_executor"] = profiler.executor(
+                tuning.get("max_concurrent_workflow_tasks") or 500
+            )
+        logger.info(
+            "Worker tuning task_queue=%s role=%s %s",
+            cfg.task_queue,
+            cfg.role,
+            describe_worker_tuning(cfg.role, tuning),
+        )
+        workers.append(
+            Worker(
+                client,
+                task_queue=cfg.task_queue,
+                workflows=cfg.workflows,
+                activities=cfg.activities,
+                interceptors=[WorkflowLoggingInterceptor(), ActivityMetricsInterceptor()],
+                workflow_runner=workflow_runner,
+                graceful_shutdown_timeout=timedelta(
+                    seconds=max(0, runtime_config.temporal_worker_graceful_shutdown_seconds)
+                ),
+                **tuning,
+            )
+        )
+
+    drainer_queue = _job_details_drainer_queue(configs)
+    if drainer_queue:
+        await _ensure_job_details_drainer(client, drainer_queue)
 
     schedule_audit_task = asyncio.create_task(schedule_audit_logger(worker_id))
+    codec_stats_task = asyncio.create_task(log_codec_stats(payload_codec, worker_id))
+    background_tasks = [schedule_audit_task, codec_stats_task]
+    if shutdown_event is not None:
+        background_tasks.append(asyncio.create_task(_shutdown_workers_on(shutdown_event, workers)))
+    if profiler is not None:
+        background_tasks.append(
+            asyncio.create_task(
+                log_profile_reports(profiler, worker_id, settings.workflow_task_profile_report_seconds)
+            )
+        )
 
     logger.info(
         "Worker started. Namespace=%s Address=%s TaskQueues=%s Role=%s",
@@ -507,11 +621,16 @@ async def main() -> None:
     except KeyboardInterrupt:
         logger.info("Worker interrupted; shutting down...")
     finally:
-        schedule_audit_task.cancel()
-        try:
-            await schedule_audit_task
-        except asyncio.CancelledError:
-            pass
+        for background_task in background_tasks:
+            background_task.cancel()
+            try:
+                await background_task
+            except asyncio.CancelledError:
+                pass
+        if profiler is not None:
+            profiler.stop()
+        await spider_clients.aclose()
+        shutdown_firecrawl_clients()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from temporalio.worker import ResourceBasedSlotConfig, WorkerTuner
+
+from ..config import runtime_config
+
+JOB_DETAILS_ROLES = {"job-details", "spidercloud-job-details"}
+
+
+def tuning_role(role: str) -> str:
+    """Map a worker role to the runtime.yaml key prefix that configures it."""
+
+    return "job_details" if (role or "").strip().lower() in JOB_DETAILS_ROLES else "general"
+
+
+def _role_limit(role: str, name: str) -> int:
+    value = getattr(runtime_config, f"temporal_{tuning_role(role)}_{name}")
+    return value if value > 0 else 0
+
+
+def worker_tuning_kwargs(role: str) -> Dict[str, Any]:
+    """Return the ``Worker(...)`` keyword arguments for slots, pollers and the sticky cache.
+
+    Limits set to 0 in runtime.yaml are omitted so the SDK default applies. With
+    ``temporal_worker_tuner: resource_based`` the slot limits become the tuner's maximums.
+    """
+
+    kwargs: Dict[str, Any] = {}
+    max_activities = _role_limit(role, "max_concurrent_activities")
+    max_workflow_tasks = _role_limit(role, "max_concurrent_workflow_tasks")
+
+    if runtime_config.temporal_worker_tuner.lower() == "resource_based":
+        kwargs["tuner"] = WorkerTuner.create_resource_based(
+            target_memory_usage=runtime_config.temporal_resource_tuner_target_memory,
+            target_cpu_usage=runtime_config.temporal_resource_tuner_target_cpu,
+            workflow_config=ResourceBasedSlotConfig(maximum_slots=max_workflow_tasks or None),
+            activity_config=ResourceBasedSlotConfig(maximum_slots=max_activities or None),
+        )
+    else:
+        if max_activities:
+            kwargs["max_concurrent_activities"] = max_activities
+        if max_workflow_tasks:
+            kwargs["max_concurrent_workflow_tasks"] = max_workflow_tasks
+
+    activity_polls = _role_limit(role, "max_concurrent_activity_task_polls")
+    if activity_polls:
+        kwargs["max_concurrent_activity_task_polls"] = activity_polls
+    workflow_polls = _role_limit(role, "max_concurrent_workflow_task_polls")
+    if workflow_polls:
+        kwargs["max_concurrent_workflow_task_polls"] = workflow_polls
+    if runtime_config.temporal_max_cached_workflows > 0:
+        kwargs["max_cached_workflows"] = runtime_config.temporal_max_cached_workflows
+    return kwargs
+
+
+def describe_worker_tuning(role: str, kwargs: Dict[str, Any]) -> str:
+    """Render the effective tuning for the startup log; unset keys are reported as SDK defaults."""
+
+    parts = []
+    if "tuner" in kwargs:
+        parts.append(
+            "tuner=resource_based cpu_target=%s memory_target=%s max_activities=%s max_workflow_tasks=%s"
+            % (
+                runtime_config.temporal_resource_tuner_target_cpu,
+                runtime_config.temporal_resource_tuner_target_memory,
+                _role_limit(role, "max_concurrent_activities") or "unbounded",
+                _role_limit(role, "max_concurrent_workflow_tasks") or "unbounded",
+            )
+        )
+    else:
+        for key in ("max_concurrent_activities", "max_concurrent_workflow_tasks"):
+            parts.append(f"{key}={kwargs.get(key, 'default')}")
+    for key in ("max_concurrent_activity_task_polls", "max_concurrent_workflow_task_polls", "max_cached_workflows"):
+        parts.append(f"{key}={kwargs.get(key, 'default')}")
+    return " ".join(parts)
+
+
+__all__ = ["describe_worker_tuning", "tuning_role", "worker_tuning_kwargs"]
@@ -91,6 +91,14 @@ _ensure_firecrawl_stub()
 _sync_settings_flags()
 
 
+@pytest.fixture(autouse=True)
+def _reset_proxy_escalation():
+    yield
+    escalation_mod = sys.modules.get("job_scrape_application.workflows.helpers.proxy_escalation")
+    if escalation_mod is not None:
+        escalation_mod.reset_proxy_escalation()
+
+
 def pytest_collection_modifyitems(config, items) -> None:  # noqa: ARG001
     skip_marker = pytest.mark.skip(reason="firecrawl/fetchfox workers are disabled")
     skip_tokens = ("firecrawl", "fetchfox")
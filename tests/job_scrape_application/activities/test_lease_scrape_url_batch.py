@@ -171,3 +171,41 @@ async def test_lease_scrape_url_batch_retries_when_all_skipped(monkeypatch):
     assert url_entry["pattern"] is None
     assert "https://example.com/skip-me" in res.get("skippedUrls", [])
     assert mutation_calls.count("router:leaseScrapeUrlBatch") == 2
+
+
+@pytest.mark.asyncio
+async def test_lease_scrape_url_batch_requests_host_cap_and_interleaves_hosts(monkeypatch):
+    leased = {
+        "urls": [
+            {"url": "https://acme.wd1.myworkdayjobs.com/job/1", "sourceUrl": "https://acme.wd1.myworkdayjobs.com"},
+            {"url": "https://acme.wd1.myworkdayjobs.com/job/2", "sourceUrl": "https://acme.wd1.myworkdayjobs.com"},
+            {"url": "https://acme.wd1.myworkdayjobs.com/job/3", "sourceUrl": "https://acme.wd1.myworkdayjobs.com"},
+            {"url": "https://boards-api.greenhouse.io/v1/boards/acme/jobs/1", "sourceUrl": "https://boards.greenhouse.io/acme"},
+            {"url": "https://boards-api.greenhouse.io/v1/boards/acme/jobs/2", "sourceUrl": "https://boards.greenhouse.io/acme"},
+        ]
+    }
+    lease_args: Dict[str, Any] = {}
+
+    async def fake_convex_mutation(name: str, args: Dict[str, Any]):
+        if name == "router:leaseScrapeUrlBatch":
+            lease_args.update(args)
+            return leased
+        raise RuntimeError(f"unexpected mutation {name}")
+
+    async def fake_fetch_seen(source_url: str, pattern: str | None):
+        return []
+
+    monkeypatch.setattr("job_scrape_application.services.convex_client.convex_mutation", fake_convex_mutation)
+    monkeypatch.setattr(acts, "fetch_seen_urls_for_site", fake_fetch_seen)
+    monkeypatch.setattr(acts.runtime_config, "spidercloud_job_details_max_per_host", 3)
+
+    res = await acts.lease_scrape_url_batch("spidercloud", 5)
+
+    assert lease_args["maxPerHost"] == 3
+    assert [entry["url"] for entry in res["urls"]] == [
+        "https://acme.wd1.myworkdayjobs.com/job/1",
+        "https://boards-api.greenhouse.io/v1/boards/acme/jobs/1",
+        "https://acme.wd1.myworkdayjobs.com/job/2",
+        "https://boards-api.greenhouse.io/v1/boards/acme/jobs/2",
+        "https://acme.wd1.myworkdayjobs.com/job/3",
+    ]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import sys
+import time
 from typing import Any, Dict
 
 import pytest
@@ -58,3 +59,61 @@ async def test_scrape_spidercloud_greenhouse_normalizes_listing_urls(monkeypatch
     assert urls == ["https://boards-api.greenhouse.io/v1/boards/mongodb/jobs/7477065"]
     assert captured["enqueue"]["urls"] == ["https://boards-api.greenhouse.io/v1/boards/mongodb/jobs/7477065"]
     assert all("\\" not in url for url in urls)
+
+
+class _FingerprintScraper:
+    provider = "spidercloud"
+
+    async def fetch_greenhouse_listing(self, site: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "job_urls": ["https://boards-api.greenhouse.io/v1/boards/mongodb/jobs/7477065"],
+            "fingerprint": "fp-1",
+        }
+
+
+@pytest.mark.asyncio
+async def test_scrape_spidercloud_greenhouse_skips_unchanged_listing(monkeypatch):
+    now_ms = int(time.time() * 1000)
+    site = {
+        "_id": "s-gh-1",
+        "url": "https://api.greenhouse.io/v1/boards/mongodb/jobs",
+        "type": "greenhouse",
+        "listingFingerprint": "fp-1",
+        "listingFingerprintAt": now_ms - 1000,
+        "lastRunAt": now_ms - 1000,
+    }
+    convex_calls: list[str] = []
+
+    async def fake_convex_call(name: str, _payload: Dict[str, Any]) -> list[Any]:
+        convex_calls.append(name)
+        return []
+
+    async def fail_fetch_seen_urls_for_site(*_args: Any, **_kwargs: Any) -> list[str]:
+        raise AssertionError("unchanged listings must not diff against Convex")
+
+    monkeypatch.setattr(activities.runtime_config, "listing_fingerprint_max_age_hours", 24.0)
+    monkeypatch.setattr(
+        "job_scrape_application.services.convex_client.convex_mutation", fake_convex_call
+    )
+    monkeypatch.setattr(
+        "job_scrape_application.services.convex_client.convex_query", fake_convex_call
+    )
+    monkeypatch.setattr(activities, "fetch_seen_urls_for_site", fail_fetch_seen_urls_for_site)
+
+    res = await activities._scrape_spidercloud_greenhouse(_FingerprintScraper(), site, [])
+
+    assert res["listingUnchanged"] is True
+    assert "listingFingerprint" not in res
+    assert convex_calls == []
+
+    async def fake_fetch_seen_urls_for_site(*_args: Any, **_kwargs: Any) -> list[str]:
+        return []
+
+    monkeypatch.setattr(activities, "fetch_seen_urls_for_site", fake_fetch_seen_urls_for_site)
+    changed = await activities._scrape_spidercloud_greenhouse(
+        _FingerprintScraper(), {**site, "listingFingerprint": "fp-0"}, []
+    )
+
+    assert "listingUnchanged" not in changed
+    assert changed["listingFingerprint"] == "fp-1"
+    assert "router:enqueueScrapeUrls" in convex_calls
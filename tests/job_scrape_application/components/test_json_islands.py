@@ -0,0 +1,68 @@
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.components.json_islands import (  # noqa: E402
+    extract_jobs_payload,
+    find_jobs_payload,
+    iter_json_islands,
+)
+
+# Generous budget for scanning ~4 MB of HTML; the previous slice-per-brace scan took
+# several seconds on the same input and grows quadratically with page size.
+SCAN_BUDGET_SECONDS = 3.0
+RAW_HTML_FIXTURES = (
+    "tests/fixtures/workday_broadcom_listing.html",
+    "tests/fixtures/ashby_lambda_spidercloud_raw.html",
+    "tests/fixtures/ashby_serval_spidercloud_raw.html",
+)
+
+
+def test_islands_skip_brackets_inside_strings_and_nested_spans():
+    text = 'var a = {"title": "Engineer [Remote] {x}", "tags": ["a", "b"]}; b = [1, 2];'
+
+    assert list(iter_json_islands(text)) == [
+        {"title": "Engineer [Remote] {x}", "tags": ["a", "b"]},
+        [1, 2],
+    ]
+
+
+def test_islands_recover_from_unbalanced_and_non_json_brackets():
+    text = 'function f() { return {"jobs": [{"id": 1}]}; } [broken {"positions": []}'
+
+    assert extract_jobs_payload(text) == {"jobs": [{"id": 1}]}
+    assert list(iter_json_islands(text, require=('"positions"',))) == [{"positions": []}]
+
+
+def test_islands_handle_escaped_quotes():
+    payload = {"jobs": [{"title": 'Say \\"hi\\" [now]'}]}
+    text = "<script>window.__DATA__ = " + json.dumps(payload) + ";</script>"
+
+    assert extract_jobs_payload(text) == payload
+
+
+def test_find_jobs_payload_returns_nested_listing():
+    node = {"props": {"pageProps": [{"other": 1}, {"positions": [{"id": 2}]}]}}
+
+    assert find_jobs_payload(node) == {"positions": [{"id": 2}]}
+
+
+@pytest.mark.parametrize("fixture_path", RAW_HTML_FIXTURES)
+def test_scan_of_large_raw_html_stays_linear(fixture_path):
+    html = Path(fixture_path).read_text(encoding="utf-8")
+    repeats = max(1, (4 * 1024 * 1024) // len(html))
+    island = {"jobs": [{"id": 1, "title": "Staff Engineer"}]}
+    page = html * repeats + "<pre>" + json.dumps(island) + "</pre>"
+
+    started = time.perf_counter()
+    found = extract_jobs_payload(page)
+    elapsed = time.perf_counter() - started
+
+    assert found == island
+    assert elapsed < SCAN_BUDGET_SECONDS, f"{fixture_path} x{repeats} took {elapsed:.2f}s"
@@ -134,7 +134,7 @@ def test_default_schedule_includes_spidercloud_job_details():
     match = next((cfg for cfg in cfgs if cfg.id == "spidercloud-job-details"), None)
     assert match is not None
     assert match.workflow == "SpidercloudJobDetails"
-    assert match.interval_seconds == 15
+    assert match.interval_seconds == 300
     assert match.overlap == "skip"
 
 
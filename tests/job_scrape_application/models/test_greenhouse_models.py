@@ -14,10 +14,15 @@ import pytest
 sys.path.insert(0, os.path.abspath("."))
 
 from job_scrape_application.components.models import (  # noqa: E402
+    GreenhouseBoardResponse,
+    GreenhouseBoardSummary,
     extract_greenhouse_job_urls,
+    greenhouse_board_fingerprint,
     load_greenhouse_board,
 )
 
+ROBINHOOD_BOARD_FIXTURE = Path("tests/fixtures/robinhood_greenhouse_board.json")
+
 
 def _extract_first_html(payload: object) -> str:
     if isinstance(payload, dict):
@@ -239,3 +244,64 @@ def test_greenhouse_handler_extracts_xai_detail_fields():
     assert title == job_payload.get("title")
     assert "About xAI" in markdown
     assert "<div" not in markdown
+
+
+def test_lean_board_matches_full_model_on_robinhood_fixture():
+    raw = ROBINHOOD_BOARD_FIXTURE.read_text(encoding="utf-8")
+
+    full = load_greenhouse_board(raw)
+    lean = load_greenhouse_board(raw, lean=True)
+
+    assert isinstance(lean, GreenhouseBoardSummary)
+    assert len(lean.jobs) == len(full.jobs) > 100
+    for summary, job in zip(lean.jobs, full.jobs):
+        assert (summary.id, summary.absolute_url, summary.title) == (job.id, job.absolute_url, job.title)
+        assert (summary.updated_at, summary.first_published) == (job.updated_at, job.first_published)
+        assert summary.to_model() == job
+    assert extract_greenhouse_job_urls(lean) == extract_greenhouse_job_urls(full)
+    assert extract_greenhouse_job_urls(lean, required_keywords=()) == extract_greenhouse_job_urls(
+        full, required_keywords=()
+    )
+
+
+def test_lean_board_falls_back_to_full_validation():
+    payload = {"jobs": [{"id": "42", "absolute_url": "https://boards.greenhouse.io/acme/jobs/42"}]}
+
+    board = load_greenhouse_board(payload, lean=True)
+
+    assert isinstance(board, GreenhouseBoardResponse)
+    assert board.jobs[0].id == 42
+
+
+def test_lean_board_keeps_alternate_timestamp_keys():
+    payload = {
+        "jobs": [
+            {
+                "id": 7,
+                "absolute_url": "https://boards.greenhouse.io/acme/jobs/7",
+                "title": "Software Engineer",
+                "updatedAt": "2025-01-02T00:00:00Z",
+                "departments": [{"id": 1}],
+            }
+        ]
+    }
+
+    board = load_greenhouse_board(json.dumps(payload), lean=True)
+
+    assert board.jobs[0].model_extra == {"updatedAt": "2025-01-02T00:00:00Z"}
+    assert load_greenhouse_board(None, lean=True).jobs == []
+
+
+def test_board_fingerprint_tracks_ids_and_updated_at_only():
+    payload = json.loads(ROBINHOOD_BOARD_FIXTURE.read_text(encoding="utf-8"))
+    fingerprint = greenhouse_board_fingerprint(load_greenhouse_board(payload, lean=True))
+
+    assert fingerprint == greenhouse_board_fingerprint(load_greenhouse_board(payload))
+    reordered = {"jobs": list(reversed(payload["jobs"]))}
+    reordered["jobs"][0] = {**reordered["jobs"][0], "content": "edited"}
+    assert greenhouse_board_fingerprint(load_greenhouse_board(reordered, lean=True)) == fingerprint
+
+    bumped = {"jobs": [dict(job) for job in payload["jobs"]]}
+    bumped["jobs"][0]["updated_at"] = "2030-01-01T00:00:00-05:00"
+    assert greenhouse_board_fingerprint(load_greenhouse_board(bumped, lean=True)) != fingerprint
+    assert greenhouse_board_fingerprint(load_greenhouse_board({"jobs": []}, lean=True)) is None
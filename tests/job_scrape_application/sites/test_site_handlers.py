@@ -20,6 +20,7 @@ from job_scrape_application.workflows.site_handlers import (  # noqa: E402
     GreenhouseHandler,
     NetflixHandler,
     UberCareersHandler,
+    WorkdayHandler,
     get_site_handler,
 )
 
@@ -78,6 +79,39 @@ def test_greenhouse_handler_builds_api_from_job_boards_url():
     assert api_url == "https://boards-api.greenhouse.io/v1/boards/xai/jobs/5012607007"
 
 
+def test_greenhouse_handler_extracts_updated_at_separately_from_posted_at():
+    handler = GreenhouseHandler()
+    detail = {"first_published": "2024-01-02T00:00:00Z", "updated_at": "2024-03-04T00:00:00Z"}
+    board = {"jobs": [{"id": 42, "updated_at": "2024-05-06T00:00:00Z"}]}
+    url = "https://boards-api.greenhouse.io/v1/boards/acme/jobs/42"
+
+    assert handler.extract_posted_at(detail, url) == "2024-01-02T00:00:00Z"
+    assert handler.extract_updated_at(detail, url) == "2024-03-04T00:00:00Z"
+    assert handler.extract_updated_at(board, url) == "2024-05-06T00:00:00Z"
+    assert handler.extract_updated_at({"first_published": "2024-01-02T00:00:00Z"}, url) is None
+    assert AshbyHqHandler().extract_updated_at(detail, url) is None
+
+
+def test_classify_matches_individual_predicates_and_is_memoized():
+    handler = WorkdayHandler()
+    listing = "https://acme.wd5.myworkdayjobs.com/en-US/External"
+    detail = "https://acme.wd5.myworkdayjobs.com/en-US/External/job/Remote/Engineer_R123"
+    api = "https://acme.wd5.myworkdayjobs.com/wday/cxs/acme/External/job/Remote/Engineer_R123"
+    apply = "https://acme.wd5.myworkdayjobs.com/en-US/External/job/Remote/Engineer_R123/apply"
+
+    for url in (listing, detail, api, apply, "mailto:jobs@acme.com"):
+        classified = handler.classify(url)
+        assert classified.listing == handler.is_listing_url(url)
+        assert classified.api_detail == handler.is_api_detail_url(url)
+    assert handler.classify(listing).listing and not handler.classify(listing).job_detail
+    assert handler.classify(detail).job_detail
+    assert handler.classify(api).api_detail
+    assert handler.classify(apply).non_job
+    assert handler.classify("mailto:jobs@acme.com").non_job
+    assert WorkdayHandler().classify(detail) is handler.classify(detail)
+    assert handler.filter_job_urls([listing, detail, "https://example.com/job/1", detail]) == [listing, detail]
+
+
 def test_github_careers_handler_builds_api_and_links():
     handler = GithubCareersHandler()
     url = "https://www.github.careers/careers-home/jobs?keywords=engineer&sortBy=relevance&limit=100"
@@ -281,6 +315,19 @@ def test_uber_careers_handler_extracts_listing_and_pagination_links():
         assert any("page=" in link for link in links if "careers/list" in link)
 
 
+def test_listing_stream_complete_signals():
+    uber = UberCareersHandler()
+    empty_results = "<html><pre>" + html_lib.escape(json.dumps({"results": [], "totalResults": 0})) + "</pre></html>"
+    assert uber.is_listing_stream_complete(empty_results, [])
+    assert not uber.is_listing_stream_complete("<html><div id='loading'></div></html>", [])
+    assert uber.is_listing_stream_complete("<html></html>", ["https://www.uber.com/us/en/careers/list/12345"])
+
+    cisco = CiscoCareersHandler()
+    assert cisco.incremental_listing
+    assert not cisco.is_listing_stream_complete("<html></html>", [])
+    assert not BaseSiteHandler.incremental_listing
+
+
 def test_uber_careers_handler_pagination_pages_have_jobs():
     handler = UberCareersHandler()
     fixture_paths = [
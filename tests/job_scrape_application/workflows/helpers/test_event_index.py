@@ -0,0 +1,67 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.workflows.helpers.event_index import EventIndex  # noqa: E402
+from job_scrape_application.workflows.helpers.link_extractors import gather_strings  # noqa: E402
+
+FIXTURE = Path("tests/job_scrape_application/workflows/fixtures/spidercloud_uber_careers_listing_page.json")
+
+
+def test_strings_match_gather_strings_order():
+    events = [
+        {"content": {"raw": "<html>a</html>", "nested": [{"text": "b"}, 3]}, "url": "c"},
+        "tail text",
+        [{"x": "d"}],
+    ]
+    index = EventIndex()
+    for event in events:
+        index.add(event)
+
+    assert index.strings == gather_strings(events)
+    assert index.html_strings() == ["<html>a</html>"]
+
+
+def test_credits_and_cost_take_max_per_event_and_overall():
+    index = EventIndex()
+    index.add({"credits_used": 3, "usage": {"total_cost": 0.002, "credit": 5}})
+    index.add({"costs": {"request_cost": 0.004}})
+    index.add(["ignored", {"credits": 100}])
+
+    assert index.credit_candidates == [5.0]
+    assert index.credits_used == 5.0
+    assert index.cost_usd == 0.004
+
+
+def test_http_status_prefers_events_then_nested_json_then_markdown():
+    index = EventIndex()
+    index.add({"content": json.dumps({"status": 503})}, markdown='{"httpStatus": 404}')
+    assert index.http_status == 503
+
+    index.add({"metadata": {"raw": {"status": 200}}})
+    assert index.http_status == 200
+
+    markdown_only = EventIndex()
+    markdown_only.add({"content": "plain"}, markdown='{"httpStatus": 404}')
+    assert markdown_only.http_status == 404
+
+
+def test_cached_values_reset_when_events_arrive():
+    index = EventIndex()
+    index.add({"title": "first"})
+    assert index.cached("titles", lambda: list(index.strings)) == ["first"]
+
+    index.add({"title": "second"})
+    assert index.cached("titles", lambda: list(index.strings)) == ["first", "second"]
+
+
+def test_fixture_strings_match_gather_strings():
+    payload = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    index = EventIndex()
+    for event in payload if isinstance(payload, list) else [payload]:
+        index.add(event)
+
+    assert index.strings == gather_strings(index.events)
@@ -0,0 +1,84 @@
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.workflows.helpers.host_limiter import (  # noqa: E402
+    HOST_LIMITS_CONFIG_KEY,
+    HostLimits,
+    get_host_limiter,
+    host_key,
+    reset_host_limiters,
+    split_host_limits,
+)
+
+
+def test_split_host_limits_strips_scheduler_keys():
+    config = {"request": "chrome", HOST_LIMITS_CONFIG_KEY: {"max_concurrency": 2}}
+
+    params, overrides = split_host_limits(config)
+
+    assert params == {"request": "chrome"}
+    assert overrides == {"max_concurrency": 2}
+    assert HOST_LIMITS_CONFIG_KEY in config
+
+
+def test_host_limits_merged_ignores_invalid_values():
+    limits = HostLimits().merged({"max_concurrency": 3, "burst": "lots", "rate_per_second": 0})
+
+    assert limits.max_concurrency == 3
+    assert limits.burst == HostLimits().burst
+    assert limits.rate_per_second == HostLimits().rate_per_second
+
+
+def test_limiter_backs_off_and_recovers():
+    reset_host_limiters()
+    limiter = get_host_limiter(
+        host_key("https://acme.wd1.myworkdayjobs.com/job/1"),
+        HostLimits(initial_concurrency=8, max_concurrency=8),
+    )
+
+    limiter.record_throttle("captcha")
+    assert int(limiter.concurrency) == 4
+    limiter.record_throttle("http_429")
+    assert int(limiter.concurrency) == 2
+
+    for _ in range(10):
+        limiter.record_success()
+    assert 2 < limiter.concurrency <= 8
+
+
+def test_limiter_state_is_shared_per_host():
+    reset_host_limiters()
+    first = get_host_limiter("jobs.example.com", HostLimits())
+    first.record_throttle("captcha")
+
+    again = get_host_limiter("jobs.example.com", HostLimits())
+    other = get_host_limiter("boards.example.com", HostLimits())
+
+    assert again is first
+    assert other is not first
+    assert other.concurrency > first.concurrency
+
+
+def test_limiter_slot_caps_in_flight_requests():
+    reset_host_limiters()
+    limiter = get_host_limiter(
+        "jobs.example.com",
+        HostLimits(initial_concurrency=2, max_concurrency=2, rate_per_second=1000, burst=1000),
+    )
+    peak = {"value": 0}
+
+    async def _work() -> None:
+        async with limiter.slot():
+            peak["value"] = max(peak["value"], limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def _run() -> None:
+        await asyncio.gather(*(_work() for _ in range(6)))
+
+    asyncio.run(_run())
+
+    assert peak["value"] == 2
+    assert limiter.in_flight == 0
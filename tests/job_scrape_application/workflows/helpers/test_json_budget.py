@@ -0,0 +1,38 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.workflows.helpers.json_budget import (  # noqa: E402
+    estimate_json_size,
+    truncate_json,
+)
+
+_PAYLOADS = [
+    {"items": {"raw": [{"markdown": "# Title\n\tBody \"quoted\" \\ path é\x01"}], "count": 3}},
+    {"floats": [1.5, float("nan"), float("inf"), -0.0], "flags": [True, False, None], 7: "int key"},
+    ["", [], {}, "x" * 500],
+]
+
+
+def test_estimate_json_size_matches_json_dumps():
+    for payload in _PAYLOADS:
+        assert estimate_json_size(payload) == len(json.dumps(payload, ensure_ascii=False))
+
+
+def test_estimate_json_size_stops_after_limit():
+    payload = {"raw": ["y" * 10_000 for _ in range(100)]}
+
+    estimate = estimate_json_size(payload, limit=20_000)
+
+    assert 20_000 < estimate < len(json.dumps(payload, ensure_ascii=False))
+
+
+def test_truncate_json_returns_exact_prefix():
+    for payload in _PAYLOADS:
+        serialized = json.dumps(payload, ensure_ascii=False)
+        for budget in (0, 1, 17, len(serialized) - 1, len(serialized), len(serialized) + 10):
+            text, truncated = truncate_json(payload, budget)
+            assert text == serialized[:budget]
+            assert truncated is (len(serialized) > budget)
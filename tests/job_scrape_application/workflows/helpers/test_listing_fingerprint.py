@@ -0,0 +1,22 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.workflows.helpers import listing_fingerprint  # noqa: E402
+from job_scrape_application.workflows.helpers.listing_fingerprint import listing_unchanged  # noqa: E402
+
+
+def test_listing_unchanged_requires_fresh_fingerprint_and_no_manual_trigger(monkeypatch):
+    now_ms = 1_700_000_000_000
+    site = {"listingFingerprint": "fp", "listingFingerprintAt": now_ms - 1000, "lastRunAt": now_ms - 1000}
+    monkeypatch.setattr(listing_fingerprint.runtime_config, "listing_fingerprint_max_age_hours", 24.0)
+
+    assert listing_unchanged(site, "fp", now_ms) is True
+    assert listing_unchanged(site, "other", now_ms) is False
+    assert listing_unchanged(site, None, now_ms) is False
+    assert listing_unchanged({**site, "manualTriggerAt": now_ms - 10}, "fp", now_ms) is False
+    stale = {**site, "listingFingerprintAt": now_ms - 25 * 3_600_000}
+    assert listing_unchanged(stale, "fp", now_ms) is False
+    monkeypatch.setattr(listing_fingerprint.runtime_config, "listing_fingerprint_max_age_hours", 0.0)
+    assert listing_unchanged(site, "fp", now_ms) is False
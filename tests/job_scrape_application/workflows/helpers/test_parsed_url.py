@@ -0,0 +1,30 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.workflows.helpers.parsed_url import (  # noqa: E402
+    cached_urlparse,
+    parse_url,
+)
+
+
+def test_parse_url_exposes_lowercased_host_segments_and_first_query_value():
+    parsed = parse_url("https://Acme.wd5.MyWorkdayJobs.com/en-US/External/job/Remote/Engineer_R123?src=a&src=b&q=")
+
+    assert parsed is not None
+    assert parsed.scheme == "https"
+    assert parsed.host == "acme.wd5.myworkdayjobs.com"
+    assert parsed.path == "/en-US/External/job/Remote/Engineer_R123"
+    assert parsed.path_lower == "/en-us/external/job/remote/engineer_r123"
+    assert parsed.segments == ("en-US", "External", "job", "Remote", "Engineer_R123")
+    assert dict(parsed.query) == {"src": "a", "q": ""}
+
+
+def test_parse_url_is_memoized_and_returns_none_for_unparseable_urls():
+    url = "https://boards.greenhouse.io/acme/jobs/1"
+
+    assert parse_url(url) is parse_url(url)
+    assert cached_urlparse(url) is cached_urlparse(url)
+    assert parse_url("http://[::1") is None
+    assert parse_url("not a url").host == ""
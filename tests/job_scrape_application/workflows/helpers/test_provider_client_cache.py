@@ -0,0 +1,57 @@
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.workflows.helpers import firecrawl_client  # noqa: E402
+
+
+class _FakeClient:
+    def __init__(self, api_key: str) -> None:
+        self.api_key = api_key
+
+
+@pytest.fixture(autouse=True)
+def _reset_clients():
+    firecrawl_client.shutdown_firecrawl_clients()
+    yield
+    firecrawl_client.shutdown_firecrawl_clients()
+
+
+def test_client_cache_is_keyed_by_api_key():
+    first = firecrawl_client.get_firecrawl_client(_FakeClient, "key-a")
+
+    assert firecrawl_client.get_firecrawl_client(_FakeClient, "key-a") is first
+    other = firecrawl_client.get_firecrawl_client(_FakeClient, "key-b")
+    assert other is not first
+    assert other.api_key == "key-b"
+
+
+@pytest.mark.asyncio
+async def test_calls_run_on_dedicated_executor():
+    def _call(value: int, *, offset: int) -> tuple[str, int]:
+        return threading.current_thread().name, value + offset
+
+    thread_name, result = await firecrawl_client.run_firecrawl_call(_call, 1, offset=2)
+
+    assert result == 3
+    assert thread_name.startswith("firecrawl")
+    executor = firecrawl_client._executor  # noqa: SLF001
+    assert executor is not None
+    assert executor._max_workers == firecrawl_client.FIRECRAWL_EXECUTOR_MAX_WORKERS  # noqa: SLF001
+
+
+def test_shutdown_clears_cache_and_executor():
+    first = firecrawl_client.get_firecrawl_client(_FakeClient, "key-a")
+    executor = firecrawl_client._get_executor()  # noqa: SLF001
+
+    firecrawl_client.shutdown_firecrawl_clients()
+
+    assert firecrawl_client._executor is None  # noqa: SLF001
+    assert firecrawl_client._clients == {}  # noqa: SLF001
+    assert executor._shutdown  # noqa: SLF001
+    assert firecrawl_client.get_firecrawl_client(_FakeClient, "key-a") is not first
+    assert firecrawl_client._get_executor() is not executor  # noqa: SLF001
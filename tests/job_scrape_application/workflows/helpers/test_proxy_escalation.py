@@ -0,0 +1,64 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.workflows.helpers.proxy_escalation import (  # noqa: E402
+    ProxyEscalationStore,
+    get_proxy_escalation_store,
+    reset_proxy_escalation,
+)
+
+PROXIES = ("residential", "isp")
+
+
+def test_success_after_captcha_raises_start_tier():
+    store = ProxyEscalationStore(PROXIES)
+    host = "careers.example.com"
+
+    tier = store.start_tier(host)
+    assert store.proxy_for(tier) is None
+    tier = store.next_tier(tier)
+    store.record_success(host, tier)
+
+    assert store.proxy_for(store.start_tier(host)) == "residential"
+    assert store.start_tier("other.example.com") == 0
+
+
+def test_clean_responses_decay_one_tier_at_a_time():
+    store = ProxyEscalationStore(PROXIES, decay_after=2)
+    host = "careers.example.com"
+    store.record_success(host, 2)
+
+    store.record_success(host, 2)
+    assert store.tier_label(store.start_tier(host)) == "isp"
+    store.record_success(host, 2)
+    assert store.tier_label(store.start_tier(host)) == "residential"
+    store.record_success(host, 1)
+    store.record_success(host, 1)
+    assert store.tier_label(store.start_tier(host)) == "direct"
+
+
+def test_next_tier_stops_at_last_proxy():
+    store = ProxyEscalationStore(PROXIES)
+
+    assert store.next_tier(store.max_tier) == store.max_tier
+
+
+def test_sqlite_persists_tiers_across_stores(tmp_path):
+    db_path = str(tmp_path / "escalation.sqlite")
+    ProxyEscalationStore(PROXIES, db_path=db_path).record_success("careers.example.com", 2)
+
+    restored = ProxyEscalationStore(PROXIES, db_path=db_path)
+
+    assert restored.tier_label(restored.start_tier("careers.example.com")) == "isp"
+
+
+def test_process_store_is_shared_until_reset():
+    reset_proxy_escalation()
+    first = get_proxy_escalation_store(PROXIES, decay_after=5)
+    first.record_success("careers.example.com", 1)
+
+    assert get_proxy_escalation_store(PROXIES, decay_after=5) is first
+    reset_proxy_escalation()
+    assert get_proxy_escalation_store(PROXIES, decay_after=5).start_tier("careers.example.com") == 0
@@ -0,0 +1,44 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.workflows.helpers.url_batch import UrlBatch  # noqa: E402
+from job_scrape_application.workflows.site_handlers import WorkdayHandler  # noqa: E402
+
+
+def test_from_values_normalizes_dedupes_and_maps_raw_inputs():
+    raw = [
+        "https://example.com/jobs/1/",
+        "https://example.com//jobs/1",
+        "/jobs/2",
+        None,
+        "  ",
+        "mailto:jobs@example.com",
+        "https://example.com/jobs/1/",
+    ]
+
+    batch = UrlBatch.from_values(raw, base_url="https://example.com")
+
+    assert batch.urls == ("https://example.com/jobs/1", "https://example.com/jobs/2")
+    assert batch.canonical_by_raw["https://example.com//jobs/1"] == "https://example.com/jobs/1"
+    assert batch.timestamps_by_url({"/jobs/2": 1700000000000, "https://example.com/jobs/1/": "x"}) == {
+        "https://example.com/jobs/2": 1700000000000
+    }
+
+
+def test_from_values_keeps_unnormalized_and_respects_limit():
+    batch = UrlBatch.from_values(["relative/path", "https://a.test/x", "https://a.test/y"], keep_unnormalized=True, limit=2)
+
+    assert batch.urls == ("relative/path", "https://a.test/x")
+
+
+def test_from_values_classifies_with_handler():
+    base = "https://acme.wd5.myworkdayjobs.com/en-US/External"
+    batch = UrlBatch.from_values(
+        [base, f"{base}/job/Remote/Engineer_R1", f"{base}/job/Remote/Engineer_R1/"],
+        handler=WorkdayHandler(),
+    )
+
+    assert batch.listing_urls == [base]
+    assert batch.job_urls == [f"{base}/job/Remote/Engineer_R1"]
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.services import metrics  # noqa: E402
+from job_scrape_application.workflows.activity_metrics import activity_labels  # noqa: E402
+
+
+def test_activity_labels_from_site_argument():
+    site = {"url": "https://boards.greenhouse.io/acme", "type": "greenhouse", "scrapeProvider": "SpiderCloud"}
+
+    assert activity_labels("scrape_site", [site]) == {"provider": "spidercloud", "handler": "greenhouse"}
+
+
+def test_activity_labels_fall_back_to_activity_name():
+    assert activity_labels("lease_scrape_url_batch", ["spidercloud", 50])["provider"] == "spidercloud"
+    assert activity_labels("collect_firecrawl_job_result", [{"jobId": "x"}]) == {
+        "provider": "firecrawl",
+        "handler": "none",
+    }
+    assert activity_labels("record_workflow_run", []) == {"provider": "none", "handler": "none"}
+
+
+def test_timed_records_outcome_on_meter(monkeypatch):
+    recorded = []
+
+    class _Histogram:
+        def __init__(self, name):
+            self.name = name
+
+        def record(self, value, attributes):
+            recorded.append((self.name, value, attributes))
+
+    class _Meter:
+        def create_histogram_float(self, name, description=None, unit=None):
+            return _Histogram(name)
+
+    monkeypatch.setattr(metrics, "current_meter", lambda: _Meter())
+
+    with metrics.timed("convex_call_latency", kind="query", function="router:listSites"):
+        pass
+    try:
+        with metrics.timed("convex_call_latency", kind="mutation", function="router:insertScrape"):
+            raise ValueError("boom")
+    except ValueError:
+        pass
+
+    assert [(name, attrs["outcome"]) for name, _value, attrs in recorded] == [
+        ("scraper_convex_call_latency", "ok"),
+        ("scraper_convex_call_latency", "ValueError"),
+    ]
+    assert recorded[0][2]["function"] == "router:listSites"
+
+
+def test_timed_is_noop_outside_activity():
+    with metrics.timed("convex_call_latency", kind="query", function="router:listSites"):
+        value = 1
+
+    assert value == 1
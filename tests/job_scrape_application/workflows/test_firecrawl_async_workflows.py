@@ -9,10 +9,16 @@ import pytest
 # Ensure repo root importable
 sys.path.insert(0, os.path.abspath("."))
 from job_scrape_application.workflows import activities as acts  # noqa: E402
+from job_scrape_application.workflows.activities import firecrawl as acts_firecrawl  # noqa: E402
+
+
+def _patch_firecrawl_executor(monkeypatch, fake) -> None:
+    monkeypatch.setattr(acts, "run_firecrawl_call", fake)
+    monkeypatch.setattr(acts_firecrawl, "run_firecrawl_call", fake)
 
 
 @pytest.mark.asyncio
-async def test_start_firecrawl_webhook_scrape_runs_via_to_thread(monkeypatch):
+async def test_start_firecrawl_webhook_scrape_runs_via_firecrawl_executor(monkeypatch):
     site = {"_id": "s1", "url": "https://example.com", "pattern": "/jobs/**"}
 
     # Env + config
@@ -25,7 +31,7 @@ async def test_start_firecrawl_webhook_scrape_runs_via_to_thread(monkeypatch):
 
     monkeypatch.setattr(acts, "fetch_seen_urls_for_site", fake_seen)
 
-    calls: Dict[str, Any] = {"to_thread": 0, "start_batch": None}
+    calls: Dict[str, Any] = {"executor": 0, "start_batch": None}
 
     class FakeJob:
         id = "job-123"
@@ -40,18 +46,18 @@ async def test_start_firecrawl_webhook_scrape_runs_via_to_thread(monkeypatch):
             calls["start_batch"] = {"urls": urls, "kwargs": kwargs}
             return FakeJob()
 
-    async def fake_to_thread(func, *args, **kwargs):
-        calls["to_thread"] += 1
+    async def fake_run_firecrawl_call(func, *args, **kwargs):
+        calls["executor"] += 1
         return func(*args, **kwargs)
 
     monkeypatch.setattr(acts, "Firecrawl", FakeFirecrawl)
-    monkeypatch.setattr(acts.asyncio, "to_thread", fake_to_thread)
+    _patch_firecrawl_executor(monkeypatch, fake_run_firecrawl_call)
 
     res = await acts.start_firecrawl_webhook_scrape(site)
 
     assert res["jobId"] == "job-123"
     assert res["kind"] == "site_crawl"
-    assert calls["to_thread"] == 1
+    assert calls["executor"] == 1
     assert calls["start_batch"]
     assert calls["start_batch"]["urls"] == [site["url"]]
     kwargs = calls["start_batch"]["kwargs"]
@@ -65,7 +71,7 @@ async def test_start_firecrawl_webhook_scrape_greenhouse_batch(monkeypatch):
     monkeypatch.setattr(acts.settings, "firecrawl_api_key", "fc-test")
     monkeypatch.setattr(acts.settings, "convex_http_url", "https://demo.convex.site")
 
-    calls: Dict[str, Any] = {"to_thread": 0, "start_batch": None}
+    calls: Dict[str, Any] = {"executor": 0, "start_batch": None}
 
     class FakeJob:
         jobId = "gh-456"
@@ -80,18 +86,18 @@ async def test_start_firecrawl_webhook_scrape_greenhouse_batch(monkeypatch):
             calls["start_batch"] = {"urls": urls, "kwargs": kwargs}
             return FakeJob()
 
-    async def fake_to_thread(func, *args, **kwargs):
-        calls["to_thread"] += 1
+    async def fake_run_firecrawl_call(func, *args, **kwargs):
+        calls["executor"] += 1
         return func(*args, **kwargs)
 
     monkeypatch.setattr(acts, "Firecrawl", FakeFirecrawl)
-    monkeypatch.setattr(acts.asyncio, "to_thread", fake_to_thread)
+    _patch_firecrawl_executor(monkeypatch, fake_run_firecrawl_call)
 
     res = await acts.start_firecrawl_webhook_scrape(site)
 
     assert res["jobId"] == "gh-456"
     assert res["kind"] == "greenhouse_listing"
-    assert calls["to_thread"] == 1
+    assert calls["executor"] == 1
     assert calls["start_batch"]["urls"] == [site["url"]]
 
 
@@ -99,7 +105,7 @@ async def test_start_firecrawl_webhook_scrape_greenhouse_batch(monkeypatch):
 async def test_collect_firecrawl_job_result_async(monkeypatch):
     monkeypatch.setattr(acts.settings, "firecrawl_api_key", "fc-test")
 
-    calls: Dict[str, Any] = {"to_thread": 0, "get_status": 0}
+    calls: Dict[str, Any] = {"executor": 0, "get_status": 0}
 
     class FakeDoc:
         def model_dump(self, mode: str = "json", exclude_none: bool = True):
@@ -122,12 +128,12 @@ async def test_collect_firecrawl_job_result_async(monkeypatch):
             calls["job_id"] = job_id
             return FakeStatus()
 
-    async def fake_to_thread(func, *args, **kwargs):
-        calls["to_thread"] += 1
+    async def fake_run_firecrawl_call(func, *args, **kwargs):
+        calls["executor"] += 1
         return func(*args, **kwargs)
 
     monkeypatch.setattr(acts, "Firecrawl", FakeFirecrawl)
-    monkeypatch.setattr(acts.asyncio, "to_thread", fake_to_thread)
+    _patch_firecrawl_executor(monkeypatch, fake_run_firecrawl_call)
 
     event: acts.FirecrawlWebhookEvent = {
         "id": "job-789",
@@ -142,7 +148,7 @@ async def test_collect_firecrawl_job_result_async(monkeypatch):
 
     assert res["jobsScraped"] == 1
     assert res["scrape"]["items"]["normalized"][0]["company"] == "ACME"
-    assert calls["to_thread"] == 1
+    assert calls["executor"] == 1
     assert calls["get_status"] == 1
     assert calls["job_id"] == "job-789"
 
@@ -198,11 +204,11 @@ async def test_start_firecrawl_webhook_scrape_wraps_webhook_for_batch(monkeypatc
             assert "pattern" not in data["metadata"]  # should strip nulls
             return FakeJob()
 
-    async def fake_to_thread(func, *args, **kwargs):
+    async def fake_run_firecrawl_call(func, *args, **kwargs):
         return func(*args, **kwargs)
 
     monkeypatch.setattr(acts, "Firecrawl", FakeFirecrawl)
-    monkeypatch.setattr(acts.asyncio, "to_thread", fake_to_thread)
+    _patch_firecrawl_executor(monkeypatch, fake_run_firecrawl_call)
 
     res = await acts.start_firecrawl_webhook_scrape(site)
 
@@ -239,12 +245,12 @@ async def test_start_firecrawl_webhook_scrape_wraps_webhook_for_crawl(monkeypatc
             assert data["metadata"]["pattern"] == site["pattern"]
             return FakeJob()
 
-    async def fake_to_thread(func, *args, **kwargs):
+    async def fake_run_firecrawl_call(func, *args, **kwargs):
         return func(*args, **kwargs)
 
     monkeypatch.setattr(acts, "fetch_seen_urls_for_site", fake_seen)
     monkeypatch.setattr(acts, "Firecrawl", FakeFirecrawl)
-    monkeypatch.setattr(acts.asyncio, "to_thread", fake_to_thread)
+    _patch_firecrawl_executor(monkeypatch, fake_run_firecrawl_call)
 
     res = await acts.start_firecrawl_webhook_scrape(site)
 
@@ -277,11 +283,11 @@ async def test_webhook_model_dump_excludes_none(monkeypatch):
             captured["strip"] = data_strip
             return FakeJob()
 
-    async def fake_to_thread(func, *args, **kwargs):
+    async def fake_run_firecrawl_call(func, *args, **kwargs):
         return func(*args, **kwargs)
 
     monkeypatch.setattr(acts, "Firecrawl", FakeFirecrawl)
-    monkeypatch.setattr(acts.asyncio, "to_thread", fake_to_thread)
+    _patch_firecrawl_executor(monkeypatch, fake_run_firecrawl_call)
 
     res = await acts.start_firecrawl_webhook_scrape(site)
 
@@ -318,12 +324,12 @@ async def test_start_firecrawl_webhook_retries_model_dump_error(monkeypatch):
                 raise AttributeError("'dict' object has no attribute 'model_dump'")
             return FakeJob()
 
-    async def fake_to_thread(func, *args, **kwargs):
+    async def fake_run_firecrawl_call(func, *args, **kwargs):
         return func(*args, **kwargs)
 
     FlakyFirecrawl.instances = []
     monkeypatch.setattr(acts, "Firecrawl", FlakyFirecrawl)
-    monkeypatch.setattr(acts.asyncio, "to_thread", fake_to_thread)
+    _patch_firecrawl_executor(monkeypatch, fake_run_firecrawl_call)
 
     res = await acts.start_firecrawl_webhook_scrape(site)
 
@@ -374,11 +380,11 @@ async def test_scrape_greenhouse_jobs_firecrawl_batches_urls(monkeypatch):
             calls["idempotency"] = kwargs.get("idempotency_key")
             return FakeResult([FakeDoc(i) for i in range(len(urls_arg))])
 
-    async def fake_to_thread(func, *args, **kwargs):
+    async def fake_run_firecrawl_call(func, *args, **kwargs):
         return func(*args, **kwargs)
 
     monkeypatch.setattr(acts, "Firecrawl", FakeFirecrawl)
-    monkeypatch.setattr(acts.asyncio, "to_thread", fake_to_thread)
+    _patch_firecrawl_executor(monkeypatch, fake_run_firecrawl_call)
 
     res = await acts.scrape_greenhouse_jobs(
         {"urls": urls, "source_url": "https://board", "idempotency_key": "webhook-123"}
@@ -70,7 +70,7 @@ async def test_fetchfox_parse_failure_emits_posthog_exception(monkeypatch):
         return {"raw": "not-json"}
 
     monkeypatch.setattr(
-        "job_scrape_application.workflows.scrapers.fetchfox_scraper.asyncio.to_thread",
+        "job_scrape_application.workflows.scrapers.fetchfox_dispatch.asyncio.to_thread",
         fake_to_thread,
     )
 
@@ -113,19 +113,18 @@ async def test_firecrawl_parse_failure_emits_posthog_exception(monkeypatch):
         lambda *_a, **_k: None,
     )
 
-    async def fake_to_thread(_fn, *_a, **_k):
-        return {"data": [{"text": "not-json"}]}
+    class _FakeFirecrawl:
+        def __init__(self, *_a, **_k) -> None:
+            pass
 
-    monkeypatch.setattr(
-        "job_scrape_application.workflows.scrapers.firecrawl_scraper.asyncio.to_thread",
-        fake_to_thread,
-    )
+        def batch_scrape(self, *_a, **_k):
+            return {"data": [{"text": "not-json"}]}
 
     deps = FirecrawlDependencies(
         start_firecrawl_webhook_scrape=lambda *_a, **_k: {},
         build_request_snapshot=lambda *_a, **_k: {},
         settings=SimpleNamespace(firecrawl_api_key="fc-test-key"),
-        firecrawl_cls=lambda *_a, **_k: None,
+        firecrawl_cls=_FakeFirecrawl,
         build_firecrawl_schema=lambda: {},
         log_provider_dispatch=lambda *_a, **_k: None,
         log_sync_response=lambda *_a, **_k: None,
@@ -77,3 +77,104 @@ async def test_greenhouse_workflow_uses_args_kw(monkeypatch):
             assert kwargs["args"][0]["urls"] == ["https://example.com/job/1"]
         if activity is gh.complete_site:
             assert kwargs["args"] == ["site1"]
+
+
+@pytest.mark.asyncio
+async def test_greenhouse_workflow_skips_unchanged_listing(monkeypatch):
+    calls = []
+    state = {"leases": 0}
+    now = datetime.fromtimestamp(1_700_000_000)
+    now_ms = int(now.timestamp() * 1000)
+    sites = [
+        {
+            "_id": "site1",
+            "url": "https://example.com/unchanged",
+            "listingFingerprint": "fp-1",
+            "listingFingerprintAt": now_ms - 60_000,
+            "lastRunAt": now_ms - 60_000,
+        },
+        {
+            "_id": "site2",
+            "url": "https://example.com/changed",
+            "listingFingerprint": "fp-old",
+            "listingFingerprintAt": now_ms - 60_000,
+        },
+    ]
+
+    async def fake_execute_activity(activity, *args, **kwargs):
+        calls.append((activity, kwargs.get("args")))
+        if activity is gh.lease_site:
+            state["leases"] += 1
+            return sites[state["leases"] - 1] if state["leases"] <= len(sites) else None
+        if activity is gh.fetch_greenhouse_listing:
+            return {"job_urls": ["https://example.com/job/1"], "fingerprint": "fp-1"}
+        if activity is gh.filter_existing_job_urls:
+            return ["https://example.com/job/1"]
+        if activity is gh.compute_urls_to_scrape:
+            return {"urlsToScrape": [], "existingCount": 1, "totalCount": 1}
+        if activity in (gh.complete_site, gh.record_workflow_run):
+            return None
+        raise RuntimeError(f"Unexpected activity {activity}")
+
+    monkeypatch.setattr(gh.workflow, "execute_activity", fake_execute_activity)
+    monkeypatch.setattr(gh.workflow, "now", lambda: now)
+
+    class _Info:
+        run_id = "run-1"
+        workflow_id = "wf-1"
+
+    monkeypatch.setattr(gh.workflow, "info", lambda: _Info())
+
+    summary = await gh.GreenhouseScraperWorkflow().run()
+
+    assert summary.site_count == 2
+    assert summary.sites_unchanged == 1
+    # Only the changed site runs the diff, and only full runs record the new fingerprint.
+    assert [args for activity, args in calls if activity is gh.filter_existing_job_urls] == [
+        [["https://example.com/job/1"]]
+    ]
+    assert [args for activity, args in calls if activity is gh.complete_site] == [["site1"], ["site2", "fp-1"]]
+
+
+@pytest.mark.asyncio
+async def test_greenhouse_workflow_forwards_updated_at_watermarks(monkeypatch):
+    calls = []
+    state = {"leased_once": False}
+    job_url = "https://boards-api.greenhouse.io/v1/boards/acme/jobs/1"
+    updated_at_by_url = {job_url: 1_700_000_000_000}
+
+    async def fake_execute_activity(activity, *args, **kwargs):
+        calls.append((activity, kwargs.get("args")))
+        if activity is gh.lease_site:
+            if state["leased_once"]:
+                return None
+            state["leased_once"] = True
+            return {"_id": "site1", "url": "https://boards.greenhouse.io/acme"}
+        if activity is gh.fetch_greenhouse_listing:
+            return {"job_urls": [job_url], "updated_at_by_url": updated_at_by_url}
+        if activity is gh.filter_existing_job_urls:
+            return []
+        if activity is gh.compute_urls_to_scrape:
+            return {"urlsToScrape": [job_url], "existingCount": 0, "totalCount": 1}
+        if activity is gh.scrape_greenhouse_jobs:
+            return {"scrapeId": "scrape1", "jobsScraped": 1}
+        if activity in (gh.complete_site, gh.record_workflow_run):
+            return None
+        raise RuntimeError(f"Unexpected activity {activity}")
+
+    monkeypatch.setattr(gh.workflow, "execute_activity", fake_execute_activity)
+    monkeypatch.setattr(gh.workflow, "now", lambda: datetime.fromtimestamp(0))
+
+    class _Info:
+        run_id = "run-1"
+        workflow_id = "wf-1"
+
+    monkeypatch.setattr(gh.workflow, "info", lambda: _Info())
+
+    await gh.GreenhouseScraperWorkflow().run()
+
+    assert [args for activity, args in calls if activity is gh.filter_existing_job_urls] == [
+        [[job_url], updated_at_by_url]
+    ]
+    scrape_args = [args for activity, args in calls if activity is gh.scrape_greenhouse_jobs]
+    assert scrape_args[0][0]["updated_at_by_url"] == updated_at_by_url
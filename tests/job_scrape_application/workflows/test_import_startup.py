@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.workflows.helpers.lazy_imports import lazy_module_attrs  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PROVIDER_SDK_MODULES = ("firecrawl", "fetchfox_sdk", "spider")
+# Secondary guard on cumulative activities import time (provider SDKs excluded); the module
+# checks below are what catch eager SDK / location-dictionary imports.
+ACTIVITIES_IMPORT_BUDGET_US = int(os.getenv("ACTIVITIES_IMPORT_BUDGET_US", "1500000"))
+
+_IMPORT_PROBE = """
+import json, sys
+import job_scrape_application.workflows.activities
+from job_scrape_application.workflows.helpers import scrape_utils
+print(json.dumps({
+    "modules": sorted(sys.modules),
+    "location_index_built": scrape_utils._location_index.cache_info().currsize > 0,
+}))
+"""
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    result = subprocess.run(
+        [sys.executable, *args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if result.returncode != 0:
+        if "ModuleNotFoundError" in result.stderr:
+            pytest.skip(f"activities dependencies are not installed: {result.stderr.strip().splitlines()[-1]}")
+        raise AssertionError(result.stderr)
+    return result
+
+
+def _importtime(module: str) -> dict[str, int]:
+    result = _run_python("-X", "importtime", "-c", f"import {module}")
+
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        if cumulative_us.isdigit():
+            cumulative[name] = int(cumulative_us)
+    return cumulative
+
+
+def test_activities_import_leaves_provider_sdks_and_location_index_unloaded():
+    probe = json.loads(_run_python("-c", _IMPORT_PROBE).stdout.strip().splitlines()[-1])
+
+    loaded_sdks = [name for name in probe["modules"] if name.split(".")[0] in PROVIDER_SDK_MODULES]
+    assert loaded_sdks == []
+    assert probe["location_index_built"] is False
+
+
+def test_activities_import_stays_within_time_budget():
+    timings = _importtime("job_scrape_application.workflows.activities")
+
+    assert timings["job_scrape_application.workflows.activities"] <= ACTIVITIES_IMPORT_BUDGET_US
+
+
+def test_lazy_module_attrs_resolves_once_and_respects_patches(monkeypatch):
+    namespace: dict[str, object] = {"__name__": "fake_module"}
+    resolve, module_getattr = lazy_module_attrs(
+        namespace,
+        {"dumps": ("json", "dumps"), "Missing": ("json", "DoesNotExist")},
+        optional=("Missing",),
+    )
+
+    import json
+
+    assert "dumps" not in namespace
+    assert module_getattr("dumps") is json.dumps
+    assert namespace["dumps"] is json.dumps
+    assert resolve("Missing") is None
+
+    namespace["dumps"] = "patched"
+    assert resolve("dumps") == "patched"
+
+    with pytest.raises(AttributeError):
+        module_getattr("other")
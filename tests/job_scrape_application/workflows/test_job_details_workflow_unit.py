@@ -253,3 +253,55 @@ async def test_job_details_yields_on_large_batches(monkeypatch):
     await wf.run()
 
     assert sleep_calls, "Expected workflow.sleep to be called to yield in large batches"
+
+
+@pytest.mark.asyncio
+async def test_job_details_drainer_ramps_while_busy_and_parks_when_idle(monkeypatch):
+    leased_rounds = [[1], [1, 1], [1, 0, 0, 0], [0], [0]]
+    child_widths: List[int] = []
+    waits: List[float] = []
+    round_state = {"index": -1, "pending": 0}
+
+    class _StopDrainer(BaseException):
+        pass
+
+    async def fake_execute_child_workflow(run_fn, **kwargs):  # type: ignore[override]
+        assert run_fn == sw.SpidercloudJobDetailsWorkflow.run
+        if round_state["pending"] == 0:
+            round_state["index"] += 1
+            round_state["pending"] = len(leased_rounds[round_state["index"]])
+            child_widths.append(round_state["pending"])
+        outcomes = leased_rounds[round_state["index"]]
+        site_count = outcomes[len(outcomes) - round_state["pending"]]
+        round_state["pending"] -= 1
+        return sw.ScrapeSummary(site_count=site_count, scrape_ids=["scr"] * site_count)
+
+    async def fake_wait_condition(predicate, *, timeout=None):  # type: ignore[override]
+        waits.append(timeout.total_seconds())
+        if len(waits) == 1:
+            raise asyncio.TimeoutError()
+        raise _StopDrainer()
+
+    monkeypatch.setattr(sw.workflow, "execute_child_workflow", fake_execute_child_workflow)
+    monkeypatch.setattr(sw.workflow, "wait_condition", fake_wait_condition)
+    monkeypatch.setattr(sw.workflow, "info", lambda: _Info())
+    monkeypatch.setattr(sw.workflow, "patched", lambda _patch_id: True)
+    monkeypatch.setattr(sw, "history_budget_exceeded", lambda: False)
+    monkeypatch.setattr(sw.runtime_config, "spidercloud_job_details_drainer_parallelism", 4)
+
+    drainer = sw.SpidercloudJobDetailsDrainerWorkflow()
+    with pytest.raises(_StopDrainer):
+        await drainer.run()
+
+    # 1 -> 2 -> 4 while every batch leases work, then back to a single probe batch.
+    assert child_widths == [1, 2, 4, 1, 1]
+    # Idle waits back off exponentially.
+    assert waits == [1.0, 2.0]
+
+
+def test_job_details_drainer_signal_wakes_idle_wait():
+    drainer = sw.SpidercloudJobDetailsDrainerWorkflow()
+
+    drainer.urls_enqueued(3)
+
+    assert drainer._wake is True  # noqa: SLF001
@@ -104,6 +104,14 @@ def test_normalize_url_strips_backslashes_and_trailing_slashes():
     assert normalize_url(url) == "https://boards-api.greenhouse.io/v1/boards/stubhubinc/jobs/4713661101"
 
 
+def test_normalize_url_keeps_query_params_byte_for_byte():
+    # Convex normalizeScrapedUrl keeps query strings, so stored job URLs only match if Python does too.
+    url = "https://boards.greenhouse.io/robinhood/jobs/7379020?t=gh_src=&gh_jid=7379020&utm_source=li&gclid=abc#apply"
+
+    assert normalize_url(url) == url
+    assert normalize_url("https://example.com//jobs/1/?UTM_Medium=x") == "https://example.com/jobs/1?UTM_Medium=x"
+
+
 def test_normalize_url_list_dedupes_and_filters():
     urls = [
         "https://example.com/jobs/1",
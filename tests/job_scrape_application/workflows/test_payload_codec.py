@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+
+from temporalio.api.common.v1 import Payload
+
+from job_scrape_application.workflows.payload_codec import (
+    ENCODING_METADATA_KEY,
+    ZLIB_ENCODING,
+    CompressionCodec,
+)
+
+
+def _json_payload(text: str) -> Payload:
+    return Payload(metadata={"encoding": b"json/plain"}, data=text.encode("utf-8"))
+
+
+def test_codec_compresses_large_payloads_and_round_trips():
+    codec = CompressionCodec(threshold_bytes=1024)
+    large = _json_payload('{"markdown": "' + "Senior Engineer role. " * 500 + '"}')
+    small = _json_payload('{"ok": true}')
+
+    encoded = asyncio.run(codec.encode([large, small]))
+
+    assert encoded[0].metadata[ENCODING_METADATA_KEY] == ZLIB_ENCODING
+    assert len(encoded[0].data) < len(large.data) / 5
+    assert encoded[1] == small
+
+    decoded = asyncio.run(codec.decode(encoded))
+    assert decoded == [large, small]
+
+    stats = codec.snapshot_stats()
+    assert stats.compressed_payloads == 1
+    assert stats.encoded_payloads == 2
+    assert stats.decoded_payloads == 1
+    assert stats.compression_ratio is not None and stats.compression_ratio > 5
+    assert codec.stats.encoded_payloads == 0
+
+
+def test_codec_with_compression_disabled_still_decodes():
+    compressed = asyncio.run(
+        CompressionCodec(threshold_bytes=0).encode([_json_payload('"' + "x" * 5000 + '"')])
+    )
+    codec = CompressionCodec(algorithm="none")
+
+    assert asyncio.run(codec.encode([_json_payload('"' + "x" * 5000 + '"')]))[0].metadata[
+        "encoding"
+    ] == b"json/plain"
+    assert asyncio.run(codec.decode(compressed))[0].data == b'"' + b"x" * 5000 + b'"'
+
+
+def test_codec_falls_back_to_zlib_for_unknown_algorithms():
+    assert CompressionCodec(algorithm="brotli").algorithm == "zlib"
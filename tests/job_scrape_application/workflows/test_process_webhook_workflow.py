@@ -479,3 +479,92 @@ async def test_process_webhook_payment_required_marks_failed(monkeypatch):
     assert calls["mark"] == [("pay-1", "Payment Required: insufficient credits")]
     assert calls["fail"] == [{"id": "site-pay", "error": "Payment Required: insufficient credits"}]
     assert calls["record"]["status"] == "failed"
+
+
+@pytest.mark.asyncio
+async def test_process_webhook_workflow_carries_seen_jobs_through_continue_as_new(monkeypatch):
+    fetches = {"count": 0}
+    marks: list[tuple[str, Any]] = []
+    recorded: list[Dict[str, Any]] = []
+
+    class _ContinueAsNew(BaseException):
+        pass
+
+    async def fake_execute_activity(fn, args=None, **_kwargs):  # type: ignore[override]
+        if fn is wf.fetch_pending_firecrawl_webhooks:
+            fetches["count"] += 1
+            return [{"_id": "e2", "event": "failed", "jobId": "job-1", "siteUrl": "https://one"}]
+        if fn is wf.mark_firecrawl_webhook_processed:
+            marks.append((args[0], args[1]))
+            return None
+        if fn is wf.record_workflow_run:
+            recorded.append(args[0])
+            return None
+        raise AssertionError(f"Unexpected activity {fn}")
+
+    def fake_continue_as_new(state):
+        raise _ContinueAsNew(state)
+
+    monkeypatch.setattr(wf.workflow, "execute_activity", fake_execute_activity)
+    monkeypatch.setattr(wf.workflow, "continue_as_new", fake_continue_as_new)
+    monkeypatch.setattr(wf.workflow, "now", lambda: datetime.fromtimestamp(1))
+    monkeypatch.setattr(
+        wf.workflow,
+        "info",
+        lambda: type("Info", (), {"run_id": "r3", "workflow_id": "ProcessWebhook/1"})(),
+    )
+    monkeypatch.setattr(wf.workflow, "patched", lambda _patch_id: True)
+    monkeypatch.setattr(wf, "history_budget_exceeded", lambda: True)
+
+    carried = wf.WebhookIngestState(processed=5, stored=2, seen_jobs=["failed:job-1"], started_at=7)
+    with pytest.raises(_ContinueAsNew) as excinfo:
+        await wf.ProcessWebhookIngestWorkflow().run(carried)
+
+    next_state = excinfo.value.args[0]
+    # The carried dedup key suppresses the replayed event instead of reprocessing it.
+    assert marks == [("e2", "duplicate")]
+    assert fetches["count"] == 1
+    assert next_state.processed == 5
+    assert next_state.stored == 2
+    assert next_state.seen_jobs == ["failed:job-1"]
+    assert next_state.started_at == 7
+    assert next_state.continued_runs == 1
+    assert recorded == []
+
+
+@pytest.mark.asyncio
+async def test_process_webhook_workflow_caps_carried_seen_jobs(monkeypatch):
+    class _ContinueAsNew(BaseException):
+        pass
+
+    async def fake_execute_activity(fn, args=None, **_kwargs):  # type: ignore[override]
+        if fn is wf.fetch_pending_firecrawl_webhooks:
+            return [{"_id": "e9", "event": "failed", "jobId": "job-old-0", "siteUrl": "https://one"}]
+        if fn is wf.mark_firecrawl_webhook_processed:
+            return None
+        raise AssertionError(f"Unexpected activity {fn}")
+
+    def fake_continue_as_new(state):
+        raise _ContinueAsNew(state)
+
+    monkeypatch.setattr(wf.workflow, "execute_activity", fake_execute_activity)
+    monkeypatch.setattr(wf.workflow, "continue_as_new", fake_continue_as_new)
+    monkeypatch.setattr(wf.workflow, "now", lambda: datetime.fromtimestamp(1))
+    monkeypatch.setattr(
+        wf.workflow,
+        "info",
+        lambda: type("Info", (), {"run_id": "r3", "workflow_id": "ProcessWebhook/1"})(),
+    )
+    monkeypatch.setattr(wf.workflow, "patched", lambda _patch_id: True)
+    monkeypatch.setattr(wf, "history_budget_exceeded", lambda: True)
+
+    seen = [f"failed:job-old-{idx}" for idx in range(wf.MAX_CARRIED_SEEN_JOBS + 50)]
+    site_urls = [f"https://example.com/{idx}" for idx in range(wf.MAX_CARRIED_SITE_URLS + 10)]
+    carried = wf.WebhookIngestState(seen_jobs=seen, site_urls=site_urls, site_count=400)
+    with pytest.raises(_ContinueAsNew) as excinfo:
+        await wf.ProcessWebhookIngestWorkflow().run(carried)
+
+    next_state = excinfo.value.args[0]
+    assert next_state.seen_jobs == seen[-wf.MAX_CARRIED_SEEN_JOBS:]
+    assert next_state.site_urls == site_urls[-wf.MAX_CARRIED_SITE_URLS:]
+    assert next_state.site_count == 400
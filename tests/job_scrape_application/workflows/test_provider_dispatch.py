@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+from temporalio.exceptions import ApplicationError
+
+sys.path.insert(0, os.path.abspath("."))
+from job_scrape_application.testing.fetchfox_mock import MockFetchFox, MockFetchFoxScenario  # noqa: E402
+from job_scrape_application.workflows.helpers.scrape_utils import normalize_fetchfox_items  # noqa: E402
+from job_scrape_application.workflows.scrapers import fetchfox_scraper  # noqa: E402
+from job_scrape_application.workflows.scrapers.fetchfox_dispatch import FetchfoxDispatcher, chunk_urls  # noqa: E402
+from job_scrape_application.workflows.scrapers.fetchfox_scraper import (  # noqa: E402
+    FetchfoxDependencies,
+    FetchfoxScraper,
+)
+
+
+def _urls(count: int) -> list[str]:
+    return [f"https://boards.greenhouse.io/example/jobs/{1000 + idx}" for idx in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_bounds_parallel_jobs():
+    fox = MockFetchFox(latency=0.03)
+    dispatcher = FetchfoxDispatcher(fox.factory, max_concurrency=2)
+
+    jobs = dispatcher.submit_many("scrape", [{"start_urls": [url]} for url in _urls(6)])
+    finished = [job async for job in dispatcher.as_completed()]
+
+    assert len(finished) == len(jobs) == 6
+    assert dispatcher.status_counts() == {"completed": 6}
+    assert len(fox.calls) == 6
+    assert fox.max_active == 2
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_streams_fastest_jobs_first_and_decodes_json():
+    fox = MockFetchFox(per_url_latency=0.02, scenario=MockFetchFoxScenario.JSON_STRING)
+    dispatcher = FetchfoxDispatcher(fox.factory, max_concurrency=3)
+    urls = _urls(6)
+
+    slow = dispatcher.submit("scrape", {"start_urls": urls[:4]})
+    fast = dispatcher.submit("scrape", {"start_urls": urls[4:5]})
+    finished = [job async for job in dispatcher.as_completed()]
+
+    assert finished == [fast, slow]
+    assert fast.result["urls"] == urls[4:5]
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_records_failed_jobs_without_raising():
+    urls = _urls(2)
+    fox = MockFetchFox(scenario=MockFetchFoxScenario.FAIL_URLS, fail_urls=[urls[0]])
+    dispatcher = FetchfoxDispatcher(fox.factory)
+
+    failed = await dispatcher.run("scrape", {"start_urls": [urls[0]]})
+    ok = await dispatcher.run("crawl", {"start_urls": [urls[1]], "priority": {"skip": []}})
+
+    assert failed.status == "failed"
+    assert isinstance(failed.error, RuntimeError)
+    assert ok.status == "completed"
+    assert len(ok.result["results"]["hits"]) == fox.crawl_hits
+
+
+def test_chunk_urls_splits_in_order():
+    urls = _urls(5)
+
+    assert chunk_urls(urls, 2) == [urls[:2], urls[2:4], urls[4:]]
+    assert chunk_urls(urls, 0) == [urls]
+    assert chunk_urls([], 3) == []
+
+
+def _scraper(sync_logs: list[dict]) -> FetchfoxScraper:
+    deps = FetchfoxDependencies(
+        fetch_seen_urls_for_site=lambda *_a, **_k: [],
+        build_job_template=lambda: {},
+        build_request_snapshot=lambda request, **_k: {"body": request},
+        log_provider_dispatch=lambda *_a, **_k: None,
+        log_sync_response=lambda *_a, **kwargs: sync_logs.append(kwargs),
+        normalize_fetchfox_items=normalize_fetchfox_items,
+        trim_scrape_for_convex=lambda payload, **_k: payload,
+        settings=SimpleNamespace(fetchfox_api_key="ff-test-key"),
+        load_greenhouse_board=lambda *_a, **_k: None,
+        extract_greenhouse_job_urls=lambda *_a, **_k: [],
+        extract_raw_body_from_fetchfox_result=lambda _result: "",
+    )
+    return FetchfoxScraper(deps)
+
+
+@pytest.mark.asyncio
+async def test_greenhouse_jobs_keep_completed_chunks_when_one_fails(monkeypatch):
+    urls = _urls(5)
+    fox = MockFetchFox(scenario=MockFetchFoxScenario.FAIL_URLS, fail_urls=[urls[2]])
+    monkeypatch.setattr(fetchfox_scraper, "FetchFox", fox)
+    monkeypatch.setattr(fetchfox_scraper.runtime_config, "fetchfox_detail_chunk_size", 2)
+    sync_logs: list[dict] = []
+
+    res = await _scraper(sync_logs).scrape_greenhouse_jobs(
+        {"urls": urls, "posted_at_by_url": {urls[4]: 1700000000000}}
+    )
+
+    assert [call["payload"]["start_urls"] for call in fox.calls] == [urls[:2], urls[2:4], urls[4:]]
+    normalized = res["scrape"]["items"]["normalized"]
+    assert sorted(row["url"] for row in normalized) == sorted(urls[:2] + urls[4:])
+    assert next(row for row in normalized if row["url"] == urls[4])["posted_at"] == 1700000000000
+    assert [item["url"] for item in res["scrape"]["items"]["failed"]] == urls[2:4]
+    assert res["jobsScraped"] == 3
+    assert sync_logs[-1]["metadata"]["failedChunks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_greenhouse_jobs_raise_when_every_chunk_fails(monkeypatch):
+    urls = _urls(2)
+    fox = MockFetchFox(scenario=MockFetchFoxScenario.FAIL_URLS, fail_urls=urls)
+    monkeypatch.setattr(fetchfox_scraper, "FetchFox", fox)
+    monkeypatch.setattr(fetchfox_scraper.runtime_config, "fetchfox_detail_chunk_size", 1)
+
+    with pytest.raises(ApplicationError):
+        await _scraper([]).scrape_greenhouse_jobs({"urls": urls})
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+import sys
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.workflows import schedule_audit, schedule_index  # noqa: E402
+
+DENVER = ZoneInfo("America/Denver")
+SCHEDULE = {
+    "_id": "sched-1",
+    "days": ["mon"],
+    "startTime": "09:00",
+    "intervalMinutes": 60,
+    "timezone": "America/Denver",
+}
+
+
+def _ts(dt: datetime) -> int:
+    return int(dt.timestamp() * 1000)
+
+
+def _sites(last_run: int) -> list[dict]:
+    return [
+        {"_id": "gh-1", "url": "https://gh", "type": "greenhouse", "scheduleId": "sched-1", "lastRunAt": last_run},
+        {"_id": "ff-1", "url": "https://ff", "type": "general", "completed": True, "lastRunAt": 0},
+    ]
+
+
+def test_unchanged_sites_are_served_from_cache():
+    now = _ts(datetime(2025, 1, 6, 10, 15, tzinfo=DENVER))
+    index = schedule_index.ScheduleDecisionIndex()
+
+    first = index.update(_sites(0), [SCHEDULE], now)
+    second = index.update(_sites(0), [SCHEDULE], now + 60_000)
+    assert index.evaluations == 2
+    assert second == first
+
+    ran_at = now + 120_000
+    index.update(_sites(ran_at), [SCHEDULE], ran_at)
+    assert index.evaluations == 3
+
+
+def test_cached_decisions_match_fresh_evaluation_across_slot_boundaries():
+    index = schedule_index.ScheduleDecisionIndex()
+    ran_at = _ts(datetime(2025, 1, 6, 10, 5, tzinfo=DENVER))
+    schedule_map = {"sched-1": SCHEDULE}
+
+    for minutes in range(0, 24 * 60, 7):
+        now = ran_at + minutes * 60_000
+        decisions = index.update(_sites(ran_at), [SCHEDULE], now)
+        assert decisions == [schedule_audit._schedule_decision_for_site(site, schedule_map, now) for site in _sites(ran_at)]
+
+    # One evaluation per hourly slot and midnight, not one per refresh.
+    assert index.evaluations < 40
+
+
+def test_snapshot_reports_next_eligible_per_group(tmp_path, monkeypatch):
+    monkeypatch.setattr(schedule_index, "INDEX_DIR", tmp_path)
+    ran_at = _ts(datetime(2025, 1, 6, 10, 5, tzinfo=DENVER))
+    next_slot = _ts(datetime(2025, 1, 6, 11, 0, tzinfo=DENVER))
+    index = schedule_index.ScheduleDecisionIndex()
+    index.update(_sites(ran_at), [SCHEDULE], ran_at)
+
+    snapshot = index.snapshot(ran_at, ttl_ms=120_000)
+    assert snapshot["groups"] == {"greenhouse|spidercloud": next_slot}
+    schedule_index.publish_snapshot(snapshot)
+
+    assert schedule_index.lease_may_find_site("greenhouse", "spidercloud", now_ms=ran_at + 1) is False
+    assert schedule_index.lease_may_find_site(None, "fetchfox", now_ms=ran_at + 1) is False
+    # Expired snapshots fall back to the Convex mutation.
+    assert schedule_index.lease_may_find_site("greenhouse", "spidercloud", now_ms=ran_at + 120_000) is True
+
+
+def test_missing_snapshot_falls_back_to_convex(tmp_path, monkeypatch):
+    monkeypatch.setattr(schedule_index, "INDEX_DIR", tmp_path)
+
+    assert schedule_index.lease_may_find_site("greenhouse", "spidercloud") is True
+
+
+def test_writer_lock_admits_one_holder(tmp_path):
+    first = schedule_index.HostWriterLock(tmp_path / "index.lock")
+    second = schedule_index.HostWriterLock(tmp_path / "index.lock")
+
+    assert first.try_acquire() is True
+    assert second.try_acquire() is False
+    first.release()
+    assert second.try_acquire() is True
+    second.release()
+
+
+def test_stale_heap_entries_are_compacted():
+    index = schedule_index.ScheduleDecisionIndex()
+    ran_at = _ts(datetime(2025, 1, 6, 10, 5, tzinfo=DENVER))
+    next_slot = _ts(datetime(2025, 1, 6, 11, 0, tzinfo=DENVER))
+
+    # Every refresh moves lastRunAt, so each update re-evaluates and pushes a new heap entry.
+    for step in range(50):
+        index.update(_sites(ran_at + step), [SCHEDULE], ran_at + step)
+
+    heap = index._heaps[("greenhouse", "spidercloud")]
+    assert index.compactions > 0
+    assert len(heap) <= 1 + index.STALE_HEAP_FACTOR
+    assert index.next_eligible_at(("greenhouse", "spidercloud")) == next_slot
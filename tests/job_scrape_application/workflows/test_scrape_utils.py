@@ -10,8 +10,10 @@ sys.path.insert(0, os.path.abspath("."))
 import json
 import pytest
 
+from job_scrape_application.components.models import load_greenhouse_board
 from job_scrape_application.workflows.helpers.scrape_utils import (
     _jobs_from_scrape_items,
+    greenhouse_updated_at_by_url,
     looks_like_job_listing_page,
     normalize_firecrawl_items,
     normalize_fetchfox_items,
@@ -428,6 +430,42 @@ def test_jobs_from_scrape_items_coerces_level_values():
     assert jobs[1]["level"] == "senior"
 
 
+def test_jobs_from_scrape_items_carries_source_updated_at():
+    items = {
+        "normalized": [
+            {"title": "Backend Engineer", "url": "https://example.com/jobs/1", "updated_at": 1_700_000_000_000},
+            {"title": "Frontend Engineer", "url": "https://example.com/jobs/2"},
+        ]
+    }
+
+    jobs = _jobs_from_scrape_items(items, default_posted_at=0)
+
+    assert jobs[0]["sourceUpdatedAt"] == 1_700_000_000_000
+    assert "sourceUpdatedAt" not in jobs[1]
+
+
+def test_greenhouse_updated_at_by_url_maps_absolute_and_api_urls():
+    board = load_greenhouse_board(
+        {
+            "jobs": [
+                {
+                    "id": 7,
+                    "title": "Engineer",
+                    "absolute_url": "https://boards.greenhouse.io/acme/jobs/7",
+                    "updated_at": "2024-03-04T00:00:00Z",
+                },
+                {"id": 8, "title": "Designer", "absolute_url": "https://boards.greenhouse.io/acme/jobs/8"},
+            ]
+        },
+        lean=True,
+    )
+
+    assert greenhouse_updated_at_by_url(board, "acme") == {
+        "https://boards.greenhouse.io/acme/jobs/7": 1709510400000,
+        "https://boards-api.greenhouse.io/v1/boards/acme/jobs/7": 1709510400000,
+    }
+
+
 def test_prefer_apply_url_prefers_company_over_greenhouse_api():
     row = {
         "apply_url": "https://boards-api.greenhouse.io/v1/boards/acme/jobs/123",
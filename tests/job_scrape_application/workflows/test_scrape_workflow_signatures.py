@@ -102,6 +102,68 @@ async def test_scrape_workflow_uses_args_kw(monkeypatch):
             assert kwargs["args"][0]["workflowName"] == "ScrapeWorkflow"
 
 
+@pytest.mark.asyncio
+async def test_scrape_workflow_records_listing_fingerprint_and_skips_unchanged(monkeypatch):
+    calls = []
+    sites = [
+        {"_id": "site-same", "url": "https://boards.greenhouse.io/same", "type": "greenhouse"},
+        {"_id": "site-new", "url": "https://boards.greenhouse.io/new", "type": "greenhouse"},
+    ]
+    results = {
+        "site-same": {
+            "provider": "spidercloud",
+            "listingUnchanged": True,
+            "items": {"normalized": []},
+        },
+        "site-new": {
+            "provider": "spidercloud",
+            "listingFingerprint": "fp-new",
+            "items": {"normalized": [], "queued": True},
+        },
+    }
+
+    async def fake_execute_activity(activity, *args, **kwargs):
+        calls.append((activity, kwargs.get("args")))
+        if activity is acts.lease_site:
+            return sites.pop(0) if sites else None
+        if activity is acts.scrape_site:
+            return results[kwargs["args"][0]["_id"]]
+        if activity is acts.store_scrape:
+            return "scrape-new"
+        if activity in (acts.complete_site, acts.record_workflow_run):
+            return None
+        raise RuntimeError(f"Unexpected activity {activity}")
+
+    monkeypatch.setattr(sw.workflow, "execute_activity", fake_execute_activity)
+    monkeypatch.setattr(sw.workflow, "now", lambda: datetime.fromtimestamp(0))
+    monkeypatch.setattr(
+        sw.workflow,
+        "logger",
+        types.SimpleNamespace(
+            info=lambda *_a, **_k: None,
+            warning=lambda *_a, **_k: None,
+            error=lambda *_a, **_k: None,
+        ),
+        raising=False,
+    )
+
+    class _Info:
+        run_id = "run-1"
+        workflow_id = "wf-1"
+
+    monkeypatch.setattr(sw.workflow, "info", lambda: _Info())
+
+    summary = await sw._run_scrape_workflow(acts.scrape_site, "ScraperSpidercloud")  # noqa: SLF001
+
+    assert summary.site_count == 2
+    assert summary.scrape_ids == ["scrape-new"]
+    stored = [args[0] for activity, args in calls if activity is acts.store_scrape]
+    assert [payload["siteId"] for payload in stored] == ["site-new"]
+    completed = [args for activity, args in calls if activity is acts.complete_site]
+    # Unchanged listings keep the stored fingerprint (and its age); full runs record theirs.
+    assert completed == [["site-same"], ["site-new", "fp-new"]]
+
+
 @pytest.mark.asyncio
 async def test_scrape_workflow_handles_no_sites(monkeypatch):
     calls = []
@@ -226,3 +288,134 @@ async def test_store_scrape_passes_metadata(monkeypatch):
     assert jobs[0]["scrapedWith"] == "firecrawl"
     assert jobs[0]["scrapedAt"] == completed_at
     assert jobs[0]["workflowName"] == "ScrapeWorkflow"
+
+
+@pytest.mark.asyncio
+async def test_scrape_workflow_continues_as_new_with_carried_state(monkeypatch):
+    recorded = []
+    leases = {"count": 0}
+
+    class _ContinueAsNew(BaseException):
+        pass
+
+    async def fake_execute_activity(activity, *args, **kwargs):
+        if activity is acts.lease_site:
+            leases["count"] += 1
+            return {"_id": f"site-{leases['count']}", "url": f"https://example.com/{leases['count']}"}
+        if activity is acts.scrape_site:
+            return {"items": {"normalized": []}}
+        if activity is acts.store_scrape:
+            return f"scrape-{leases['count']}"
+        if activity is acts.complete_site:
+            return None
+        if activity is acts.record_workflow_run:
+            recorded.append(kwargs["args"][0])
+            return None
+        raise RuntimeError(f"Unexpected activity {activity}")
+
+    def fake_continue_as_new(state):
+        raise _ContinueAsNew(state)
+
+    class _Info:
+        run_id = "run-2"
+        workflow_id = "wf-1"
+
+    monkeypatch.setattr(sw.workflow, "execute_activity", fake_execute_activity)
+    monkeypatch.setattr(sw.workflow, "continue_as_new", fake_continue_as_new)
+    monkeypatch.setattr(sw.workflow, "now", lambda: datetime.fromtimestamp(0))
+    monkeypatch.setattr(sw.workflow, "info", lambda: _Info())
+    monkeypatch.setattr(sw.workflow, "patched", lambda _patch_id: True)
+    monkeypatch.setattr(sw, "history_budget_exceeded", lambda: True)
+
+    carried = sw.ScrapeRunState(
+        leased_count=3,
+        scrape_ids=["scrape-a"],
+        site_urls=["https://example.com/a"],
+        started_at=42,
+        continued_runs=1,
+    )
+    with pytest.raises(_ContinueAsNew) as excinfo:
+        await sw._run_scrape_workflow(acts.scrape_site, "ScrapeWorkflow", state=carried)  # noqa: SLF001
+
+    next_state = excinfo.value.args[0]
+    assert leases["count"] == 1
+    assert next_state.leased_count == 4
+    assert next_state.scrape_ids == ["scrape-a", "scrape-1"]
+    assert next_state.site_urls == ["https://example.com/a", "https://example.com/1"]
+    assert next_state.started_at == 42
+    assert next_state.continued_runs == 2
+    # Only the final run of the chain records the workflow summary.
+    assert recorded == []
+
+
+def _continue_as_new_harness(monkeypatch, *, patched: bool, lease_limit: int):
+    recorded: list = []
+    leases = {"count": 0}
+
+    class _ContinueAsNew(BaseException):
+        pass
+
+    async def fake_execute_activity(activity, *args, **kwargs):
+        if activity is acts.lease_site:
+            if leases["count"] >= lease_limit:
+                return None
+            leases["count"] += 1
+            return {"_id": f"site-{leases['count']}", "url": f"https://example.com/{leases['count']}"}
+        if activity is acts.scrape_site:
+            return {"items": {"normalized": []}}
+        if activity is acts.store_scrape:
+            return f"scrape-{leases['count']}"
+        if activity is acts.complete_site:
+            return None
+        if activity is acts.record_workflow_run:
+            recorded.append(kwargs["args"][0])
+            return None
+        raise RuntimeError(f"Unexpected activity {activity}")
+
+    def fake_continue_as_new(state):
+        raise _ContinueAsNew(state)
+
+    class _Info:
+        run_id = "run-2"
+        workflow_id = "wf-1"
+
+    monkeypatch.setattr(sw.workflow, "execute_activity", fake_execute_activity)
+    monkeypatch.setattr(sw.workflow, "continue_as_new", fake_continue_as_new)
+    monkeypatch.setattr(sw.workflow, "now", lambda: datetime.fromtimestamp(0))
+    monkeypatch.setattr(sw.workflow, "info", lambda: _Info())
+    monkeypatch.setattr(sw.workflow, "patched", lambda _patch_id: patched)
+    monkeypatch.setattr(sw, "history_budget_exceeded", lambda: True)
+    return _ContinueAsNew, recorded
+
+
+@pytest.mark.asyncio
+async def test_scrape_workflow_caps_carried_lists_and_keeps_totals(monkeypatch):
+    continue_exc, _recorded = _continue_as_new_harness(monkeypatch, patched=True, lease_limit=1)
+    carried = sw.ScrapeRunState(
+        leased_count=500,
+        scrape_ids=[f"scrape-old-{idx}" for idx in range(sw.MAX_CARRIED_SCRAPE_IDS)],
+        site_urls=[f"https://example.com/old-{idx}" for idx in range(sw.MAX_CARRIED_SITE_URLS)],
+        scrape_count=450,
+    )
+
+    with pytest.raises(continue_exc) as excinfo:
+        await sw._run_scrape_workflow(acts.scrape_site, "ScrapeWorkflow", state=carried)  # noqa: SLF001
+
+    next_state = excinfo.value.args[0]
+    assert len(next_state.scrape_ids) == sw.MAX_CARRIED_SCRAPE_IDS
+    assert next_state.scrape_ids[-1] == "scrape-1"
+    assert len(next_state.site_urls) == sw.MAX_CARRIED_SITE_URLS
+    assert next_state.site_urls[-1] == "https://example.com/1"
+    assert next_state.scrape_count == 451
+    assert next_state.leased_count == 501
+
+
+@pytest.mark.asyncio
+async def test_scrape_workflow_unpatched_replay_does_not_continue_as_new(monkeypatch):
+    _continue_exc, recorded = _continue_as_new_harness(monkeypatch, patched=False, lease_limit=2)
+    carried = sw.ScrapeRunState(scrape_ids=["scrape-a"], scrape_count=10)
+
+    summary = await sw._run_scrape_workflow(acts.scrape_site, "ScrapeWorkflow", state=carried)  # noqa: SLF001
+
+    assert summary.site_count == 2
+    assert recorded[0]["jobsScraped"] == 12
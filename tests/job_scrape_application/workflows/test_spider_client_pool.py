@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.workflows.scrapers.spider_client_pool import (  # noqa: E402
+    SpiderClientPool,
+    _is_connection_error,
+)
+
+
+class _FakeSpider:
+    opened = 0
+    closed = 0
+
+    def __init__(self, api_key: str) -> None:
+        self.api_key = api_key
+
+    async def __aenter__(self):
+        type(self).opened += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        type(self).closed += 1
+        return False
+
+
+@pytest.fixture(autouse=True)
+def _reset_fake_counts():
+    _FakeSpider.opened = 0
+    _FakeSpider.closed = 0
+
+
+def test_pool_reuses_client_per_api_key():
+    pool = SpiderClientPool()
+
+    async def _run():
+        async with pool.lease("key-a", _FakeSpider) as first:
+            pass
+        async with pool.lease("key-a", _FakeSpider) as second:
+            pass
+        async with pool.lease("key-b", _FakeSpider) as other:
+            pass
+        await pool.aclose()
+        return first, second, other
+
+    first, second, other = asyncio.run(_run())
+
+    assert first is second
+    assert other is not first
+    assert _FakeSpider.opened == 2
+    assert _FakeSpider.closed == 2
+
+
+def test_pool_rebuilds_client_after_connection_error():
+    pool = SpiderClientPool()
+
+    async def _run():
+        with pytest.raises(ConnectionResetError):
+            async with pool.lease("key-a", _FakeSpider):
+                raise ConnectionResetError("reset by peer")
+        async with pool.lease("key-a", _FakeSpider) as client:
+            pass
+        await pool.aclose()
+        return client
+
+    asyncio.run(_run())
+
+    assert _FakeSpider.opened == 2
+    assert _FakeSpider.closed == 2
+
+
+def test_pool_rebuilds_client_when_factory_changes():
+    pool = SpiderClientPool()
+
+    class _OtherSpider(_FakeSpider):
+        pass
+
+    async def _run():
+        async with pool.lease("key-a", _FakeSpider) as first:
+            pass
+        async with pool.lease("key-a", _OtherSpider) as second:
+            pass
+        await pool.aclose()
+        return first, second
+
+    first, second = asyncio.run(_run())
+
+    assert isinstance(second, _OtherSpider)
+    assert first is not second
+
+
+def test_pool_keeps_client_after_timeout():
+    pool = SpiderClientPool()
+
+    async def _run():
+        with pytest.raises(asyncio.TimeoutError):
+            async with pool.lease("key-a", _FakeSpider) as first:
+                raise asyncio.TimeoutError()
+        async with pool.lease("key-a", _FakeSpider) as second:
+            pass
+        await pool.aclose()
+        return first, second
+
+    first, second = asyncio.run(_run())
+
+    assert first is second
+    assert _FakeSpider.opened == 1
+    assert _FakeSpider.closed == 1
+
+
+def test_connection_error_detection_ignores_timeouts_and_status_errors():
+    module = {"__module__": "aiohttp.client_exceptions"}
+    ClientConnectionError = type("ClientConnectionError", (Exception,), module)
+    ServerTimeoutError = type(
+        "ServerTimeoutError", (ClientConnectionError, asyncio.TimeoutError), module
+    )
+    ClientResponseError = type("ClientResponseError", (Exception,), module)
+
+    assert _is_connection_error(ClientConnectionError("refused")) is True
+    assert _is_connection_error(ServerTimeoutError("read timeout")) is False
+    assert _is_connection_error(ClientResponseError("502")) is False
+    assert _is_connection_error(TimeoutError()) is False
+    assert _is_connection_error(OSError("disk")) is False
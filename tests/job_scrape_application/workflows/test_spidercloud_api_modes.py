@@ -174,6 +174,48 @@ async def test_openai_listing_scrape_extracts_job_urls(monkeypatch):
     assert not any("/careers/search" in url for url in job_urls)
 
 
+@pytest.mark.asyncio
+async def test_incremental_listing_closes_stream_after_complete_event(monkeypatch):
+    response = _load_spidercloud_fixture(
+        Path("tests/job_scrape_application/workflows/fixtures/spidercloud_uber_careers_listing_page_1.json")
+    )
+    while isinstance(response, list) and response and isinstance(response[0], list):
+        response = response[0]
+    listing_event = response[0]
+    source_url = listing_event["url"]
+    trailing_event = {"content": {"raw": "<html>" + "x" * 1000 + "</html>"}, "url": source_url}
+
+    async def _run() -> tuple[Dict[str, Any], List[str], List[bool]]:
+        pulled: List[str] = []
+        closed: List[bool] = []
+        client = _FakeClient([])
+
+        async def _scrape_url(url: str, *, params: Dict[str, Any], stream: bool, content_type: str):
+            try:
+                for name, event in (("listing", listing_event), ("trailing", trailing_event)):
+                    pulled.append(name)
+                    yield event
+            finally:
+                closed.append(True)
+
+        client.scrape_url = _scrape_url  # type: ignore[assignment]
+        result = await _make_scraper()._scrape_single_url(client, source_url, {"return_format": ["raw_html"]})
+        return result, pulled, closed
+
+    result, pulled, closed = await _run()
+    assert pulled == ["listing"]
+    assert closed == [True]
+    assert any(url.rstrip("/").split("/")[-1].isdigit() for url in result["job_urls"])
+
+    monkeypatch.setattr(
+        "job_scrape_application.workflows.site_handlers.uber_careers.UberCareersHandler.incremental_listing",
+        False,
+    )
+    full_result, full_pulled, _ = await _run()
+    assert full_pulled == ["listing", "trailing"]
+    assert full_result["job_urls"] == result["job_urls"]
+
+
 @pytest.mark.asyncio
 async def test_captcha_failure_emits_posthog_warn(monkeypatch):
     scraper = _make_scraper()
@@ -463,6 +505,24 @@ async def test_captcha_retry_uses_proxy_sequence(monkeypatch):
     assert len(client.calls) == 2
 
 
+@pytest.mark.asyncio
+async def test_captcha_escalation_is_remembered_per_host(monkeypatch):
+    scraper = _make_scraper()
+    client = _CaptchaClient({"commonmark": "# Title\nBody"})
+    logged: list[Dict[str, Any]] = []
+
+    monkeypatch.setattr("job_scrape_application.workflows.scrapers.spidercloud_scraper.AsyncSpider", lambda **_: client)
+    monkeypatch.setattr(scraper.deps, "log_sync_response", lambda *_args, **kwargs: logged.append(kwargs))
+
+    await scraper._scrape_urls_batch(["https://careers.confluent.io/jobs/1"], source_url="https://careers.confluent.io/jobs/1")
+    await scraper._scrape_urls_batch(["https://careers.confluent.io/jobs/2"], source_url="https://careers.confluent.io/jobs/2")
+
+    # The second batch starts at the proxy that got through instead of paying for a direct captcha.
+    assert [call["params"].get("proxy") for call in client.calls] == [None, CAPTCHA_PROXY_SEQUENCE[0], CAPTCHA_PROXY_SEQUENCE[0]]
+    summary = logged[-1]["metadata"]["proxyEscalation"]
+    assert summary["hosts"]["careers.confluent.io"] == {"tier": CAPTCHA_PROXY_SEQUENCE[0], "avoidedAttempts": 1}
+
+
 @pytest.mark.asyncio
 async def test_captcha_gives_up_after_limit(monkeypatch):
     scraper = _make_scraper()
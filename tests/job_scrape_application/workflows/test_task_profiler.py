@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.workflows import task_profiler  # noqa: E402
+from job_scrape_application.workflows.deadlock_logging import record_run_metadata  # noqa: E402
+
+
+def test_profiler_attributes_samples_to_workflow_type():
+    record_run_metadata("run-profile-1", "wf-1", "ScrapeWorkflow", "scraper-task-queue")
+    profiler = task_profiler.WorkflowTaskProfiler(interval_ms=1, top_n=5)
+    executor = profiler.executor(max_workers=1)
+    entered = threading.Event()
+    release = threading.Event()
+
+    def _busy_activation(activation):
+        entered.set()
+        release.wait(5)
+        return activation.run_id
+
+    future = executor.submit(_busy_activation, SimpleNamespace(run_id="run-profile-1"))
+    assert entered.wait(5)
+    profiler.sample_once()
+    profiler.sample_once()
+    release.set()
+
+    assert future.result(timeout=5) == "run-profile-1"
+    executor.shutdown()
+
+    [report] = profiler.report()
+    assert report["workflowType"] == "ScrapeWorkflow"
+    assert report["samples"] == 2
+    assert report["activations"] == 1
+    assert report["topSelf"]
+    assert profiler.report() == []
+
+
+def test_submissions_without_run_id_are_not_tracked():
+    profiler = task_profiler.WorkflowTaskProfiler(interval_ms=1)
+    executor = profiler.executor(max_workers=1)
+
+    assert executor.submit(lambda: 42).result(timeout=5) == 42
+    executor.shutdown()
+
+    assert profiler.report() == []
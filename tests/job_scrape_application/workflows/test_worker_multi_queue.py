@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import sys
 
@@ -46,3 +47,34 @@ def test_select_worker_configs_job_details_role(monkeypatch):
     assert configs[0].task_queue == "spidercloud-job-details-queue"
     assert configs[0].workflows == worker_mod.JOB_DETAILS_WORKFLOWS
     assert configs[0].activities == worker_mod.JOB_DETAILS_ACTIVITIES
+
+
+def test_all_role_starts_drainer_on_job_details_queue(monkeypatch):
+    monkeypatch.setattr(worker_mod.settings, "worker_role", "all")
+    monkeypatch.setattr(worker_mod.settings, "task_queue", "scraper-task-queue")
+    monkeypatch.setattr(worker_mod.settings, "job_details_task_queue", "spidercloud-job-details-queue")
+    started: list[dict] = []
+
+    class FakeClient:
+        async def start_workflow(self, *_args, **kwargs):
+            started.append(kwargs)
+
+    configs = worker_mod._select_worker_configs()
+    # The general queue registers the drainer too and comes first.
+    assert worker_mod.SpidercloudJobDetailsDrainerWorkflow in configs[0].workflows
+
+    queue = worker_mod._job_details_drainer_queue(configs)
+    asyncio.run(worker_mod._ensure_job_details_drainer(FakeClient(), queue))
+
+    assert queue == "spidercloud-job-details-queue"
+    assert started[0]["task_queue"] == "spidercloud-job-details-queue"
+    assert started[0]["id"] == worker_mod.JOB_DETAILS_DRAINER_WORKFLOW_ID
+
+
+def test_drainer_queue_falls_back_to_general_queue(monkeypatch):
+    monkeypatch.setattr(worker_mod.settings, "worker_role", "all")
+    monkeypatch.setattr(worker_mod.settings, "task_queue", "scraper-task-queue")
+    monkeypatch.setattr(worker_mod.settings, "job_details_task_queue", None)
+
+    assert worker_mod._job_details_drainer_queue(worker_mod._select_worker_configs()) == "scraper-task-queue"
+    assert worker_mod._job_details_drainer_queue([]) is None
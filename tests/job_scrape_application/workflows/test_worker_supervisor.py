@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.workflows import supervisor  # noqa: E402
+from job_scrape_application.workflows import worker as worker_module  # noqa: E402
+
+
+def test_build_slots_matches_start_worker_roles():
+    slots = supervisor.build_slots(2, 1)
+
+    assert [slot.name for slot in slots] == ["all-1", "all-2", "job-details-1"]
+
+
+def test_metrics_ports_are_offset_per_child():
+    slots = supervisor.build_slots(2, 1)
+
+    assert [supervisor.offset_bind_address("127.0.0.1:9464", slot.metrics_port_offset) for slot in slots] == [
+        "127.0.0.1:9464",
+        "127.0.0.1:9465",
+        "127.0.0.1:9466",
+    ]
+    assert supervisor.offset_bind_address(None, 3) is None
+
+
+def test_restart_delay_backs_off_exponentially():
+    delays = [supervisor.restart_delay(failures) for failures in range(0, 9)]
+
+    assert delays[:4] == [0.0, 1.0, 2.0, 4.0]
+    assert delays[-1] == supervisor.RESTART_BACKOFF_MAX_SECONDS
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_crashed_child_is_scheduled_for_restart(monkeypatch):
+    monkeypatch.setattr(supervisor, "_child_entrypoint", lambda slot: 3)
+    slot = supervisor.WorkerSlot("job-details", 1)
+    sup = supervisor.Supervisor([slot])
+
+    sup._spawn(slot)
+    deadline = time.monotonic() + 10
+    while slot.pid is not None and time.monotonic() < deadline:
+        sup._reap()
+        time.sleep(0.01)
+
+    assert slot.pid is None
+    assert slot.exit_codes == [3]
+    assert slot.failures == 1
+    assert slot.restart_at > time.monotonic() - 1
+
+
+@pytest.mark.skipif(os.name != "posix", reason="requires POSIX signals")
+def test_child_sigterm_requests_graceful_worker_shutdown(monkeypatch):
+    seen = {}
+
+    async def fake_main(shutdown_event=None):
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.wait_for(shutdown_event.wait(), timeout=5)
+        seen["shutdown"] = shutdown_event.is_set()
+
+    monkeypatch.setattr(supervisor.worker_module, "main", fake_main)
+
+    asyncio.run(supervisor._run_child_worker())
+
+    assert seen == {"shutdown": True}
+
+
+def test_shutdown_event_drains_workers_through_worker_shutdown():
+    class _FakeWorker:
+        def __init__(self) -> None:
+            self.stopped = asyncio.Event()
+            self.shutdown_calls = 0
+
+        async def run(self) -> None:
+            await self.stopped.wait()
+
+        async def shutdown(self) -> None:
+            self.shutdown_calls += 1
+            self.stopped.set()
+
+    async def scenario() -> list[int]:
+        workers = [_FakeWorker(), _FakeWorker()]
+        shutdown_event = asyncio.Event()
+        runs = [asyncio.create_task(w.run()) for w in workers]
+        drain = asyncio.create_task(worker_module._shutdown_workers_on(shutdown_event, workers))
+        await asyncio.sleep(0)
+        assert not any(run.done() for run in runs)
+        shutdown_event.set()
+        await asyncio.wait_for(asyncio.gather(drain, *runs), timeout=5)
+        return [w.shutdown_calls for w in workers]
+
+    assert asyncio.run(scenario()) == [1, 1]
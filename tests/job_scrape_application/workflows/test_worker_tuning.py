@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.workflows import worker_tuning  # noqa: E402
+
+
+def _set_limits(monkeypatch, prefix: str, activities: int, workflow_tasks: int, polls: int) -> None:
+    cfg = worker_tuning.runtime_config
+    monkeypatch.setattr(cfg, f"temporal_{prefix}_max_concurrent_activities", activities)
+    monkeypatch.setattr(cfg, f"temporal_{prefix}_max_concurrent_workflow_tasks", workflow_tasks)
+    monkeypatch.setattr(cfg, f"temporal_{prefix}_max_concurrent_activity_task_polls", polls)
+    monkeypatch.setattr(cfg, f"temporal_{prefix}_max_concurrent_workflow_task_polls", polls)
+
+
+def test_fixed_tuning_uses_role_limits(monkeypatch):
+    monkeypatch.setattr(worker_tuning.runtime_config, "temporal_worker_tuner", "fixed")
+    monkeypatch.setattr(worker_tuning.runtime_config, "temporal_max_cached_workflows", 250)
+    _set_limits(monkeypatch, "general", 40, 20, 4)
+    _set_limits(monkeypatch, "job_details", 8, 0, 2)
+
+    general = worker_tuning.worker_tuning_kwargs("all")
+    job_details = worker_tuning.worker_tuning_kwargs("job-details")
+
+    assert general == {
+        "max_concurrent_activities": 40,
+        "max_concurrent_workflow_tasks": 20,
+        "max_concurrent_activity_task_polls": 4,
+        "max_concurrent_workflow_task_polls": 4,
+        "max_cached_workflows": 250,
+    }
+    # 0 leaves the SDK default in place.
+    assert "max_concurrent_workflow_tasks" not in job_details
+    assert job_details["max_concurrent_activities"] == 8
+    assert "max_concurrent_workflow_tasks=default" in worker_tuning.describe_worker_tuning("job-details", job_details)
+
+
+def test_resource_based_tuning_replaces_fixed_slots(monkeypatch):
+    monkeypatch.setattr(worker_tuning.runtime_config, "temporal_worker_tuner", "resource_based")
+    _set_limits(monkeypatch, "general", 40, 20, 4)
+
+    kwargs = worker_tuning.worker_tuning_kwargs("general")
+
+    assert "tuner" in kwargs
+    assert "max_concurrent_activities" not in kwargs
+    assert "max_concurrent_workflow_tasks" not in kwargs
+    assert kwargs["max_concurrent_activity_task_polls"] == 4
+    assert "max_activities=40" in worker_tuning.describe_worker_tuning("general", kwargs)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("."))
+
+from temporalio.api.enums.v1 import EventType  # noqa: E402
+from temporalio.client import WorkflowHistory  # noqa: E402
+from temporalio.worker import Replayer  # noqa: E402
+
+from job_scrape_application.workflows.payload_codec import build_data_converter  # noqa: E402
+from job_scrape_application.workflows.sandbox import build_workflow_runner  # noqa: E402
+from job_scrape_application.workflows.worker import WORKFLOW_CLASSES  # noqa: E402
+
+# Written by ``agent_scripts/record_workflow_histories.py`` (one per workflow type); live
+# executions exported with ``benchmark_workflow_replay.py --export`` are replayed too.
+HISTORIES_DIR = Path("tests/fixtures/workflow_histories")
+
+
+def _recorded_histories() -> list[WorkflowHistory]:
+    return [
+        WorkflowHistory.from_json(path.stem.replace("__", "/"), path.read_text(encoding="utf-8"))
+        for path in sorted(HISTORIES_DIR.glob("*.json"))
+    ]
+
+
+def _workflow_type(history: WorkflowHistory) -> str:
+    started = history.events[0]
+    assert started.event_type == EventType.EVENT_TYPE_WORKFLOW_EXECUTION_STARTED
+    return started.workflow_execution_started_event_attributes.workflow_type.name
+
+
+def test_every_registered_workflow_has_a_recorded_history():
+    recorded = {_workflow_type(history) for history in _recorded_histories()}
+    registered = {cls.__temporal_workflow_definition.name for cls in WORKFLOW_CLASSES}
+
+    assert registered <= recorded, sorted(registered - recorded)
+
+
+@pytest.mark.asyncio
+async def test_recorded_histories_replay_with_curated_sandbox_runner():
+    histories = _recorded_histories()
+    assert histories, f"no recorded workflow histories in {HISTORIES_DIR}"
+
+    replayer = Replayer(
+        workflows=WORKFLOW_CLASSES,
+        workflow_runner=build_workflow_runner(),
+        data_converter=build_data_converter(),
+    )
+    for history in histories:
+        await replayer.replay_workflow(history, raise_on_replay_failure=True)
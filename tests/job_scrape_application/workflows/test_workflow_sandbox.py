@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath("."))
+
+from job_scrape_application.workflows import sandbox  # noqa: E402
+from job_scrape_application.workflows.worker import WORKFLOW_CLASSES  # noqa: E402
+
+
+def test_workflow_definition_modules_stay_sandboxed():
+    workflow_modules = {cls.__module__ for cls in WORKFLOW_CLASSES}
+
+    for module in workflow_modules:
+        assert not any(
+            module == passthrough or module.startswith(f"{passthrough}.")
+            for passthrough in sandbox.SANDBOX_PASSTHROUGH_MODULES
+        ), module
+
+
+def test_build_workflow_runner_applies_passthrough_modules():
+    runner = sandbox.build_workflow_runner(extra_passthrough=["json"])
+    passthrough = runner.restrictions.passthrough_modules
+
+    assert set(sandbox.SANDBOX_PASSTHROUGH_MODULES) <= passthrough
+    assert "json" in passthrough
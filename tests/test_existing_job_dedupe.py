@@ -82,6 +82,26 @@ def test_filter_existing_job_urls_returns_only_known_job_urls(monkeypatch):
     assert captured["args"] == {"urls": urls}
 
 
+def test_filter_existing_job_urls_drops_jobs_changed_since_last_scrape(monkeypatch):
+    urls = [
+        "https://boards-api.greenhouse.io/v1/boards/acme/jobs/1",
+        "https://boards-api.greenhouse.io/v1/boards/acme/jobs/2",
+        "https://boards-api.greenhouse.io/v1/boards/acme/jobs/3",
+    ]
+    captured: dict[str, object] = {}
+
+    async def fake_convex_query(_name, args):
+        captured["args"] = args
+        return {"existing": urls[:2], "changed": [urls[1]]}
+
+    monkeypatch.setattr(convex_client, "convex_query", fake_convex_query)
+
+    result = asyncio.run(activities.filter_existing_job_urls(urls, {urls[0]: 10, urls[1]: 20}))
+
+    assert result == [urls[0]]
+    assert captured["args"] == {"urls": urls, "updatedAts": [10, 20, None]}
+
+
 def test_filter_existing_job_urls_ignores_malformed_payloads(monkeypatch):
     async def fake_convex_query(_name, _args):
         return {"existing": "not-a-list"}